@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import re
 from logging.config import fileConfig
 
 from alembic import context
@@ -28,6 +29,26 @@ target_metadata = Base.metadata
 
 # Other values from the config can be acquired as needed
 
+# Monthly transaction partitions are created at runtime, not by migrations
+TRANSACTION_PARTITION = re.compile(r"^transactions_\d{4}_\d{2}$")
+
+
+def include_object(
+    obj: object,
+    name: str | None,
+    type_: str,
+    reflected: bool,  # noqa: FBT001
+    compare_to: object | None,
+) -> bool:
+    """Exclude runtime-managed transaction partitions from autogenerate."""
+    del obj, compare_to
+    return not (
+        type_ == "table"
+        and reflected
+        and name is not None
+        and TRANSACTION_PARTITION.match(name) is not None
+    )
+
 
 def get_database_url() -> str:
     """Get database URL from environment or config."""
@@ -57,6 +78,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -67,7 +89,11 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with database connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
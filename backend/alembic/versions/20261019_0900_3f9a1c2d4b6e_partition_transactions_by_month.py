@@ -0,0 +1,192 @@
+"""Partition transactions by month of transaction_date.
+
+Revision ID: 3f9a1c2d4b6e  # pragma: allowlist secret
+Revises: 7c28f12e743f  # pragma: allowlist secret
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3f9a1c2d4b6e"  # pragma: allowlist secret
+down_revision = "7c28f12e743f"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "id, statement_id, account_id, transaction_date, amount, description, "
+    "custom_description, category, transaction_type, reference_id, "
+    "created_at, updated_at"
+)
+
+CREATE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transactions_partition(day date)
+RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date := date_trunc('month', day)::date;
+    partition_name text := 'transactions_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass(partition_name) IS NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtext('transactions_partitions'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month_start,
+                (month_start + interval '1 month')::date
+            );
+        END IF;
+    END IF;
+    RETURN partition_name;
+END;
+$$
+"""
+
+INDEXES = (
+    "idx_transactions_account_id",
+    "idx_transactions_amount",
+    "idx_transactions_category",
+    "idx_transactions_custom_description_search",
+    "idx_transactions_date",
+    "idx_transactions_description_search",
+    "idx_transactions_statement_id",
+    "idx_transactions_type",
+)
+
+
+def _create_transactions_table(*, partitioned: bool) -> None:
+    """Create the transactions table as it was before or after partitioning."""
+    primary_key = ("transaction_date", "id") if partitioned else ("id",)
+    options = (
+        {"postgresql_partition_by": "RANGE (transaction_date)"} if partitioned else {}
+    )
+    op.create_table(
+        "transactions",
+        sa.Column("statement_id", sa.UUID(), nullable=False),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("transaction_date", sa.Date(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("custom_description", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("transaction_type", sa.String(length=50), nullable=False),
+        sa.Column("reference_id", sa.String(length=255), nullable=True),
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "transaction_type IN ('debit', 'credit', 'payment', 'refund')",
+            name="transactions_type_valid",
+        ),
+        sa.CheckConstraint("amount != 0", name="transactions_amount_not_zero"),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["statement_id"], ["statements.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **options,
+    )
+
+
+def _create_transaction_indexes() -> None:
+    """Create the transaction indexes (cascaded to every partition)."""
+    op.create_index(
+        "idx_transactions_account_id", "transactions", ["account_id"], unique=False
+    )
+    op.create_index("idx_transactions_amount", "transactions", ["amount"], unique=False)
+    op.create_index(
+        "idx_transactions_category", "transactions", ["category"], unique=False
+    )
+    op.create_index(
+        "idx_transactions_custom_description_search",
+        "transactions",
+        ["custom_description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"custom_description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_transactions_date", "transactions", ["transaction_date"], unique=False
+    )
+    op.create_index(
+        "idx_transactions_description_search",
+        "transactions",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_transactions_statement_id", "transactions", ["statement_id"], unique=False
+    )
+    op.create_index(
+        "idx_transactions_type", "transactions", ["transaction_type"], unique=False
+    )
+
+
+def _move_aside_old_table() -> None:
+    """Rename the current table and drop its indexes to free their names."""
+    for index_name in INDEXES:
+        op.drop_index(index_name, table_name="transactions")
+    op.rename_table("transactions", "transactions_old")
+    op.execute("ALTER INDEX transactions_pkey RENAME TO transactions_old_pkey")
+
+
+def upgrade() -> None:
+    _move_aside_old_table()
+    _create_transactions_table(partitioned=True)
+    _create_transaction_indexes()
+    op.execute(CREATE_PARTITION_FUNCTION)
+
+    # Partitions for every month with data plus a year either side of today
+    op.execute(
+        """
+        SELECT create_transactions_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', LEAST(
+                (SELECT min(transaction_date) FROM transactions_old),
+                CURRENT_DATE - interval '12 months'
+            )),
+            date_trunc('month', GREATEST(
+                (SELECT max(transaction_date) FROM transactions_old),
+                CURRENT_DATE + interval '12 months'
+            )),
+            interval '1 month'
+        ) AS month
+        """
+    )
+    op.execute(
+        f"INSERT INTO transactions ({COLUMNS}) "  # noqa: S608
+        f"SELECT {COLUMNS} FROM transactions_old"
+    )
+    op.drop_table("transactions_old")
+
+
+def downgrade() -> None:
+    _move_aside_old_table()
+    _create_transactions_table(partitioned=False)
+    op.execute(
+        f"INSERT INTO transactions ({COLUMNS}) "  # noqa: S608
+        f"SELECT {COLUMNS} FROM transactions_old"
+    )
+    # Dropping the partitioned parent drops all of its partitions
+    op.drop_table("transactions_old")
+    op.execute("DROP FUNCTION create_transactions_partition(date)")
+    _create_transaction_indexes()
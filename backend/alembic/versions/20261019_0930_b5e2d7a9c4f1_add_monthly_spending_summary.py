@@ -0,0 +1,73 @@
+"""Add monthly spending summary table.
+
+Revision ID: b5e2d7a9c4f1  # pragma: allowlist secret
+Revises: 3f9a1c2d4b6e  # pragma: allowlist secret
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b5e2d7a9c4f1"  # pragma: allowlist secret
+down_revision = "3f9a1c2d4b6e"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_spending_summary",
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False, comment="First day of the month"),
+        sa.Column("category", sa.String(length=100), nullable=False),
+        sa.Column("transaction_type", sa.String(length=50), nullable=False),
+        sa.Column("total_amount", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column(
+            "spending_amount",
+            sa.Numeric(precision=14, scale=2),
+            nullable=False,
+            comment="Sum of negative amounts",
+        ),
+        sa.Column(
+            "credit_amount",
+            sa.Numeric(precision=14, scale=2),
+            nullable=False,
+            comment="Sum of positive amounts",
+        ),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("account_id", "month", "category", "transaction_type"),
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO monthly_spending_summary (
+            account_id, month, category, transaction_type, total_amount,
+            spending_amount, credit_amount, transaction_count
+        )
+        SELECT account_id,
+               CAST(date_trunc('month', transaction_date) AS date),
+               COALESCE(category, 'uncategorized'),
+               transaction_type,
+               sum(amount),
+               COALESCE(sum(amount) FILTER (WHERE amount < 0), 0),
+               COALESCE(sum(amount) FILTER (WHERE amount > 0), 0),
+               count(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_spending_summary")
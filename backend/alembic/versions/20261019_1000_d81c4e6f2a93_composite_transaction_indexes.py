@@ -0,0 +1,74 @@
+"""Replace single-column transaction indexes with composite and partial ones.
+
+Revision ID: d81c4e6f2a93  # pragma: allowlist secret
+Revises: b5e2d7a9c4f1  # pragma: allowlist secret
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d81c4e6f2a93"  # pragma: allowlist secret
+down_revision = "b5e2d7a9c4f1"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+SINGLE_COLUMN_INDEXES = {
+    "idx_transactions_account_id": "account_id",
+    "idx_transactions_date": "transaction_date",
+    "idx_transactions_amount": "amount",
+    "idx_transactions_category": "category",
+    "idx_transactions_type": "transaction_type",
+}
+
+
+def _create_custom_description_search(*, partial: bool) -> None:
+    op.create_index(
+        "idx_transactions_custom_description_search",
+        "transactions",
+        ["custom_description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"custom_description": "gin_trgm_ops"},
+        postgresql_where=sa.text("custom_description IS NOT NULL") if partial else None,
+    )
+
+
+def upgrade() -> None:
+    # Indexes on the partitioned parent cascade to every partition
+    op.create_index(
+        "idx_transactions_account_date",
+        "transactions",
+        ["account_id", "transaction_date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_transactions_account_category_date",
+        "transactions",
+        ["account_id", "category", "transaction_date"],
+        unique=False,
+        postgresql_where=sa.text("category IS NOT NULL"),
+    )
+    for index_name in SINGLE_COLUMN_INDEXES:
+        op.drop_index(index_name, table_name="transactions")
+
+    # Most rows have no custom description, so the partial GIN is tiny
+    op.drop_index(
+        "idx_transactions_custom_description_search", table_name="transactions"
+    )
+    _create_custom_description_search(partial=True)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_transactions_custom_description_search", table_name="transactions"
+    )
+    _create_custom_description_search(partial=False)
+
+    for index_name, column in SINGLE_COLUMN_INDEXES.items():
+        op.create_index(index_name, "transactions", [column], unique=False)
+    op.drop_index("idx_transactions_account_category_date", table_name="transactions")
+    op.drop_index("idx_transactions_account_date", table_name="transactions")
@@ -0,0 +1,42 @@
+"""Allow uploaded statements to exist before their period is parsed.
+
+Revision ID: 5a7e3c9b1d24  # pragma: allowlist secret
+Revises: d81c4e6f2a93  # pragma: allowlist secret
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5a7e3c9b1d24"  # pragma: allowlist secret
+down_revision = "d81c4e6f2a93"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A pending upload has no billing period until the parser reads it
+    op.alter_column(
+        "statements", "period_start", existing_type=sa.Date(), nullable=True
+    )
+    op.alter_column("statements", "period_end", existing_type=sa.Date(), nullable=True)
+    op.create_check_constraint(
+        "statements_period_known",
+        "statements",
+        "status <> 'completed' OR (period_start IS NOT NULL AND period_end IS NOT NULL)",
+    )
+
+
+def downgrade() -> None:
+    # Uploads that never got a period cannot satisfy NOT NULL
+    op.execute(
+        "DELETE FROM statements WHERE period_start IS NULL OR period_end IS NULL"
+    )
+    op.drop_constraint("statements_period_known", "statements", type_="check")
+    op.alter_column("statements", "period_end", existing_type=sa.Date(), nullable=False)
+    op.alter_column(
+        "statements", "period_start", existing_type=sa.Date(), nullable=False
+    )
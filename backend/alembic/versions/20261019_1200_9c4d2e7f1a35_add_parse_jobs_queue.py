@@ -0,0 +1,101 @@
+"""Add parse_jobs table as the statement processing queue.
+
+Revision ID: 9c4d2e7f1a35  # pragma: allowlist secret
+Revises: 5a7e3c9b1d24  # pragma: allowlist secret
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9c4d2e7f1a35"  # pragma: allowlist secret
+down_revision = "5a7e3c9b1d24"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parse_jobs",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("statement_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "status", sa.String(length=20), server_default="queued", nullable=False
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default="5", nullable=False),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "locked_by",
+            sa.String(length=255),
+            nullable=True,
+            comment="Worker holding the lease",
+        ),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'dead')",
+            name="parse_jobs_status_valid",
+        ),
+        sa.CheckConstraint(
+            "status <> 'running' "
+            "OR (locked_by IS NOT NULL AND lease_expires_at IS NOT NULL)",
+            name="parse_jobs_running_leased",
+        ),
+        sa.ForeignKeyConstraint(
+            ["statement_id"], ["statements.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("statement_id"),
+    )
+    op.create_index(
+        "idx_parse_jobs_queued",
+        "parse_jobs",
+        ["run_after"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "idx_parse_jobs_leases",
+        "parse_jobs",
+        ["lease_expires_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+    # Uploads whose in-process parse was lost to a restart get queued
+    op.execute(
+        """
+        INSERT INTO parse_jobs (statement_id)
+        SELECT id FROM statements WHERE status IN ('pending', 'processing')
+        """
+    )
+    op.execute("UPDATE statements SET status = 'pending' WHERE status = 'processing'")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_parse_jobs_leases", table_name="parse_jobs")
+    op.drop_index("idx_parse_jobs_queued", table_name="parse_jobs")
+    op.drop_table("parse_jobs")
@@ -0,0 +1,84 @@
+"""Notify listeners when parse jobs become due and statement statuses change.
+
+Revision ID: e3b7a1f94c52  # pragma: allowlist secret
+Revises: 9c4d2e7f1a35  # pragma: allowlist secret
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e3b7a1f94c52"  # pragma: allowlist secret
+down_revision = "9c4d2e7f1a35"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+
+# Notifications are delivered when the writing transaction commits. The
+# status payload carries every field of the status endpoint, so waiting
+# clients are answered without reading the row again; the error is cut
+# short to stay well below the 8000 byte payload limit.
+NOTIFY_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION notify_parse_job_due()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('parse_jobs', NEW.id::text);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION notify_statement_status()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify(
+        'statement_status',
+        json_build_object(
+            'statement_id', NEW.id,
+            'status', NEW.status,
+            'uploaded_at', NEW.uploaded_at,
+            'processed_at', NEW.processed_at,
+            'period_start', NEW.period_start,
+            'period_end', NEW.period_end,
+            'error', left(NEW.processing_metadata ->> 'error', 2000)
+        )::text
+    );
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTIONS)
+    # Retries queued with a backoff are left to the workers' poll
+    op.execute(
+        """
+        CREATE TRIGGER parse_jobs_notify_due
+        AFTER INSERT OR UPDATE OF status ON parse_jobs
+        FOR EACH ROW
+        WHEN (NEW.status = 'queued' AND NEW.run_after <= now())
+        EXECUTE FUNCTION notify_parse_job_due()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER statements_notify_status
+        AFTER UPDATE OF status ON statements
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_statement_status()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS statements_notify_status ON statements")
+    op.execute("DROP TRIGGER IF EXISTS parse_jobs_notify_due ON parse_jobs")
+    op.execute("DROP FUNCTION IF EXISTS notify_statement_status()")
+    op.execute("DROP FUNCTION IF EXISTS notify_parse_job_due()")
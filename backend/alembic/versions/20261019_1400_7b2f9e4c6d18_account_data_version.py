@@ -0,0 +1,35 @@
+"""Version each account's imported data for analytics caching.
+
+Revision ID: 7b2f9e4c6d18  # pragma: allowlist secret
+Revises: e3b7a1f94c52  # pragma: allowlist secret
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "7b2f9e4c6d18"  # pragma: allowlist secret
+down_revision = "e3b7a1f94c52"  # pragma: allowlist secret
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Bumped in the transaction that refreshes the account's spending summary
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "data_version",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+            comment="Incremented whenever the account's transactions change",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("accounts", "data_version")
@@ -3,11 +3,23 @@
 from fastapi import APIRouter
 
 from .endpoints import admin_secrets
+from .endpoints import analytics
 from .endpoints import institutions
+from .endpoints import parse
+from .endpoints import statements
+from .endpoints import transactions
+from .endpoints import uploads
 
 
 api_router = APIRouter()
 api_router.include_router(
     institutions.router, prefix="/institutions", tags=["institutions"]
 )
+api_router.include_router(statements.router, prefix="/statements", tags=["statements"])
+api_router.include_router(parse.router, prefix="/statements", tags=["statements"])
+api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
+api_router.include_router(
+    transactions.router, prefix="/transactions", tags=["transactions"]
+)
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 api_router.include_router(admin_secrets.router, tags=["Admin - Secrets"])
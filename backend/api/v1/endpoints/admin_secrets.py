@@ -164,22 +164,22 @@ async def create_secret(
 
 @router.get("/", response_model=list[SecretResponse])
 async def list_secrets(
+    request: Request,
     include_metadata: bool = False,  # noqa: FBT001,FBT002
-    request: Request | None = None,
     vault: SecureVault = Depends(get_secure_vault),  # noqa: B008
 ) -> list[SecretResponse]:
     """List all secrets with optional metadata.
 
     Args:
-        include_metadata: Include access counts, timestamps, etc.
         request: HTTP request for context
+        include_metadata: Include access counts, timestamps, etc.
         vault: SecureVault instance
 
     Returns:
         List of secret metadata (no values)
     """
     try:
-        context = get_request_context(request) if request else {}
+        context = get_request_context(request)
         secrets_data = await vault.list_secrets(
             include_metadata=include_metadata, **context
         )
@@ -0,0 +1,227 @@
+"""Spending analytics endpoints for Ledgerly API.
+
+Dashboards request the same reports on every load while the data behind
+them only changes when a statement is imported. Responses are cached per
+process, keyed on the accounts covered, the parameters and the accounts'
+data versions, which imports bump; every response carries a strong ETag,
+so a client revalidating an unchanged report gets ``304 Not Modified``
+without a body. A request costs one version lookup unless the report
+has to be recomputed.
+"""
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import database
+from services.analytics import AnalyticsCache
+from services.analytics import CachedResponse
+from services.analytics import DataScope
+from services.analytics import Granularity
+from services.analytics import category_trends_report
+from services.analytics import data_scope
+from services.analytics import get_analytics_cache
+from services.analytics import monthly_spending_report
+from services.analytics.reports import month_end
+from services.persistence.partitions import add_months
+from services.persistence.partitions import month_start
+
+
+router = APIRouter()
+
+TrendPeriod = Literal["3months", "6months", "12months"]
+TREND_PERIOD_MONTHS: dict[TrendPeriod, int] = {
+    "3months": 3,
+    "6months": 6,
+    "12months": 12,
+}
+
+# Clients may reuse a report but must revalidate it with its ETag first
+CACHE_CONTROL = "private, no-cache"
+
+
+class MonthlyPeriod(BaseModel):
+    """Dates a monthly spending report covers."""
+
+    year: int
+    month: int | None
+    start_date: date
+    end_date: date
+
+
+class CategorySpending(BaseModel):
+    """One category's share of a period's spending."""
+
+    category: str
+    amount: float
+    percentage: float
+    transaction_count: int
+
+
+class DailySpending(BaseModel):
+    """Net amount of one day."""
+
+    date: date
+    amount: float
+    transaction_count: int
+
+
+class MonthlySpendingResponse(BaseModel):
+    """Spending of a month or year, by category and by day."""
+
+    period: MonthlyPeriod
+    total_spending: float
+    total_credits: float
+    net_amount: float
+    categories: list[CategorySpending]
+    daily_breakdown: list[DailySpending]
+
+
+class TrendRange(BaseModel):
+    """Dates and period length of a trends report."""
+
+    start_date: date
+    end_date: date
+    granularity: Granularity
+
+
+class TrendPoint(BaseModel):
+    """A category's net amount in one period."""
+
+    period: str
+    amount: float
+    transaction_count: int
+
+
+class CategoryTrend(BaseModel):
+    """A category's amounts over the range and their direction."""
+
+    category: str
+    trend: Literal["increasing", "decreasing", "stable"]
+    average_monthly: float
+    data_points: list[TrendPoint]
+
+
+class PeriodTotals(BaseModel):
+    """Spending and credits of one period across the categories."""
+
+    period: str
+    total_spending: float
+    total_credits: float
+
+
+class CategoryTrendsResponse(BaseModel):
+    """Category amounts per period over a range."""
+
+    period: TrendRange
+    categories: list[CategoryTrend]
+    totals: list[PeriodTotals]
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches a strong ETag.
+
+    ``If-None-Match`` uses weak comparison, so ``W/`` prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def cached_response(request: Request, cached: CachedResponse) -> Response:
+    """Return a cached body, or ``304`` if the client already has it."""
+    headers = {"ETag": cached.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
+
+
+async def _scope(session: AsyncSession, account_id: UUID | None) -> DataScope:
+    # Read before the report, so a cached report is never older than its key
+    scope = await data_scope(session, account_id)
+    if scope is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return scope
+
+
+@router.get("/spending/monthly", response_model=MonthlySpendingResponse)
+async def get_monthly_spending(  # noqa: PLR0917
+    request: Request,
+    year: int = Query(..., ge=1900, le=9999),
+    month: int | None = Query(None, ge=1, le=12),
+    account_id: UUID | None = None,
+    category: str | None = None,
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+    cache: AnalyticsCache = Depends(get_analytics_cache),  # noqa: B008
+) -> Response:
+    """Get spending of a month, or a whole year, by category and by day."""
+    scope = await _scope(session, account_id)
+
+    async def compute() -> bytes:
+        report = await monthly_spending_report(
+            session, scope, year=year, month=month, category=category
+        )
+        return MonthlySpendingResponse.model_validate(report).model_dump_json().encode()
+
+    key = ("spending/monthly", scope.versions, year, month, category)
+    return cached_response(request, await cache.get_or_compute(key, compute))
+
+
+@router.get("/trends/categories", response_model=CategoryTrendsResponse)
+async def get_category_trends(  # noqa: PLR0917
+    request: Request,
+    period: TrendPeriod,
+    account_id: UUID | None = None,
+    categories: str | None = Query(
+        None, description="Comma-separated categories (default: all)"
+    ),
+    granularity: Granularity = "monthly",
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+    cache: AnalyticsCache = Depends(get_analytics_cache),  # noqa: B008
+) -> Response:
+    """Get category amounts per period over the last months, with trends.
+
+    The range ends with the current month and spans ``period`` months.
+    """
+    today = datetime.now(UTC).date()
+    start = add_months(month_start(today), 1 - TREND_PERIOD_MONTHS[period])
+    end = month_end(today)
+    names = (
+        sorted({name.strip() for name in categories.split(",") if name.strip()})
+        if categories
+        else None
+    )
+    scope = await _scope(session, account_id)
+
+    async def compute() -> bytes:
+        report = await category_trends_report(
+            session,
+            scope,
+            start=start,
+            end=end,
+            granularity=granularity,
+            categories=names,
+        )
+        return CategoryTrendsResponse.model_validate(report).model_dump_json().encode()
+
+    key = (
+        "trends/categories",
+        scope.versions,
+        start,
+        end,
+        granularity,
+        tuple(names) if names else None,
+    )
+    return cached_response(request, await cache.get_or_compute(key, compute))
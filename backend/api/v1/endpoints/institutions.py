@@ -18,7 +18,7 @@ router = APIRouter()
 
 @router.get("/", response_model=list[dict[str, str | None]])
 async def list_institutions(
-    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
 ) -> list[dict[str, str | None]]:
     """List all institutions."""
     result = await session.execute(select(Institution))
@@ -39,7 +39,7 @@ async def list_institutions(
 @router.get("/{institution_id}", response_model=dict[str, Any])
 async def get_institution(
     institution_id: UUID,
-    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
 ) -> dict[str, Any]:
     """Get a specific institution by ID."""
     institution = await session.get(Institution, institution_id)
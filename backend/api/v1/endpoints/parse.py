@@ -0,0 +1,402 @@
+"""Statement upload and processing status endpoints for Ledgerly API."""
+
+import asyncio
+import contextlib
+import math
+import os
+import weakref
+from collections.abc import AsyncIterator
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+from uuid import uuid4
+
+from api.v1.endpoints.statements import StatementFiles
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import database
+from models.orm import ParseJob
+from models.orm import Statement
+from services.admission import Admission
+from services.admission import AdmissionRejectedError
+from services.admission import get_admission
+from services.jobs import TERMINAL_STATUSES
+from services.jobs import StatusBroker
+from services.jobs import StatusEvent
+from services.normalization import get_account_uuid
+from services.secure_vault.config_manager import get_config_manager
+from services.storage import ObjectStorage
+from services.storage import get_storage
+from services.uploads import ReceivedUpload
+from services.uploads import UploadError
+from services.uploads import UploadTooLargeError
+from services.uploads import receive_upload
+
+
+router = APIRouter()
+
+# Uploads are received here before they are stored (the local backend
+# stores them here too)
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "data/uploads"))
+MAX_FILE_BYTES = get_config_manager().get_max_file_bytes()
+
+# Upload field name -> required file extension
+FILE_FIELDS = {"pdf_file": ".pdf", "csv_file": ".csv"}
+# A body of unknown length reserves the most an upload may carry
+MAX_REQUEST_BYTES = MAX_FILE_BYTES * len(FILE_FIELDS)
+
+MAX_STATUS_WAIT_SECONDS = 60.0
+# Idle status streams send a comment this often so proxies keep them open
+STATUS_KEEPALIVE_SECONDS = 15.0
+
+
+class ProcessingInfo(BaseModel):
+    """Where to follow an upload's processing."""
+
+    progress_url: str
+
+
+class StatementUploadResponse(BaseModel):
+    """An accepted upload, before parsing has finished."""
+
+    statement_id: UUID
+    status: str
+    uploaded_at: datetime
+    files: StatementFiles
+    processing_info: ProcessingInfo
+
+
+class StatementStatusResponse(BaseModel):
+    """Processing status of an uploaded statement."""
+
+    statement_id: UUID
+    status: str
+    uploaded_at: datetime
+    processed_at: datetime | None
+    period_start: date | None
+    period_end: date | None
+    error: str | None
+
+
+def too_busy(error: AdmissionRejectedError) -> HTTPException:
+    """Return the ``429`` for work refused by admission control."""
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(math.ceil(error.retry_after))},
+    )
+
+
+def declared_length(request: Request, limit: int) -> int:
+    """Return the request's ``Content-Length``, capped at ``limit``.
+
+    Without a valid header (e.g. a chunked request body), ``limit``.
+    """
+    try:
+        length = int(request.headers.get("content-length", ""))
+    except ValueError:
+        return limit
+    return min(max(length, 0), limit)
+
+
+def validate_upload(upload: ReceivedUpload) -> tuple[str, UUID]:
+    """Check an upload's fields and files and resolve its account.
+
+    Args:
+        upload: Received form fields and files
+
+    Returns:
+        The account type slug and the account's UUID
+
+    Raises:
+        HTTPException: 400 if a field is missing or a file has the wrong type
+    """
+    account_type = upload.fields.get("account_type")
+    if not account_type:
+        raise HTTPException(status_code=400, detail="account_type is required")
+    if "pdf_file" not in upload.files:
+        # The billing period is read from the PDF; a CSV alone has none
+        raise HTTPException(
+            status_code=400, detail="A pdf_file is required; a csv_file is optional"
+        )
+    for name, suffix in FILE_FIELDS.items():
+        stored = upload.files.get(name)
+        if stored is not None and not stored.key.endswith(suffix):
+            raise HTTPException(
+                status_code=400, detail=f"{name} must be a {suffix} file"
+            )
+    try:
+        account_id = get_account_uuid(account_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return account_type, account_id
+
+
+@router.post("/", status_code=202, response_model=StatementUploadResponse)
+async def upload_statement(
+    request: Request,
+    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+    storage: ObjectStorage = Depends(get_storage),  # noqa: B008
+    admission: Admission = Depends(get_admission),  # noqa: B008
+) -> StatementUploadResponse:
+    """Store uploaded statement files and queue them for parsing.
+
+    The body is streamed to disk while being hashed, the files are
+    stored under their content digest, and a ``pending`` statement is
+    committed together with its parse job; the response returns before
+    any worker picks the job up, so wait on the status endpoint or its
+    event stream for the outcome.
+
+    Uploads are refused with ``429`` and ``Retry-After`` while too many
+    bytes are being received or too many statements wait to be parsed.
+    """
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data")
+
+    try:
+        async with admission.upload_bytes.reserve(
+            declared_length(request, MAX_REQUEST_BYTES)
+        ):
+            upload = await _receive(content_type, request)
+            try:
+                account_type, account_id = validate_upload(upload)
+                await admission.check_backlog(session, account_id)
+            except (HTTPException, AdmissionRejectedError):
+                await upload.discard()
+                raise
+            await upload.keep(storage)
+    except AdmissionRejectedError as e:
+        raise too_busy(e) from e
+    statement = queue_statement(session, upload, account_type, account_id, storage)
+    await session.commit()
+
+    return upload_response(statement, request.url.path.rstrip("/"))
+
+
+async def _receive(content_type: str, request: Request) -> ReceivedUpload:
+    try:
+        return await receive_upload(
+            content_type, request.stream(), UPLOAD_DIR, max_file_bytes=MAX_FILE_BYTES
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def queue_statement(
+    session: AsyncSession,
+    upload: ReceivedUpload,
+    account_type: str,
+    account_id: UUID,
+    storage: ObjectStorage,
+) -> Statement:
+    """Add a ``pending`` statement for a kept upload, with its parse job.
+
+    The caller commits; the statement and its job go in the same
+    transaction, so a statement is never left without its job.
+
+    Args:
+        session: Primary database session
+        upload: Validated upload whose files have been kept
+        account_type: Account type slug from ``validate_upload``
+        account_id: Account UUID from ``validate_upload``
+        storage: Backend the files were kept in
+
+    Returns:
+        The added statement
+    """
+    pdf = upload.files.get("pdf_file")
+    csv = upload.files.get("csv_file")
+    statement = Statement(
+        id=uuid4(),
+        account_id=account_id,
+        file_pdf_url=storage.location(pdf.key) if pdf else None,
+        file_csv_url=storage.location(csv.key) if csv else None,
+        status="pending",
+        processing_metadata={
+            "account_type": account_type,
+            "uploads": {
+                name: {
+                    "filename": stored.filename,
+                    "size": stored.size,
+                    "sha256": stored.sha256,
+                }
+                for name, stored in upload.files.items()
+            },
+        },
+        uploaded_at=datetime.now(UTC),
+    )
+    session.add(statement)
+    session.add(ParseJob(statement_id=statement.id))
+    return statement
+
+
+def upload_response(
+    statement: Statement, statements_path: str
+) -> StatementUploadResponse:
+    """Describe a queued statement.
+
+    Args:
+        statement: Statement added by ``queue_statement``
+        statements_path: Path of the statements collection, for the
+            progress URL
+    """
+    return StatementUploadResponse(
+        statement_id=statement.id,
+        status=statement.status,
+        uploaded_at=statement.uploaded_at,
+        files=StatementFiles(
+            pdf_url=statement.file_pdf_url, csv_url=statement.file_csv_url
+        ),
+        processing_info=ProcessingInfo(
+            progress_url=f"{statements_path}/{statement.id}/status"
+        ),
+    )
+
+
+async def read_status(
+    session: AsyncSession, statement_id: UUID
+) -> StatementStatusResponse:
+    """Read a statement's processing status.
+
+    Raises:
+        HTTPException: 404 if the statement does not exist
+    """
+    result = await session.execute(
+        select(Statement).where(Statement.id == statement_id)
+    )
+    statement = result.scalars().first()
+    if statement is None:
+        raise HTTPException(status_code=404, detail="Statement not found")
+    return StatementStatusResponse(
+        statement_id=statement.id,
+        status=statement.status,
+        uploaded_at=statement.uploaded_at,
+        processed_at=statement.processed_at,
+        period_start=statement.period_start,
+        period_end=statement.period_end,
+        error=statement.processing_metadata.get("error"),
+    )
+
+
+def _status_broker(request: Request) -> StatusBroker | None:
+    return getattr(request.app.state, "status_broker", None)
+
+
+@router.get("/{statement_id}/status", response_model=StatementStatusResponse)
+async def get_statement_status(
+    statement_id: UUID,
+    request: Request,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_STATUS_WAIT_SECONDS,
+        description="Seconds to hold the request until the status changes",
+    ),
+    # Polled right after an upload, so read from the primary, not a replica
+    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+) -> StatementStatusResponse:
+    """Get the processing status of an uploaded statement.
+
+    With ``wait``, a statement that has not finished is held until its
+    status changes or ``wait`` seconds pass. The change is pushed by a
+    database notification, so the wait itself runs no queries.
+    """
+    broker = _status_broker(request)
+    if not wait or broker is None:
+        return await read_status(session, statement_id)
+
+    with broker.subscribe(statement_id) as events:
+        current = await read_status(session, statement_id)
+        # Give the connection back to the pool for the wait
+        await session.commit()
+        if current.status in TERMINAL_STATUSES:
+            return current
+
+        initial = current.status
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(wait):
+                while current.status == initial:
+                    event = await events.get()
+                    if event is None:
+                        # Notifications may have been missed
+                        current = await read_status(session, statement_id)
+                        await session.commit()
+                    else:
+                        current = StatementStatusResponse.model_validate(event)
+    return current
+
+
+def _status_event(status: StatementStatusResponse) -> str:
+    return f"event: status\ndata: {status.model_dump_json()}\n\n"
+
+
+async def _status_stream(
+    current: StatementStatusResponse,
+    events: asyncio.Queue[StatusEvent],
+    subscription: contextlib.ExitStack,
+) -> AsyncIterator[str]:
+    with subscription:
+        yield _status_event(current)
+        while current.status not in TERMINAL_STATUSES:
+            try:
+                async with asyncio.timeout(STATUS_KEEPALIVE_SECONDS):
+                    event = await events.get()
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if event is None:
+                # Notifications may have been missed
+                async with database.async_session_maker() as session:
+                    latest = await read_status(session, current.statement_id)
+            else:
+                latest = StatementStatusResponse.model_validate(event)
+            if latest.status != current.status:
+                yield _status_event(latest)
+            current = latest
+
+
+@router.get("/{statement_id}/events")
+async def stream_statement_status(
+    statement_id: UUID,
+    request: Request,
+    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+) -> StreamingResponse:
+    """Stream a statement's status changes as server-sent events.
+
+    Each ``status`` event carries the body of the status endpoint,
+    starting with the current status; the stream ends once the statement
+    is ``completed`` or ``failed``.
+    """
+    broker = _status_broker(request)
+    if broker is None:
+        raise HTTPException(
+            status_code=503, detail="Status notifications are unavailable"
+        )
+
+    with contextlib.ExitStack() as stack:
+        events = stack.enter_context(broker.subscribe(statement_id))
+        current = await read_status(session, statement_id)
+        subscription = stack.pop_all()
+
+    stream = _status_stream(current, events, subscription)
+    # A stream the server never starts is never closed; unsubscribe when dropped
+    weakref.finalize(stream, subscription.close)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
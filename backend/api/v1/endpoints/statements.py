@@ -0,0 +1,304 @@
+"""Statement query endpoints for Ledgerly API."""
+
+from collections.abc import Sequence
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from api.v1.pagination import CursorPage
+from api.v1.pagination import build_page
+from api.v1.pagination import decode_cursor
+from api.v1.pagination import seek
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+import database
+from models.orm import Account
+from models.orm import CreditCardDetail
+from models.orm import Statement
+from models.orm import StatementDetail
+from models.orm import Transaction
+
+
+router = APIRouter()
+
+
+class StatementFiles(BaseModel):
+    """Stored source files of a statement."""
+
+    pdf_url: str | None
+    csv_url: str | None
+
+
+class StatementItem(BaseModel):
+    """Statement as returned by list endpoints."""
+
+    id: UUID
+    account_id: UUID
+    period_start: date | None
+    period_end: date | None
+    uploaded_at: datetime
+    processed_at: datetime | None
+    status: str
+    files: StatementFiles
+
+
+class StatementListResponse(BaseModel):
+    """A page of statements."""
+
+    statements: list[StatementItem]
+    pagination: CursorPage
+
+
+class StatementWithInstitution(StatementItem):
+    """Statement together with the institution of its account."""
+
+    institution_id: UUID
+
+
+class StatementDetailItem(BaseModel):
+    """Balance and payment information of a statement."""
+
+    id: UUID
+    statement_id: UUID
+    previous_balance: float | None
+    new_balance: float | None
+    minimum_payment: float | None
+    due_date: date | None
+
+
+class CreditCardDetailItem(BaseModel):
+    """Credit card information of a statement."""
+
+    id: UUID
+    account_id: UUID
+    statement_id: UUID
+    credit_limit: float | None
+    available_credit: float | None
+    points_earned: int
+    points_redeemed: int
+    cash_advances: float
+    fees: float
+    purchases: float
+    credits: float
+
+
+class StatementSummary(BaseModel):
+    """Transaction totals of a statement."""
+
+    transaction_count: int = 0
+    total_credits: float = 0.0
+    total_debits: float = 0.0
+    net_amount: float = 0.0
+    categories: dict[str, float] = {}
+
+
+class StatementResponse(BaseModel):
+    """A statement with its details and transaction summary."""
+
+    statement: StatementWithInstitution
+    details: StatementDetailItem | None
+    credit_card_details: CreditCardDetailItem | None
+    summary: StatementSummary
+
+
+def _optional_float(value: Decimal | None) -> float | None:
+    return None if value is None else float(value)
+
+
+def statement_detail_item(detail: StatementDetail) -> StatementDetailItem:
+    """Convert a StatementDetail row to its API representation."""
+    return StatementDetailItem(
+        id=detail.id,
+        statement_id=detail.statement_id,
+        previous_balance=_optional_float(detail.previous_balance),
+        new_balance=_optional_float(detail.new_balance),
+        minimum_payment=_optional_float(detail.minimum_payment),
+        due_date=detail.due_date,
+    )
+
+
+def credit_card_detail_item(detail: CreditCardDetail) -> CreditCardDetailItem:
+    """Convert a CreditCardDetail row to its API representation."""
+    return CreditCardDetailItem(
+        id=detail.id,
+        account_id=detail.account_id,
+        statement_id=detail.statement_id,
+        credit_limit=_optional_float(detail.credit_limit),
+        available_credit=_optional_float(detail.available_credit),
+        points_earned=detail.points_earned,
+        points_redeemed=detail.points_redeemed,
+        cash_advances=float(detail.cash_advances),
+        fees=float(detail.fees),
+        purchases=float(detail.purchases),
+        credits=float(detail.credits),
+    )
+
+
+def statement_item(statement: Statement) -> StatementItem:
+    """Convert a Statement row to its API representation."""
+    return StatementItem(
+        id=statement.id,
+        account_id=statement.account_id,
+        period_start=statement.period_start,
+        period_end=statement.period_end,
+        uploaded_at=statement.uploaded_at,
+        processed_at=statement.processed_at,
+        status=statement.status,
+        files=StatementFiles(
+            pdf_url=statement.file_pdf_url, csv_url=statement.file_csv_url
+        ),
+    )
+
+
+def statements_query(
+    *,
+    account_id: UUID | None = None,
+    institution_id: UUID | None = None,
+    period_start: date | None = None,
+    period_end: date | None = None,
+    status: str | None = None,
+) -> Select[Statement]:
+    """Build the filtered statements query (without ordering or paging)."""
+    query = select(Statement)
+    if account_id is not None:
+        query = query.where(Statement.account_id == account_id)
+    if institution_id is not None:
+        query = query.where(
+            Statement.account_id.in_(
+                select(Account.id).where(Account.institution_id == institution_id)
+            )
+        )
+    if period_start is not None:
+        query = query.where(Statement.period_start >= period_start)
+    if period_end is not None:
+        query = query.where(Statement.period_end <= period_end)
+    if status is not None:
+        query = query.where(Statement.status == status)
+    return query
+
+
+@router.get("/", response_model=StatementListResponse)
+async def list_statements(  # noqa: PLR0917
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    account_id: UUID | None = None,
+    institution_id: UUID | None = None,
+    period_start: date | None = None,
+    period_end: date | None = None,
+    status: str | None = None,
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+) -> StatementListResponse:
+    """List statements newest upload first, one keyset page at a time."""
+    after = decode_cursor(cursor, datetime.fromisoformat) if cursor else None
+    query = seek(
+        statements_query(
+            account_id=account_id,
+            institution_id=institution_id,
+            period_start=period_start,
+            period_end=period_end,
+            status=status,
+        ),
+        Statement.uploaded_at,
+        Statement.id,
+        after,
+        limit,
+    )
+    result = await session.execute(query)
+    rows, page = build_page(
+        result.scalars().all(), limit, lambda row: (row.uploaded_at, row.id)
+    )
+    return StatementListResponse(
+        statements=[statement_item(row) for row in rows], pagination=page
+    )
+
+
+def statement_with_details_query(statement_id: UUID) -> Select[Statement]:
+    """Load a statement with its account and one-to-one details in one query.
+
+    Relationships raise on lazy access, so everything the response reads
+    is loaded here. Transactions are summarized in SQL instead of loaded.
+    """
+    return (
+        select(Statement)
+        .where(Statement.id == statement_id)
+        .options(
+            joinedload(Statement.account),
+            joinedload(Statement.statement_detail),
+            joinedload(Statement.credit_card_detail),
+        )
+    )
+
+
+def statement_summary_query(
+    statement_id: UUID,
+) -> Select[str, int, Decimal, Decimal, Decimal]:
+    """Per-category transaction count, net total, credits and debits."""
+    category = func.coalesce(Transaction.category, "uncategorized")
+    amount = Transaction.amount
+    return (
+        select(
+            category,
+            func.count(),
+            func.sum(amount),
+            func.sum(case((amount > 0, amount), else_=0)),
+            func.sum(case((amount < 0, amount), else_=0)),
+        )
+        .where(Transaction.statement_id == statement_id)
+        .group_by(category)
+    )
+
+
+def build_summary(
+    rows: Sequence[tuple[str, int, Decimal, Decimal, Decimal]],
+) -> StatementSummary:
+    """Fold per-category totals into a statement summary.
+
+    Credits and debits are summed per transaction in SQL, so a category
+    holding both charges and refunds contributes to each side.
+    """
+    summary = StatementSummary()
+    for category, count, total, credit, debit in rows:
+        summary.transaction_count += count
+        summary.categories[category] = float(total)
+        summary.total_credits += float(credit)
+        summary.total_debits += float(debit)
+    summary.net_amount = summary.total_credits + summary.total_debits
+    return summary
+
+
+@router.get("/{statement_id}", response_model=StatementResponse)
+async def get_statement(
+    statement_id: UUID,
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+) -> StatementResponse:
+    """Get a statement with its details and transaction summary."""
+    result = await session.execute(statement_with_details_query(statement_id))
+    statement = result.scalars().first()
+    if statement is None:
+        raise HTTPException(status_code=404, detail="Statement not found")
+
+    summary = await session.execute(statement_summary_query(statement_id))
+    return StatementResponse(
+        statement=StatementWithInstitution(
+            **statement_item(statement).model_dump(),
+            institution_id=statement.account.institution_id,
+        ),
+        details=statement_detail_item(statement.statement_detail)
+        if statement.statement_detail
+        else None,
+        credit_card_details=credit_card_detail_item(statement.credit_card_detail)
+        if statement.credit_card_detail
+        else None,
+        summary=build_summary(summary.tuples().all()),
+    )
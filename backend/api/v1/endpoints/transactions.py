@@ -0,0 +1,235 @@
+"""Transaction query endpoints for Ledgerly API."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Annotated
+from typing import Literal
+from uuid import UUID
+
+from api.v1.pagination import CursorPage
+from api.v1.pagination import build_page
+from api.v1.pagination import decode_cursor
+from api.v1.pagination import seek
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Query
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import database
+from models.orm import Transaction
+
+
+router = APIRouter()
+
+TransactionType = Literal["debit", "credit", "payment", "refund"]
+
+
+class TransactionItem(BaseModel):
+    """Transaction as returned by list endpoints."""
+
+    id: UUID
+    statement_id: UUID
+    account_id: UUID
+    date: date
+    amount: float
+    description: str
+    custom_description: str | None
+    category: str | None
+    type: str
+
+
+class TransactionListResponse(BaseModel):
+    """A page of transactions."""
+
+    transactions: list[TransactionItem]
+    pagination: CursorPage
+
+
+class TransactionSearchItem(TransactionItem):
+    """Transaction matched by a search, with its similarity to the query."""
+
+    score: float
+
+
+class TransactionSearchResponse(BaseModel):
+    """Best matches for a search query."""
+
+    query: str
+    transactions: list[TransactionSearchItem]
+
+
+def transaction_item(transaction: Transaction) -> TransactionItem:
+    """Convert a Transaction row to its API representation."""
+    return TransactionItem(
+        id=transaction.id,
+        statement_id=transaction.statement_id,
+        account_id=transaction.account_id,
+        date=transaction.transaction_date,
+        amount=float(transaction.amount),
+        description=transaction.description,
+        custom_description=transaction.custom_description,
+        category=transaction.category,
+        type=transaction.transaction_type,
+    )
+
+
+def transactions_query(
+    *,
+    statement_id: UUID | None = None,
+    account_id: UUID | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    category: str | None = None,
+    transaction_type: str | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+) -> Select[Transaction]:
+    """Build the filtered transactions query (without ordering or paging).
+
+    Date bounds are applied to ``transaction_date`` directly so the
+    planner can prune monthly partitions outside the range.
+    """
+    query = select(Transaction)
+    if statement_id is not None:
+        query = query.where(Transaction.statement_id == statement_id)
+    if account_id is not None:
+        query = query.where(Transaction.account_id == account_id)
+    if date_from is not None:
+        query = query.where(Transaction.transaction_date >= date_from)
+    if date_to is not None:
+        query = query.where(Transaction.transaction_date <= date_to)
+    if category is not None:
+        query = query.where(Transaction.category == category)
+    if transaction_type is not None:
+        query = query.where(Transaction.transaction_type == transaction_type)
+    if min_amount is not None:
+        query = query.where(Transaction.amount >= min_amount)
+    if max_amount is not None:
+        query = query.where(Transaction.amount <= max_amount)
+    return query
+
+
+def search_score(q: str) -> ColumnElement[float]:
+    """Similarity of the better matching description column to a query."""
+    return func.greatest(
+        func.similarity(Transaction.description, q),
+        func.coalesce(func.similarity(Transaction.custom_description, q), 0),
+    )
+
+
+def search_query(
+    q: str,
+    *,
+    account_id: UUID | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    limit: int = 20,
+) -> Select[Transaction, float]:
+    """Build a similarity-ranked search over both description columns.
+
+    The ``%`` operator is what the trigram GIN indexes answer, so each
+    column is matched with it and the two index scans are OR-ed together
+    before ranking; ``similarity()`` alone would scan every row. Account
+    and date filters sit in the same WHERE clause so they are applied
+    during the scan and the date bounds prune partitions.
+    """
+    score = search_score(q).label("score")
+    query = select(Transaction, score).where(
+        or_(
+            Transaction.description.op("%")(q),
+            Transaction.custom_description.op("%")(q),
+        )
+    )
+    if account_id is not None:
+        query = query.where(Transaction.account_id == account_id)
+    if date_from is not None:
+        query = query.where(Transaction.transaction_date >= date_from)
+    if date_to is not None:
+        query = query.where(Transaction.transaction_date <= date_to)
+    return query.order_by(
+        score.desc(), Transaction.transaction_date.desc(), Transaction.id.desc()
+    ).limit(limit)
+
+
+@router.get("/search", response_model=TransactionSearchResponse)
+async def search_transactions(  # noqa: PLR0917
+    q: str = Query(..., min_length=3, max_length=200),
+    threshold: float = Query(0.3, ge=0.05, le=1.0),
+    limit: int = Query(20, ge=1, le=100),
+    account_id: UUID | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+) -> TransactionSearchResponse:
+    """Fuzzy-search transaction descriptions, best matches first."""
+    # The % operator compares against this setting; scope it to the request
+    await session.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)},
+    )
+    result = await session.execute(
+        search_query(
+            q,
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+        )
+    )
+    return TransactionSearchResponse(
+        query=q,
+        transactions=[
+            TransactionSearchItem(
+                **transaction_item(row.Transaction).model_dump(), score=row.score
+            )
+            for row in result.all()
+        ],
+    )
+
+
+@router.get("/", response_model=TransactionListResponse)
+async def list_transactions(  # noqa: PLR0917
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    statement_id: UUID | None = None,
+    account_id: UUID | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    category: str | None = None,
+    transaction_type: Annotated[TransactionType | None, Query(alias="type")] = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    session: AsyncSession = Depends(database.get_read_session),  # noqa: B008
+) -> TransactionListResponse:
+    """List transactions newest first, one keyset page at a time."""
+    after = decode_cursor(cursor, date.fromisoformat) if cursor else None
+    query = seek(
+        transactions_query(
+            statement_id=statement_id,
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
+            category=category,
+            transaction_type=transaction_type,
+            min_amount=min_amount,
+            max_amount=max_amount,
+        ),
+        Transaction.transaction_date,
+        Transaction.id,
+        after,
+        limit,
+    )
+    result = await session.execute(query)
+    rows, page = build_page(
+        result.scalars().all(), limit, lambda row: (row.transaction_date, row.id)
+    )
+    return TransactionListResponse(
+        transactions=[transaction_item(row) for row in rows], pagination=page
+    )
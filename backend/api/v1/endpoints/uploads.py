@@ -0,0 +1,363 @@
+"""Resumable chunked upload endpoints for Ledgerly API.
+
+Large statement PDFs and zip archives of many statements are sent in
+chunks: create a session, ``PUT`` each chunk at its offset (in any order,
+in parallel, retrying any that fail), then complete the session to queue
+its statements for parsing. ``GET`` on the session lists the chunks
+still missing, so an interrupted upload resumes where it stopped.
+"""
+
+import base64
+import binascii
+import os
+import re
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from api.v1.endpoints.parse import MAX_FILE_BYTES
+from api.v1.endpoints.parse import UPLOAD_DIR
+from api.v1.endpoints.parse import StatementUploadResponse
+from api.v1.endpoints.parse import declared_length
+from api.v1.endpoints.parse import queue_statement
+from api.v1.endpoints.parse import too_busy
+from api.v1.endpoints.parse import upload_response
+from api.v1.endpoints.parse import validate_upload
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Header
+from fastapi import HTTPException
+from fastapi import Request
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import database
+from services.admission import Admission
+from services.admission import AdmissionRejectedError
+from services.admission import get_admission
+from services.normalization import get_account_uuid
+from services.storage import ObjectStorage
+from services.storage import content_key
+from services.storage import get_storage
+from services.uploads import ArchiveContents
+from services.uploads import ChunkedUploads
+from services.uploads import ChunkError
+from services.uploads import IncompleteUploadError
+from services.uploads import ReceivedUpload
+from services.uploads import StoredFile
+from services.uploads import UploadError
+from services.uploads import UploadSession
+from services.uploads import UploadSessionNotFoundError
+from services.uploads import UploadTooLargeError
+from services.uploads import count_statements
+from services.uploads import extract_statements
+
+
+router = APIRouter()
+
+MB = 1024 * 1024
+# Keep the spool on the upload directory's filesystem: locally, completion is a rename
+UPLOAD_SPOOL_DIR = Path(os.getenv("UPLOAD_SPOOL_DIR", str(UPLOAD_DIR / ".chunks")))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_SIZE_MB", "8")) * MB
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_SIZE_MB", "500")) * MB
+UPLOAD_SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24")) * 3600
+
+SHA256_BYTES = 32
+
+ARCHIVE_SUFFIX = ".zip"
+UPLOAD_SUFFIXES = (".pdf", ARCHIVE_SUFFIX)
+
+# RFC 9530: Content-Digest: sha-256=:<base64 digest>:
+_SHA256_DIGEST_RE = re.compile(r"(?:^|,)\s*sha-256=:([A-Za-z0-9+/]+={0,2}):")
+
+chunked_uploads = ChunkedUploads(
+    UPLOAD_SPOOL_DIR,
+    chunk_size=UPLOAD_CHUNK_BYTES,
+    max_upload_bytes=MAX_UPLOAD_BYTES,
+    ttl_seconds=UPLOAD_SESSION_TTL_SECONDS,
+)
+
+
+class UploadCreateRequest(BaseModel):
+    """A file about to be sent in chunks."""
+
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(gt=0, description="Exact file size in bytes")
+    account_type: str
+    sha256: str | None = Field(
+        None,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description="Hex SHA-256 of the whole file, checked at completion",
+    )
+
+
+class UploadSessionResponse(BaseModel):
+    """State of a chunked upload."""
+
+    upload_id: str
+    filename: str
+    size: int
+    chunk_size: int
+    received_bytes: int
+    missing_offsets: list[int]
+    expires_at: datetime
+
+
+class UploadCompleteResponse(BaseModel):
+    """Statements queued from a completed upload."""
+
+    statements: list[StatementUploadResponse]
+    skipped: list[str]
+
+
+async def _session_response(session: UploadSession) -> UploadSessionResponse:
+    received = set(await chunked_uploads.received(session))
+    return UploadSessionResponse(
+        upload_id=session.id,
+        filename=session.filename,
+        size=session.size,
+        chunk_size=session.chunk_size,
+        received_bytes=sum(session.chunk_length(index) for index in received),
+        missing_offsets=[
+            index * session.chunk_size
+            for index in range(session.chunk_count)
+            if index not in received
+        ],
+        expires_at=datetime.fromtimestamp(
+            session.created_at + chunked_uploads.ttl_seconds, UTC
+        ),
+    )
+
+
+async def _get_session(upload_id: UUID) -> UploadSession:
+    try:
+        return await chunked_uploads.get(upload_id.hex)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+def _chunk_digest(content_digest: str | None) -> bytes:
+    match = _SHA256_DIGEST_RE.search(content_digest or "")
+    if match is None:
+        raise HTTPException(
+            status_code=400,
+            detail="A Content-Digest header with a sha-256 digest is required",
+        )
+    try:
+        digest = base64.b64decode(match.group(1), validate=True)
+    except binascii.Error:
+        digest = b""
+    if len(digest) != SHA256_BYTES:
+        raise HTTPException(status_code=400, detail="Malformed sha-256 digest")
+    return digest
+
+
+def _account_id(account_type: str) -> UUID:
+    try:
+        return get_account_uuid(account_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.post("/", status_code=201, response_model=UploadSessionResponse)
+async def create_upload(
+    body: UploadCreateRequest,
+    db_session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+    admission: Admission = Depends(get_admission),  # noqa: B008
+) -> UploadSessionResponse:
+    """Open a chunked upload of a statement PDF or a zip of statements.
+
+    Send the file as ``chunk_size`` chunks to the chunk endpoint, at the
+    offsets listed in ``missing_offsets``, then complete the upload.
+    While too many statements wait to be parsed, uploads are refused with
+    ``429`` and ``Retry-After`` before any chunk is sent.
+    """
+    suffix = Path(body.filename).suffix.lower()
+    if suffix not in UPLOAD_SUFFIXES:
+        raise HTTPException(
+            status_code=400, detail="Upload a .pdf statement or a .zip of statements"
+        )
+    if suffix != ARCHIVE_SUFFIX and body.size > MAX_FILE_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"pdf_file exceeds the {MAX_FILE_BYTES // MB}MB limit",
+        )
+    try:
+        await admission.check_backlog(db_session, _account_id(body.account_type))
+    except AdmissionRejectedError as e:
+        raise too_busy(e) from e
+
+    try:
+        session = await chunked_uploads.create(
+            body.filename,
+            body.size,
+            fields={"account_type": body.account_type},
+            sha256=body.sha256,
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
+    return await _session_response(session)
+
+
+@router.get("/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload(upload_id: UUID) -> UploadSessionResponse:
+    """Get the chunks an upload has received and the ones it still needs."""
+    session = await _get_session(upload_id)
+    try:
+        return await _session_response(session)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.put("/{upload_id}/chunks/{offset}", status_code=204)
+async def put_chunk(
+    upload_id: UUID,
+    offset: int,
+    request: Request,
+    content_digest: str | None = Header(None),
+    admission: Admission = Depends(get_admission),  # noqa: B008
+) -> Response:
+    """Write one chunk of an upload at its byte offset.
+
+    The body must be exactly the chunk at ``offset`` and carry its
+    checksum as ``Content-Digest: sha-256=:<base64>:``; a chunk that does
+    not match is rejected and can be sent again, as can one refused with
+    ``429`` while too many bytes are being received.
+    """
+    digest = _chunk_digest(content_digest)
+    session = await _get_session(upload_id)
+    try:
+        async with admission.upload_bytes.reserve(
+            declared_length(request, session.chunk_size)
+        ):
+            await chunked_uploads.write_chunk(session, offset, request.stream(), digest)
+    except AdmissionRejectedError as e:
+        raise too_busy(e) from e
+    except ChunkError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return Response(status_code=204)
+
+
+async def _statement_count(session: UploadSession, path: Path) -> int:
+    if Path(session.filename).suffix.lower() != ARCHIVE_SUFFIX:
+        return 1
+    try:
+        return await count_statements(path)
+    except UploadError:
+        # Reported with the archive's other errors when it is unpacked
+        return 1
+
+
+async def _unpack(session: UploadSession, path: Path, sha256: str) -> ArchiveContents:
+    if Path(session.filename).suffix.lower() == ARCHIVE_SUFFIX:
+        try:
+            return await extract_statements(
+                path, UPLOAD_DIR, fields=session.fields, max_file_bytes=MAX_FILE_BYTES
+            )
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e)) from e
+        except UploadError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    upload = ReceivedUpload(fields=dict(session.fields))
+    # Kept straight from the spool file: locally a rename, never a copy
+    upload.add_file(
+        StoredFile(
+            field="pdf_file",
+            filename=session.filename,
+            key=content_key(sha256, ".pdf"),
+            size=session.size,
+            sha256=sha256,
+        ),
+        path,
+    )
+    return ArchiveContents(uploads=[upload])
+
+
+@router.post(
+    "/{upload_id}/complete", status_code=202, response_model=UploadCompleteResponse
+)
+async def complete_upload(
+    upload_id: UUID,
+    request: Request,
+    session: AsyncSession = Depends(database.get_async_session),  # noqa: B008
+    storage: ObjectStorage = Depends(get_storage),  # noqa: B008
+    admission: Admission = Depends(get_admission),  # noqa: B008
+) -> UploadCompleteResponse:
+    """Assemble a fully received upload and queue its statements for parsing.
+
+    A PDF becomes one statement. A zip archive becomes one statement per
+    PDF it contains, paired with a transaction CSV of the same name when
+    there is one; files that cannot be queued are listed in ``skipped``.
+    The upload session is closed either way, unless completion is refused
+    with ``429`` because its statements, every PDF of an archive, would
+    take the parse queue past its limits; then it can be completed again
+    after ``Retry-After``.
+    """
+    upload = await _get_session(upload_id)
+    account_id = _account_id(upload.fields["account_type"])
+    try:
+        path, sha256 = await chunked_uploads.complete(upload)
+    except IncompleteUploadError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    # Checked once the file is whole, so an archive counts all its statements
+    try:
+        await admission.check_backlog(
+            session, account_id, new_jobs=await _statement_count(upload, path)
+        )
+    except AdmissionRejectedError as e:
+        await chunked_uploads.release(upload)
+        raise too_busy(e) from e
+    except Exception:
+        # Nothing was queued, so the upload can be completed again
+        await chunked_uploads.release(upload)
+        raise
+
+    try:
+        contents = await _unpack(upload, path, sha256)
+        statements = []
+        for received in contents.uploads:
+            try:
+                account_type, account_id = validate_upload(received)
+            except HTTPException as e:
+                await received.discard()
+                filenames = ", ".join(f.filename for f in received.files.values())
+                contents.skipped.append(f"{filenames}: {e.detail}")
+                continue
+            await received.keep(storage)
+            statements.append(
+                queue_statement(session, received, account_type, account_id, storage)
+            )
+        if not statements:
+            raise HTTPException(
+                status_code=422,
+                detail=f"No statements to queue in {upload.filename}: "
+                + "; ".join(contents.skipped),
+            )
+        await session.commit()
+    finally:
+        await chunked_uploads.delete(upload.id)
+
+    statements_path = request.app.url_path_for("upload_statement").rstrip("/")
+    return UploadCompleteResponse(
+        statements=[
+            upload_response(statement, statements_path) for statement in statements
+        ],
+        skipped=contents.skipped,
+    )
+
+
+@router.delete("/{upload_id}", status_code=204)
+async def delete_upload(upload_id: UUID) -> Response:
+    """Abandon an upload and delete its chunks."""
+    await _get_session(upload_id)
+    await chunked_uploads.delete(upload_id.hex)
+    return Response(status_code=204)
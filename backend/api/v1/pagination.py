@@ -0,0 +1,122 @@
+"""Keyset (seek) pagination helpers for list endpoints.
+
+Lists are ordered newest first by a sort column plus ``id`` as a
+tie-breaker. Instead of an ``OFFSET``, each page ends with an opaque
+cursor holding the last row's (sort value, id); the next page asks for
+rows strictly after that pair, which the database answers with an index
+range scan, so page N costs the same as page 1.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+from typing import TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi import status
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+T = TypeVar("T")
+S = TypeVar("S", bound=Select[Any])
+
+
+class CursorPage(BaseModel):
+    """Pagination block returned alongside a page of results."""
+
+    limit: int
+    next_cursor: str | None = None
+    has_next: bool = False
+
+
+def encode_cursor(position: date, row_id: UUID) -> str:
+    """Encode a row's sort value and id as an opaque cursor.
+
+    Args:
+        position: Sort column value (a date or datetime)
+        row_id: Row id used as tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([position.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse: Callable[[str], T]) -> tuple[T, UUID]:  # noqa: UP047
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor from a previous page
+        parse: Parser for the sort value (e.g. ``date.fromisoformat``)
+
+    Returns:
+        (sort value, id) of the last row on the previous page
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return parse(position), UUID(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from e
+
+
+def seek(  # noqa: UP047
+    query: S,
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[UUID],
+    after: tuple[Any, UUID] | None,
+    limit: int,
+) -> S:
+    """Order a query newest first and restrict it to one page.
+
+    One extra row is fetched so ``build_page`` can tell whether another
+    page follows without a ``COUNT``.
+
+    Args:
+        query: Filtered query
+        sort_column: Column the list is ordered by
+        id_column: Unique tie-breaker column
+        after: Decoded cursor of the previous page
+        limit: Page size
+
+    Returns:
+        Query for at most ``limit + 1`` rows
+    """
+    if after is not None:
+        query = query.where(tuple_(sort_column, id_column) < tuple_(*after))
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def build_page(  # noqa: UP047
+    rows: Sequence[T], limit: int, position: Callable[[T], tuple[date, UUID]]
+) -> tuple[list[T], CursorPage]:
+    """Trim the extra row fetched by ``seek`` and build the next cursor.
+
+    Args:
+        rows: Rows returned by the seek query
+        limit: Page size
+        position: Returns a row's (sort value, id)
+
+    Returns:
+        Rows of this page and its pagination block
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, CursorPage(limit=limit)
+    return items, CursorPage(
+        limit=limit, next_cursor=encode_cursor(*position(items[-1])), has_next=True
+    )
@@ -1,21 +1,37 @@
 """FastAPI application for Ledgerly backend."""
 
+import asyncio
 import logging
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from api.v1 import api_router
 from fastapi import FastAPI
+from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 
+import database
+from services.admission import Admission
+from services.admission import get_admission
+from services.analytics import AnalyticsCache
+from services.analytics import get_analytics_cache
+from services.jobs import JOBS_CHANNEL
+from services.jobs import STATUS_CHANNEL
+from services.jobs import NotificationListener
+from services.jobs import ParseJobWorker
+from services.jobs import StatusBroker
+from services.parsers.worker_pool import ParserPool
 from services.secure_vault.config_manager import initialize_config
+from services.storage import get_storage
 
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager with SecureVault initialization."""
     logger.info("Starting Ledgerly backend application...")
 
@@ -33,9 +49,60 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         logger.exception("Failed to initialize configuration")
         raise
 
+    # Uploaded files are kept by one backend (STORAGE_BACKEND), read back by
+    # the parsers
+    storage = get_storage()
+    await storage.ensure_ready()
+
+    # Upload bytes in flight, queued jobs and concurrent parses are bounded
+    admission = get_admission()
+    app.state.admission = admission
+
+    # Analytics responses are cached until an import bumps the data version
+    app.state.analytics_cache = get_analytics_cache()
+
+    # Parsers run in warm worker processes, never on the event loop
+    parser_pool = ParserPool.from_env()
+    await parser_pool.start()
+    app.state.parser_pool = parser_pool
+
+    # Parse jobs are claimed from the database queue; dedicated
+    # cli/parse_worker.py processes can take over with PARSE_JOBS_IN_API=false
+    parse_worker = None
+    parse_worker_task = None
+    if os.getenv("PARSE_JOBS_IN_API", "true").lower() != "false":
+        parse_worker = ParseJobWorker(
+            database.async_session_maker,
+            parser_pool,
+            storage=storage,
+            concurrency=admission.limits.max_concurrent_parses,
+        )
+        parse_worker_task = asyncio.create_task(parse_worker.run())
+    app.state.parse_worker = parse_worker
+
+    # One LISTEN connection per process pushes new jobs to the worker and
+    # status changes to waiting clients; missed events are caught up on
+    # every reconnect
+    status_broker = StatusBroker()
+    listener = NotificationListener(database.db.database_url)
+    listener.add_handler(STATUS_CHANNEL, status_broker.publish)
+    listener.on_connect(status_broker.resync)
+    if parse_worker is not None:
+        listener.add_handler(JOBS_CHANNEL, lambda _job_id: parse_worker.wake())
+        listener.on_connect(parse_worker.wake)
+    await listener.start()
+    app.state.status_broker = status_broker
+    app.state.notification_listener = listener
+
     yield
 
     logger.info("Shutting down Ledgerly backend application...")
+    await listener.stop()
+    if parse_worker is not None and parse_worker_task is not None:
+        parse_worker.stop()
+        await parse_worker_task
+    await parser_pool.shutdown()
+    await database.dispose()
 
 
 app = FastAPI(
@@ -74,3 +141,31 @@ async def health() -> dict[str, str]:
 async def api_status() -> dict[str, str]:
     """API status endpoint for frontend connectivity test."""
     return {"api": "online", "version": "1.0.0"}
+
+
+@app.get("/metrics")
+async def metrics(request: Request) -> dict[str, Any]:
+    """Runtime metrics: pools, workers, jobs, notifications, admission, caches."""
+    parser_pool: ParserPool | None = getattr(request.app.state, "parser_pool", None)
+    parse_worker: ParseJobWorker | None = getattr(
+        request.app.state, "parse_worker", None
+    )
+    listener: NotificationListener | None = getattr(
+        request.app.state, "notification_listener", None
+    )
+    status_broker: StatusBroker | None = getattr(
+        request.app.state, "status_broker", None
+    )
+    admission: Admission | None = getattr(request.app.state, "admission", None)
+    analytics_cache: AnalyticsCache | None = getattr(
+        request.app.state, "analytics_cache", None
+    )
+    return {
+        "database_pools": database.pool_stats_snapshot(),
+        "parser_pool": parser_pool.stats() if parser_pool else None,
+        "parse_jobs": parse_worker.stats() if parse_worker else None,
+        "notifications": listener.stats() if listener else None,
+        "status_waiters": status_broker.stats() if status_broker else None,
+        "admission": admission.stats() if admission else None,
+        "analytics_cache": analytics_cache.stats() if analytics_cache else None,
+    }
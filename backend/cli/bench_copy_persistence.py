@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Benchmark COPY-based statement persistence against a live PostgreSQL.
+
+Creates a throwaway user and credit card account, saves synthetic
+statements through ``save_statement`` and reports transactions per
+second; ``--reimport`` then imports them again through the idempotent
+upsert path. The fixture user is deleted afterwards, which cascades to every
+row the benchmark wrote. Requires a migrated and seeded database.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import date
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+from uuid import uuid4
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from seeds import ACCOUNT_TYPE_IDS
+from seeds import INSTITUTION_IDS
+from sqlalchemy import delete
+
+import database
+from models.orm import Account
+from models.orm import User
+from services.persistence import import_statement
+from services.persistence import save_statement
+
+
+TRANSACTION_TYPES = ("debit", "credit", "payment", "refund")
+
+
+def console_output(message: str) -> None:
+    """Output message to console."""
+    sys.stdout.write(f"{message}\n")
+    sys.stdout.flush()
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark COPY-based persistence of parsed statements"
+    )
+    parser.add_argument(
+        "--statements",
+        type=int,
+        default=20,
+        help="Number of statements to save",
+    )
+    parser.add_argument(
+        "--transactions",
+        type=int,
+        default=10_000,
+        help="Transactions per statement",
+    )
+    parser.add_argument(
+        "--reimport",
+        action="store_true",
+        help="Re-import every statement unchanged and report the upsert cost",
+    )
+    return parser
+
+
+def synthetic_results(account_id: UUID, index: int, count: int) -> dict[str, Any]:
+    """Build a parse result with ``count`` transactions for one month."""
+    statement_id = uuid4()
+    period_start = date(2000, 1, 1) + timedelta(days=31 * index)
+    period_end = period_start + timedelta(days=30)
+    return {
+        "statement_data": {
+            "id": statement_id,
+            "account_id": account_id,
+            "period_start": period_start,
+            "period_end": period_end,
+        },
+        "transactions": [
+            {
+                "id": uuid4(),
+                "statement_id": statement_id,
+                "account_id": account_id,
+                "date": period_start + timedelta(days=i % 30),
+                "amount": -round(1 + (i % 50_000) / 100, 2),
+                "description": f"BENCHMARK MERCHANT {i % 997}",
+                "type": TRANSACTION_TYPES[i % len(TRANSACTION_TYPES)],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+async def create_fixture_account() -> tuple[UUID, UUID]:
+    """Insert a throwaway user and account, returning their IDs."""
+    user = User(
+        email=f"bench-{uuid4().hex}@example.com",
+        password_hash="benchmark",  # noqa: S106  # pragma: allowlist secret
+    )
+    async with database.async_session_maker() as session, session.begin():
+        session.add(user)
+        await session.flush()
+        account = Account(
+            user_id=user.id,
+            institution_id=INSTITUTION_IDS["citi"],
+            account_type_id=ACCOUNT_TYPE_IDS["credit_card"],
+            account_number_hash=uuid4().hex,
+            nickname="COPY benchmark",
+        )
+        session.add(account)
+        await session.flush()
+        return user.id, account.id
+
+
+async def delete_fixture_user(user_id: UUID) -> None:
+    """Delete the fixture user and everything that cascades from it."""
+    async with database.async_session_maker() as session, session.begin():
+        await session.execute(delete(User).where(User.id == user_id))
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """Save synthetic statements and report throughput."""
+    user_id, account_id = await create_fixture_account()
+    try:
+        payloads = [
+            synthetic_results(account_id, index, args.transactions)
+            for index in range(args.statements)
+        ]
+        total = 0
+        started = time.perf_counter()
+        for results in payloads:
+            persisted = await save_statement(
+                database.async_session_maker,
+                results,
+                file_csv_url="benchmark.csv",
+            )
+            total += persisted.transaction_count
+        elapsed = time.perf_counter() - started
+
+        if args.reimport:
+            reimport_started = time.perf_counter()
+            for results in payloads:
+                await import_statement(
+                    database.async_session_maker,
+                    results,
+                    file_csv_url="benchmark.csv",
+                )
+            reimport_elapsed = time.perf_counter() - reimport_started
+    finally:
+        await delete_fixture_user(user_id)
+        await database.dispose()
+
+    console_output(
+        f"💾 {total:,} transactions in {args.statements} statements "
+        f"in {elapsed:.2f}s ({total / elapsed:,.0f} transactions/s)"
+    )
+    if args.reimport:
+        console_output(
+            f"🔁 Unchanged re-import: {reimport_elapsed * 1000 / args.statements:.1f} ms "
+            "per statement"
+        )
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    database.configure("cli")
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Compare transaction index sets on bulk insert and query cost.
+
+For each index set a scratch table shaped like ``transactions`` is
+created with only that set's indexes, filled with synthetic rows through
+COPY in statement-sized batches, analyzed, and then queried with the
+shapes the API and imports run. The report shows insert throughput,
+total index size and the median latency of every query shape, which is
+how the composite and partial indexes in ``models/orm/transaction.py``
+were chosen. The scratch table is dropped afterwards; no application
+data is read or written.
+
+The scratch table is not partitioned, so absolute timings are those of a
+single partition holding every month.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+from uuid import uuid4
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncpg
+
+import database
+from services.persistence.partitions import add_months
+
+
+TABLE = "transactions_index_bench"
+
+COLUMNS = (
+    "id",
+    "statement_id",
+    "account_id",
+    "transaction_date",
+    "amount",
+    "description",
+    "custom_description",
+    "category",
+    "transaction_type",
+)
+
+CATEGORIES = (
+    "groceries",
+    "dining",
+    "transport",
+    "utilities",
+    "shopping",
+    "travel",
+    "health",
+    "entertainment",
+)
+TRANSACTION_TYPES = ("debit", "credit", "payment", "refund")
+MERCHANTS = (
+    "WHOLE FOODS MARKET",
+    "SHELL OIL",
+    "AMAZON MKTPLACE",
+    "STARBUCKS STORE",
+    "UBER TRIP",
+    "CITY UTILITIES",
+    "DELTA AIR LINES",
+    "CVS PHARMACY",
+)
+
+_TRIGRAM_DESCRIPTION = (
+    "CREATE INDEX ON transactions_index_bench USING gin (description gin_trgm_ops)"
+)
+_PARTIAL_TRIGRAM_CUSTOM_DESCRIPTION = (
+    "CREATE INDEX ON transactions_index_bench "
+    "USING gin (custom_description gin_trgm_ops) "
+    "WHERE custom_description IS NOT NULL"
+)
+_STATEMENT = "CREATE INDEX ON transactions_index_bench (statement_id)"
+_ACCOUNT_DATE = (
+    "CREATE INDEX ON transactions_index_bench (account_id, transaction_date, id)"
+)
+
+# Index sets compared; "single_column" is the set before the redesign
+INDEX_SETS: dict[str, tuple[str, ...]] = {
+    "single_column": (
+        _STATEMENT,
+        "CREATE INDEX ON transactions_index_bench (account_id)",
+        "CREATE INDEX ON transactions_index_bench (transaction_date)",
+        "CREATE INDEX ON transactions_index_bench (amount)",
+        "CREATE INDEX ON transactions_index_bench (category)",
+        "CREATE INDEX ON transactions_index_bench (transaction_type)",
+        _TRIGRAM_DESCRIPTION,
+        (
+            "CREATE INDEX ON transactions_index_bench "
+            "USING gin (custom_description gin_trgm_ops)"
+        ),
+    ),
+    "composite": (
+        _STATEMENT,
+        _ACCOUNT_DATE,
+        _TRIGRAM_DESCRIPTION,
+        _PARTIAL_TRIGRAM_CUSTOM_DESCRIPTION,
+    ),
+    "composite_partial": (
+        _STATEMENT,
+        _ACCOUNT_DATE,
+        (
+            "CREATE INDEX ON transactions_index_bench "
+            "(account_id, category, transaction_date) WHERE category IS NOT NULL"
+        ),
+        _TRIGRAM_DESCRIPTION,
+        _PARTIAL_TRIGRAM_CUSTOM_DESCRIPTION,
+    ),
+    "no_search": (
+        _STATEMENT,
+        _ACCOUNT_DATE,
+    ),
+}
+
+
+@dataclass
+class Samples:
+    """Values the query shapes draw their parameters from."""
+
+    accounts: list[UUID]
+    statements: list[UUID]
+    months: list[date]
+
+
+@dataclass
+class QueryShape:
+    """A parameterized query and how to pick its arguments."""
+
+    sql: str
+    arguments: Callable[[random.Random, Samples], tuple[Any, ...]]
+
+
+def _month_bounds(rng: random.Random, samples: Samples) -> tuple[date, date]:
+    month = rng.choice(samples.months)
+    return month, (month + timedelta(days=32)).replace(day=1)
+
+
+QUERY_SHAPES: dict[str, QueryShape] = {
+    # GET /transactions for one account, first page
+    "account_latest": QueryShape(
+        "SELECT * FROM transactions_index_bench WHERE account_id = $1 "
+        "ORDER BY transaction_date DESC, id DESC LIMIT 50",
+        lambda rng, s: (rng.choice(s.accounts),),
+    ),
+    # GET /transactions for one account and month
+    "account_month": QueryShape(
+        "SELECT * FROM transactions_index_bench WHERE account_id = $1 "
+        "AND transaction_date >= $2 AND transaction_date < $3 "
+        "ORDER BY transaction_date DESC, id DESC LIMIT 50",
+        lambda rng, s: (rng.choice(s.accounts), *_month_bounds(rng, s)),
+    ),
+    # GET /transactions?category=... for one account
+    "account_category": QueryShape(
+        "SELECT * FROM transactions_index_bench WHERE account_id = $1 "
+        "AND category = $2 ORDER BY transaction_date DESC, id DESC LIMIT 50",
+        lambda rng, s: (rng.choice(s.accounts), rng.choice(CATEGORIES)),
+    ),
+    # Monthly spending summary refresh
+    "account_month_totals": QueryShape(
+        "SELECT category, transaction_type, sum(amount), count(*) "
+        "FROM transactions_index_bench WHERE account_id = $1 "
+        "AND transaction_date >= $2 AND transaction_date < $3 GROUP BY 1, 2",
+        lambda rng, s: (rng.choice(s.accounts), *_month_bounds(rng, s)),
+    ),
+    # Re-import diff and statement deletes
+    "statement_rows": QueryShape(
+        "SELECT * FROM transactions_index_bench WHERE statement_id = $1",
+        lambda rng, s: (rng.choice(s.statements),),
+    ),
+    # Description search
+    "description_search": QueryShape(
+        "SELECT * FROM transactions_index_bench WHERE description ILIKE $1 LIMIT 50",
+        lambda rng, _s: (f"%{rng.choice(MERCHANTS).split()[0].lower()}%",),
+    ),
+}
+
+
+@dataclass
+class IndexSetResult:
+    """Measurements for one index set."""
+
+    name: str
+    rows_per_second: float
+    index_bytes: int
+    query_ms: dict[str, float] = field(default_factory=dict)
+
+
+def console_output(message: str) -> None:
+    """Output message to console."""
+    sys.stdout.write(f"{message}\n")
+    sys.stdout.flush()
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Compare transaction index sets on insert and query cost"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Synthetic transactions to load"
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=200, help="Accounts the rows are spread over"
+    )
+    parser.add_argument(
+        "--months", type=int, default=24, help="Months the rows are spread over"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=2_000,
+        help="Rows per COPY, i.e. transactions per imported statement",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="Executions per query shape"
+    )
+    parser.add_argument(
+        "--sets",
+        nargs="+",
+        choices=sorted(INDEX_SETS),
+        default=list(INDEX_SETS),
+        help="Index sets to compare",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    return parser
+
+
+def synthetic_rows(args: argparse.Namespace) -> tuple[list[tuple[Any, ...]], Samples]:
+    """Generate transaction rows, one statement per account and month."""
+    rng = random.Random(args.seed)  # noqa: S311
+    months = [add_months(date(2024, 1, 1), i) for i in range(args.months)]
+    accounts = [uuid4() for _ in range(args.accounts)]
+    statements = {(account, month): uuid4() for account in accounts for month in months}
+
+    rows = []
+    for _ in range(args.rows):
+        account = rng.choice(accounts)
+        month = rng.choice(months)
+        merchant = rng.choice(MERCHANTS)
+        rows.append(
+            (
+                uuid4(),
+                statements[account, month],
+                account,
+                month + timedelta(days=rng.randrange(28)),
+                Decimal(rng.randrange(-50_000, 50_000) or 1) / 100,
+                f"{merchant} #{rng.randrange(10_000)}",
+                f"Note for {merchant.lower()}" if rng.random() < 0.05 else None,  # noqa: PLR2004
+                rng.choice(CATEGORIES) if rng.random() < 0.7 else None,  # noqa: PLR2004
+                rng.choice(TRANSACTION_TYPES),
+            )
+        )
+    return rows, Samples(accounts, list(statements.values()), months)
+
+
+async def load(
+    connection: asyncpg.Connection,
+    index_set: tuple[str, ...],
+    rows: list[Any],
+    batch: int,
+) -> float:
+    """Create the scratch table with an index set and COPY rows into it.
+
+    Returns:
+        Rows inserted per second
+    """
+    await connection.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    await connection.execute(
+        f"CREATE TABLE {TABLE} (LIKE transactions INCLUDING DEFAULTS)"
+    )
+    for statement in index_set:
+        await connection.execute(statement)
+
+    started = time.perf_counter()
+    for offset in range(0, len(rows), batch):
+        await connection.copy_records_to_table(
+            TABLE, records=rows[offset : offset + batch], columns=COLUMNS
+        )
+    elapsed = time.perf_counter() - started
+
+    await connection.execute(f"ANALYZE {TABLE}")
+    return len(rows) / elapsed
+
+
+async def time_query(
+    connection: asyncpg.Connection,
+    shape: QueryShape,
+    samples: Samples,
+    rng: random.Random,
+    repeat: int,
+) -> float:
+    """Return the median latency of a query shape in milliseconds."""
+    statement = await connection.prepare(shape.sql)
+    timings = []
+    for _ in range(repeat):
+        arguments = shape.arguments(rng, samples)
+        started = time.perf_counter()
+        await statement.fetch(*arguments)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[IndexSetResult]:
+    """Measure every selected index set."""
+    rows, samples = synthetic_rows(args)
+    connection = await asyncpg.connect(database.db.database_url)
+    results = []
+    try:
+        for name in args.sets:
+            rows_per_second = await load(connection, INDEX_SETS[name], rows, args.batch)
+            result = IndexSetResult(
+                name=name,
+                rows_per_second=rows_per_second,
+                index_bytes=await connection.fetchval(
+                    "SELECT pg_indexes_size($1::regclass)", TABLE
+                ),
+            )
+            rng = random.Random(args.seed)  # noqa: S311
+            for shape_name, shape in QUERY_SHAPES.items():
+                result.query_ms[shape_name] = await time_query(
+                    connection, shape, samples, rng, args.repeat
+                )
+            results.append(result)
+            console_output(f"✓ Measured {name}")
+    finally:
+        await connection.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        await connection.close()
+    return results
+
+
+def report(results: list[IndexSetResult]) -> None:
+    """Print one row per index set."""
+    shapes = list(QUERY_SHAPES)
+    header = ["index set", "rows/s", "index MB", *(f"{s} ms" for s in shapes)]
+    console_output(" | ".join(header))
+    for result in results:
+        cells = [
+            result.name,
+            f"{result.rows_per_second:,.0f}",
+            f"{result.index_bytes / 1024 / 1024:,.1f}",
+            *(f"{result.query_ms[s]:.2f}" for s in shapes),
+        ]
+        console_output(" | ".join(cells))
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    report(asyncio.run(run_benchmark(args)))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Search parser config regexes for catastrophic backtracking.
+
+Every label and value pattern is statically analysed and then fuzzed
+with inputs up to the config's line length cap. Exits non-zero if any
+pattern is unsafe or an input exceeds the slowness threshold.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.parsers.parser_config_loader import DEFAULT_MAX_LINE_LENGTH
+from services.parsers.parser_config_loader import available_parser_configs
+from services.parsers.parser_config_loader import config_patterns
+from services.parsers.parser_config_loader import load_parser_config
+from services.parsers.regex_safety import ERROR
+from services.parsers.regex_safety import analyze_pattern
+from services.parsers.regex_safety import fuzz_pattern
+
+
+def console_output(message: str) -> None:
+    """Output message to console."""
+    sys.stdout.write(f"{message}\n")
+    sys.stdout.flush()
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Fuzz parser config regexes for slow (ReDoS) inputs"
+    )
+    parser.add_argument(
+        "configs",
+        nargs="*",
+        help="Config names to check (default: all configs)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Mutated inputs to try per pattern",
+    )
+    parser.add_argument(
+        "--threshold-ms",
+        type=float,
+        default=10.0,
+        help="Match time that counts as slow, in milliseconds",
+    )
+    parser.add_argument(
+        "--max-length",
+        type=int,
+        help="Longest input to try (default: the config's max_line_length)",
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    return parser
+
+
+def check_config(config_name: str, args: argparse.Namespace) -> int:
+    """Analyse and fuzz one config, returning the number of problems found."""
+    config = load_parser_config(config_name, validate=False)
+    max_length = args.max_length or config.get("matching", {}).get(
+        "max_line_length", DEFAULT_MAX_LINE_LENGTH
+    )
+    problems = 0
+
+    console_output(f"🔍 {config_name} (inputs up to {max_length} chars)")
+    for field_name, pattern in config_patterns(config):
+        issues = analyze_pattern(pattern)
+        for issue in issues:
+            console_output(
+                f"  {'✗' if issue.severity == ERROR else '!'} {field_name}: {issue}"
+            )
+        if any(issue.severity == ERROR for issue in issues):
+            problems += 1
+            continue
+
+        result = fuzz_pattern(
+            pattern,
+            iterations=args.iterations,
+            max_length=max_length,
+            threshold=args.threshold_ms / 1000,
+            seed=args.seed,
+        )
+        status = "✗ SLOW" if result.slow else "✓"
+        console_output(
+            f"  {status} {field_name}: {pattern!r} "
+            f"worst {result.slowest_seconds * 1000:.3f} ms "
+            f"over {result.attempts} inputs"
+        )
+        if result.slow:
+            problems += 1
+            console_output(f"      slowest input: {result.slowest_input[:120]!r}")
+
+    return problems
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    configs = args.configs or available_parser_configs()
+
+    problems = sum(check_config(config_name, args) for config_name in configs)
+    if problems:
+        console_output(f"✗ {problems} unsafe or slow patterns found")
+        sys.exit(1)
+    console_output("✓ No slow patterns found")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Manage the monthly partitions of the transactions table.
+
+Imports create partitions on demand; this command pre-creates upcoming
+months (e.g. from a monthly cron job), lists what is attached, and
+detaches old months for archival without a bulk DELETE.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+from services.persistence.partitions import add_months
+from services.persistence.partitions import detach_transaction_partitions
+from services.persistence.partitions import ensure_transaction_partitions
+from services.persistence.partitions import list_transaction_partitions
+
+
+def console_output(message: str) -> None:
+    """Output message to console."""
+    sys.stdout.write(f"{message}\n")
+    sys.stdout.flush()
+
+
+def parse_month(value: str) -> date:
+    """Parse a YYYY-MM argument into the first day of that month."""
+    try:
+        return date.fromisoformat(f"{value}-01")
+    except ValueError as e:
+        error_msg = f"Expected a month as YYYY-MM, got {value!r}"
+        raise argparse.ArgumentTypeError(error_msg) from e
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Manage monthly partitions of the transactions table"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List attached partitions")
+
+    create_parser = subparsers.add_parser(
+        "create", help="Create partitions from this month onwards"
+    )
+    create_parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=3,
+        help="Future months to create after the current one",
+    )
+
+    detach_parser = subparsers.add_parser(
+        "detach", help="Detach partitions for months before a cutoff"
+    )
+    detach_parser.add_argument(
+        "--before", type=parse_month, required=True, help="First month to keep"
+    )
+    detach_parser.add_argument(
+        "--drop", action="store_true", help="Drop detached partitions"
+    )
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the selected partition command."""
+    try:
+        if args.command == "list":
+            async with database.async_engine.connect() as connection:
+                for name, _month in await list_transaction_partitions(connection):
+                    console_output(name)
+
+        elif args.command == "create":
+            this_month = datetime.now(UTC).date().replace(day=1)
+            months = [add_months(this_month, i) for i in range(args.months_ahead + 1)]
+            async with database.async_session_maker() as session, session.begin():
+                names = await ensure_transaction_partitions(session, months)
+            console_output(f"✓ Partitions present: {', '.join(names)}")
+
+        elif args.command == "detach":
+            async with database.async_engine.connect() as connection:
+                autocommit = await connection.execution_options(
+                    isolation_level="AUTOCOMMIT"
+                )
+                detached = await detach_transaction_partitions(
+                    autocommit, args.before, drop=args.drop
+                )
+            console_output(f"✓ Detached {len(detached)} partitions")
+    finally:
+        await database.dispose()
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    database.configure("cli")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
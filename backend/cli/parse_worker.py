@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Run a standalone parse job worker against the shared database.
+
+Claims queued statement parse jobs and runs them in a local parser pool
+until SIGINT or SIGTERM, then finishes the jobs in flight. New jobs are
+claimed as soon as the database notifies them; the poll interval only
+matters for retries and while the notification connection is down.
+Start as many as needed on any host that can reach the database and the
+file storage (the upload directory, or the bucket with
+``STORAGE_BACKEND=s3``); set ``PARSE_JOBS_IN_API=false`` to keep API
+processes out of the queue. Requires a migrated database.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+from services.admission import AdmissionLimits
+from services.jobs import DEFAULT_LEASE_SECONDS
+from services.jobs import JOBS_CHANNEL
+from services.jobs import NotificationListener
+from services.jobs import ParseJobWorker
+from services.parsers.worker_pool import ParserPool
+from services.secure_vault.config_manager import initialize_config
+from services.storage import get_storage
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Claim and process statement parse jobs"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parser processes (default: PARSER_WORKERS or the CPU count up to 4)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=(
+            "Jobs in flight at once "
+            "(default: MAX_CONCURRENT_PARSES or one per parser process)"
+        ),
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help="Lease length; jobs of a worker silent this long are retried",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between claims while the queue is empty",
+    )
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Process jobs until interrupted."""
+    # Storage credentials may live in the vault, as for the API
+    await initialize_config()
+    storage = get_storage()
+    await storage.ensure_ready()
+    parser_pool = ParserPool.from_env()
+    if args.workers:
+        parser_pool = ParserPool(
+            args.workers, max_jobs_per_worker=parser_pool.max_jobs_per_worker
+        )
+    await parser_pool.start()
+    worker = ParseJobWorker(
+        database.async_session_maker,
+        parser_pool,
+        storage=storage,
+        concurrency=(
+            args.concurrency or AdmissionLimits.from_env().max_concurrent_parses
+        ),
+        lease_seconds=args.lease_seconds,
+        poll_interval=args.poll_interval,
+    )
+    listener = NotificationListener(database.db.database_url)
+    listener.add_handler(JOBS_CHANNEL, lambda _job_id: worker.wake())
+    listener.on_connect(worker.wake)
+    await listener.start()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await listener.stop()
+        await parser_pool.shutdown()
+        await database.dispose()
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    database.configure("worker")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
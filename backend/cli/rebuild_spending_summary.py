@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Rebuild the monthly spending summary from the transactions table.
+
+Imports keep the summary current for the months they touch; this is the
+fallback after deleting statements or editing transactions directly.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from uuid import UUID
+
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+from services.persistence.spending_summary import rebuild_monthly_spending
+
+
+def console_output(message: str) -> None:
+    """Output message to console."""
+    sys.stdout.write(f"{message}\n")
+    sys.stdout.flush()
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Rebuild the monthly spending summary table"
+    )
+    parser.add_argument(
+        "--account",
+        type=UUID,
+        help="Only rebuild this account (default: every account)",
+    )
+    return parser
+
+
+async def run(account_id: UUID | None) -> int:
+    """Rebuild the summary in one transaction and return the row count."""
+    try:
+        async with database.async_session_maker() as session, session.begin():
+            return await rebuild_monthly_spending(session, account_id)
+    finally:
+        await database.dispose()
+
+
+def main() -> None:
+    """Main CLI function."""
+    args = create_argument_parser().parse_args()
+    database.configure("cli")
+    rows = asyncio.run(run(args.account))
+    console_output(f"✓ Wrote {rows} summary rows")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -2,47 +2,204 @@
 """Ledgerly Statement Parser CLI."""
 
 import argparse
-import json
 import logging
 import os
+import signal
+import sys
+import threading
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from dotenv import load_dotenv
 
 from registry.loader import get_account_registry
-from services.parsers.dispatch_parser import parse_csv
-from services.parsers.dispatch_parser import parse_pdf
+from services.batch import BatchJournal
+from services.batch import BatchProgress
+from services.batch import discover_inputs
+from services.batch import run_batch
+from services.batch.watcher import IngestDaemon
+from services.batch.watcher import create_watcher
+from services.output import LazyJson
+from services.output import OutputWriter
+from services.output import available_formats
+from services.output import dumps
+from services.output import get_writer
+from services.parsers.dispatch_parser import parse_statement
+from services.telemetry import FieldMetrics
+from services.telemetry import StageProfiler
+from services.telemetry import collecting_field_metrics
+from services.telemetry import profiling
 
 
+if TYPE_CHECKING:
+    from services.output.columnar import ColumnarExporter
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+JOURNAL_FILENAME = "batch_journal.jsonl"
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+
+def _validate_account(parser: argparse.ArgumentParser, account: str) -> None:
+    """Exit with a usage error if the account type is not supported."""
     supported_accounts = get_account_registry()
 
+    if account not in supported_accounts:
+        supported_list = ", ".join(supported_accounts.keys())
+        logger.error(
+            "Unsupported account: '%s'. Supported accounts: %s",
+            account,
+            supported_list,
+        )
+        parser.error("Unsupported account type")
+
+
+def _add_output_args(parser: argparse.ArgumentParser) -> None:
+    """Add result serialization options to a parser."""
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=available_formats(),
+        default="json",
+        help="Result file format (default: json)",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["zstd"],
+        help="Compress result files",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON results for human reading",
+    )
+
+
+def _writer_from_args(args: argparse.Namespace) -> OutputWriter:
+    """Build the result writer selected on the command line."""
+    options = {"pretty": True} if args.pretty and args.output_format == "json" else {}
+    return get_writer(args.output_format, args.compress, **options)
+
+
+def _add_columnar_args(parser: argparse.ArgumentParser) -> None:
+    """Add columnar analytics export options to a parser."""
+    parser.add_argument(
+        "--columnar",
+        choices=["parquet", "arrow"],
+        help="Also export transactions and summaries as partitioned datasets",
+    )
+    parser.add_argument(
+        "--columnar-dir",
+        type=Path,
+        help="Root of the columnar datasets (default: <output-dir>/columnar)",
+    )
+
+
+def _exporter_from_args(
+    args: argparse.Namespace, output_dir: Path
+) -> "ColumnarExporter | None":
+    """Build the columnar exporter selected on the command line, if any."""
+    if not args.columnar:
+        return None
+
+    # pyarrow is only imported when a columnar export is requested
+    from services.output.columnar import ColumnarExporter  # noqa: PLC0415
+
+    return ColumnarExporter(args.columnar_dir or output_dir / "columnar", args.columnar)
+
+
+def _add_field_metrics_args(parser: argparse.ArgumentParser) -> None:
+    """Add the field extraction metrics option to a parser."""
+    parser.add_argument(
+        "--field-metrics",
+        type=Path,
+        help="Write per-field extraction metrics here (.prom for Prometheus text)",
+    )
+
+
+def _write_field_metrics(metrics: FieldMetrics, path: Path) -> None:
+    """Write field metrics as Prometheus text or JSON, based on the suffix."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".prom":
+        path.write_text(metrics.to_prometheus(), encoding="utf-8")
+    else:
+        path.write_bytes(dumps(metrics.to_dict(), pretty=True))
+    logger.info("📊 Field metrics written to %s", path)
+
+
+def _write_timings(
+    profiler: StageProfiler,
+    recorded: dict[str, dict[str, float | int]],
+    output_dir: Path,
+    stem: str,
+) -> None:
+    """Write the stages timed after the result was serialized.
+
+    Parse stages are already in the result's ``metadata.timings``; the
+    writer's spans only close once the result is on disk, so they go to a
+    ``.timings.json`` file next to it.
+    """
+    timings = {
+        stage: timing
+        for stage, timing in profiler.to_dict().items()
+        if stage not in recorded
+    }
+    if not timings:
+        return
+    path = output_dir / f"{stem}.timings.json"
+    path.write_bytes(dumps(timings, pretty=True))
+    logger.info("📊 Writer timings written to %s", path)
+
+
+def _field_metrics_from_args(
+    args: argparse.Namespace,
+) -> AbstractContextManager[FieldMetrics | None]:
+    """Return a field metrics collection context if --field-metrics was given."""
+    if not args.field_metrics:
+        return nullcontext()
+    return collecting_field_metrics()
+
+
+def _profiler_from_args(
+    args: argparse.Namespace,
+) -> AbstractContextManager[StageProfiler | None]:
+    """Return a profiling context if --profile or --profile-out was given."""
+    if not args.profile and not args.profile_out:
+        return nullcontext()
+    return profiling(args.profile_out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Ledgerly Statement Parser CLI")
     parser.add_argument("--account", required=True, help="Account type (e.g., citi_cc)")
     parser.add_argument("--pdf", help="Path to PDF file")
     parser.add_argument("--csv", help="Path to CSV file (optional)")
+    _add_output_args(parser)
+    _add_columnar_args(parser)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage timing breakdown and store it in the result",
+    )
+    parser.add_argument(
+        "--profile-out",
+        type=Path,
+        help="Also dump cProfile statistics to this pstats file (implies --profile)",
+    )
+    _add_field_metrics_args(parser)
 
     try:
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
     except Exception:
         logger.exception("❌ Failed to parse command-line arguments")
         raise
 
-    if args.account not in supported_accounts:
-        supported_list = ", ".join(supported_accounts.keys())
-        logger.error(
-            "Unsupported account: '%s'. Supported accounts: %s",
-            args.account,
-            supported_list,
-        )
-        parser.error("Unsupported account type")
+    _validate_account(parser, args.account)
 
     if not args.pdf and not args.csv:
         logger.error("No input file provided.")
@@ -51,32 +208,222 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-def main() -> None:
+def parse_batch_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command line arguments for the batch subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Parse many statements in parallel",
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Directories, glob patterns, or files containing PDFs and CSVs",
+    )
+    parser.add_argument("--account", required=True, help="Account type (e.g., citi_cc)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parser processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path(os.getenv("OUTPUT_DIR", "./output")),
+        help="Base output directory (results go to ready/ and errors/)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help=f"Resume journal path (default: <output-dir>/{JOURNAL_FILENAME})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess inputs even if the journal marks them completed",
+    )
+    _add_output_args(parser)
+    _add_columnar_args(parser)
+    _add_field_metrics_args(parser)
+
+    args = parser.parse_args(argv)
+    _validate_account(parser, args.account)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    return args
+
+
+def run_batch_command(args: argparse.Namespace) -> int:
+    """Run the batch subcommand and return the process exit code."""
+    inputs = discover_inputs(args.sources)
+    journal_path = args.journal or args.output_dir / JOURNAL_FILENAME
+
+    if args.no_resume and journal_path.exists():
+        journal_path.unlink()
+
+    field_metrics = FieldMetrics() if args.field_metrics else None
+
+    with BatchJournal(journal_path) as journal:
+        summary = run_batch(
+            args.account,
+            inputs,
+            args.output_dir,
+            journal=journal,
+            workers=args.workers,
+            progress=BatchProgress(total=len(inputs)),
+            writer=_writer_from_args(args),
+            exporter=_exporter_from_args(args, args.output_dir),
+            field_metrics=field_metrics,
+        )
+
+    if field_metrics is not None:
+        _write_field_metrics(field_metrics, args.field_metrics)
+
+    sys.stderr.write(
+        f"Processed {summary.succeeded + summary.failed} of {summary.total} inputs "
+        f"in {summary.elapsed:.1f}s ({summary.throughput:.1f} stmt/s): "
+        f"{summary.succeeded} succeeded, {summary.failed} failed, "
+        f"{summary.skipped} skipped\n"
+    )
+    return 1 if summary.failed else 0
+
+
+def parse_watch_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command line arguments for the watch subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="main.py watch",
+        description="Ingest statements dropped into an inbox directory",
+    )
+    parser.add_argument("--account", required=True, help="Account type (e.g., citi_cc)")
+    parser.add_argument(
+        "--inbox",
+        type=Path,
+        default=Path(os.getenv("INBOX_DIR", "./inbox")),
+        help="Directory to watch for new PDFs and CSVs",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path(os.getenv("OUTPUT_DIR", "./output")),
+        help="Base output directory (jobs move to ready/ and errors/)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parser processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Maximum jobs queued or running at once (default: 2x workers)",
+    )
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=2.0,
+        help="Seconds a file must stay unchanged before it is ingested",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Scan interval when inotify is unavailable",
+    )
+    parser.add_argument(
+        "--force-polling",
+        action="store_true",
+        help="Use directory polling even where inotify is available",
+    )
+    _add_output_args(parser)
+
+    args = parser.parse_args(argv)
+    _validate_account(parser, args.account)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    return args
+
+
+def run_watch_command(args: argparse.Namespace) -> int:
+    """Run the ingestion daemon until interrupted."""
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    args.inbox.mkdir(parents=True, exist_ok=True)
+    watcher = create_watcher(
+        args.inbox,
+        force_polling=args.force_polling,
+        poll_interval=args.poll_interval,
+    )
+
+    with IngestDaemon(
+        args.account,
+        args.inbox,
+        args.output_dir,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        settle_seconds=args.settle_seconds,
+        watcher=watcher,
+        writer=_writer_from_args(args),
+    ) as daemon:
+        try:
+            daemon.run(stop_event)
+        except KeyboardInterrupt:
+            stop_event.set()
+
+    sys.stderr.write(f"Ingested {daemon.succeeded} jobs, {daemon.failed} failed\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
     """Main function to parse financial statements."""
-    args = parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] == "batch":
+        sys.exit(run_batch_command(parse_batch_args(argv[1:])))
+
+    if argv and argv[0] == "watch":
+        sys.exit(run_watch_command(parse_watch_args(argv[1:])))
+
+    args = parse_args(argv)
     statement_id = str(uuid4())
     output_dir = Path(os.getenv("OUTPUT_DIR", "./output"))
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"{statement_id}.json"
-
-    results = {}
+    writer = _writer_from_args(args)
+    exporter = _exporter_from_args(args, output_dir)
 
     try:
-        if args.pdf:
-            logger.info("📄 Parsing PDF: %s", args.pdf)
-            results.update(parse_pdf(args.account, args.pdf))
+        with (
+            _profiler_from_args(args) as profiler,
+            _field_metrics_from_args(args) as field_metrics,
+        ):
+            results = parse_statement(
+                args.account, pdf_path=args.pdf, csv_path=args.csv
+            )
+            if profiler is not None:
+                results.setdefault("metadata", {})["timings"] = profiler.to_dict()
+
+            # Only serialized if a DEBUG handler actually emits the record
+            logger.debug("🔍 Final output contents: %s", LazyJson(results))
 
-        if args.csv:
-            logger.info("📈 Parsing CSV: %s", args.csv)
-            statement_id = results["statement_data"]["id"]
-            results["transactions"] = parse_csv(args.account, args.csv, statement_id)
+            output_path = writer.write(results, output_dir, statement_id)
+            if exporter is not None:
+                exporter.export(results)
 
-        debug_output = json.dumps(results, indent=2, default=str)
-        logger.debug("🔍 Final output contents: %s", debug_output)
+        if field_metrics is not None:
+            _write_field_metrics(field_metrics, args.field_metrics)
 
-        # Write result
-        with output_path.open("w") as f:
-            json.dump(results, f, indent=2, default=str)
+        if profiler is not None:
+            sys.stderr.write(profiler.format_report() + "\n")
+            _write_timings(
+                profiler, results["metadata"]["timings"], output_dir, statement_id
+            )
+            if args.profile_out:
+                logger.info("📊 Profile statistics written to %s", args.profile_out)
 
         logger.info("✅ Output written to %s", output_path)
 
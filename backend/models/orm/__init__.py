@@ -6,6 +6,8 @@ from .base import Base
 from .base import TimestampMixin
 from .credit_card_detail import CreditCardDetail
 from .institution import Institution
+from .monthly_spending_summary import MonthlySpendingSummary
+from .parse_job import ParseJob
 from .secret import Secret
 from .secret import SecretAuditLog
 from .statement import Statement
@@ -20,6 +22,8 @@ __all__ = [
     "Base",
     "CreditCardDetail",
     "Institution",
+    "MonthlySpendingSummary",
+    "ParseJob",
     "Secret",
     "SecretAuditLog",
     "Statement",
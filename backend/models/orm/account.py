@@ -2,6 +2,7 @@
 
 from uuid import UUID
 
+from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
 from sqlalchemy import CheckConstraint
 from sqlalchemy import ForeignKey
@@ -56,19 +57,38 @@ class Account(Base, UUIDMixin, TimestampMixin):
         default=True,
         nullable=False,
     )
+    data_version: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Incremented whenever the account's transactions change",
+    )
 
     # Relationships
-    user = relationship("User", back_populates="accounts")
-    institution = relationship("Institution", back_populates="accounts")
-    account_type = relationship("AccountType", back_populates="accounts")
+    user = relationship("User", back_populates="accounts", lazy="raise")
+    institution = relationship("Institution", back_populates="accounts", lazy="raise")
+    account_type = relationship("AccountType", back_populates="accounts", lazy="raise")
     statements = relationship(
-        "Statement", back_populates="account", cascade="all, delete-orphan"
+        "Statement",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     transactions = relationship(
-        "Transaction", back_populates="account", cascade="all, delete-orphan"
+        "Transaction",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     credit_card_details = relationship(
-        "CreditCardDetail", back_populates="account", cascade="all, delete-orphan"
+        "CreditCardDetail",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     # Constraints
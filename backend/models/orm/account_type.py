@@ -41,7 +41,7 @@ class AccountType(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    accounts = relationship("Account", back_populates="account_type")
+    accounts = relationship("Account", back_populates="account_type", lazy="raise")
 
     # Constraints
     __table_args__ = (
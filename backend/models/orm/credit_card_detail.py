@@ -74,8 +74,12 @@ class CreditCardDetail(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    account = relationship("Account", back_populates="credit_card_details")
-    statement = relationship("Statement", back_populates="credit_card_detail")
+    account = relationship(
+        "Account", back_populates="credit_card_details", lazy="raise"
+    )
+    statement = relationship(
+        "Statement", back_populates="credit_card_detail", lazy="raise"
+    )
 
     # Constraints
     __table_args__ = (
@@ -36,7 +36,7 @@ class Institution(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    accounts = relationship("Account", back_populates="institution")
+    accounts = relationship("Account", back_populates="institution", lazy="raise")
 
     # Constraints
     __table_args__ = (
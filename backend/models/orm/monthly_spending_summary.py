@@ -0,0 +1,81 @@
+"""Monthly spending summary maintained alongside transaction imports."""
+
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class MonthlySpendingSummary(Base):
+    """Transaction totals per account, month, category and type.
+
+    Rows are recomputed for the months an import touches, so dashboard
+    queries read a handful of rows per month instead of scanning
+    transactions. Uncategorized transactions use the category
+    ``"uncategorized"``.
+    """
+
+    __tablename__ = "monthly_spending_summary"
+
+    account_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="First day of the month",
+    )
+    category: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+    )
+    transaction_type: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+    )
+    total_amount: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+    )
+    spending_amount: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        comment="Sum of negative amounts",
+    )
+    credit_amount: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        comment="Sum of positive amounts",
+    )
+    transaction_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of MonthlySpendingSummary."""
+        return (
+            f"<MonthlySpendingSummary(account_id={self.account_id}, "
+            f"month={self.month}, category={self.category}, "
+            f"type={self.transaction_type}, total={self.total_amount})>"
+        )
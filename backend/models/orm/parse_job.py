@@ -0,0 +1,119 @@
+"""Parse job model backing the durable statement processing queue."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import Text
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from .base import Base
+from .base import TimestampMixin
+from .base import UUIDMixin
+
+
+class ParseJob(Base, UUIDMixin, TimestampMixin):
+    """One uploaded statement waiting for, or going through, parsing.
+
+    Workers claim ``queued`` jobs whose ``run_after`` has passed with
+    ``FOR UPDATE SKIP LOCKED`` and hold them under a lease that they
+    renew while parsing. A failed attempt is queued again with a backoff
+    until ``max_attempts`` is reached, after which the job is ``dead``.
+    """
+
+    __tablename__ = "parse_jobs"
+
+    statement_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("statements.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="queued",
+        server_default="queued",
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=5,
+        server_default="5",
+        nullable=False,
+    )
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        nullable=False,
+    )
+    locked_by: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="Worker holding the lease",
+    )
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Relationships
+    statement = relationship("Statement", lazy="raise")
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'dead')",
+            name="parse_jobs_status_valid",
+        ),
+        CheckConstraint(
+            "status <> 'running' "
+            "OR (locked_by IS NOT NULL AND lease_expires_at IS NOT NULL)",
+            name="parse_jobs_running_leased",
+        ),
+        # Only claimable and leased jobs are indexed; finished ones pile up
+        Index(
+            "idx_parse_jobs_queued",
+            "run_after",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "idx_parse_jobs_leases",
+            "lease_expires_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of ParseJob."""
+        return (
+            f"<ParseJob(id={self.id}, statement_id={self.statement_id}, "
+            f"status={self.status}, attempts={self.attempts})>"
+        )
@@ -34,13 +34,14 @@ class Statement(Base, UUIDMixin, TimestampMixin):
         ForeignKey("accounts.id", ondelete="CASCADE"),
         nullable=False,
     )
-    period_start: Mapped[date] = mapped_column(
+    # Unknown until an uploaded statement has been parsed
+    period_start: Mapped[date | None] = mapped_column(
         Date,
-        nullable=False,
+        nullable=True,
     )
-    period_end: Mapped[date] = mapped_column(
+    period_end: Mapped[date | None] = mapped_column(
         Date,
-        nullable=False,
+        nullable=True,
     )
     file_pdf_url: Mapped[str | None] = mapped_column(
         String(255),
@@ -71,26 +72,39 @@ class Statement(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    account = relationship("Account", back_populates="statements")
+    account = relationship("Account", back_populates="statements", lazy="raise")
     statement_detail = relationship(
         "StatementDetail",
         back_populates="statement",
         uselist=False,
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     transactions = relationship(
-        "Transaction", back_populates="statement", cascade="all, delete-orphan"
+        "Transaction",
+        back_populates="statement",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     credit_card_detail = relationship(
         "CreditCardDetail",
         back_populates="statement",
         uselist=False,
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     # Constraints
     __table_args__ = (
         CheckConstraint("period_end >= period_start", name="statements_period_valid"),
+        CheckConstraint(
+            "status <> 'completed' "
+            "OR (period_start IS NOT NULL AND period_end IS NOT NULL)",
+            name="statements_period_known",
+        ),
         CheckConstraint(
             "status IN ('pending', 'processing', 'completed', 'failed')",
             name="statements_status_valid",
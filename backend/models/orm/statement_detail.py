@@ -47,7 +47,9 @@ class StatementDetail(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    statement = relationship("Statement", back_populates="statement_detail")
+    statement = relationship(
+        "Statement", back_populates="statement_detail", lazy="raise"
+    )
 
     # Constraints
     __table_args__ = (
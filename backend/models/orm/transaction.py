@@ -1,9 +1,16 @@
-"""Transaction model for individual financial transactions."""
+"""Transaction model for individual financial transactions.
+
+The table is range-partitioned by ``transaction_date`` into monthly
+partitions named ``transactions_YYYY_MM``. Partitions are created on
+demand with the ``create_transactions_partition(date)`` database
+function, so the primary key includes the partition key.
+"""
 
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy import DDL
 from sqlalchemy import CheckConstraint
 from sqlalchemy import Date
 from sqlalchemy import ForeignKey
@@ -11,6 +18,8 @@ from sqlalchemy import Index
 from sqlalchemy import Numeric
 from sqlalchemy import String
 from sqlalchemy import Text
+from sqlalchemy import event
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
@@ -38,6 +47,7 @@ class Transaction(Base, UUIDMixin, TimestampMixin):
     )
     transaction_date: Mapped[date] = mapped_column(
         Date,
+        primary_key=True,
         nullable=False,
     )
     amount: Mapped[Decimal] = mapped_column(
@@ -66,8 +76,8 @@ class Transaction(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    statement = relationship("Statement", back_populates="transactions")
-    account = relationship("Account", back_populates="transactions")
+    statement = relationship("Statement", back_populates="transactions", lazy="raise")
+    account = relationship("Account", back_populates="transactions", lazy="raise")
 
     # Constraints
     __table_args__ = (
@@ -76,12 +86,23 @@ class Transaction(Base, UUIDMixin, TimestampMixin):
             name="transactions_type_valid",
         ),
         CheckConstraint("amount != 0", name="transactions_amount_not_zero"),
+        # Index set chosen with cli/bench_transaction_indexes.py: reads are
+        # per account and newest first, so single-column indexes on
+        # amount, category, type and date only slowed down imports
         Index("idx_transactions_statement_id", "statement_id"),
-        Index("idx_transactions_account_id", "account_id"),
-        Index("idx_transactions_date", "transaction_date"),
-        Index("idx_transactions_amount", "amount"),
-        Index("idx_transactions_category", "category"),
-        Index("idx_transactions_type", "transaction_type"),
+        Index(
+            "idx_transactions_account_date",
+            "account_id",
+            "transaction_date",
+            "id",
+        ),
+        Index(
+            "idx_transactions_account_category_date",
+            "account_id",
+            "category",
+            "transaction_date",
+            postgresql_where=text("category IS NOT NULL"),
+        ),
         Index(
             "idx_transactions_description_search",
             "description",
@@ -93,9 +114,47 @@ class Transaction(Base, UUIDMixin, TimestampMixin):
             "custom_description",
             postgresql_using="gin",
             postgresql_ops={"custom_description": "gin_trgm_ops"},
+            postgresql_where=text("custom_description IS NOT NULL"),
         ),
+        {"postgresql_partition_by": "RANGE (transaction_date)"},
     )
 
     def __repr__(self) -> str:
         """Return string representation of Transaction."""
         return f"<Transaction(id={self.id}, date={self.transaction_date}, amount={self.amount}, type={self.transaction_type})>"
+
+
+# Creates the monthly partition holding a date if it does not exist yet.
+# The advisory lock serializes concurrent imports racing for a new month.
+CREATE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transactions_partition(day date)
+RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date := date_trunc('month', day)::date;
+    partition_name text := 'transactions_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass(partition_name) IS NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtext('transactions_partitions'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month_start,
+                (month_start + interval '1 month')::date
+            );
+        END IF;
+    END IF;
+    RETURN partition_name;
+END;
+$$
+"""
+
+event.listen(
+    Transaction.__table__,
+    "after_create",
+    DDL(CREATE_PARTITION_FUNCTION.replace("%", "%%")).execute_if(  # type: ignore[no-untyped-call]
+        dialect="postgresql"
+    ),
+)
@@ -35,7 +35,11 @@ class User(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     accounts = relationship(
-        "Account", back_populates="user", cascade="all, delete-orphan"
+        "Account",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     # Constraints
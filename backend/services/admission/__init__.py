@@ -0,0 +1,16 @@
+"""Admission control and backpressure for statement ingestion."""
+
+from .budget import AdmissionRejectedError
+from .budget import ByteBudget
+from .control import Admission
+from .control import AdmissionLimits
+from .control import get_admission
+
+
+__all__ = [
+    "Admission",
+    "AdmissionLimits",
+    "AdmissionRejectedError",
+    "ByteBudget",
+    "get_admission",
+]
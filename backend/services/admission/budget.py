@@ -0,0 +1,137 @@
+"""A byte budget shared by concurrent uploads, with a bounded wait queue."""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+
+class AdmissionRejectedError(Exception):
+    """Work was refused because a capacity limit is reached."""
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        """Create the error.
+
+        Args:
+            message: What limit was reached
+            retry_after: Seconds after which the work may be admitted
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ByteBudget:
+    """Bounds the bytes in flight across concurrent requests.
+
+    A request reserves its size before its body is read and gives it
+    back when done. When the budget is spent, up to ``max_waiters``
+    requests wait, in arrival order, for up to ``max_wait_seconds``;
+    anything beyond that is rejected at once. Waiters are served first
+    come first served, so a large upload is not starved by small ones.
+    """
+
+    def __init__(
+        self, capacity: int, *, max_waiters: int, max_wait_seconds: float
+    ) -> None:
+        """Configure the budget.
+
+        Args:
+            capacity: Bytes in flight at once
+            max_waiters: Requests held while the budget is spent
+            max_wait_seconds: How long a held request waits before it is
+                rejected
+        """
+        self.capacity = capacity
+        self.max_waiters = max_waiters
+        self.max_wait_seconds = max_wait_seconds
+        self.in_use = 0
+        self.peak = 0
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+        self.admitted = 0
+        self.waited = 0
+        self.rejected = 0
+
+    def _take(self, nbytes: int) -> None:
+        self.in_use += nbytes
+        self.peak = max(self.peak, self.in_use)
+        self.admitted += 1
+
+    def _release(self, nbytes: int) -> None:
+        self.in_use -= nbytes
+        while self._waiters:
+            size, future = self._waiters[0]
+            if future.done():
+                # Gave up waiting
+                self._waiters.popleft()
+                continue
+            if self.in_use + size > self.capacity:
+                return
+            self._waiters.popleft()
+            self._take(size)
+            future.set_result(None)
+
+    def _rejected(self, error_msg: str) -> AdmissionRejectedError:
+        self.rejected += 1
+        return AdmissionRejectedError(error_msg, retry_after=self.max_wait_seconds)
+
+    async def _acquire(self, nbytes: int) -> None:
+        if not self._waiters and self.in_use + nbytes <= self.capacity:
+            self._take(nbytes)
+            return
+        if len(self._waiters) >= self.max_waiters:
+            error_msg = "Too many uploads in progress; try again later"
+            raise self._rejected(error_msg)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (nbytes, future)
+        self._waiters.append(entry)
+        self.waited += 1
+        try:
+            async with asyncio.timeout(self.max_wait_seconds):
+                await future
+        except BaseException as e:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(entry)
+            if future.done() and not future.cancelled():
+                # Granted just as the wait ended; hand the bytes on
+                self._release(nbytes)
+            if isinstance(e, TimeoutError):
+                error_msg = "Timed out waiting for other uploads to finish"
+                raise self._rejected(error_msg) from None
+            raise
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[int]:
+        """Hold ``nbytes`` of the budget for the duration of the block.
+
+        A request larger than the whole budget reserves all of it, so it
+        runs alone rather than never.
+
+        Yields:
+            The bytes reserved
+
+        Raises:
+            AdmissionRejectedError: If the wait queue is full or the wait
+                timed out
+        """
+        nbytes = min(max(nbytes, 0), self.capacity)
+        await self._acquire(nbytes)
+        try:
+            yield nbytes
+        finally:
+            self._release(nbytes)
+
+    def stats(self) -> dict[str, Any]:
+        """Return bytes in flight, waiters and admission counters."""
+        return {
+            "capacity_bytes": self.capacity,
+            "in_flight_bytes": self.in_use,
+            "peak_in_flight_bytes": self.peak,
+            "waiting": len(self._waiters),
+            "max_waiters": self.max_waiters,
+            "max_wait_seconds": self.max_wait_seconds,
+            "admitted": self.admitted,
+            "waited": self.waited,
+            "rejected": self.rejected,
+        }
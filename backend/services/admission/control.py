@@ -0,0 +1,179 @@
+"""Admission limits for statement ingestion, read from the environment.
+
+Three things bound how much work the API takes on:
+
+- bytes of upload bodies being received at once (``ByteBudget``);
+- parse jobs waiting in the queue, overall and per user, checked before
+  a new statement is queued;
+- parses running at once, the parse worker's concurrency.
+
+Work over a limit is refused with ``AdmissionRejectedError``, which the
+endpoints turn into ``429 Too Many Requests`` with ``Retry-After``.
+"""
+
+import functools
+import os
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from models.orm import Account
+from models.orm import ParseJob
+from models.orm import Statement
+
+from .budget import AdmissionRejectedError
+from .budget import ByteBudget
+
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    """Capacity limits; a job limit of 0 means no limit."""
+
+    max_upload_bytes_in_flight: int = 256 * MB
+    max_upload_waiters: int = 16
+    max_upload_wait_seconds: float = 10.0
+    max_queued_jobs: int = 1000
+    max_queued_jobs_per_user: int = 100
+    backlog_retry_after_seconds: float = 30.0
+    # None: one parse per parser process
+    max_concurrent_parses: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "AdmissionLimits":
+        """Read the limits from the environment, defaulting unset ones.
+
+        The variables are ``MAX_UPLOAD_BYTES_IN_FLIGHT_MB``,
+        ``MAX_UPLOAD_WAITERS``, ``MAX_UPLOAD_WAIT_SECONDS``,
+        ``MAX_QUEUED_JOBS``, ``MAX_QUEUED_JOBS_PER_USER``,
+        ``BACKLOG_RETRY_AFTER_SECONDS`` and ``MAX_CONCURRENT_PARSES``.
+        """
+        defaults = cls()
+        parses = os.getenv("MAX_CONCURRENT_PARSES")
+        return cls(
+            max_upload_bytes_in_flight=int(
+                os.getenv(
+                    "MAX_UPLOAD_BYTES_IN_FLIGHT_MB",
+                    str(defaults.max_upload_bytes_in_flight // MB),
+                )
+            )
+            * MB,
+            max_upload_waiters=int(
+                os.getenv("MAX_UPLOAD_WAITERS", str(defaults.max_upload_waiters))
+            ),
+            max_upload_wait_seconds=float(
+                os.getenv(
+                    "MAX_UPLOAD_WAIT_SECONDS", str(defaults.max_upload_wait_seconds)
+                )
+            ),
+            max_queued_jobs=int(
+                os.getenv("MAX_QUEUED_JOBS", str(defaults.max_queued_jobs))
+            ),
+            max_queued_jobs_per_user=int(
+                os.getenv(
+                    "MAX_QUEUED_JOBS_PER_USER", str(defaults.max_queued_jobs_per_user)
+                )
+            ),
+            backlog_retry_after_seconds=float(
+                os.getenv(
+                    "BACKLOG_RETRY_AFTER_SECONDS",
+                    str(defaults.backlog_retry_after_seconds),
+                )
+            ),
+            max_concurrent_parses=int(parses) if parses else None,
+        )
+
+
+class Admission:
+    """Applies the admission limits and counts what they refused."""
+
+    def __init__(self, limits: AdmissionLimits) -> None:
+        """Create the upload byte budget for ``limits``."""
+        self.limits = limits
+        self.upload_bytes = ByteBudget(
+            limits.max_upload_bytes_in_flight,
+            max_waiters=limits.max_upload_waiters,
+            max_wait_seconds=limits.max_upload_wait_seconds,
+        )
+        # Queue depth seen by the latest backlog check
+        self.queued_jobs: int | None = None
+        self.rejected_queue_full = 0
+        self.rejected_user_queue_full = 0
+
+    async def check_backlog(
+        self, session: AsyncSession, account_id: UUID, *, new_jobs: int = 1
+    ) -> None:
+        """Refuse new parse jobs while too many are queued.
+
+        Jobs count against the user owning the account. The check is not
+        locked, so concurrent uploads can overshoot a limit by a few jobs.
+
+        Args:
+            session: Database session
+            account_id: Account the statements are uploaded to
+            new_jobs: Jobs about to be queued
+
+        Raises:
+            AdmissionRejectedError: If either queue limit would be exceeded
+        """
+        limits = self.limits
+        if not limits.max_queued_jobs and not limits.max_queued_jobs_per_user:
+            return
+
+        uploaded_to = aliased(Account)
+        owner = select(uploaded_to.user_id).where(uploaded_to.id == account_id)
+        result = await session.execute(
+            select(
+                func.count(),
+                func.count().filter(Account.user_id == owner.scalar_subquery()),
+            )
+            .select_from(ParseJob)
+            .join(Statement, Statement.id == ParseJob.statement_id)
+            .join(Account, Account.id == Statement.account_id)
+            .where(ParseJob.status == "queued")
+        )
+        queued, queued_for_user = result.one()
+        self.queued_jobs = queued
+
+        if limits.max_queued_jobs and queued + new_jobs > limits.max_queued_jobs:
+            self.rejected_queue_full += 1
+            error_msg = f"{queued} statements are waiting to be parsed; try again later"
+            raise AdmissionRejectedError(
+                error_msg, retry_after=limits.backlog_retry_after_seconds
+            )
+        if (
+            limits.max_queued_jobs_per_user
+            and queued_for_user + new_jobs > limits.max_queued_jobs_per_user
+        ):
+            self.rejected_user_queue_full += 1
+            error_msg = (
+                f"{queued_for_user} of your statements are waiting to be parsed; "
+                "try again once they are done"
+            )
+            raise AdmissionRejectedError(
+                error_msg, retry_after=limits.backlog_retry_after_seconds
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the limits, upload bytes in flight and rejections."""
+        return {
+            "limits": asdict(self.limits),
+            "upload_bytes": self.upload_bytes.stats(),
+            "queued_jobs": self.queued_jobs,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_user_queue_full": self.rejected_user_queue_full,
+        }
+
+
+@functools.cache
+def get_admission() -> Admission:
+    """Return the process's admission control; usable as a FastAPI dependency."""
+    return Admission(AdmissionLimits.from_env())
@@ -0,0 +1,22 @@
+"""Cached spending analytics for dashboards."""
+
+from .cache import AnalyticsCache
+from .cache import CachedResponse
+from .cache import get_analytics_cache
+from .reports import DataScope
+from .reports import Granularity
+from .reports import category_trends_report
+from .reports import data_scope
+from .reports import monthly_spending_report
+
+
+__all__ = [
+    "AnalyticsCache",
+    "CachedResponse",
+    "DataScope",
+    "Granularity",
+    "category_trends_report",
+    "data_scope",
+    "get_analytics_cache",
+    "monthly_spending_report",
+]
@@ -0,0 +1,132 @@
+"""In-process cache of analytics responses with single-flight recomputation.
+
+Entries are keyed on the request's scope, its parameters and the data
+version of the accounts it covers. An import bumps the version, so later
+requests miss and recompute while entries for the old version are never
+served again and age out of the LRU. When several requests miss on the
+same key at once, one computes and the others wait for its result.
+"""
+
+import asyncio
+import functools
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body and its strong entity tag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedResponse":
+        """Tag a body with a digest of its bytes, so equal tags mean equal bytes."""
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class AnalyticsCache:
+    """Bounded LRU of computed responses, shared by concurrent requests."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Keep up to ``max_entries`` responses, least recently used out first."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._computing: dict[Hashable, asyncio.Future[CachedResponse]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _lookup(self, key: Hashable) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def _store(self, key: Hashable, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[bytes]]
+    ) -> CachedResponse:
+        """Return the cached response for ``key``, computing it on a miss.
+
+        Only one caller computes a missing key; the others await its
+        result, or its exception. If that caller is cancelled (its client
+        went away), a waiting caller takes over the computation.
+
+        Args:
+            key: Hashable cache key, including the data version
+            compute: Produces the response body; runs in the caller's
+                task, so it may use the caller's database session
+
+        Returns:
+            The response body and its ETag
+        """
+        while (entry := self._lookup(key)) is None:
+            pending = self._computing.get(key)
+            if pending is None:
+                return await self._compute(key, compute)
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The computing request was cancelled; try again
+        return entry
+
+    async def _compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[bytes]]
+    ) -> CachedResponse:
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._computing[key] = future
+        try:
+            entry = CachedResponse.from_body(await compute())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here, so it is not reported when nobody was waiting
+            future.exception()
+            raise
+        finally:
+            del self._computing[key]
+        self._store(key, entry)
+        future.set_result(entry)
+        return entry
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache size and hit, miss and coalesced counters."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "computing": len(self._computing),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+@functools.cache
+def get_analytics_cache() -> AnalyticsCache:
+    """Return the process's analytics cache, sized by ``ANALYTICS_CACHE_ENTRIES``."""
+    return AnalyticsCache(
+        int(os.getenv("ANALYTICS_CACHE_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+    )
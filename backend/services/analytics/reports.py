@@ -0,0 +1,362 @@
+"""Spending analytics computed from the monthly summary and transactions.
+
+Monthly figures come from ``monthly_spending_summary``, a handful of rows
+per account and month; only daily and weekly breakdowns aggregate the
+transactions themselves, bounded by date so partitions are pruned.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import Date
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal_column
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.orm import Account
+from models.orm import Transaction
+from services.persistence.partitions import add_months
+from services.persistence.partitions import month_start
+from services.persistence.spending_summary import monthly_spending
+
+
+Granularity = Literal["daily", "weekly", "monthly"]
+
+# Matches the summary's name for transactions without a category
+UNCATEGORIZED = "uncategorized"
+
+# Change across the period, relative to the average, that counts as a trend
+TREND_THRESHOLD = 0.1
+MIN_TREND_POINTS = 2
+
+_TRUNC_UNITS: dict[Granularity, str] = {
+    "daily": "day",
+    "weekly": "week",
+    "monthly": "month",
+}
+
+
+def _category() -> ColumnElement[str]:
+    # A literal rather than a parameter, so GROUP BY matches the selection
+    return func.coalesce(Transaction.category, literal_column(f"'{UNCATEGORIZED}'"))
+
+
+@dataclass(frozen=True)
+class DataScope:
+    """The accounts a report covers, with their data versions.
+
+    ``versions`` pairs each account with its ``data_version``; as part of
+    a cache key it identifies both whose data a report shows and which
+    imports it reflects.
+    """
+
+    versions: tuple[tuple[UUID, int], ...]
+
+    @property
+    def account_ids(self) -> list[UUID]:
+        """IDs of the accounts covered."""
+        return [account_id for account_id, _version in self.versions]
+
+
+async def data_scope(
+    session: AsyncSession, account_id: UUID | None
+) -> DataScope | None:
+    """Read the data versions of one account, or of every account.
+
+    Args:
+        session: Database session
+        account_id: Account to report on (default: all accounts)
+
+    Returns:
+        The scope, or None if ``account_id`` does not exist
+    """
+    query = select(Account.id, Account.data_version).order_by(Account.id)
+    if account_id is not None:
+        query = query.where(Account.id == account_id)
+    result = await session.execute(query)
+    versions = tuple((row.id, row.data_version) for row in result.all())
+    if account_id is not None and not versions:
+        return None
+    return DataScope(versions=versions)
+
+
+def month_end(day: date) -> date:
+    """Return the last day of the month containing ``day``."""
+    return add_months(month_start(day), 1) - timedelta(days=1)
+
+
+def period_starts(start: date, end: date, granularity: Granularity) -> list[date]:
+    """Return the first day of each period overlapping ``start``..``end``.
+
+    Weeks start on Monday, as PostgreSQL's ``date_trunc('week', ...)``.
+    """
+    if granularity == "monthly":
+        periods = [month_start(start)]
+        while (following := add_months(periods[-1], 1)) <= end:
+            periods.append(following)
+        return periods
+    if granularity == "weekly":
+        first, step = start - timedelta(days=start.weekday()), 7
+    else:
+        first, step = start, 1
+    return [
+        first + timedelta(days=offset)
+        for offset in range(0, (end - first).days + 1, step)
+    ]
+
+
+def period_label(day: date, granularity: Granularity) -> str:
+    """Label a period: ``YYYY-MM`` for months, its first day otherwise."""
+    return day.strftime("%Y-%m") if granularity == "monthly" else day.isoformat()
+
+
+def _money(amount: Decimal | float) -> float:
+    return round(float(amount), 2)
+
+
+def trend(amounts: Sequence[float]) -> str:
+    """Classify a series as ``increasing``, ``decreasing`` or ``stable``.
+
+    The least-squares slope of the amounts' magnitudes is compared with
+    their average, so spending that grows more negative is increasing.
+    """
+    magnitudes = [abs(amount) for amount in amounts]
+    count = len(magnitudes)
+    average = sum(magnitudes) / count if count else 0.0
+    if count < MIN_TREND_POINTS or average == 0:
+        return "stable"
+    middle = (count - 1) / 2
+    slope = sum(
+        (index - middle) * (magnitude - average)
+        for index, magnitude in enumerate(magnitudes)
+    ) / sum((index - middle) ** 2 for index in range(count))
+    change = slope * (count - 1)
+    if abs(change) <= TREND_THRESHOLD * average:
+        return "stable"
+    return "increasing" if change > 0 else "decreasing"
+
+
+async def _daily_totals(
+    session: AsyncSession,
+    account_ids: list[UUID],
+    start: date,
+    end: date,
+    category: str | None,
+) -> list[dict[str, Any]]:
+    query = (
+        select(Transaction.transaction_date, func.sum(Transaction.amount), func.count())
+        .where(
+            Transaction.account_id.in_(account_ids),
+            Transaction.transaction_date >= start,
+            Transaction.transaction_date <= end,
+        )
+        .group_by(Transaction.transaction_date)
+        .order_by(Transaction.transaction_date)
+    )
+    if category is not None:
+        query = query.where(_category() == category)
+    result = await session.execute(query)
+    return [
+        {"date": day, "amount": _money(amount), "transaction_count": count}
+        for day, amount, count in result.all()
+    ]
+
+
+async def monthly_spending_report(
+    session: AsyncSession,
+    scope: DataScope,
+    *,
+    year: int,
+    month: int | None = None,
+    category: str | None = None,
+) -> dict[str, Any]:
+    """Spending and credits of a month, or a year, by category and by day.
+
+    Args:
+        session: Database session
+        scope: Accounts to include
+        year: Calendar year
+        month: Month (1-12), or None for the whole year
+        category: Only include this category
+
+    Returns:
+        The ``GET /analytics/spending/monthly`` response body
+    """
+    start = date(year, month or 1, 1)
+    end = month_end(start) if month else date(year, 12, 31)
+    account_ids = scope.account_ids
+
+    rows = await monthly_spending(session, account_ids, start, end, category=category)
+    amounts: dict[str, Decimal] = defaultdict(Decimal)
+    counts: dict[str, int] = defaultdict(int)
+    spending = received = Decimal(0)
+    for row in rows:
+        spending += row.spending_amount
+        received += row.credit_amount
+        amounts[row.category] += row.total_amount
+        counts[row.category] += row.transaction_count
+
+    # Largest spending first, as a share of all spending
+    categories = [
+        {
+            "category": name,
+            "amount": _money(amount),
+            "percentage": round(float(amount / spending * 100), 1) if spending else 0.0,
+            "transaction_count": counts[name],
+        }
+        for name, amount in sorted(amounts.items(), key=lambda item: (item[1], item[0]))
+    ]
+    return {
+        "period": {"year": year, "month": month, "start_date": start, "end_date": end},
+        "total_spending": _money(spending),
+        "total_credits": _money(received),
+        "net_amount": _money(spending + received),
+        "categories": categories,
+        "daily_breakdown": await _daily_totals(
+            session, account_ids, start, end, category
+        ),
+    }
+
+
+async def _period_totals(
+    session: AsyncSession,
+    *,
+    account_ids: list[UUID],
+    start: date,
+    end: date,
+    granularity: Granularity,
+    categories: list[str] | None,
+) -> Iterable[tuple[date, str, Decimal, Decimal, Decimal, int]]:
+    """Return (period, category, total, spending, credits, count) rows."""
+    if granularity == "monthly":
+        rows = await monthly_spending(session, account_ids, start, end)
+        return (
+            (
+                row.month,
+                row.category,
+                row.total_amount,
+                row.spending_amount,
+                row.credit_amount,
+                row.transaction_count,
+            )
+            for row in rows
+            if categories is None or row.category in categories
+        )
+
+    unit: ColumnElement[str] = literal_column(f"'{_TRUNC_UNITS[granularity]}'")
+    period = cast(func.date_trunc(unit, Transaction.transaction_date), Date)
+    query = (
+        select(
+            period,
+            _category(),
+            func.sum(Transaction.amount),
+            func.coalesce(
+                func.sum(Transaction.amount).filter(Transaction.amount < 0), 0
+            ),
+            func.coalesce(
+                func.sum(Transaction.amount).filter(Transaction.amount > 0), 0
+            ),
+            func.count(),
+        )
+        .where(
+            Transaction.account_id.in_(account_ids),
+            Transaction.transaction_date >= start,
+            Transaction.transaction_date <= end,
+        )
+        .group_by(period, _category())
+    )
+    if categories is not None:
+        query = query.where(_category().in_(categories))
+    result = await session.execute(query)
+    return result.tuples().all()
+
+
+async def category_trends_report(
+    session: AsyncSession,
+    scope: DataScope,
+    *,
+    start: date,
+    end: date,
+    granularity: Granularity = "monthly",
+    categories: list[str] | None = None,
+) -> dict[str, Any]:
+    """Amounts per category and period, with each category's trend.
+
+    Every period in the range gets a data point, zero when a category
+    had no transactions in it.
+
+    Args:
+        session: Database session
+        scope: Accounts to include
+        start: First day of the range
+        end: Last day of the range
+        granularity: Period length
+        categories: Only include these categories
+
+    Returns:
+        The ``GET /analytics/trends/categories`` response body
+    """
+    periods = period_starts(start, end, granularity)
+    months = len(period_starts(start, end, "monthly"))
+    amounts: dict[tuple[str, date], Decimal] = defaultdict(Decimal)
+    counts: dict[tuple[str, date], int] = defaultdict(int)
+    spending: dict[date, Decimal] = defaultdict(Decimal)
+    received: dict[date, Decimal] = defaultdict(Decimal)
+    rows = await _period_totals(
+        session,
+        account_ids=scope.account_ids,
+        start=start,
+        end=end,
+        granularity=granularity,
+        categories=categories,
+    )
+    for period, category, total, spent, credited, count in rows:
+        amounts[category, period] += total
+        counts[category, period] += count
+        spending[period] += spent
+        received[period] += credited
+
+    trends = []
+    for category in sorted({category for category, _period in amounts}):
+        series = [
+            _money(amounts.get((category, period), Decimal(0))) for period in periods
+        ]
+        points = [
+            {
+                "period": period_label(period, granularity),
+                "amount": amount,
+                "transaction_count": counts.get((category, period), 0),
+            }
+            for period, amount in zip(periods, series, strict=True)
+        ]
+        trends.append(
+            {
+                "category": category,
+                "trend": trend(series),
+                "average_monthly": _money(sum(series) / months),
+                "data_points": points,
+            }
+        )
+    return {
+        "period": {"start_date": start, "end_date": end, "granularity": granularity},
+        "categories": trends,
+        "totals": [
+            {
+                "period": period_label(period, granularity),
+                "total_spending": _money(spending.get(period, Decimal(0))),
+                "total_credits": _money(received.get(period, Decimal(0))),
+            }
+            for period in periods
+        ],
+    }
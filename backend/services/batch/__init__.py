@@ -0,0 +1,22 @@
+"""Batch processing of statement files for large backfills."""
+
+from .discovery import StatementInput
+from .discovery import discover_inputs
+from .discovery import pair_inputs
+from .journal import BatchJournal
+from .runner import BatchOutcome
+from .runner import BatchProgress
+from .runner import BatchSummary
+from .runner import run_batch
+
+
+__all__ = [
+    "BatchJournal",
+    "BatchOutcome",
+    "BatchProgress",
+    "BatchSummary",
+    "StatementInput",
+    "discover_inputs",
+    "pair_inputs",
+    "run_batch",
+]
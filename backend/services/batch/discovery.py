@@ -0,0 +1,130 @@
+"""Input discovery and PDF/CSV pairing for batch statement processing."""
+
+import glob
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SUFFIXES = (".pdf", ".csv")
+
+# Trailing words that distinguish a statement PDF from its transaction CSV,
+# e.g. "2025-04_statement.pdf" and "2025-04_transactions.csv"
+_PAIRING_SUFFIX_RE = re.compile(
+    r"[\s_.-]*(statements?|transactions?|activity)$", re.IGNORECASE
+)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StatementInput:
+    """A statement PDF and/or transaction CSV to be parsed together."""
+
+    key: str
+    pdf_path: Path | None = None
+    csv_path: Path | None = None
+
+    @property
+    def paths(self) -> list[Path]:
+        """Return the input files that are present."""
+        return [path for path in (self.pdf_path, self.csv_path) if path is not None]
+
+    def content_hash(self) -> str:
+        """Return a SHA-256 digest over the contents of all input files."""
+        digest = hashlib.sha256()
+        for label, path in (("pdf", self.pdf_path), ("csv", self.csv_path)):
+            digest.update(label.encode())
+            if path is None:
+                continue
+            with path.open("rb") as f:
+                while chunk := f.read(_HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+
+def pairing_key(path: Path) -> str:
+    """Return the key used to pair a PDF with its CSV.
+
+    Files pair when they live in the same directory and share a stem once
+    a trailing "statement"/"transactions" word is removed.
+
+    Args:
+        path: Path to a PDF or CSV file
+
+    Returns:
+        Pairing key for the file
+    """
+    stem = _PAIRING_SUFFIX_RE.sub("", path.stem).lower() or path.stem.lower()
+    return str(path.parent / stem)
+
+
+def _expand_source(source: str) -> list[Path]:
+    """Expand a directory, glob pattern, or file path into input files."""
+    path = Path(source)
+    if path.is_dir():
+        return [p for p in path.rglob("*") if p.suffix.lower() in SUPPORTED_SUFFIXES]
+    if glob.has_magic(source):
+        return [
+            Path(p)
+            for p in glob.glob(source, recursive=True)  # noqa: PTH207
+            if Path(p).suffix.lower() in SUPPORTED_SUFFIXES
+        ]
+    if path.is_file():
+        return [path]
+
+    logger.warning("⚠️ Input source not found: %s", source)
+    return []
+
+
+def pair_inputs(paths: list[Path]) -> list[StatementInput]:
+    """Group PDF and CSV files into statement inputs.
+
+    Args:
+        paths: PDF and CSV files to group
+
+    Returns:
+        Statement inputs sorted by pairing key
+    """
+    groups: dict[str, dict[str, Path]] = {}
+
+    for path in sorted(set(paths)):
+        kind = path.suffix.lower().lstrip(".")
+        if kind not in ("pdf", "csv"):
+            continue
+        group = groups.setdefault(pairing_key(path), {})
+        if kind in group:
+            logger.warning(
+                "⚠️ Ambiguous %s for '%s', ignoring %s", kind, pairing_key(path), path
+            )
+            continue
+        group[kind] = path
+
+    return [
+        StatementInput(key=key, pdf_path=group.get("pdf"), csv_path=group.get("csv"))
+        for key, group in sorted(groups.items())
+    ]
+
+
+def discover_inputs(sources: list[str]) -> list[StatementInput]:
+    """Find statement files in directories or globs and pair them.
+
+    Args:
+        sources: Directories, glob patterns, or individual file paths
+
+    Returns:
+        Statement inputs ready for batch processing
+    """
+    paths: list[Path] = []
+    for source in sources:
+        paths.extend(_expand_source(source))
+
+    inputs = pair_inputs(paths)
+    logger.info(
+        "🔍 Discovered %s statement inputs from %s files", len(inputs), len(paths)
+    )
+    return inputs
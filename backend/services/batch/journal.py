@@ -0,0 +1,99 @@
+"""Append-only journal of completed batch inputs, used to resume runs."""
+
+import json
+import logging
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+from typing import TextIO
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJournal:
+    """Records content hashes of successfully processed inputs.
+
+    Each completed input is appended as one JSON line, so an interrupted
+    run loses at most the line being written when it stopped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the journal and load previously completed hashes.
+
+        Args:
+            path: Location of the JSON-lines journal file
+        """
+        self.path = path
+        self._completed: set[str] = set()
+        self._handle: TextIO | None = None
+        self._load()
+
+    def _load(self) -> None:
+        """Read completed hashes from an existing journal file."""
+        if not self.path.exists():
+            return
+
+        with self.path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    self._completed.add(json.loads(line)["hash"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(
+                        "⚠️ Ignoring unreadable journal line %s in %s",
+                        line_number,
+                        self.path,
+                    )
+
+        logger.info(
+            "📒 Loaded %s completed inputs from %s", len(self._completed), self.path
+        )
+
+    def __len__(self) -> int:
+        """Return the number of completed inputs."""
+        return len(self._completed)
+
+    def __contains__(self, content_hash: object) -> bool:
+        """Return whether an input with this hash has already completed."""
+        return content_hash in self._completed
+
+    def record(self, content_hash: str, **details: str | None) -> None:
+        """Mark an input as completed.
+
+        Args:
+            content_hash: Content hash of the completed input
+            **details: Extra context stored alongside the hash
+        """
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+
+        entry = {
+            "hash": content_hash,
+            "completed_at": datetime.now(UTC).isoformat(),
+            **details,
+        }
+        self._handle.write(json.dumps(entry, default=str) + "\n")
+        self._handle.flush()
+        self._completed.add(content_hash)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> Self:
+        """Enter the journal context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the journal on context exit."""
+        self.close()
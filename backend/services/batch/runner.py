@@ -0,0 +1,348 @@
+"""Parallel batch runner that parses statement inputs across a process pool."""
+
+import logging
+import os
+import sys
+import time
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TextIO
+
+from services.batch.discovery import StatementInput
+from services.batch.journal import BatchJournal
+from services.output import JsonWriter
+from services.output import OutputWriter
+from services.parsers.dispatch_parser import parse_statement
+from services.telemetry import FieldMetrics
+from services.telemetry import collecting_field_metrics
+
+
+if TYPE_CHECKING:
+    from services.output.columnar import ColumnarExporter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    """Result of processing a single statement input."""
+
+    key: str
+    content_hash: str
+    ok: bool
+    output_path: str
+    statement_id: str | None = None
+    error: str | None = None
+    duration: float = 0.0
+    field_metrics: dict[str, Any] | None = None
+
+
+@dataclass
+class BatchSummary:
+    """Totals for a completed batch run."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    outcomes: list[BatchOutcome] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Return processed inputs per second."""
+        processed = self.succeeded + self.failed
+        return processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ERROR_WRITER = JsonWriter(pretty=True)
+
+
+def error_report(error: Exception, **context: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Build the payload written to errors/ for a failed input."""
+    return {
+        **context,
+        "error": f"{type(error).__name__}: {error}",
+        "traceback": traceback.format_exc(),
+    }
+
+
+def _error_stem(item: StatementInput, content_hash: str) -> str:
+    """Build a stable error file name for an input."""
+    return f"{Path(item.key).name}-{content_hash[:12]}"
+
+
+def process_input(
+    account_slug: str,
+    item: StatementInput,
+    content_hash: str,
+    ready_dir: Path,
+    errors_dir: Path,
+    *,
+    writer: OutputWriter,
+    exporter: "ColumnarExporter | None" = None,
+    collect_field_metrics: bool = False,
+) -> BatchOutcome:
+    """Parse one statement input and write its result or error file.
+
+    Runs inside a worker process, so results are written directly to disk
+    rather than sent back to the parent.
+
+    Args:
+        account_slug: Account type identifier (e.g., 'citi_cc')
+        item: Statement input to parse
+        content_hash: Content hash of the input
+        ready_dir: Directory for successful results
+        errors_dir: Directory for error reports
+        writer: Writer used to serialize successful results
+        exporter: Optional columnar exporter for analytics datasets
+        collect_field_metrics: Return field extraction metrics with the outcome
+
+    Returns:
+        Outcome describing where the result was written
+    """
+    started = time.perf_counter()
+    metrics = FieldMetrics() if collect_field_metrics else None
+    try:
+        with collecting_field_metrics(metrics) if metrics else nullcontext():
+            results = parse_statement(
+                account_slug,
+                pdf_path=str(item.pdf_path) if item.pdf_path else None,
+                csv_path=str(item.csv_path) if item.csv_path else None,
+            )
+        statement_data = results.get("statement_data")
+        statement_id = str(statement_data["id"]) if statement_data else content_hash
+        output_path = writer.write(results, ready_dir, statement_id)
+        if exporter is not None:
+            exporter.export(results)
+    except Exception as e:  # noqa: BLE001 - every failure is reported per input
+        output_path = ERROR_WRITER.write(
+            error_report(
+                e,
+                key=item.key,
+                pdf=item.pdf_path,
+                csv=item.csv_path,
+                hash=content_hash,
+            ),
+            errors_dir,
+            _error_stem(item, content_hash),
+        )
+        return BatchOutcome(
+            key=item.key,
+            content_hash=content_hash,
+            ok=False,
+            output_path=str(output_path),
+            error=f"{type(e).__name__}: {e}",
+            duration=time.perf_counter() - started,
+            field_metrics=metrics.to_dict() if metrics else None,
+        )
+
+    return BatchOutcome(
+        key=item.key,
+        content_hash=content_hash,
+        ok=True,
+        output_path=str(output_path),
+        statement_id=statement_id,
+        duration=time.perf_counter() - started,
+        field_metrics=metrics.to_dict() if metrics else None,
+    )
+
+
+class BatchProgress:
+    """Single-line progress and throughput display for batch runs."""
+
+    def __init__(
+        self, total: int, stream: TextIO | None = None, interval: float = 0.5
+    ) -> None:
+        """Initialize the progress display.
+
+        Args:
+            total: Number of inputs that will be processed
+            stream: Output stream (defaults to stderr)
+            interval: Minimum seconds between redraws
+        """
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.started = time.perf_counter()
+        self._last_render = 0.0
+        self.done = 0
+        self.failed = 0
+
+    def update(self, outcome: BatchOutcome) -> None:
+        """Count an outcome and redraw if the interval has passed."""
+        self.done += 1
+        if not outcome.ok:
+            self.failed += 1
+
+        now = time.perf_counter()
+        if now - self._last_render >= self.interval or self.done == self.total:
+            self._last_render = now
+            self.render(now)
+
+    def render(self, now: float | None = None) -> None:
+        """Write the current progress line."""
+        elapsed = (now or time.perf_counter()) - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        percent = (self.done / self.total * 100) if self.total else 100.0
+        self.stream.write(
+            f"\r[{self.done}/{self.total}] {percent:5.1f}%  "
+            f"{rate:6.1f} stmt/s  failed={self.failed}"
+        )
+        if self.done == self.total:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+def _run_jobs(
+    account_slug: str,
+    jobs: list[tuple[StatementInput, str]],
+    ready_dir: Path,
+    errors_dir: Path,
+    *,
+    writer: OutputWriter,
+    exporter: "ColumnarExporter | None",
+    collect_field_metrics: bool,
+    workers: int,
+) -> Iterator[BatchOutcome]:
+    """Yield outcomes as jobs finish, in-process or across a process pool."""
+    if workers <= 1:
+        for item, content_hash in jobs:
+            yield process_input(
+                account_slug,
+                item,
+                content_hash,
+                ready_dir,
+                errors_dir,
+                writer=writer,
+                exporter=exporter,
+                collect_field_metrics=collect_field_metrics,
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: list[Future[BatchOutcome]] = [
+            executor.submit(
+                process_input,
+                account_slug,
+                item,
+                content_hash,
+                ready_dir,
+                errors_dir,
+                writer=writer,
+                exporter=exporter,
+                collect_field_metrics=collect_field_metrics,
+            )
+            for item, content_hash in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(
+    account_slug: str,
+    inputs: list[StatementInput],
+    output_dir: Path,
+    *,
+    journal: BatchJournal | None = None,
+    workers: int | None = None,
+    progress: BatchProgress | None = None,
+    writer: OutputWriter | None = None,
+    exporter: "ColumnarExporter | None" = None,
+    field_metrics: FieldMetrics | None = None,
+) -> BatchSummary:
+    """Parse statement inputs in parallel, skipping already completed ones.
+
+    Successful results are written to ``output_dir/ready`` and failures to
+    ``output_dir/errors``. Completed inputs are recorded in the journal so
+    an interrupted run can be resumed.
+
+    Args:
+        account_slug: Account type identifier (e.g., 'citi_cc')
+        inputs: Statement inputs to process
+        output_dir: Base output directory
+        journal: Optional journal used to skip and record completed inputs
+        workers: Worker process count (defaults to the CPU count)
+        progress: Optional progress display
+        writer: Result writer (defaults to compact JSON)
+        exporter: Optional columnar exporter for analytics datasets
+        field_metrics: Optional collector that worker field metrics merge into
+
+    Returns:
+        Summary of the batch run
+    """
+    ready_dir = output_dir / "ready"
+    errors_dir = output_dir / "errors"
+    ready_dir.mkdir(parents=True, exist_ok=True)
+    errors_dir.mkdir(parents=True, exist_ok=True)
+
+    summary = BatchSummary(total=len(inputs))
+    started = time.perf_counter()
+
+    jobs: list[tuple[StatementInput, str]] = []
+    for item in inputs:
+        content_hash = item.content_hash()
+        if journal is not None and content_hash in journal:
+            summary.skipped += 1
+            continue
+        jobs.append((item, content_hash))
+
+    logger.info(
+        "🚀 Processing %s inputs (%s already completed) with %s workers",
+        len(jobs),
+        summary.skipped,
+        workers or os.cpu_count(),
+    )
+
+    if progress is not None:
+        progress.total = len(jobs)
+
+    for outcome in _run_jobs(
+        account_slug,
+        jobs,
+        ready_dir,
+        errors_dir,
+        writer=writer or JsonWriter(),
+        exporter=exporter,
+        collect_field_metrics=field_metrics is not None,
+        workers=workers or os.cpu_count() or 1,
+    ):
+        if field_metrics is not None and outcome.field_metrics:
+            field_metrics.merge(FieldMetrics.from_dict(outcome.field_metrics))
+        # Metrics are merged already; don't keep one copy per input
+        summary.outcomes.append(replace(outcome, field_metrics=None))
+        if outcome.ok:
+            summary.succeeded += 1
+            if journal is not None:
+                journal.record(
+                    outcome.content_hash,
+                    key=outcome.key,
+                    statement_id=outcome.statement_id,
+                    output=outcome.output_path,
+                )
+        else:
+            summary.failed += 1
+            logger.warning("❌ Failed to process %s: %s", outcome.key, outcome.error)
+
+        if progress is not None:
+            progress.update(outcome)
+
+    summary.elapsed = time.perf_counter() - started
+    logger.info(
+        "✅ Batch complete: %s succeeded, %s failed, %s skipped in %.1fs",
+        summary.succeeded,
+        summary.failed,
+        summary.skipped,
+        summary.elapsed,
+    )
+    return summary
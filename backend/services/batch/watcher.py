@@ -0,0 +1,561 @@
+"""Watch-folder ingestion daemon feeding the output/ready and output/errors layout.
+
+Files dropped into an inbox directory are debounced until they stop
+changing, grouped into PDF/CSV pairs, claimed by moving them into a
+per-job directory, and parsed on a bounded process pool. Each finished
+job directory (original files plus the ``result`` file) is renamed into
+``ready/`` or ``errors/`` in one atomic step.
+
+Job directories left in ``processing/`` by a daemon that died are parsed
+again on startup. When a worker process crashes, the pool fails every job
+in flight, not only the one that crashed it, so each of them is parsed
+again on its own. A job that keeps crashing is moved to ``errors/`` with
+the crash recorded as its result once it has taken down ``max_crashes``
+pools.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import logging
+import os
+import select
+import shutil
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Protocol
+from typing import Self
+from uuid import uuid4
+
+from services.batch.discovery import SUPPORTED_SUFFIXES
+from services.batch.discovery import pairing_key
+from services.batch.runner import ERROR_WRITER
+from services.batch.runner import error_report
+from services.output import JsonWriter
+from services.output import OutputWriter
+from services.parsers.dispatch_parser import parse_statement
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_STEM = "result"
+
+# Pool crashes a job may be caught in before it is moved to errors/
+DEFAULT_MAX_CRASHES = 2
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_INOTIFY_EVENT = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 64 * 1024
+
+
+class InboxWatcher(Protocol):
+    """Reports names of inbox entries that may have changed."""
+
+    def changes(self, timeout: float) -> set[str] | None:
+        """Wait up to ``timeout`` seconds for changes.
+
+        Returns:
+            Changed entry names, or None when a full rescan is needed
+        """
+        ...
+
+    def close(self) -> None:
+        """Release watcher resources."""
+        ...
+
+
+class InotifyWatcher:
+    """Linux inotify watcher for a single directory."""
+
+    def __init__(self, directory: Path) -> None:
+        """Start watching a directory.
+
+        Args:
+            directory: Directory to watch
+
+        Raises:
+            OSError: If inotify is unavailable or the watch cannot be added
+        """
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_MODIFY
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, os.strerror(err), str(directory))
+
+    def changes(self, timeout: float) -> set[str] | None:
+        """Wait for inotify events and return the affected names."""
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return set()
+
+        names: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, _INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                _wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable watcher that rescans the directory on an interval."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        """Initialize the watcher.
+
+        Args:
+            interval: Maximum seconds between directory scans
+        """
+        self.interval = interval
+
+    def changes(self, timeout: float) -> set[str] | None:
+        """Sleep until the next scan and request a full rescan."""
+        time.sleep(max(min(timeout, self.interval), 0))
+        return None
+
+    def close(self) -> None:
+        """Nothing to release for polling."""
+
+
+def create_watcher(
+    directory: Path, *, force_polling: bool = False, poll_interval: float = 1.0
+) -> InboxWatcher:
+    """Create an inotify watcher, falling back to polling when unavailable.
+
+    Args:
+        directory: Directory to watch
+        force_polling: Skip inotify even where it is available
+        poll_interval: Scan interval for the polling fallback
+
+    Returns:
+        Watcher for the directory
+    """
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            logger.warning("⚠️ inotify unavailable (%s), falling back to polling", e)
+    return PollingWatcher(poll_interval)
+
+
+@dataclass
+class _FileState:
+    """Last observed size/mtime of an inbox file and when it last changed."""
+
+    size: int
+    mtime_ns: int
+    changed_at: float
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    """Result of processing one claimed inbox job."""
+
+    job_id: str
+    ok: bool
+    path: str
+    error: str | None = None
+
+
+def _is_candidate(name: str) -> bool:
+    """Return whether an inbox entry should be ingested."""
+    return not name.startswith(".") and name.lower().endswith(SUPPORTED_SUFFIXES)
+
+
+def _move(source: Path, destination: Path) -> None:
+    """Rename a path, copying only when it crosses filesystems."""
+    try:
+        source.replace(destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
+def process_job(
+    account_slug: str,
+    job_dir: Path,
+    ready_dir: Path,
+    errors_dir: Path,
+    writer: OutputWriter,
+) -> JobOutcome:
+    """Parse a claimed job and move its directory into ready/ or errors/.
+
+    Args:
+        account_slug: Account type identifier (e.g., 'citi_cc')
+        job_dir: Directory holding the claimed PDF and/or CSV
+        ready_dir: Destination for successful jobs
+        errors_dir: Destination for failed jobs
+        writer: Writer used to serialize successful results
+
+    Returns:
+        Outcome with the job's final location
+    """
+    pdf_path = next((p for p in job_dir.iterdir() if p.suffix.lower() == ".pdf"), None)
+    csv_path = next((p for p in job_dir.iterdir() if p.suffix.lower() == ".csv"), None)
+    error: str | None = None
+
+    try:
+        results = parse_statement(
+            account_slug,
+            pdf_path=str(pdf_path) if pdf_path else None,
+            csv_path=str(csv_path) if csv_path else None,
+        )
+        writer.write(results, job_dir, RESULT_STEM)
+    except Exception as e:  # noqa: BLE001 - failures are recorded in errors/
+        error = f"{type(e).__name__}: {e}"
+        ERROR_WRITER.write(error_report(e), job_dir, RESULT_STEM)
+
+    destination = (ready_dir if error is None else errors_dir) / job_dir.name
+    job_dir.replace(destination)
+    return JobOutcome(
+        job_id=job_dir.name, ok=error is None, path=str(destination), error=error
+    )
+
+
+def abandon_job(job_dir: Path, errors_dir: Path, error: Exception) -> JobOutcome:
+    """Move a job whose worker crashed into errors/ with the crash as its result.
+
+    Must be called while handling ``error`` so its traceback is recorded.
+
+    Args:
+        job_dir: Claimed job directory still in processing/
+        errors_dir: Destination for failed jobs
+        error: Exception raised in place of the job's outcome
+
+    Returns:
+        Failed outcome with the job's final location
+    """
+    ERROR_WRITER.write(error_report(error), job_dir, RESULT_STEM)
+    destination = errors_dir / job_dir.name
+    job_dir.replace(destination)
+    return JobOutcome(
+        job_id=job_dir.name,
+        ok=False,
+        path=str(destination),
+        error=f"{type(error).__name__}: {error}",
+    )
+
+
+class IngestDaemon:
+    """Long-running ingestion loop over an inbox directory."""
+
+    def __init__(
+        self,
+        account_slug: str,
+        inbox: Path,
+        output_dir: Path,
+        *,
+        workers: int = 1,
+        max_in_flight: int | None = None,
+        settle_seconds: float = 2.0,
+        watcher: InboxWatcher | None = None,
+        writer: OutputWriter | None = None,
+        max_crashes: int = DEFAULT_MAX_CRASHES,
+    ) -> None:
+        """Initialize the daemon.
+
+        Args:
+            account_slug: Account type identifier (e.g., 'citi_cc')
+            inbox: Directory that new statement files are dropped into
+            output_dir: Base output directory holding ready/ and errors/
+            workers: Parser processes; 1 parses inline in the daemon loop
+            max_in_flight: Jobs queued or running at once (default 2x workers)
+            settle_seconds: Quiet period before a file is considered complete
+            watcher: Change source (defaults to inotify with polling fallback)
+            writer: Result writer (defaults to compact JSON)
+            max_crashes: Pool crashes a job may be in flight for before it
+                is moved to errors/; it runs alone after the first
+        """
+        self.account_slug = account_slug
+        self.inbox = inbox
+        self.processing_dir = output_dir / "processing"
+        self.ready_dir = output_dir / "ready"
+        self.errors_dir = output_dir / "errors"
+        for directory in (
+            inbox,
+            self.processing_dir,
+            self.ready_dir,
+            self.errors_dir,
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self.workers = workers
+        self.max_in_flight = max_in_flight or workers * 2
+        self.settle_seconds = settle_seconds
+        self.watcher = watcher or create_watcher(inbox)
+        self.writer = writer or JsonWriter()
+        self.max_crashes = max_crashes
+
+        self._pending: dict[str, _FileState] = {}
+        self._recovered: deque[Path] = deque()
+        self._in_flight: dict[Future[JobOutcome], Path] = {}
+        # Jobs in flight when a worker crashed -> pool crashes seen so far
+        self._crashes: dict[Path, int] = {}
+        # Crashed jobs waiting to be parsed again, one at a time
+        self._suspects: deque[Path] = deque()
+        self._executor = (
+            ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        )
+        self.succeeded = 0
+        self.failed = 0
+
+    def _observe(self, names: set[str] | None, now: float) -> None:
+        """Update debounce state for changed names, or rescan everything."""
+        if names is None:
+            names = {entry.name for entry in os.scandir(self.inbox)}
+            names |= set(self._pending)
+
+        for name in names:
+            if not _is_candidate(name):
+                continue
+            try:
+                stat = (self.inbox / name).stat()
+            except FileNotFoundError:
+                self._pending.pop(name, None)
+                continue
+
+            state = self._pending.get(name)
+            if state is None or (state.size, state.mtime_ns) != (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                self._pending[name] = _FileState(stat.st_size, stat.st_mtime_ns, now)
+
+    def _settled_groups(self, now: float) -> list[list[str]]:
+        """Return pairing groups whose files have all stopped changing."""
+        groups: dict[str, list[str]] = {}
+        for name in self._pending:
+            groups.setdefault(pairing_key(Path(name)), []).append(name)
+
+        return [
+            sorted(names)
+            for names in groups.values()
+            if all(
+                now - self._pending[name].changed_at >= self.settle_seconds
+                for name in names
+            )
+        ]
+
+    def _claim(self, names: list[str]) -> Path | None:
+        """Move a settled group into a fresh job directory."""
+        job_dir = self.processing_dir / uuid4().hex[:12]
+        job_dir.mkdir()
+        for name in names:
+            self._pending.pop(name, None)
+            try:
+                _move(self.inbox / name, job_dir / name)
+            except FileNotFoundError:
+                logger.warning("⚠️ %s disappeared before it could be claimed", name)
+
+        if not any(job_dir.iterdir()):
+            job_dir.rmdir()
+            return None
+        return job_dir
+
+    def _record(self, outcome: JobOutcome) -> None:
+        """Log and count a finished job."""
+        if outcome.ok:
+            self.succeeded += 1
+            logger.info("✅ Ingested job %s -> %s", outcome.job_id, outcome.path)
+        else:
+            self.failed += 1
+            logger.warning("❌ Job %s failed: %s", outcome.job_id, outcome.error)
+
+    def recover(self) -> int:
+        """Queue job directories left in processing/ by a previous run.
+
+        Returns:
+            Number of jobs queued to be parsed again
+        """
+        for job_dir in sorted(self.processing_dir.iterdir()):
+            if not job_dir.is_dir() or job_dir in self._in_flight.values():
+                continue
+            if job_dir in self._suspects:
+                # Waiting to be parsed again alone after a crash
+                continue
+            if not any(job_dir.iterdir()):
+                # Claimed directory that never received its files
+                job_dir.rmdir()
+                continue
+            if job_dir not in self._recovered:
+                self._recovered.append(job_dir)
+
+        if self._recovered:
+            logger.info("♻️ Recovering %s unfinished jobs", len(self._recovered))
+        return len(self._recovered)
+
+    def _retry_after_crash(self, job_dir: Path) -> bool:
+        """Count a pool crash against a job and queue it to run alone.
+
+        Returns:
+            Whether the job gets another attempt
+        """
+        crashes = self._crashes.get(job_dir, 0) + 1
+        self._crashes[job_dir] = crashes
+        if crashes >= self.max_crashes:
+            return False
+        logger.warning(
+            "⚠️ Parser pool crashed with job %s in flight, parsing it again alone",
+            job_dir.name,
+        )
+        self._suspects.append(job_dir)
+        return True
+
+    def _reap(self) -> None:
+        """Collect finished futures, retrying the jobs a worker crash failed."""
+        for future in [f for f in self._in_flight if f.done()]:
+            job_dir = self._in_flight.pop(future)
+            try:
+                outcome = future.result()
+            except Exception as e:
+                if not job_dir.exists():
+                    logger.exception("❌ Lost the outcome of job %s", job_dir.name)
+                    self._crashes.pop(job_dir, None)
+                    self.failed += 1
+                    continue
+                if isinstance(e, BrokenProcessPool) and self._retry_after_crash(
+                    job_dir
+                ):
+                    continue
+                logger.exception("❌ Ingestion worker crashed on job %s", job_dir.name)
+                outcome = abandon_job(job_dir, self.errors_dir, e)
+            self._crashes.pop(job_dir, None)
+            self._record(outcome)
+
+    def _submit(self, job_dir: Path) -> None:
+        """Parse a claimed job inline or on the worker pool."""
+        job = functools.partial(
+            process_job,
+            self.account_slug,
+            job_dir,
+            self.ready_dir,
+            self.errors_dir,
+            self.writer,
+        )
+        if self._executor is None:
+            self._record(job())
+            return
+
+        try:
+            future = self._executor.submit(job)
+        except BrokenProcessPool:
+            # A worker process died; its jobs are parsed again when reaped
+            logger.warning("⚠️ Parser pool broke, starting a new one")
+            self._executor.shutdown(wait=False)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            future = self._executor.submit(job)
+        self._in_flight[future] = job_dir
+
+    def _dispatch(self, now: float) -> None:
+        """Claim settled groups and hand them to the worker pool."""
+        # A job caught in a crash runs alone, so a crash while it runs is its own
+        if any(job_dir in self._crashes for job_dir in self._in_flight.values()):
+            return
+        if self._suspects:
+            if not self._in_flight:
+                self._submit(self._suspects.popleft())
+            return
+
+        # Recovered jobs were claimed before anything now in the inbox
+        while self._recovered:
+            if len(self._in_flight) >= self.max_in_flight:
+                return
+            self._submit(self._recovered.popleft())
+
+        for names in self._settled_groups(now):
+            if len(self._in_flight) >= self.max_in_flight:
+                # Leave the rest in the inbox until a worker frees up
+                return
+
+            job_dir = self._claim(names)
+            if job_dir is not None:
+                self._submit(job_dir)
+
+    def poll_once(self, timeout: float = 0.0, *, rescan: bool = False) -> None:
+        """Run one iteration of the watch/debounce/dispatch loop.
+
+        Args:
+            timeout: Maximum seconds to wait for new filesystem events
+            rescan: Force a full directory scan instead of using events
+        """
+        names = self.watcher.changes(timeout)
+        now = time.monotonic()
+        self._observe(None if rescan else names, now)
+        self._reap()
+        self._dispatch(now)
+
+    def run(self, stop_event: threading.Event | None = None) -> None:
+        """Process the inbox until the stop event is set.
+
+        Args:
+            stop_event: Event that ends the loop when set
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info("👀 Watching %s for new statements", self.inbox)
+
+        # Pick up anything claimed or dropped while the daemon was not running
+        self.recover()
+        self.poll_once(rescan=True)
+        while not stop_event.is_set():
+            timeout = self.settle_seconds / 2 if self._pending else 1.0
+            self.poll_once(timeout)
+
+        logger.info("🛑 Stopping ingestion, waiting for %s jobs", len(self._in_flight))
+
+    def close(self) -> None:
+        """Wait for in-flight jobs and release resources."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._reap()
+        self.watcher.close()
+
+    def __enter__(self) -> Self:
+        """Enter the daemon context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut the daemon down on context exit."""
+        self.close()
@@ -0,0 +1,38 @@
+"""Durable statement parse jobs: the PostgreSQL queue, its worker and notifications."""
+
+from .notifications import JOBS_CHANNEL
+from .notifications import STATUS_CHANNEL
+from .notifications import TERMINAL_STATUSES
+from .notifications import NotificationListener
+from .notifications import StatusBroker
+from .notifications import StatusEvent
+from .queue import DEFAULT_LEASE_SECONDS
+from .queue import ClaimedJob
+from .queue import LeaseLostError
+from .queue import claim_job
+from .queue import complete_job
+from .queue import fail_job
+from .queue import heartbeat
+from .queue import requeue_expired
+from .queue import retry_delay
+from .worker import ParseJobWorker
+
+
+__all__ = [
+    "DEFAULT_LEASE_SECONDS",
+    "JOBS_CHANNEL",
+    "STATUS_CHANNEL",
+    "TERMINAL_STATUSES",
+    "ClaimedJob",
+    "LeaseLostError",
+    "NotificationListener",
+    "ParseJobWorker",
+    "StatusBroker",
+    "StatusEvent",
+    "claim_job",
+    "complete_job",
+    "fail_job",
+    "heartbeat",
+    "requeue_expired",
+    "retry_delay",
+]
@@ -0,0 +1,202 @@
+"""Push notifications for parse jobs over PostgreSQL LISTEN/NOTIFY.
+
+Database triggers ``NOTIFY`` when a parse job becomes due and when a
+statement's status changes, so every writer (the upload endpoint, any
+worker, lease reclaims) is covered without calling anything. Each
+process holds a single ``LISTEN`` connection in a
+``NotificationListener`` and fans the notifications out in memory:
+``parse_jobs`` wakes the local ``ParseJobWorker``, and
+``statement_status`` reaches the requests waiting in a
+``StatusBroker``, so waiting clients cost no queries.
+
+Notifications are not queued while the connection is down, so after
+every (re)connect the handlers are told to catch up from the database.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+
+logger = logging.getLogger(__name__)
+
+JOBS_CHANNEL = "parse_jobs"
+STATUS_CHANNEL = "statement_status"
+
+# Statuses after which a statement no longer changes
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+# A status notification, or None when notifications may have been missed
+StatusEvent = dict[str, Any] | None
+
+
+class NotificationListener:
+    """Holds one LISTEN connection and dispatches notifications to handlers."""
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        """Configure the listener; nothing connects until ``start``.
+
+        Args:
+            dsn: PostgreSQL connection URL (``postgresql://...``)
+            reconnect_delay: First wait after a failed connection attempt
+            max_reconnect_delay: Cap on the doubling reconnect wait
+        """
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._connect_callbacks: list[Callable[[], None]] = []
+        self._task: asyncio.Task[None] | None = None
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+
+    def add_handler(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Call ``handler`` with the payload of every notification on a channel.
+
+        Handlers must be registered before ``start``.
+        """
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_connect(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` after every (re)connect, when events may have been missed."""
+        self._connect_callbacks.append(callback)
+
+    async def start(self) -> None:
+        """Connect in the background, reconnecting until ``stop``."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def dispatch(self, channel: str, payload: str) -> None:
+        """Hand a notification to the channel's handlers."""
+        self.received += 1
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("❌ Handler for %s notification failed", channel)
+
+    def _notified(
+        self, _connection: asyncpg.Connection, _pid: int, channel: str, payload: str
+    ) -> None:
+        self.dispatch(channel, payload)
+
+    async def _listen(self, connection: asyncpg.Connection) -> None:
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _connection: lost.set())
+        for channel in self._handlers:
+            await connection.add_listener(channel, self._notified)
+        self.connected = True
+        logger.info("📡 Listening for %s", ", ".join(self._handlers))
+        for callback in self._connect_callbacks:
+            callback()
+        await lost.wait()
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(
+                    "⚠️ LISTEN connection failed (%s), retrying in %.0fs", e, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            delay = self.reconnect_delay
+            try:
+                await self._listen(connection)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("❌ LISTEN connection failed")
+            finally:
+                self.connected = False
+                await connection.close()
+            self.reconnects += 1
+            logger.warning("⚠️ LISTEN connection lost, reconnecting")
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection state and notification counters."""
+        return {
+            "connected": self.connected,
+            "channels": sorted(self._handlers),
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+class StatusBroker:
+    """Fans statement status notifications out to waiting requests."""
+
+    def __init__(self) -> None:
+        """Initialize a broker with no subscribers."""
+        self._subscribers: dict[UUID, set[asyncio.Queue[StatusEvent]]] = {}
+        self.delivered = 0
+
+    def publish(self, payload: str) -> None:
+        """Deliver a ``statement_status`` notification to its subscribers."""
+        try:
+            event = json.loads(payload)
+            statement_id = UUID(event["statement_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("⚠️ Ignoring malformed status notification %r", payload)
+            return
+
+        for queue in self._subscribers.get(statement_id, ()):
+            queue.put_nowait(event)
+            self.delivered += 1
+
+    def resync(self) -> None:
+        """Tell every subscriber to re-read its statement."""
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+
+    @contextlib.contextmanager
+    def subscribe(self, statement_id: UUID) -> Iterator[asyncio.Queue[StatusEvent]]:
+        """Receive a statement's status events while the block is open.
+
+        Subscribe before reading the current status, so a change that
+        lands in between is not missed.
+
+        Yields:
+            Queue of status events, None meaning read the status again
+        """
+        queue: asyncio.Queue[StatusEvent] = asyncio.Queue()
+        queues = self._subscribers.setdefault(statement_id, set())
+        queues.add(queue)
+        try:
+            yield queue
+        finally:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[statement_id]
+
+    def stats(self) -> dict[str, Any]:
+        """Return waiting subscribers and delivered events."""
+        return {
+            "statements": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "delivered": self.delivered,
+        }
@@ -0,0 +1,305 @@
+"""Durable parse job queue on PostgreSQL.
+
+Uploads insert a ``parse_jobs`` row in the same transaction as their
+``pending`` statement. Workers on any number of hosts claim the oldest
+due job with ``FOR UPDATE SKIP LOCKED``, so concurrent claims never wait
+on each other or hand out the same job, and take a lease on it that they
+renew with heartbeats while parsing. Every later write is fenced on the
+lease: a worker that lost its lease cannot complete or fail a job that
+another worker has since claimed.
+
+A failed attempt is queued again after an exponential backoff until the
+job runs out of attempts; then it is ``dead`` and its statement
+``failed``. Leases left behind by crashed workers are reclaimed by
+``requeue_expired`` and count as failed attempts.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.orm import ParseJob
+from models.orm import Statement
+
+
+DEFAULT_LEASE_SECONDS = 60.0
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 600.0
+
+
+class LeaseLostError(Exception):
+    """A job's lease expired and it may now belong to another worker."""
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """A job leased to a worker, with what is needed to parse it."""
+
+    id: UUID
+    statement_id: UUID
+    worker_id: str
+    attempts: int
+    max_attempts: int
+    account_slug: str
+    pdf_path: str | None
+    csv_path: str | None
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether this is the job's last allowed attempt."""
+        return self.attempts >= self.max_attempts
+
+
+def retry_delay(
+    attempts: int,
+    *,
+    base: float = RETRY_BASE_SECONDS,
+    cap: float = RETRY_MAX_SECONDS,
+) -> float:
+    """Return the backoff before retrying a job that failed ``attempts`` times.
+
+    The delay doubles per attempt up to ``cap``; a random half of it is
+    jittered so jobs that failed together do not retry together.
+    """
+    delay = min(cap, base * 2.0 ** max(0, attempts - 1))
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+
+def _seconds_from_now(seconds: float) -> ColumnElement[Any]:
+    return func.now() + timedelta(seconds=seconds)
+
+
+def _leased_to(job: ClaimedJob) -> tuple[ColumnElement[bool], ...]:
+    return (
+        ParseJob.id == job.id,
+        ParseJob.status == "running",
+        ParseJob.locked_by == job.worker_id,
+    )
+
+
+def _failed_statement(error: str) -> dict[str, Any]:
+    return {
+        "status": "failed",
+        "processing_metadata": Statement.processing_metadata.op("||")(
+            literal({"error": error}, JSONB)
+        ),
+        "processed_at": func.now(),
+    }
+
+
+async def claim_job(
+    session: AsyncSession,
+    worker_id: str,
+    *,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> ClaimedJob | None:
+    """Lease the oldest due job to a worker and mark its statement processing.
+
+    Args:
+        session: Session with an open transaction
+        worker_id: Identifier of the claiming worker
+        lease_seconds: How long the lease lasts without a heartbeat
+
+    Returns:
+        The claimed job, or None if no job is due
+    """
+    # Rows locked by other claimers are skipped rather than waited on
+    due = (
+        select(ParseJob.id)
+        .where(ParseJob.status == "queued", ParseJob.run_after <= func.now())
+        .order_by(ParseJob.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    claimed = await session.execute(
+        update(ParseJob)
+        .where(ParseJob.id == due)
+        .values(
+            status="running",
+            attempts=ParseJob.attempts + 1,
+            locked_by=worker_id,
+            lease_expires_at=_seconds_from_now(lease_seconds),
+            heartbeat_at=func.now(),
+        )
+        .returning(
+            ParseJob.id,
+            ParseJob.statement_id,
+            ParseJob.attempts,
+            ParseJob.max_attempts,
+        )
+    )
+    job = claimed.one_or_none()
+    if job is None:
+        return None
+
+    statement = await session.execute(
+        update(Statement)
+        .where(Statement.id == job.statement_id)
+        .values(status="processing")
+        .returning(
+            Statement.processing_metadata["account_type"].astext,
+            Statement.file_pdf_url,
+            Statement.file_csv_url,
+        )
+    )
+    account_slug, pdf_path, csv_path = statement.one()
+    return ClaimedJob(
+        id=job.id,
+        statement_id=job.statement_id,
+        worker_id=worker_id,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        account_slug=account_slug,
+        pdf_path=pdf_path,
+        csv_path=csv_path,
+    )
+
+
+async def heartbeat(
+    session: AsyncSession,
+    job: ClaimedJob,
+    *,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> bool:
+    """Extend a job's lease.
+
+    Returns:
+        False if the worker no longer holds the lease
+    """
+    renewed = await session.execute(
+        update(ParseJob)
+        .where(*_leased_to(job))
+        .values(
+            lease_expires_at=_seconds_from_now(lease_seconds),
+            heartbeat_at=func.now(),
+        )
+        .returning(ParseJob.id)
+    )
+    return renewed.scalar_one_or_none() is not None
+
+
+async def complete_job(session: AsyncSession, job: ClaimedJob) -> None:
+    """Mark a job succeeded in the transaction that stores its result.
+
+    Raises:
+        LeaseLostError: If the worker no longer holds the lease; the
+            caller's transaction must then be rolled back
+    """
+    completed = await session.execute(
+        update(ParseJob)
+        .where(*_leased_to(job))
+        .values(
+            status="succeeded",
+            locked_by=None,
+            lease_expires_at=None,
+            last_error=None,
+            finished_at=func.now(),
+        )
+        .returning(ParseJob.id)
+    )
+    if completed.scalar_one_or_none() is None:
+        error_msg = f"Lease on parse job {job.id} was lost before it completed"
+        raise LeaseLostError(error_msg)
+
+
+async def fail_job(
+    session: AsyncSession,
+    job: ClaimedJob,
+    error: str,
+    *,
+    retry: bool = True,
+) -> str:
+    """Record a failed attempt, queueing a retry or dead-lettering the job.
+
+    Args:
+        session: Session with an open transaction
+        job: The failed job
+        error: Failure description kept on the job
+        retry: False for failures another attempt cannot fix
+
+    Returns:
+        The job's new status, ``queued`` or ``dead``
+
+    Raises:
+        LeaseLostError: If the worker no longer holds the lease
+    """
+    dead = not retry or job.exhausted
+    values: dict[str, Any] = {
+        "locked_by": None,
+        "lease_expires_at": None,
+        "last_error": error,
+    }
+    if dead:
+        values |= {"status": "dead", "finished_at": func.now()}
+    else:
+        values |= {
+            "status": "queued",
+            "run_after": _seconds_from_now(retry_delay(job.attempts)),
+        }
+    failed = await session.execute(
+        update(ParseJob).where(*_leased_to(job)).values(**values).returning(ParseJob.id)
+    )
+    if failed.scalar_one_or_none() is None:
+        error_msg = f"Lease on parse job {job.id} was lost before it failed"
+        raise LeaseLostError(error_msg)
+
+    await session.execute(
+        update(Statement)
+        .where(Statement.id == job.statement_id)
+        .values(**(_failed_statement(error) if dead else {"status": "pending"}))
+    )
+    return str(values["status"])
+
+
+async def requeue_expired(session: AsyncSession) -> int:
+    """Take back jobs whose worker stopped renewing its lease.
+
+    Each expired lease counts as a failed attempt: the job is queued
+    again, or dead-lettered if it has no attempts left.
+
+    Args:
+        session: Session with an open transaction
+
+    Returns:
+        Number of jobs taken back
+    """
+    exhausted = ParseJob.attempts >= ParseJob.max_attempts
+    expired = await session.execute(
+        update(ParseJob)
+        .where(ParseJob.status == "running", ParseJob.lease_expires_at < func.now())
+        .values(
+            status=case((exhausted, "dead"), else_="queued"),
+            last_error="Lease expired on worker " + ParseJob.locked_by,
+            locked_by=None,
+            lease_expires_at=None,
+            run_after=func.now(),
+            finished_at=case((exhausted, func.now()), else_=None),
+        )
+        .returning(ParseJob.statement_id, ParseJob.status, ParseJob.last_error)
+    )
+    jobs = expired.all()
+    for statement_id, status, error in jobs:
+        await session.execute(
+            update(Statement)
+            .where(Statement.id == statement_id)
+            .values(
+                **(
+                    _failed_statement(error or "Lease expired")
+                    if status == "dead"
+                    else {"status": "pending"}
+                )
+            )
+        )
+    return len(jobs)
@@ -0,0 +1,277 @@
+"""Worker loop that claims parse jobs and runs them in a parser pool.
+
+A ``ParseJobWorker`` keeps up to ``concurrency`` jobs in flight, each
+parsed in a ``ParserPool`` process while a heartbeat renews its lease.
+The API runs one alongside its request handlers; ``cli/parse_worker.py``
+runs one as a standalone process, and any number of them can share a
+database.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from services.jobs.queue import DEFAULT_LEASE_SECONDS
+from services.jobs.queue import ClaimedJob
+from services.jobs.queue import LeaseLostError
+from services.jobs.queue import claim_job
+from services.jobs.queue import complete_job
+from services.jobs.queue import fail_job
+from services.jobs.queue import heartbeat
+from services.jobs.queue import requeue_expired
+from services.parsers.dispatch_parser import parse_statement
+from services.parsers.worker_pool import ParserPool
+from services.persistence.statements import complete_statement
+from services.storage import ObjectStorage
+
+
+logger = logging.getLogger(__name__)
+
+# Parser failures that would recur on every attempt: bad input or no parser
+PERMANENT_ERRORS: tuple[type[Exception], ...] = (
+    FileNotFoundError,
+    NotImplementedError,
+    ValueError,
+)
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this process, even across restarts."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class ParseJobWorker:
+    """Claims parse jobs from the database and processes them."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        parser_pool: ParserPool,
+        *,
+        storage: ObjectStorage | None = None,
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Configure the worker; nothing is claimed until ``run``.
+
+        Args:
+            session_maker: Factory for database sessions on the primary
+            parser_pool: Started pool the parsers run in
+            storage: Backend the uploaded files are stored in (default:
+                locations are local paths)
+            worker_id: Lease holder name (default: host, pid and a nonce)
+            concurrency: Jobs in flight at once (default: pool workers)
+            lease_seconds: Lease length; renewed every third of it
+            poll_interval: Seconds between claims while the queue is empty
+        """
+        self.session_maker = session_maker
+        self.parser_pool = parser_pool
+        self.storage = storage
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency or parser_pool.workers
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self.claimed = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.dead = 0
+        self.lost_leases = 0
+        self.reclaimed = 0
+
+    def wake(self) -> None:
+        """Claim again now instead of at the next poll."""
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop claiming; ``run`` returns once jobs in flight finish."""
+        self._stopping = True
+        self._wakeup.set()
+
+    async def claim(self) -> ClaimedJob | None:
+        """Lease the next due job, if any, in its own transaction."""
+        async with self.session_maker() as session, session.begin():
+            job = await claim_job(
+                session, self.worker_id, lease_seconds=self.lease_seconds
+            )
+        if job is not None:
+            self.claimed += 1
+        return job
+
+    async def reclaim_expired(self) -> int:
+        """Requeue or dead-letter jobs whose lease ran out."""
+        async with self.session_maker() as session, session.begin():
+            count = await requeue_expired(session)
+        if count:
+            logger.warning("⏰ Took back %s parse jobs with expired leases", count)
+        self.reclaimed += count
+        return count
+
+    async def _keep_leased(self, job: ClaimedJob) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self.session_maker() as session, session.begin():
+                    leased = await heartbeat(
+                        session, job, lease_seconds=self.lease_seconds
+                    )
+            except Exception:
+                # The lease may still be renewed by the next beat
+                logger.exception("⚠️ Heartbeat for parse job %s failed", job.id)
+                continue
+            if not leased:
+                logger.warning("⚠️ Lost the lease on parse job %s", job.id)
+                return
+
+    async def process(self, job: ClaimedJob) -> None:
+        """Parse a claimed job's files and store the result or the failure."""
+        beats = asyncio.create_task(self._keep_leased(job))
+        try:
+            await self._parse_and_store(job)
+        finally:
+            beats.cancel()
+
+    async def _parse_and_store(self, job: ClaimedJob) -> None:
+        try:
+            results = await self.parser_pool.submit(
+                parse_statement,
+                job.account_slug,
+                pdf_path=job.pdf_path,
+                csv_path=job.csv_path,
+                storage=self.storage,
+            )
+        except Exception as e:  # noqa: BLE001 - failures are recorded on the job
+            await self._record_failure(
+                job, e, retry=not isinstance(e, PERMANENT_ERRORS)
+            )
+            return
+
+        try:
+            async with self.session_maker() as session, session.begin():
+                await complete_job(session, job)
+                persisted = await complete_statement(
+                    session,
+                    job.statement_id,
+                    results,
+                    file_pdf_url=job.pdf_path,
+                    file_csv_url=job.csv_path,
+                )
+        except LeaseLostError:
+            self.lost_leases += 1
+            logger.warning("⚠️ Discarded result of parse job %s", job.id)
+            return
+        except Exception as e:  # noqa: BLE001 - failures are recorded on the job
+            # Storing can fail for reasons the database recovers from, such
+            # as a dropped connection or a deadlock, so it is always retried
+            await self._record_failure(job, e, retry=True)
+            return
+
+        self.succeeded += 1
+        logger.info(
+            "✅ Processed statement %s with %s transactions in %.3fs (attempt %s)",
+            job.statement_id,
+            persisted.transaction_count,
+            persisted.duration,
+            job.attempts,
+        )
+
+    async def _record_failure(
+        self, job: ClaimedJob, error: Exception, *, retry: bool
+    ) -> None:
+        description = f"{type(error).__name__}: {error}"
+        try:
+            async with self.session_maker() as session, session.begin():
+                status = await fail_job(session, job, description, retry=retry)
+        except LeaseLostError:
+            self.lost_leases += 1
+            return
+        except Exception:
+            # The lease expires and the job is taken back as a failed attempt
+            logger.exception("❌ Could not record failure of parse job %s", job.id)
+            return
+
+        if status == "dead":
+            self.dead += 1
+            logger.error(
+                "❌ Parse job %s for statement %s failed for good after %s "
+                "attempts: %s",
+                job.id,
+                job.statement_id,
+                job.attempts,
+                description,
+            )
+        else:
+            self.retried += 1
+            logger.warning(
+                "🔁 Parse job %s failed on attempt %s of %s, will retry: %s",
+                job.id,
+                job.attempts,
+                job.max_attempts,
+                description,
+            )
+
+    def _start(self, job: ClaimedJob) -> None:
+        task = asyncio.create_task(self.process(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        # A free slot means another job can be claimed right away
+        self._wakeup.set()
+
+    async def _fill_slots(self) -> None:
+        while not self._stopping and len(self._tasks) < self.concurrency:
+            job = await self.claim()
+            if job is None:
+                return
+            self._start(job)
+
+    async def run(self) -> None:
+        """Claim and process jobs until ``stop`` is called."""
+        logger.info(
+            "🧵 Parse worker %s started with %s slots", self.worker_id, self.concurrency
+        )
+        next_reclaim = 0.0
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                if time.monotonic() >= next_reclaim:
+                    await self.reclaim_expired()
+                    next_reclaim = time.monotonic() + self.lease_seconds / 2
+                await self._fill_slots()
+            except Exception:
+                logger.exception("❌ Parse worker could not reach the job queue")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+        if self._tasks:
+            logger.info("🧵 Waiting for %s parse jobs to finish", len(self._tasks))
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("🧵 Parse worker %s stopped", self.worker_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Return jobs in flight and outcome counters."""
+        return {
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency,
+            "in_flight": len(self._tasks),
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "dead": self.dead,
+            "lost_leases": self.lost_leases,
+            "reclaimed": self.reclaimed,
+        }
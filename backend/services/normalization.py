@@ -13,6 +13,7 @@ from models import StatementDetails
 from models import Transaction
 from registry.loader import get_account_registry
 from registry.loader import get_institution_registry
+from services.telemetry import timed
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ def get_account_uuid(account_slug: str) -> UUID:
     return UUID(registry[account_slug]["uuid"])
 
 
+@timed()
 def normalize_statement_data(
     parsed_data: dict[str, Any],
     account_slug: str,
@@ -94,6 +96,7 @@ def normalize_statement_data(
     }
 
 
+@timed()
 def normalize_debt_details(
     parsed_data: dict[str, Any],
     account_slug: str,
@@ -128,6 +131,7 @@ def normalize_debt_details(
     return {"debt_details": debt_details}
 
 
+@timed()
 def normalize_cc_details(
     parsed_data: dict[str, Any],
     account_slug: str,
@@ -162,6 +166,7 @@ def normalize_cc_details(
     return {"credit_card_details": cc_details}
 
 
+@timed()
 def normalize_transactions(
     parsed_data: list[dict[str, Any]],
     account_slug: str,
@@ -0,0 +1,22 @@
+"""Serialization of parse results to output files."""
+
+from .encoders import LazyJson
+from .encoders import dumps
+from .writers import JsonWriter
+from .writers import NdjsonWriter
+from .writers import OutputWriter
+from .writers import available_formats
+from .writers import get_writer
+from .writers import register_writer
+
+
+__all__ = [
+    "JsonWriter",
+    "LazyJson",
+    "NdjsonWriter",
+    "OutputWriter",
+    "available_formats",
+    "dumps",
+    "get_writer",
+    "register_writer",
+]
@@ -0,0 +1,253 @@
+"""Columnar Parquet/Arrow IPC export of parse results for analytics.
+
+Transactions and statement summaries are written as hive-partitioned
+datasets (``account_id=<uuid>/month=YYYY-MM``) with typed columns, so
+notebook scans only read the columns and partitions they need::
+
+    columnar/
+        transactions/account_id=.../month=2025-04/<statement_id>-0.parquet
+        statements/account_id=.../month=2025-04/<statement_id>-0.parquet
+"""
+
+import logging
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from typing import ClassVar
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from services.telemetry import timed
+
+
+logger = logging.getLogger(__name__)
+
+MONEY = pa.decimal128(12, 2)
+_CENTS = Decimal("0.01")
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("account_id", pa.string()), ("month", pa.string())]),
+    flavor="hive",
+)
+
+TRANSACTION_SCHEMA = pa.schema(
+    [
+        ("id", pa.uuid()),
+        ("statement_id", pa.uuid()),
+        ("transaction_date", pa.date32()),
+        ("amount", MONEY),
+        ("description", pa.string()),
+        ("custom_description", pa.string()),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("transaction_type", pa.dictionary(pa.int8(), pa.string())),
+        ("account_id", pa.string()),
+        ("month", pa.string()),
+    ]
+)
+
+STATEMENT_SCHEMA = pa.schema(
+    [
+        ("statement_id", pa.uuid()),
+        ("institution_id", pa.uuid()),
+        ("period_start", pa.date32()),
+        ("period_end", pa.date32()),
+        ("uploaded_at", pa.timestamp("us", tz="UTC")),
+        ("previous_balance", MONEY),
+        ("new_balance", MONEY),
+        ("payments", MONEY),
+        ("min_payment_due", MONEY),
+        ("payment_due_date", pa.date32()),
+        ("interest_rate", pa.float64()),
+        ("interest_paid", MONEY),
+        ("credit_limit", MONEY),
+        ("available_credit", MONEY),
+        ("purchases", MONEY),
+        ("credits", MONEY),
+        ("fees", MONEY),
+        ("cash_advances", MONEY),
+        ("points_earned", pa.int32()),
+        ("points_redeemed", pa.int32()),
+        ("transaction_count", pa.int32()),
+        ("account_id", pa.string()),
+        ("month", pa.string()),
+    ]
+)
+
+
+def _uuid_bytes(value: Any) -> bytes | None:  # noqa: ANN401
+    """Convert a UUID or UUID string to its 16-byte form."""
+    if value is None:
+        return None
+    return (value if isinstance(value, UUID) else UUID(str(value))).bytes
+
+
+def _money(value: Any) -> Decimal | None:  # noqa: ANN401
+    """Convert a float or string amount to a two-place Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(_CENTS)
+
+
+def _as_date(value: Any) -> date | None:  # noqa: ANN401
+    """Convert a date or ISO string to a date."""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def _as_datetime(value: Any) -> datetime | None:  # noqa: ANN401
+    """Convert a datetime or ISO string to a datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def _month(value: date | None) -> str:
+    """Return the YYYY-MM partition value for a date."""
+    return value.strftime("%Y-%m") if value else "unknown"
+
+
+def transactions_table(results: dict[str, Any]) -> pa.Table:
+    """Build a typed transactions table from parse results.
+
+    Args:
+        results: Parse results containing a ``transactions`` list
+
+    Returns:
+        Arrow table matching ``TRANSACTION_SCHEMA``
+    """
+    transactions = results.get("transactions", [])
+    dates = [_as_date(txn["date"]) for txn in transactions]
+    columns = {
+        "id": [_uuid_bytes(txn["id"]) for txn in transactions],
+        "statement_id": [_uuid_bytes(txn["statement_id"]) for txn in transactions],
+        "transaction_date": dates,
+        "amount": [_money(txn["amount"]) for txn in transactions],
+        "description": [txn["description"] for txn in transactions],
+        "custom_description": [txn.get("custom_description") for txn in transactions],
+        "category": [txn.get("category") for txn in transactions],
+        "transaction_type": [txn["type"] for txn in transactions],
+        "account_id": [str(txn["account_id"]) for txn in transactions],
+        "month": [_month(d) for d in dates],
+    }
+    return pa.Table.from_pydict(columns, schema=TRANSACTION_SCHEMA)
+
+
+def statement_table(results: dict[str, Any]) -> pa.Table:
+    """Build a one-row statement summary table from parse results.
+
+    Args:
+        results: Parse results containing ``statement_data`` and details
+
+    Returns:
+        Arrow table matching ``STATEMENT_SCHEMA``
+    """
+    statement = results["statement_data"]
+    details = results.get("statement_details", {})
+    debt = results.get("debt_details", {})
+    cc = results.get("credit_card_details", {})
+    period_end = _as_date(statement["period_end"])
+
+    row = {
+        "statement_id": _uuid_bytes(statement["id"]),
+        "institution_id": _uuid_bytes(statement["institution_id"]),
+        "period_start": _as_date(statement["period_start"]),
+        "period_end": period_end,
+        "uploaded_at": _as_datetime(statement.get("uploaded_at")),
+        "previous_balance": _money(details.get("previous_balance")),
+        "new_balance": _money(details.get("new_balance")),
+        "payments": _money(debt.get("payments")),
+        "min_payment_due": _money(debt.get("min_payment_due")),
+        "payment_due_date": _as_date(debt.get("payment_due_date")),
+        "interest_rate": debt.get("interest_rate"),
+        "interest_paid": _money(debt.get("interest_paid")),
+        "credit_limit": _money(cc.get("credit_limit")),
+        "available_credit": _money(cc.get("available_credit")),
+        "purchases": _money(cc.get("purchases")),
+        "credits": _money(cc.get("credits")),
+        "fees": _money(cc.get("fees")),
+        "cash_advances": _money(cc.get("cash_advances")),
+        "points_earned": cc.get("points_earned"),
+        "points_redeemed": cc.get("points_redeemed"),
+        "transaction_count": len(results.get("transactions", [])),
+        "account_id": str(statement["account_id"]),
+        "month": _month(period_end),
+    }
+    return pa.Table.from_pylist([row], schema=STATEMENT_SCHEMA)
+
+
+class ColumnarExporter:
+    """Writes parse results into partitioned Parquet or Arrow IPC datasets."""
+
+    FORMATS: ClassVar[dict[str, tuple[str, str]]] = {
+        "parquet": ("parquet", ".parquet"),
+        "arrow": ("ipc", ".arrow"),
+    }
+
+    def __init__(self, base_dir: Path, output_format: str = "parquet") -> None:
+        """Initialize the exporter.
+
+        Args:
+            base_dir: Root directory for the transactions/ and statements/ datasets
+            output_format: "parquet" or "arrow" (Arrow IPC)
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if output_format not in self.FORMATS:
+            error_msg = f"Unsupported columnar format: {output_format}"
+            raise ValueError(error_msg)
+        self.base_dir = base_dir
+        self.output_format = output_format
+
+    def _write(self, table: pa.Table, dataset: str, file_stem: str) -> list[Path]:
+        """Write a table into a partitioned dataset and return the new files."""
+        dataset_format, extension = self.FORMATS[self.output_format]
+        written: list[Path] = []
+        ds.write_dataset(
+            table,
+            self.base_dir / dataset,
+            format=dataset_format,
+            partitioning=PARTITIONING,
+            basename_template=f"{file_stem}-{{i}}{extension}",
+            existing_data_behavior="overwrite_or_ignore",
+            file_visitor=lambda written_file: written.append(Path(written_file.path)),
+        )
+        return written
+
+    @timed("export_columnar")
+    def export(self, results: dict[str, Any]) -> list[Path]:
+        """Export one statement's transactions and summary.
+
+        Files are named after the statement id, so exports from parallel
+        batch workers never collide.
+
+        Args:
+            results: Parse results from ``parse_statement``
+
+        Returns:
+            Paths of the files written
+        """
+        statement = results.get("statement_data")
+        transactions = results.get("transactions", [])
+        if statement:
+            file_stem = str(statement["id"])
+        elif transactions:
+            file_stem = str(transactions[0]["statement_id"])
+        else:
+            return []
+
+        written: list[Path] = []
+        if transactions:
+            written += self._write(
+                transactions_table(results), "transactions", file_stem
+            )
+        if statement:
+            written += self._write(statement_table(results), "statements", file_stem)
+
+        logger.debug("Exported %s columnar files for %s", len(written), file_stem)
+        return written
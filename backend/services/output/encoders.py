@@ -0,0 +1,67 @@
+"""JSON encoding for parse results."""
+
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def encode_default(obj: Any) -> Any:  # noqa: ANN401 - orjson default hook
+    """Encode values that orjson does not handle natively.
+
+    UUIDs, dates and datetimes are handled by orjson itself. ``Decimal``
+    values are emitted as strings so no digits are lost. Parsed amounts are
+    floats (see ``models.transactions``) and are written by orjson in their
+    shortest round-trip form, not through this hook.
+
+    Args:
+        obj: Value to encode
+
+    Returns:
+        JSON-serializable representation of the value
+
+    Raises:
+        TypeError: If the value has no known encoding
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, set | frozenset):
+        return sorted(obj)
+
+    error_msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(error_msg)
+
+
+def dumps(obj: Any, *, pretty: bool = False) -> bytes:  # noqa: ANN401
+    """Serialize a value to JSON bytes.
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent the output for human reading
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    return orjson.dumps(obj, default=encode_default, option=option)
+
+
+class LazyJson:
+    """Defers serialization until the value is actually formatted.
+
+    Passing ``LazyJson(results)`` as a logging argument means the JSON is
+    only built when a handler emits the record.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:  # noqa: ANN401
+        """Wrap a value for deferred serialization."""
+        self.obj = obj
+
+    def __str__(self) -> str:
+        """Serialize the wrapped value."""
+        return dumps(self.obj, pretty=True).decode()
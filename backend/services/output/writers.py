@@ -0,0 +1,169 @@
+"""Pluggable writers that serialize parse results to disk exactly once."""
+
+import logging
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import ClassVar
+
+from services.output.encoders import dumps
+from services.telemetry import span
+
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_EXTENSIONS = {"zstd": ".zst"}
+
+
+class OutputWriter(ABC):
+    """Base class for result writers.
+
+    Subclasses stream a result into a binary file object; the base class
+    handles compression and moves the finished file into place atomically.
+    """
+
+    name: ClassVar[str]
+    extension: ClassVar[str]
+
+    def __init__(self, compression: str | None = None) -> None:
+        """Initialize the writer.
+
+        Args:
+            compression: Optional compression codec ("zstd")
+
+        Raises:
+            ValueError: If the compression codec is not supported
+        """
+        if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+            error_msg = f"Unsupported compression: {compression}"
+            raise ValueError(error_msg)
+        self.compression = compression
+
+    def output_path(self, directory: Path, stem: str) -> Path:
+        """Return the path a result with this stem is written to."""
+        suffix = self.extension + COMPRESSION_EXTENSIONS.get(self.compression or "", "")
+        return directory / f"{stem}{suffix}"
+
+    @contextmanager
+    def _open(self, path: Path) -> Iterator[IO[bytes]]:
+        """Open a path for writing, wrapping it in a compressor if configured."""
+        with path.open("wb") as raw:
+            if self.compression == "zstd":
+                import zstandard  # noqa: PLC0415 - only needed when compressing
+
+                with zstandard.ZstdCompressor().stream_writer(raw) as compressed:
+                    yield compressed
+            else:
+                yield raw
+
+    def write(self, results: dict[str, Any], directory: Path, stem: str) -> Path:
+        """Serialize a result to ``directory`` and return the written path.
+
+        Args:
+            results: Parse results to write
+            directory: Destination directory
+            stem: File name without extension
+
+        Returns:
+            Path of the written file
+        """
+        path = self.output_path(directory, stem)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with span(f"write_{self.name}"), self._open(tmp_path) as stream:
+            self.write_to(stream, results)
+        tmp_path.replace(path)
+        logger.debug("Wrote %s output to %s", self.name, path)
+        return path
+
+    @abstractmethod
+    def write_to(self, stream: IO[bytes], results: dict[str, Any]) -> None:
+        """Serialize a result into an open binary stream."""
+
+
+class JsonWriter(OutputWriter):
+    """Writes the whole result as a single JSON document."""
+
+    name = "json"
+    extension = ".json"
+
+    def __init__(self, compression: str | None = None, *, pretty: bool = False) -> None:
+        """Initialize the writer.
+
+        Args:
+            compression: Optional compression codec ("zstd")
+            pretty: Indent the output for human reading
+        """
+        super().__init__(compression)
+        self.pretty = pretty
+
+    def write_to(self, stream: IO[bytes], results: dict[str, Any]) -> None:
+        """Write the result as one JSON document."""
+        stream.write(dumps(results, pretty=self.pretty))
+
+
+class NdjsonWriter(OutputWriter):
+    """Writes one JSON record per line, streaming transactions individually.
+
+    The first line is a ``statement`` record holding every section except
+    the transactions; each following line is a ``transaction`` record.
+    """
+
+    name = "ndjson"
+    extension = ".ndjson"
+
+    def write_to(self, stream: IO[bytes], results: dict[str, Any]) -> None:
+        """Write the statement header and one line per transaction."""
+        header = {key: value for key, value in results.items() if key != "transactions"}
+        stream.write(dumps({"record": "statement", **header}))
+        stream.write(b"\n")
+
+        for transaction in results.get("transactions", []):
+            stream.write(dumps({"record": "transaction", **transaction}))
+            stream.write(b"\n")
+
+
+_WRITERS: dict[str, type[OutputWriter]] = {
+    JsonWriter.name: JsonWriter,
+    NdjsonWriter.name: NdjsonWriter,
+}
+
+
+def register_writer(writer_cls: type[OutputWriter]) -> None:
+    """Register an additional output format under its ``name``."""
+    _WRITERS[writer_cls.name] = writer_cls
+
+
+def available_formats() -> list[str]:
+    """Return the names of all registered output formats."""
+    return sorted(_WRITERS)
+
+
+def get_writer(
+    output_format: str = "json",
+    compression: str | None = None,
+    **options: Any,  # noqa: ANN401
+) -> OutputWriter:
+    """Create a writer for a registered output format.
+
+    Args:
+        output_format: Registered format name (e.g., 'json', 'ndjson')
+        compression: Optional compression codec ("zstd")
+        **options: Format-specific writer options
+
+    Returns:
+        Configured writer instance
+
+    Raises:
+        ValueError: If the format is not registered
+    """
+    if output_format not in _WRITERS:
+        error_msg = (
+            f"Unsupported output format: {output_format}. "
+            f"Available formats: {', '.join(available_formats())}"
+        )
+        raise ValueError(error_msg)
+    return _WRITERS[output_format](compression, **options)
@@ -9,11 +9,13 @@ from typing import TextIO
 from uuid import UUID
 
 from services.normalization import normalize_transactions
+from services.telemetry import timed
 
 
 logger = logging.getLogger(__name__)
 
 
+@timed()
 def parse_citi_cc_csv(
     csv_file: TextIO, statement_uuid: UUID, account_slug: str
 ) -> list[dict[str, Any]]:
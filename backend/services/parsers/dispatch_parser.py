@@ -1,24 +1,46 @@
 """Main parser dispatcher for routing files to appropriate parsers."""
 
+import io
 import logging
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 from typing import NoReturn
+from typing import TextIO
 from uuid import UUID
+from uuid import uuid4
 
 from services.parsers.csv.parse_citi_cc_csv import parse_citi_cc_csv
 from services.parsers.pdf.parse_citi_cc_pdf import parse_citi_cc_pdf
+from services.storage import ObjectStorage
+from services.telemetry import timed
 
 
 logger = logging.getLogger(__name__)
 
 
-def parse_pdf(account_slug: str, pdf_path: str) -> dict[str, Any]:
+def _open_binary(location: str, storage: ObjectStorage | None) -> BinaryIO:
+    if storage is None:
+        return Path(location).open("rb")
+    return storage.open(location)
+
+
+def _open_text(location: str, storage: ObjectStorage | None) -> TextIO:
+    if storage is None:
+        return Path(location).open("r", encoding="utf-8")
+    return io.TextIOWrapper(storage.open(location), encoding="utf-8")
+
+
+@timed()
+def parse_pdf(
+    account_slug: str, pdf_path: str, storage: ObjectStorage | None = None
+) -> dict[str, Any]:
     """Parse a PDF statement file using account-specific parser.
 
     Args:
         account_slug: Account type identifier (e.g., 'citi_cc')
-        pdf_path: Path to the PDF file to parse
+        pdf_path: Path to the PDF file to parse, or its storage location
+        storage: Backend to read ``pdf_path`` from (default: local path)
 
     Returns:
         Dictionary containing parsed statement data
@@ -29,7 +51,7 @@ def parse_pdf(account_slug: str, pdf_path: str) -> dict[str, Any]:
     """
     logger.debug("Dispatching PDF parser for account: %s", account_slug)
     try:
-        with Path(pdf_path).open("rb") as f:
+        with _open_binary(pdf_path, storage) as f:
             file_bytes = f.read()
 
         match account_slug:
@@ -46,15 +68,20 @@ def parse_pdf(account_slug: str, pdf_path: str) -> dict[str, Any]:
         raise
 
 
+@timed()
 def parse_csv(
-    account_slug: str, csv_path: str, statement_uuid: UUID
+    account_slug: str,
+    csv_path: str,
+    statement_uuid: UUID,
+    storage: ObjectStorage | None = None,
 ) -> list[dict[str, Any]]:
     """Parse a CSV transaction file using account-specific parser.
 
     Args:
         account_slug: Account type identifier (e.g., 'citi_cc')
-        csv_path: Path to the CSV file to parse
+        csv_path: Path to the CSV file to parse, or its storage location
         statement_uuid: UUID of the associated statement
+        storage: Backend to read ``csv_path`` from (default: local path)
 
     Returns:
         List of normalized transaction dictionaries
@@ -68,7 +95,7 @@ def parse_csv(
         match account_slug:
             case "citi_cc":
                 logger.debug("✅ Passing statement_id %s to CSV parser", statement_uuid)
-                with Path(csv_path).open("r", encoding="utf-8") as f:
+                with _open_text(csv_path, storage) as f:
                     return parse_citi_cc_csv(f, statement_uuid, account_slug)
             case _:
                 _raise_parser_not_implemented(account_slug, "CSV")
@@ -80,6 +107,51 @@ def parse_csv(
         raise
 
 
+@timed()
+def parse_statement(
+    account_slug: str,
+    pdf_path: str | None = None,
+    csv_path: str | None = None,
+    storage: ObjectStorage | None = None,
+) -> dict[str, Any]:
+    """Parse a statement PDF and/or its transaction CSV into one result.
+
+    Args:
+        account_slug: Account type identifier (e.g., 'citi_cc')
+        pdf_path: Optional path to the PDF statement
+        csv_path: Optional path to the transaction CSV
+        storage: Backend the files are stored in, for uploaded
+            statements; paths are local files without one
+
+    Returns:
+        Dictionary containing parsed statement data and transactions
+
+    Raises:
+        ValueError: If neither a PDF nor a CSV path is given
+    """
+    if not pdf_path and not csv_path:
+        error_msg = "At least one of pdf_path or csv_path is required"
+        raise ValueError(error_msg)
+
+    results: dict[str, Any] = {}
+
+    if pdf_path:
+        logger.info("📄 Parsing PDF: %s", pdf_path)
+        results.update(parse_pdf(account_slug, pdf_path, storage))
+
+    if csv_path:
+        logger.info("📈 Parsing CSV: %s", csv_path)
+        # CSV-only inputs have no statement yet, so they get a fresh id
+        statement_id = (
+            results["statement_data"]["id"] if "statement_data" in results else uuid4()
+        )
+        results["transactions"] = parse_csv(
+            account_slug, csv_path, statement_id, storage
+        )
+
+    return results
+
+
 def _raise_parser_not_implemented(account_slug: str, parser_type: str) -> NoReturn:
     """Raise NotImplementedError for missing parsers."""
     logger.error("No %s parser available for account: %s", parser_type, account_slug)
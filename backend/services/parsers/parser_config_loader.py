@@ -4,15 +4,110 @@ from typing import Any
 
 import yaml
 
+from services.parsers.regex_safety import ERROR
+from services.parsers.regex_safety import RegexIssue
+from services.parsers.regex_safety import analyze_pattern
+
 
 logger = logging.getLogger(__name__)
 
+# Runtime limits for matching untrusted statement text, overridable in a
+# config's "matching" section (and per field with "time_budget_ms")
+DEFAULT_MAX_LINE_LENGTH = 500
+DEFAULT_FIELD_TIME_BUDGET_MS = 50
+
+# (config path, validated) -> (file mtime, config); filled per process
+_loaded_configs: dict[tuple[Path, bool], tuple[int, dict[str, Any]]] = {}
+
+
+class ParserConfigError(ValueError):
+    """Raised when a parser config contains unsafe or invalid settings."""
+
+
+def config_patterns(config: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return (field name, pattern) pairs for every regex in a config."""
+    patterns: list[tuple[str, str]] = []
+    for field in config.get("account_summary_fields", []):
+        name = field.get("name", "unknown")
+        patterns.extend((name, label) for label in field.get("label_patterns", []))
+        if field.get("value_pattern"):
+            patterns.append((name, field["value_pattern"]))
+    return patterns
+
+
+def validate_parser_config(
+    config: dict[str, Any], config_name: str
+) -> list[RegexIssue]:
+    """Check a parser config's regexes and matching limits.
+
+    Patterns with super-linear backtracking constructs are rejected;
+    patterns that are only potentially slow are logged as warnings.
+
+    Args:
+        config: Loaded parser config
+        config_name: Config name for error messages
+
+    Returns:
+        Warnings found in the config
+
+    Raises:
+        ParserConfigError: If a pattern is unsafe or a limit is invalid
+    """
+    errors: list[str] = []
+    warnings: list[RegexIssue] = []
+
+    for field_name, pattern in config_patterns(config):
+        for issue in analyze_pattern(pattern):
+            if issue.severity == ERROR:
+                errors.append(f"{field_name}: {issue}")
+            else:
+                logger.warning("⚠️ %s field '%s': %s", config_name, field_name, issue)
+                warnings.append(issue)
+
+    matching = config.get("matching", {})
+    for key in ("max_line_length", "field_time_budget_ms"):
+        value = matching.get(key)
+        if value is not None and (not isinstance(value, int | float) or value <= 0):
+            errors.append(f"matching.{key} must be a positive number, got {value!r}")
 
-def load_parser_config(config_name: str) -> dict[str, Any]:
-    """Load the YAML config for the given parser."""
-    config_path = (
-        Path(__file__).parent / "pdf" / "config" / f"{config_name}_config.yaml"
+    if errors:
+        error_msg = f"Unsafe parser config '{config_name}': " + "; ".join(errors)
+        raise ParserConfigError(error_msg)
+
+    return warnings
+
+
+def _config_dir() -> Path:
+    """Return the directory holding the parser YAML configs."""
+    return Path(__file__).parent / "pdf" / "config"
+
+
+def available_parser_configs() -> list[str]:
+    """Return the names of all parser configs."""
+    return sorted(
+        path.name.removesuffix("_config.yaml")
+        for path in _config_dir().glob("*_config.yaml")
     )
+
+
+def load_parser_config(config_name: str, *, validate: bool = True) -> dict[str, Any]:
+    """Load the YAML config for the given parser.
+
+    Configs are cached per process and read again only when the file
+    changes, so callers must treat the returned dict as read-only.
+
+    Args:
+        config_name: Parser config name (e.g., 'citi_cc')
+        validate: Reject configs with unsafe regexes or limits
+
+    Returns:
+        The loaded config
+
+    Raises:
+        FileNotFoundError: If the config does not exist
+        ParserConfigError: If validation is enabled and the config is unsafe
+    """
+    config_path = _config_dir() / f"{config_name}_config.yaml"
     logger.debug("🔍 Looking for config at: %s", config_path)
 
     if not config_path.exists():
@@ -20,14 +115,24 @@ def load_parser_config(config_name: str) -> dict[str, Any]:
         error_msg = f"Config file not found: {config_path}"
         raise FileNotFoundError(error_msg)
 
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _loaded_configs.get((config_path, validate))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     try:
         with config_path.open(encoding="utf-8") as f:
             config: dict[str, Any] | None = yaml.safe_load(f)
-            logger.debug("✅ Successfully loaded config: %s", config_name)
-            return config or {}
     except yaml.YAMLError:
         logger.exception("❌ YAML parsing error in config: %s", config_path)
         raise
     except Exception:
         logger.exception("❌ Unexpected error loading config: %s", config_path)
         raise
+
+    config = config or {}
+    if validate:
+        validate_parser_config(config, config_name)
+    _loaded_configs[config_path, validate] = (mtime_ns, config)
+    logger.debug("✅ Successfully loaded config: %s", config_name)
+    return config
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import time
 from collections.abc import Callable
 from datetime import UTC
 from datetime import datetime
@@ -13,7 +14,16 @@ import pdfplumber
 from services.normalization import normalize_cc_details
 from services.normalization import normalize_debt_details
 from services.normalization import normalize_statement_data
+from services.parsers.parser_config_loader import DEFAULT_FIELD_TIME_BUDGET_MS
+from services.parsers.parser_config_loader import DEFAULT_MAX_LINE_LENGTH
+from services.parsers.parser_config_loader import ParserConfigError
 from services.parsers.parser_config_loader import load_parser_config
+from services.parsers.regex_safety import ERROR
+from services.parsers.regex_safety import analyze_pattern
+from services.telemetry import FieldMetrics
+from services.telemetry import current_field_metrics
+from services.telemetry import span
+from services.telemetry import timed
 
 
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -26,6 +36,7 @@ TRANSFORM_REGISTRY: dict[str, Callable[[str], int | float]] = {
 }
 
 
+@timed()
 def parse_citi_cc_pdf(file_bytes: bytes, account_slug: str) -> dict[str, Any]:
     """Parse Citi Credit Card PDF statement.
 
@@ -43,12 +54,15 @@ def parse_citi_cc_pdf(file_bytes: bytes, account_slug: str) -> dict[str, Any]:
         with pdfplumber.open(BytesIO(file_bytes)) as pdf:
             statement_lines: list[str] = []
 
-            for page in pdf.pages:
-                raw_text = page.extract_text()
-                if raw_text:
-                    raw_lines = raw_text.splitlines()
-                    cleaned_lines = [line.strip() for line in raw_lines if line.strip()]
-                    statement_lines.extend(cleaned_lines)
+            with span("extract_text"):
+                for page in pdf.pages:
+                    raw_text = page.extract_text()
+                    if raw_text:
+                        raw_lines = raw_text.splitlines()
+                        cleaned_lines = [
+                            line.strip() for line in raw_lines if line.strip()
+                        ]
+                        statement_lines.extend(cleaned_lines)
 
             account_summary = extract_account_summary(statement_lines)
 
@@ -83,6 +97,7 @@ def parse_citi_cc_pdf(file_bytes: bytes, account_slug: str) -> dict[str, Any]:
         raise
 
 
+@timed()
 def extract_account_summary(statement_lines: list[str]) -> dict[str, Any]:
     """Extract account summary data from statement text lines.
 
@@ -95,6 +110,9 @@ def extract_account_summary(statement_lines: list[str]) -> dict[str, Any]:
     config = load_parser_config("citi_cc")
     summary_fields = config.get("account_summary_fields", [])
     summary_data: dict[str, Any] = {}
+    matching = config.get("matching", {})
+    max_line_length = matching.get("max_line_length", DEFAULT_MAX_LINE_LENGTH)
+    budget_ms = matching.get("field_time_budget_ms", DEFAULT_FIELD_TIME_BUDGET_MS)
 
     for field in summary_fields:
         try:
@@ -105,15 +123,30 @@ def extract_account_summary(statement_lines: list[str]) -> dict[str, Any]:
                 data_type=field.get("data_type", "string"),
                 field_name=field["name"],
                 transform=field.get("transform"),
+                max_line_length=max_line_length,
+                time_budget=field.get("time_budget_ms", budget_ms) / 1000,
             )
 
         except (ValueError, re.error, KeyError, RuntimeError) as e:
             logger.warning("⚠️ Failed to extract field '%s': %s", field["name"], e)
+            _record_outcome(field.get("name", "unknown"), "error", len(statement_lines))
             summary_data[field["name"]] = None  # Preserve key for consistency
 
     return summary_data
 
 
+def _record_outcome(
+    field_name: str,
+    outcome: str,
+    lines_scanned: int,
+    metrics: FieldMetrics | None = None,
+) -> None:
+    """Record an extraction outcome if field metrics are being collected."""
+    metrics = metrics or current_field_metrics()
+    if metrics is not None:
+        metrics.record_outcome(field_name, outcome, lines_scanned)
+
+
 def _apply_transform(raw_val: str, transform: str | None) -> str | float | int:
     """Apply transformation to raw value."""
     if transform and transform in TRANSFORM_REGISTRY:
@@ -157,9 +190,18 @@ def extract_field_value(
     data_type: str = "string",
     field_name: str = "unknown",
     transform: str | None = None,
+    *,
+    max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
+    time_budget: float | None = None,
 ) -> str | float | int | None:
     """Extract and process field value from statement lines.
 
+    A single ``re.search`` cannot be interrupted, so each one is bounded up
+    front: lines are always truncated to ``max_line_length``, and patterns
+    with exponential or high-degree polynomial backtracking are refused.
+    ``time_budget`` is checked between lines; it stops a field that is slow
+    over many lines but not a search already running.
+
     Args:
         lines: List of text lines from the statement
         label_patterns: Regex patterns to match field labels
@@ -167,33 +209,71 @@ def extract_field_value(
         data_type: Target data type for conversion
         field_name: Name of field for logging
         transform: Optional transformation to apply
+        max_line_length: Cap on the characters matched per line
+        time_budget: Optional time budget in seconds, checked between lines
 
     Returns:
         Processed field value or None if not found/invalid
+
+    Raises:
+        ParserConfigError: If a pattern can backtrack catastrophically
     """
-    for line in lines:
-        if any(re.search(label, line) for label in label_patterns):
-            match_obj = re.search(value_pattern, line)
+    unsafe = [
+        str(issue)
+        for pattern in (*label_patterns, value_pattern)
+        for issue in analyze_pattern(pattern)
+        if issue.severity == ERROR
+    ]
+    if unsafe:
+        error_msg = f"Unsafe pattern for field '{field_name}': " + "; ".join(unsafe)
+        raise ParserConfigError(error_msg)
+
+    metrics = current_field_metrics()
+    label_search = metrics.searcher(field_name, "label") if metrics else re.search
+    value_search = metrics.searcher(field_name, "value") if metrics else re.search
+
+    deadline = time.perf_counter() + time_budget if time_budget else None
+
+    for line_number, raw_line in enumerate(lines, start=1):
+        if deadline is not None and time.perf_counter() > deadline:
+            logger.warning(
+                "⏱️ Time budget exceeded for field '%s' after %s lines",
+                field_name,
+                line_number - 1,
+            )
+            _record_outcome(field_name, "timeout", line_number - 1, metrics)
+            return None
+
+        line = raw_line[:max_line_length]
+        if any(label_search(label, line) for label in label_patterns):
+            match_obj = value_search(value_pattern, line)
             logger.debug("line matched for '%s': %s", field_name, line)
             if not match_obj:
                 logger.warning(
                     "Found label match but no value match in line: '%s'",
                     line,
                 )
+                _record_outcome(field_name, "no_value", line_number, metrics)
                 return None
 
             raw_val = match_obj.group(0).strip().replace("$", "").replace(",", "")
 
             try:
                 transformed_val = _apply_transform(raw_val, transform)
-                return _convert_to_type(transformed_val, data_type, field_name)
+                value = _convert_to_type(transformed_val, data_type, field_name)
             except ValueError:
                 logger.warning(
                     "Could not process value '%s' for field '%s'",
                     raw_val,
                     field_name,
                 )
+                _record_outcome(field_name, "transform_failure", line_number, metrics)
                 return None
 
+            outcome = "hit" if value is not None else "invalid"
+            _record_outcome(field_name, outcome, line_number, metrics)
+            return value
+
     logger.debug("No match found for field: %s", field_name)
+    _record_outcome(field_name, "miss", len(lines), metrics)
     return None
@@ -0,0 +1,446 @@
+r"""Static ReDoS analysis and fuzzing for parser config regexes.
+
+Parser configs run their label and value patterns against every line of
+untrusted PDF text, so a pattern that backtracks catastrophically can
+stall a worker. ``analyze_pattern`` walks the parsed pattern looking for
+the constructs that cause super-linear matching in a backtracking engine:
+
+* nested quantifiers, e.g. ``(\d+)+`` (exponential)
+* alternation with overlapping branches under a quantifier, e.g.
+  ``(\d\d|\w\w)+`` (exponential)
+* adjacent quantifiers over overlapping characters, e.g. ``\d+\d*``
+  (polynomial, of degree the length of the chain)
+* a variable-width group repeated a fixed number of times, e.g.
+  ``(.*a){12}`` (polynomial, of degree the repeat count)
+* backreferences (warning)
+
+Python's ``re`` cannot be interrupted mid-search, and the field time
+budget is only checked between lines, so there is no time limit on a
+single search. What bounds it is this analysis together with the line
+length cap that ``extract_field_value`` always applies: with exponential
+constructs refused, a search costs at most the cap raised to a degree
+below ``POLYNOMIAL_ERROR_DEGREE``, so lower degrees are only a warning.
+
+A bounded repeat that is always ended by a character it cannot match,
+like the ``\d{1,3}`` in ``(\d{1,3},)*``, splits its input only one way
+and is not reported.
+
+``fuzz_pattern`` complements the analysis by searching for inputs that
+are slow to match in practice.
+"""
+
+import functools
+import random
+import re
+import string
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from re import _constants as sre_constants  # type: ignore[attr-defined]
+from re import _parser as sre_parser  # type: ignore[attr-defined]
+from typing import Any
+
+
+ERROR = "error"
+WARNING = "warning"
+
+# Polynomial backtracking of this degree or higher is rejected
+POLYNOMIAL_ERROR_DEGREE = 3
+
+# Characters used to approximate what a pattern element can match
+PROBE_ALPHABET = string.printable + "\xa0\xe9\u20ac"
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_ZERO_WIDTH = (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+
+
+def _any_char(_char: str) -> bool:
+    """Match every character (fallback for unknown categories)."""
+    return True
+
+
+def _children(op: Any, av: Any) -> list[Any]:  # noqa: ANN401
+    """Return the nested sequences of a parsed pattern item."""
+    if op in _REPEATS or op is sre_constants.POSSESSIVE_REPEAT:
+        return [av[2]]
+    if op is sre_constants.SUBPATTERN:
+        return [av[-1]]
+    if op is sre_constants.BRANCH:
+        return list(av[1])
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return [av[1]]
+    if op is sre_constants.ATOMIC_GROUP:
+        return [av]
+    return []
+
+
+_CATEGORIES: dict[Any, Callable[[str], bool]] = {
+    sre_constants.CATEGORY_DIGIT: str.isdigit,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda c: not c.isdigit(),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda c: not c.isspace(),
+    sre_constants.CATEGORY_WORD: lambda c: c.isalnum() or c == "_",
+    sre_constants.CATEGORY_NOT_WORD: lambda c: not (c.isalnum() or c == "_"),
+}
+
+
+@dataclass(frozen=True)
+class RegexIssue:
+    """A problem found in a regex pattern."""
+
+    pattern: str
+    severity: str
+    message: str
+
+    def __str__(self) -> str:
+        """Format the issue for log messages."""
+        return f"{self.severity}: {self.message} in {self.pattern!r}"
+
+
+class _Analyzer:
+    """Walks a parsed pattern and collects backtracking hazards."""
+
+    def __init__(self, pattern: str, flags: int) -> None:
+        self.pattern = pattern
+        self.ignore_case = bool(flags & re.IGNORECASE)
+        self.dot_all = bool(flags & re.DOTALL)
+        self.issues: list[RegexIssue] = []
+
+    def report(self, severity: str, message: str) -> None:
+        issue = RegexIssue(self.pattern, severity, message)
+        if issue not in self.issues:
+            self.issues.append(issue)
+
+    # -- character sets -------------------------------------------------
+
+    def _literal_matches(self, code: int, char: str) -> bool:
+        if self.ignore_case:
+            return chr(code).lower() == char.lower()
+        return chr(code) == char
+
+    def _in_matches(self, items: list[tuple[Any, Any]], char: str) -> bool:
+        negate = False
+        matched = False
+        for op, av in items:
+            if op is sre_constants.NEGATE:
+                negate = True
+            elif op is sre_constants.LITERAL:
+                matched = matched or self._literal_matches(av, char)
+            elif op is sre_constants.RANGE:
+                low, high = av
+                code = ord(char.lower()) if self.ignore_case else ord(char)
+                matched = matched or low <= ord(char) <= high or low <= code <= high
+            elif op is sre_constants.CATEGORY:
+                matched = matched or _CATEGORIES.get(av, _any_char)(char)
+        return matched != negate
+
+    def _item_chars(self, op: Any, av: Any) -> frozenset[str]:  # noqa: ANN401
+        """Return the probe characters a single-character item can match."""
+        if op is sre_constants.LITERAL:
+            return frozenset(c for c in PROBE_ALPHABET if self._literal_matches(av, c))
+        if op is sre_constants.NOT_LITERAL:
+            return frozenset(
+                c for c in PROBE_ALPHABET if not self._literal_matches(av, c)
+            )
+        if op is sre_constants.ANY:
+            return frozenset(c for c in PROBE_ALPHABET if self.dot_all or c != "\n")
+        if op is sre_constants.IN:
+            return frozenset(c for c in PROBE_ALPHABET if self._in_matches(av, c))
+        if op is sre_constants.CATEGORY:
+            return frozenset(filter(_CATEGORIES.get(av, _any_char), PROBE_ALPHABET))
+        return frozenset()
+
+    def first_chars(
+        self, items: Iterable[tuple[Any, Any]], *, from_end: bool = False
+    ) -> tuple[frozenset[str], bool]:
+        """Return the characters a sequence can start with and whether it is nullable.
+
+        With ``from_end``, return the characters it can end with instead.
+        """
+        chars: set[str] = set()
+        for op, av in reversed(list(items)) if from_end else items:
+            item_chars, nullable = self._first_of_item(op, av, from_end=from_end)
+            chars |= item_chars
+            if not nullable:
+                return frozenset(chars), False
+        return frozenset(chars), True
+
+    def _first_of_item(
+        self,
+        op: Any,  # noqa: ANN401
+        av: Any,  # noqa: ANN401
+        *,
+        from_end: bool = False,
+    ) -> tuple[frozenset[str], bool]:
+        if op in _REPEATS or op is sre_constants.POSSESSIVE_REPEAT:
+            low, _high, body = av
+            chars, nullable = self.first_chars(body, from_end=from_end)
+            return chars, nullable or low == 0
+        if op in (sre_constants.SUBPATTERN, sre_constants.BRANCH) or (
+            op is sre_constants.ATOMIC_GROUP
+        ):
+            # Groups start like their body; alternations like any branch
+            union: set[str] = set()
+            nullable = False
+            for child in _children(op, av):
+                child_chars, child_nullable = self.first_chars(child, from_end=from_end)
+                union |= child_chars
+                nullable = nullable or child_nullable
+            return frozenset(union), nullable
+        if op in _ZERO_WIDTH:
+            return frozenset(), True
+        if op is sre_constants.GROUPREF:
+            return frozenset(PROBE_ALPHABET), True
+        return self._item_chars(op, av), False
+
+    # -- hazards --------------------------------------------------------
+
+    def _guarded(self, items: list[tuple[Any, Any]], index: int) -> bool:
+        r"""Return whether a bounded repeat is always ended by a character it cannot match.
+
+        Such a repeat, like ``\d{1,3},``, can only stop where its
+        delimiter is, so repeating the sequence around it is unambiguous.
+        """
+        op, av = items[index]
+        if op not in _REPEATS or av[1] == sre_constants.MAXREPEAT:
+            return False
+        if len(av[2]) != 1 or index + 1 == len(items):
+            return False
+        chars = self._item_chars(*av[2][0])
+        delimiter, nullable = self._first_of_item(*items[index + 1])
+        return bool(chars) and not nullable and not chars & delimiter
+
+    def _variable_width(self, items: Iterable[tuple[Any, Any]]) -> bool:
+        """Return whether a sequence contains a quantifier with a variable count."""
+        items = list(items)
+        for index, (op, av) in enumerate(items):
+            if op in _REPEATS and av[0] != av[1]:
+                if self._guarded(items, index):
+                    continue
+                return True
+            if op is sre_constants.ATOMIC_GROUP:
+                continue
+            if op is sre_constants.BRANCH and len({b.getwidth() for b in av[1]}) > 1:
+                return True
+            if any(self._variable_width(child) for child in _children(op, av)):
+                return True
+        return False
+
+    def _check_branch_overlap(self, items: Iterable[tuple[Any, Any]]) -> None:
+        """Report alternations in a repeated body whose branches overlap."""
+        for op, av in items:
+            if op is sre_constants.SUBPATTERN:
+                self._check_branch_overlap(av[-1])
+            elif op is sre_constants.BRANCH:
+                firsts = [self.first_chars(branch)[0] for branch in av[1]]
+                for i, chars in enumerate(firsts):
+                    if any(chars & other for other in firsts[i + 1 :]):
+                        self.report(
+                            ERROR,
+                            "overlapping alternation inside a quantifier "
+                            "(exponential backtracking)",
+                        )
+                        return
+
+    def report_polynomial(self, degree: int, message: str) -> None:
+        """Report polynomial backtracking, as an error from the limit degree."""
+        severity = ERROR if degree >= POLYNOMIAL_ERROR_DEGREE else WARNING
+        self.report(severity, f"{message} (polynomial backtracking, degree {degree})")
+
+    def _check_adjacent(self, items: list[tuple[Any, Any]]) -> None:
+        """Report chains of unbounded quantifiers that can trade characters."""
+        # Characters the chain so far can end with, and how many
+        # quantifiers in it can trade characters with each other
+        previous: frozenset[str] | None = None
+        degree = longest = 0
+        for op, av in items:
+            if op in _REPEATS and av[1] == sre_constants.MAXREPEAT:
+                chars = self.first_chars(av[2])[0]
+                last = self.first_chars(av[2], from_end=True)[0]
+                if previous is not None and previous & chars:
+                    degree += 1
+                elif av[0] != 0 or not previous:
+                    degree = 1
+                longest = max(longest, degree)
+                # An optional quantifier lets its neighbours meet directly
+                previous = last | previous if av[0] == 0 and previous else last
+            elif op in _ZERO_WIDTH:
+                continue
+            else:
+                _, nullable = self._first_of_item(op, av)
+                if not nullable:
+                    previous = None
+                    degree = 0
+        if longest > 1:
+            self.report_polynomial(
+                longest, f"{longest} adjacent quantifiers match overlapping characters"
+            )
+
+    def walk(self, items: list[tuple[Any, Any]], *, repeated: bool = False) -> None:
+        """Walk a parsed sequence, tracking whether it sits inside a quantifier."""
+        self._check_adjacent(items)
+        for index, (op, av) in enumerate(items):
+            if op in _REPEATS:
+                low, high, body = av
+                unbounded = high == sre_constants.MAXREPEAT
+                if repeated and low != high and not self._guarded(items, index):
+                    self.report(ERROR, "nested quantifiers (exponential backtracking)")
+                if unbounded:
+                    if self._variable_width(body):
+                        self.report(
+                            ERROR, "nested quantifiers (exponential backtracking)"
+                        )
+                    self._check_branch_overlap(body)
+                elif high > 1 and self._variable_width(body):
+                    # Each repetition picks where the previous one stopped
+                    self.report_polynomial(
+                        high, f"variable-width group repeated up to {high} times"
+                    )
+                self.walk(body, repeated=repeated or unbounded)
+            elif op is sre_constants.SUBPATTERN:
+                self.walk(av[-1], repeated=repeated)
+            elif op is sre_constants.BRANCH:
+                for branch in av[1]:
+                    self.walk(branch, repeated=repeated)
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                self.walk(av[1], repeated=repeated)
+            elif op is sre_constants.GROUPREF:
+                self.report(WARNING, "backreference (may backtrack super-linearly)")
+            # Atomic groups and possessive quantifiers never backtrack into
+            # their body, so they are safe by construction
+
+
+@functools.lru_cache(maxsize=512)
+def analyze_pattern(pattern: str) -> tuple[RegexIssue, ...]:
+    """Statically check a regex for super-linear backtracking constructs.
+
+    Args:
+        pattern: Regex pattern to analyze
+
+    Returns:
+        Issues found, most severe first; empty if the pattern looks safe
+    """
+    try:
+        parsed = sre_parser.parse(pattern)
+    except re.error as e:
+        return (RegexIssue(pattern, ERROR, f"invalid regex: {e}"),)
+
+    analyzer = _Analyzer(pattern, parsed.state.flags)
+    analyzer.walk(list(parsed))
+    return tuple(sorted(analyzer.issues, key=lambda issue: issue.severity != ERROR))
+
+
+@dataclass(frozen=True)
+class FuzzResult:
+    """Slowest input found while fuzzing a pattern."""
+
+    pattern: str
+    slowest_input: str
+    slowest_seconds: float
+    attempts: int
+    threshold: float
+
+    @property
+    def slow(self) -> bool:
+        """Return whether an input reached the slowness threshold."""
+        return self.slowest_seconds >= self.threshold
+
+
+def _pump_chars(pattern: str) -> list[str]:
+    """Return characters that extend the pattern's quantified parts."""
+    parsed = sre_parser.parse(pattern)
+    analyzer = _Analyzer(pattern, parsed.state.flags)
+    pumps: list[str] = []
+
+    def collect(items: Iterable[tuple[Any, Any]]) -> None:
+        for op, av in items:
+            if op in _REPEATS:
+                pumps.extend(sorted(analyzer.first_chars(av[2])[0])[:3])
+            for child in _children(op, av):
+                collect(child)
+
+    collect(parsed)
+    return list(dict.fromkeys(pumps))
+
+
+def _mutate(rng: random.Random, text: str, alphabet: str, max_length: int) -> str:
+    """Make one small random edit: insert, delete, replace or duplicate."""
+    if not text:
+        return rng.choice(alphabet)
+    position = rng.randrange(len(text))
+    match rng.randrange(4):
+        case 0:
+            text = text[:position] + rng.choice(alphabet) + text[position:]
+        case 1:
+            text = text[:position] + text[position + 1 :]
+        case 2:
+            text = text[:position] + rng.choice(alphabet) + text[position + 1 :]
+        case _:
+            # Short duplications only: one extra character can double the
+            # match time of an exponential pattern
+            text = text[: position + 2] + text[position:]
+    return text[:max_length]
+
+
+def fuzz_pattern(
+    pattern: str,
+    *,
+    iterations: int = 2000,
+    max_length: int = 500,
+    threshold: float = 0.01,
+    seed: int | None = None,
+) -> FuzzResult:
+    """Search for inputs that make a pattern slow to match.
+
+    Pumped attack strings (a quantified character repeated, then a
+    character that breaks the match) are grown step by step, then the
+    slowest input is hill-climbed with small mutations. The search stops
+    as soon as an input takes longer than ``threshold``, so exponential
+    patterns are reported without hanging the harness.
+
+    Args:
+        pattern: Regex pattern to fuzz
+        iterations: Number of mutated inputs to time
+        max_length: Longest input to try (the runtime line length cap)
+        threshold: Match time in seconds that counts as slow
+        seed: Optional random seed for reproducible runs
+
+    Returns:
+        The slowest input found and its match time
+    """
+    rng = random.Random(seed)  # noqa: S311 - not used for security
+    compiled = re.compile(pattern)
+    alphabet = "".join(sorted(set(PROBE_ALPHABET) - set("\x0b\x0c\r")))
+    slowest_input = ""
+    slowest_seconds = 0.0
+    attempts = 0
+
+    def try_input(text: str) -> bool:
+        nonlocal slowest_input, slowest_seconds, attempts
+        attempts += 1
+        started = time.perf_counter()
+        compiled.search(text)
+        elapsed = time.perf_counter() - started
+        if elapsed > slowest_seconds:
+            slowest_input, slowest_seconds = text, elapsed
+        return elapsed >= threshold
+
+    for pump in _pump_chars(pattern):
+        for breaker in ("!", "\n", "\xa0", "x"):
+            length = 1
+            while length < max_length:
+                if try_input(pump * length + breaker):
+                    return FuzzResult(
+                        pattern, slowest_input, slowest_seconds, attempts, threshold
+                    )
+                length = min(length + max(1, length // 4), max_length)
+
+    for _ in range(10):
+        try_input("".join(rng.choices(alphabet, k=rng.randrange(1, max_length))))
+
+    for _ in range(iterations):
+        if try_input(_mutate(rng, slowest_input, alphabet, max_length)):
+            break
+
+    return FuzzResult(pattern, slowest_input, slowest_seconds, attempts, threshold)
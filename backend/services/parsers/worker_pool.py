@@ -0,0 +1,243 @@
+"""Warm process pool for running statement parsers from the API.
+
+Parsing a PDF takes seconds of CPU, so it cannot run on the event loop,
+and a fresh process per upload would pay for importing pdfplumber and
+loading the parser configs every time. ``ParserPool`` keeps a fixed set
+of worker processes forked from a forkserver that has already imported
+the parser modules. Each worker then loads, validates and compiles every
+parser config once, before its first job.
+
+Workers are recycled so memory held by the PDF libraries cannot grow
+without bound. ``max_tasks_per_child`` cannot be used for this: when a
+worker exits at its limit while jobs are queued, the executor can
+deadlock. Instead, after ``workers * max_jobs_per_worker`` jobs the pool
+hands new jobs to a fresh executor and lets the old one finish the jobs
+it already has before its processes exit.
+
+Work is submitted with ``await pool.submit(fn, *args)``. The pool counts
+jobs in flight, so it can report how many are queued behind busy
+workers and how busy the workers have been since the pool started.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from typing import TypeVar
+
+from services.parsers.parser_config_loader import available_parser_configs
+from services.parsers.parser_config_loader import config_patterns
+from services.parsers.parser_config_loader import load_parser_config
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Imported once in the forkserver; every worker forks with them loaded
+PRELOAD_MODULES = ["services.parsers.dispatch_parser"]
+
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+
+
+def warm_worker() -> None:
+    """Load, validate and compile every parser config in a new worker.
+
+    The loader caches validated configs per process and ``re`` caches
+    the compiled patterns, so the first statement a worker parses is as
+    fast as the rest.
+    """
+    for name in available_parser_configs():
+        config = load_parser_config(name)
+        for _field, pattern in config_patterns(config):
+            re.compile(pattern)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+class ParserPool:
+    """Pre-started worker processes for CPU-bound parsing."""
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+    ) -> None:
+        """Configure the pool; no process starts until ``start``.
+
+        Args:
+            workers: Number of worker processes
+            max_jobs_per_worker: Jobs per worker, on average, before the
+                workers are replaced
+        """
+        self.workers = workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_jobs = 0
+        self._retiring: set[asyncio.Task[None]] = set()
+        self._started_at = 0.0
+        self._in_flight = 0
+        self._last_change = 0.0
+        self._busy_seconds = 0.0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.recycles = 0
+
+    @classmethod
+    def from_env(cls) -> "ParserPool":
+        """Size the pool from ``PARSER_WORKERS`` and ``PARSER_MAX_JOBS_PER_WORKER``."""
+        return cls(
+            int(os.getenv("PARSER_WORKERS", str(min(4, os.cpu_count() or 1)))),
+            max_jobs_per_worker=int(
+                os.getenv(
+                    "PARSER_MAX_JOBS_PER_WORKER", str(DEFAULT_MAX_JOBS_PER_WORKER)
+                )
+            ),
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the pool accepts work."""
+        return self._executor is not None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(PRELOAD_MODULES)
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=warm_worker,
+        )
+
+    async def start(self) -> None:
+        """Start every worker and wait until each has warmed up."""
+        if self._executor is not None:
+            return
+        self._executor = self._create_executor()
+        self._executor_jobs = 0
+        self._started_at = self._last_change = time.monotonic()
+        # One job per worker makes the executor fork all of them now
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _worker_pid)
+                for _ in range(self.workers)
+            )
+        )
+        logger.info(
+            "🏭 Parser pool started with %s workers (pids %s)",
+            self.workers,
+            ", ".join(map(str, sorted(set(pids)))),
+        )
+
+    async def shutdown(self) -> None:
+        """Stop accepting work, cancel queued jobs and wait for the workers."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        if self._retiring:
+            await asyncio.gather(*self._retiring)
+        logger.info("🏭 Parser pool stopped after %s jobs", self.completed)
+
+    def _track(self, delta: int) -> None:
+        # Busy time accrues for every worker with a job, queued jobs excluded
+        now = time.monotonic()
+        self._busy_seconds += min(self._in_flight, self.workers) * (
+            now - self._last_change
+        )
+        self._last_change = now
+        self._in_flight += delta
+
+    async def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        """Run a picklable function in a worker and await its result.
+
+        Args:
+            fn: Module-level function to run
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The function's return value
+
+        Raises:
+            RuntimeError: If the pool is not running
+        """
+        if self._executor is None:
+            error_msg = "Parser pool is not running"
+            raise RuntimeError(error_msg)
+        if self._executor_jobs >= self.workers * self.max_jobs_per_worker:
+            self._recycle()
+        executor = self._executor
+        self._executor_jobs += 1
+
+        self.submitted += 1
+        self._track(+1)
+        try:
+            result = await asyncio.wrap_future(executor.submit(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            self.failed += 1
+            await self._replace_broken_executor(executor)
+            raise
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self._track(-1)
+        self.completed += 1
+        return result
+
+    def _recycle(self) -> None:
+        """Send new jobs to fresh workers and retire the current ones."""
+        retired = self._executor
+        self._executor = self._create_executor()
+        self._executor_jobs = 0
+        self.recycles += 1
+        if retired is None:
+            return
+        # Jobs already submitted still run; the processes exit afterwards
+        task = asyncio.create_task(asyncio.to_thread(retired.shutdown, wait=True))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Swap in a fresh executor after a worker died mid-job."""
+        # Every job in flight fails at once; only the first one restarts
+        if self._executor is not broken:
+            return
+        self._executor = self._create_executor()
+        self._executor_jobs = 0
+        logger.error("💥 Parser worker died; restarting the pool")
+        self.restarts += 1
+        await asyncio.to_thread(broken.shutdown, wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, worker utilization and job counters."""
+        self._track(0)
+        uptime = time.monotonic() - self._started_at if self.running else 0.0
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "max_jobs_per_worker": self.max_jobs_per_worker,
+            "busy_workers": min(self._in_flight, self.workers),
+            "queue_depth": max(0, self._in_flight - self.workers),
+            "utilization": (
+                self._busy_seconds / (self.workers * uptime) if uptime > 0 else 0.0
+            ),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "recycles": self.recycles,
+        }
@@ -0,0 +1,54 @@
+"""Persistence of parsed statements into the database."""
+
+from .partitions import detach_transaction_partitions
+from .partitions import ensure_transaction_partitions
+from .partitions import list_transaction_partitions
+from .rows import TRANSACTION_COLUMNS
+from .rows import content_hash
+from .rows import credit_card_detail_row
+from .rows import statement_detail_row
+from .rows import statement_row
+from .rows import transaction_records
+from .rows import with_statement_id
+from .spending_summary import monthly_spending
+from .spending_summary import rebuild_monthly_spending
+from .spending_summary import refresh_monthly_spending
+from .statements import PersistedStatement
+from .statements import complete_statement
+from .statements import copy_transactions
+from .statements import persist_statement
+from .statements import save_statement
+from .statements import set_statement_status
+from .upsert import ImportedStatement
+from .upsert import TransactionChanges
+from .upsert import diff_transactions
+from .upsert import import_statement
+from .upsert import upsert_statement
+
+
+__all__ = [
+    "TRANSACTION_COLUMNS",
+    "ImportedStatement",
+    "PersistedStatement",
+    "TransactionChanges",
+    "complete_statement",
+    "content_hash",
+    "copy_transactions",
+    "credit_card_detail_row",
+    "detach_transaction_partitions",
+    "diff_transactions",
+    "ensure_transaction_partitions",
+    "import_statement",
+    "list_transaction_partitions",
+    "monthly_spending",
+    "persist_statement",
+    "rebuild_monthly_spending",
+    "refresh_monthly_spending",
+    "save_statement",
+    "set_statement_status",
+    "statement_detail_row",
+    "statement_row",
+    "transaction_records",
+    "upsert_statement",
+    "with_statement_id",
+]
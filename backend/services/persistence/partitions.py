@@ -0,0 +1,129 @@
+"""Monthly partition management for the ``transactions`` table.
+
+Imports call ``ensure_transaction_partitions`` for the months they touch
+before loading rows, since a row for a month without a partition is
+rejected. Old months can be detached with ``DETACH PARTITION
+CONCURRENTLY``, which leaves the data in a standalone table that can be
+archived or dropped without a bulk ``DELETE``.
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME_PATTERN = re.compile(r"^transactions_(\d{4})_(\d{2})$")
+
+_ENSURE_PARTITIONS = text(
+    "SELECT create_transactions_partition(month) "
+    "FROM unnest(CAST(:months AS date[])) AS month"
+)
+
+_LIST_PARTITIONS = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = 'transactions'
+    ORDER BY child.relname
+    """
+)
+
+
+def month_start(day: date) -> date:
+    """Return the first day of a date's month."""
+    return day.replace(day=1)
+
+
+def partition_month(name: str) -> date | None:
+    """Return the month a partition holds, or None for other tables."""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def add_months(day: date, months: int) -> date:
+    """Return the first day of the month ``months`` after a date's month."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def ensure_transaction_partitions(
+    session: AsyncSession, days: Iterable[date]
+) -> list[str]:
+    """Create any missing monthly partitions for the given dates.
+
+    Args:
+        session: Session with an open transaction
+        days: Transaction dates about to be written
+
+    Returns:
+        Names of the partitions covering the dates
+    """
+    months = sorted({month_start(day) for day in days})
+    if not months:
+        return []
+    result = await session.execute(_ENSURE_PARTITIONS, {"months": months})
+    return list(result.scalars())
+
+
+async def list_transaction_partitions(
+    connection: AsyncConnection | AsyncSession,
+) -> list[tuple[str, date]]:
+    """Return the attached monthly partitions and the month each holds.
+
+    Args:
+        connection: Connection or session to query
+
+    Returns:
+        (name, month) pairs in month order
+    """
+    result = await connection.execute(_LIST_PARTITIONS)
+    partitions = []
+    for name in result.scalars():
+        month = partition_month(name)
+        if month is not None:
+            partitions.append((name, month))
+    return partitions
+
+
+async def detach_transaction_partitions(
+    connection: AsyncConnection, before: date, *, drop: bool = False
+) -> list[str]:
+    """Detach every partition holding months before a date.
+
+    ``DETACH PARTITION CONCURRENTLY`` cannot run inside a transaction
+    block, so the connection must use ``AUTOCOMMIT`` isolation.
+
+    Args:
+        connection: Connection in autocommit mode
+        before: First month to keep
+        drop: Drop the detached tables instead of keeping them
+
+    Returns:
+        Names of the detached partitions
+    """
+    detached = []
+    for name, month in await list_transaction_partitions(connection):
+        if month >= month_start(before):
+            break
+        # Names come from the catalog and match PARTITION_NAME_PATTERN
+        await connection.execute(
+            text(f"ALTER TABLE transactions DETACH PARTITION {name} CONCURRENTLY")
+        )
+        if drop:
+            await connection.execute(text(f"DROP TABLE {name}"))
+        logger.info(
+            "📦 Detached partition %s%s", name, " and dropped it" if drop else ""
+        )
+        detached.append(name)
+    return detached
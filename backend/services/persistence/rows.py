@@ -0,0 +1,300 @@
+"""Mapping of normalized parse results to database rows.
+
+The functions here are pure: they turn the dictionaries produced by the
+parsers (or read back from result JSON files) into column dictionaries
+and COPY records with the Python types asyncpg expects.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+
+logger = logging.getLogger(__name__)
+
+_CENTS = Decimal("0.01")
+
+# Column order of the records produced by transaction_records()
+TRANSACTION_COLUMNS = (
+    "id",
+    "statement_id",
+    "account_id",
+    "transaction_date",
+    "amount",
+    "description",
+    "custom_description",
+    "category",
+    "transaction_type",
+    "reference_id",
+)
+_DATE_COLUMN = TRANSACTION_COLUMNS.index("transaction_date")
+
+# Debt fields have no table of their own, so they are kept with the statement
+DEBT_METADATA_FIELDS = (
+    "payments",
+    "min_payment_due",
+    "payment_due_date",
+    "interest_rate",
+    "interest_paid",
+    "principal_paid",
+)
+
+
+def as_uuid(value: Any) -> UUID:  # noqa: ANN401
+    """Convert a UUID or UUID string to a UUID."""
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def as_money(value: Any) -> Decimal | None:  # noqa: ANN401
+    """Convert a float or string amount to a two-place Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(_CENTS)
+
+
+def as_date(value: Any) -> date | None:  # noqa: ANN401
+    """Convert a date or ISO date string to a date."""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def as_datetime(value: Any) -> datetime | None:  # noqa: ANN401
+    """Convert a datetime or ISO datetime string to a datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def with_statement_id(results: dict[str, Any], statement_id: UUID) -> dict[str, Any]:
+    """Point a parse result at an existing statement row.
+
+    Parsers generate a fresh statement ID; an uploaded statement already
+    has one, so the result and every child record are rebound to it.
+
+    Args:
+        results: Parse results from ``parse_statement``
+        statement_id: ID of the stored statement
+
+    Returns:
+        A copy of the results referring to ``statement_id``
+    """
+    rebound = dict(results)
+    if results.get("statement_data"):
+        rebound["statement_data"] = {**results["statement_data"], "id": statement_id}
+    for key in ("statement_details", "credit_card_details"):
+        if results.get(key):
+            rebound[key] = {**results[key], "statement_id": statement_id}
+    rebound["transactions"] = [
+        {**txn, "statement_id": statement_id} for txn in results.get("transactions", [])
+    ]
+    return rebound
+
+
+def statement_row(
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+    processed_at: datetime | None = None,
+) -> dict[str, Any]:
+    """Build the ``statements`` row for a parse result.
+
+    Args:
+        results: Parse results containing ``statement_data``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+        processed_at: When parsing finished
+
+    Returns:
+        Column values for the statement
+
+    Raises:
+        ValueError: If the result has no statement data or no source file
+    """
+    statement = results.get("statement_data")
+    if not statement:
+        error_msg = "Parse result has no statement_data to persist"
+        raise ValueError(error_msg)
+    if not file_pdf_url and not file_csv_url:
+        error_msg = "A statement needs a source PDF or CSV URL"
+        raise ValueError(error_msg)
+
+    debt = results.get("debt_details") or {}
+    processing_metadata: dict[str, Any] = {
+        "debt_details": {
+            name: str(debt[name])
+            if isinstance(debt.get(name), date)
+            else debt.get(name)
+            for name in DEBT_METADATA_FIELDS
+        },
+    }
+    if "metadata" in results:
+        processing_metadata.update(results["metadata"])
+
+    row: dict[str, Any] = {
+        "id": as_uuid(statement["id"]),
+        "account_id": as_uuid(statement["account_id"]),
+        "period_start": as_date(statement["period_start"]),
+        "period_end": as_date(statement["period_end"]),
+        "file_pdf_url": file_pdf_url,
+        "file_csv_url": file_csv_url,
+        "status": "completed",
+        "processing_metadata": processing_metadata,
+        "processed_at": processed_at,
+    }
+    if statement.get("uploaded_at"):
+        row["uploaded_at"] = as_datetime(statement["uploaded_at"])
+    return row
+
+
+def statement_detail_row(results: dict[str, Any]) -> dict[str, Any] | None:
+    """Build the ``statement_details`` row, or None if there are no details.
+
+    Args:
+        results: Parse results containing ``statement_details``
+
+    Returns:
+        Column values for the statement details
+    """
+    details = results.get("statement_details")
+    if not details:
+        return None
+    debt = results.get("debt_details") or {}
+    return {
+        "id": as_uuid(details["id"]),
+        "statement_id": as_uuid(details["statement_id"]),
+        "previous_balance": as_money(details.get("previous_balance")),
+        "new_balance": as_money(details.get("new_balance")),
+        "minimum_payment": as_money(debt.get("min_payment_due")),
+        "due_date": as_date(debt.get("payment_due_date")),
+    }
+
+
+def credit_card_detail_row(results: dict[str, Any]) -> dict[str, Any] | None:
+    """Build the ``credit_card_details`` row, or None if there are no details.
+
+    Args:
+        results: Parse results containing ``credit_card_details``
+
+    Returns:
+        Column values for the credit card details
+    """
+    cc = results.get("credit_card_details")
+    if not cc:
+        return None
+    return {
+        "id": as_uuid(cc["id"]),
+        "account_id": as_uuid(cc["account_id"]),
+        "statement_id": as_uuid(cc["statement_id"]),
+        "credit_limit": as_money(cc.get("credit_limit")),
+        "available_credit": as_money(cc.get("available_credit")),
+        "points_earned": cc.get("points_earned") or 0,
+        "points_redeemed": cc.get("points_redeemed") or 0,
+        "cash_advances": as_money(cc.get("cash_advances")) or Decimal(0),
+        "fees": as_money(cc.get("fees")) or Decimal(0),
+        "purchases": as_money(cc.get("purchases")) or Decimal(0),
+        "credits": as_money(cc.get("credits")) or Decimal(0),
+    }
+
+
+def transaction_records(results: dict[str, Any]) -> list[tuple[Any, ...]]:
+    """Build COPY records for a result's transactions.
+
+    Records follow ``TRANSACTION_COLUMNS``. Zero-amount rows are dropped
+    because the ``transactions_amount_not_zero`` constraint would abort
+    the whole COPY.
+
+    Args:
+        results: Parse results containing ``transactions``
+
+    Returns:
+        One tuple per transaction
+    """
+    records: list[tuple[Any, ...]] = []
+    skipped = 0
+    for txn in results.get("transactions", []):
+        amount = as_money(txn["amount"])
+        if not amount:
+            skipped += 1
+            continue
+        records.append(
+            (
+                as_uuid(txn["id"]),
+                as_uuid(txn["statement_id"]),
+                as_uuid(txn["account_id"]),
+                as_date(txn["date"]),
+                amount,
+                txn["description"],
+                txn.get("custom_description"),
+                txn.get("category"),
+                txn["type"],
+                txn.get("reference_id"),
+            )
+        )
+
+    if skipped:
+        logger.warning("⚠️ Skipped %s zero-amount transactions", skipped)
+    return records
+
+
+def transaction_dates(records: list[tuple[Any, ...]]) -> set[date]:
+    """Return the distinct transaction dates in a list of COPY records."""
+    return {record[_DATE_COLUMN] for record in records}
+
+
+def content_hash(
+    statement: dict[str, Any],
+    detail: dict[str, Any] | None,
+    cc_detail: dict[str, Any] | None,
+    records: list[tuple[Any, ...]],
+) -> str:
+    """Hash the content a statement import would write.
+
+    Generated row IDs, timestamps and run metadata such as timings are
+    left out, so parsing the same file twice gives the same hash.
+
+    Args:
+        statement: Row from ``statement_row``
+        detail: Row from ``statement_detail_row``
+        cc_detail: Row from ``credit_card_detail_row``
+        records: Records from ``transaction_records``
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    content = {
+        "statement": {
+            name: statement[name]
+            for name in (
+                "account_id",
+                "period_start",
+                "period_end",
+                "file_pdf_url",
+                "file_csv_url",
+            )
+        },
+        "debt_details": statement["processing_metadata"].get("debt_details"),
+        "detail": _without_ids(detail),
+        "credit_card_detail": _without_ids(cc_detail),
+        # Skip the generated transaction and statement IDs
+        "transactions": sorted(
+            json.dumps(record[2:], default=str) for record in records
+        ),
+    }
+    encoded = json.dumps(content, default=str, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _without_ids(row: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Drop the generated ID columns from a detail row."""
+    if row is None:
+        return None
+    return {
+        name: value for name, value in row.items() if name not in {"id", "statement_id"}
+    }
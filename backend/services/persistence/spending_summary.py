@@ -0,0 +1,209 @@
+"""Maintenance and queries for the ``monthly_spending_summary`` table.
+
+Imports call ``refresh_monthly_spending`` in their own transaction with
+the months they touched. Each month is recomputed from its transactions
+rather than adjusted by deltas, so the summary is always exactly what a
+full aggregate would return and the work is bounded by one month of one
+account (a single partition). ``rebuild_monthly_spending`` recomputes
+everything as a fallback after bulk deletes or manual fixes.
+
+Both bump the account's ``data_version`` in the same transaction, so
+cached analytics computed from the old data are never served again.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.orm import MonthlySpendingSummary
+from services.persistence.partitions import add_months
+from services.persistence.partitions import month_start
+from services.telemetry import timed
+
+
+logger = logging.getLogger(__name__)
+
+# Serializes refreshes of one account so concurrent imports touching the
+# same month cannot both insert its rows
+_LOCK_ACCOUNT = text(
+    "SELECT pg_advisory_xact_lock("
+    "hashtext('monthly_spending_summary'), hashtext(CAST(:account_id AS text)))"
+)
+
+_BUMP_VERSION = text(
+    "UPDATE accounts SET data_version = data_version + 1 WHERE id = :account_id"
+)
+
+_DELETE_MONTHS = text(
+    """
+    DELETE FROM monthly_spending_summary
+    WHERE account_id = :account_id
+      AND month = ANY(CAST(:months AS date[]))
+    """
+)
+
+_AGGREGATE = """
+    SELECT account_id,
+           CAST(date_trunc('month', transaction_date) AS date) AS month,
+           COALESCE(category, 'uncategorized') AS category,
+           transaction_type,
+           sum(amount),
+           COALESCE(sum(amount) FILTER (WHERE amount < 0), 0),
+           COALESCE(sum(amount) FILTER (WHERE amount > 0), 0),
+           count(*)
+    FROM transactions
+"""
+
+_INSERT = """
+    INSERT INTO monthly_spending_summary (
+        account_id, month, category, transaction_type, total_amount,
+        spending_amount, credit_amount, transaction_count
+    )
+"""
+
+# The date range lets the planner prune to the touched partitions
+_INSERT_MONTHS = text(
+    _INSERT
+    + _AGGREGATE
+    + """
+    WHERE account_id = :account_id
+      AND transaction_date >= :first_month
+      AND transaction_date < :after_last_month
+      AND CAST(date_trunc('month', transaction_date) AS date)
+          = ANY(CAST(:months AS date[]))
+    GROUP BY 1, 2, 3, 4
+    """
+)
+
+_INSERT_ALL = text(_INSERT + _AGGREGATE + " GROUP BY 1, 2, 3, 4")
+
+_INSERT_ACCOUNT = text(
+    _INSERT + _AGGREGATE + " WHERE account_id = :account_id GROUP BY 1, 2, 3, 4"
+)
+
+
+async def statement_months(session: AsyncSession, statement_id: UUID) -> set[date]:
+    """Return the months a stored statement's transactions fall in.
+
+    Args:
+        session: Database session
+        statement_id: Statement whose transactions are checked
+
+    Returns:
+        First day of each month
+    """
+    result = await session.execute(
+        text(
+            "SELECT DISTINCT CAST(date_trunc('month', transaction_date) AS date) "
+            "FROM transactions WHERE statement_id = :statement_id"
+        ),
+        {"statement_id": statement_id},
+    )
+    return set(result.scalars())
+
+
+@timed()
+async def refresh_monthly_spending(
+    session: AsyncSession, account_id: UUID, days: Iterable[date]
+) -> int:
+    """Recompute an account's summary rows for the months containing dates.
+
+    Args:
+        session: Session with an open transaction
+        account_id: Account whose summary is refreshed
+        days: Dates whose months changed
+
+    Returns:
+        Number of summary rows written
+    """
+    months = sorted({month_start(day) for day in days})
+    if not months:
+        return 0
+
+    params = {
+        "account_id": account_id,
+        "months": months,
+        "first_month": months[0],
+        "after_last_month": add_months(months[-1], 1),
+    }
+    await session.execute(_LOCK_ACCOUNT, params)
+    await session.execute(_BUMP_VERSION, params)
+    await session.execute(_DELETE_MONTHS, params)
+    result = await session.execute(_INSERT_MONTHS, params)
+    return cast("CursorResult[Any]", result).rowcount
+
+
+async def rebuild_monthly_spending(
+    session: AsyncSession, account_id: UUID | None = None
+) -> int:
+    """Recompute the whole summary, or all months of one account.
+
+    Args:
+        session: Session with an open transaction
+        account_id: Account to rebuild (defaults to every account)
+
+    Returns:
+        Number of summary rows written
+    """
+    if account_id is None:
+        await session.execute(text("TRUNCATE monthly_spending_summary"))
+        await session.execute(
+            text("UPDATE accounts SET data_version = data_version + 1")
+        )
+        result = await session.execute(_INSERT_ALL)
+    else:
+        params = {"account_id": account_id}
+        await session.execute(_LOCK_ACCOUNT, params)
+        await session.execute(_BUMP_VERSION, params)
+        await session.execute(
+            text("DELETE FROM monthly_spending_summary WHERE account_id = :account_id"),
+            params,
+        )
+        result = await session.execute(_INSERT_ACCOUNT, params)
+
+    rows = cast("CursorResult[Any]", result).rowcount
+    logger.info("📊 Rebuilt monthly spending summary (%s rows)", rows)
+    return rows
+
+
+async def monthly_spending(
+    session: AsyncSession,
+    account_ids: Iterable[UUID],
+    start: date,
+    end: date,
+    *,
+    category: str | None = None,
+) -> list[MonthlySpendingSummary]:
+    """Read summary rows for accounts over a range of months.
+
+    Args:
+        session: Database session
+        account_ids: Accounts to include
+        start: Any date in the first month
+        end: Any date in the last month
+        category: Only return this category
+
+    Returns:
+        Summary rows ordered by month, category and type
+    """
+    query = select(MonthlySpendingSummary).where(
+        MonthlySpendingSummary.account_id.in_(list(account_ids)),
+        MonthlySpendingSummary.month.between(month_start(start), month_start(end)),
+    )
+    if category is not None:
+        query = query.where(MonthlySpendingSummary.category == category)
+    query = query.order_by(
+        MonthlySpendingSummary.month,
+        MonthlySpendingSummary.category,
+        MonthlySpendingSummary.transaction_type,
+    )
+    result = await session.execute(query)
+    return list(result.scalars())
@@ -0,0 +1,284 @@
+"""Persistence of parsed statements into PostgreSQL.
+
+Statement, detail and credit card rows are single-row inserts; the
+transactions are streamed with asyncpg's binary ``COPY`` on the same
+connection, so a statement and all of its transactions land in one
+database transaction without going through the ORM unit of work.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from models.orm import CreditCardDetail
+from models.orm import Statement
+from models.orm import StatementDetail
+from models.orm import Transaction
+from services.persistence.partitions import ensure_transaction_partitions
+from services.persistence.rows import TRANSACTION_COLUMNS
+from services.persistence.rows import credit_card_detail_row
+from services.persistence.rows import statement_detail_row
+from services.persistence.rows import statement_row
+from services.persistence.rows import transaction_dates
+from services.persistence.rows import transaction_records
+from services.persistence.rows import with_statement_id
+from services.persistence.spending_summary import refresh_monthly_spending
+from services.telemetry import timed
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PersistedStatement:
+    """Summary of a statement written to the database."""
+
+    statement_id: UUID
+    transaction_count: int
+    duration: float
+
+
+async def driver_connection(session: AsyncSession) -> Any:  # noqa: ANN401
+    """Return the asyncpg connection behind a session's current transaction.
+
+    The asyncpg dialect only sends ``BEGIN`` before the first statement,
+    so a trivial query is run first if the connection is not yet inside a
+    transaction; otherwise a ``COPY`` would autocommit on its own.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    asyncpg_connection: Any = raw_connection.driver_connection
+    if not asyncpg_connection.is_in_transaction():
+        await connection.execute(select(1))
+    return asyncpg_connection
+
+
+@timed()
+async def copy_transactions(
+    session: AsyncSession, records: list[tuple[Any, ...]]
+) -> int:
+    """Bulk load transaction records with ``COPY`` in the session's transaction.
+
+    Monthly partitions for the records' dates are created first if needed.
+
+    Args:
+        session: Session whose connection and transaction are used
+        records: Records in ``TRANSACTION_COLUMNS`` order
+
+    Returns:
+        Number of rows copied
+    """
+    if not records:
+        return 0
+
+    await ensure_transaction_partitions(session, transaction_dates(records))
+    asyncpg_connection = await driver_connection(session)
+    await asyncpg_connection.copy_records_to_table(
+        Transaction.__tablename__,
+        records=records,
+        columns=TRANSACTION_COLUMNS,
+    )
+    return len(records)
+
+
+@timed()
+async def persist_statement(
+    session: AsyncSession,
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+) -> PersistedStatement:
+    """Write a parse result to the statement tables in the caller's transaction.
+
+    Args:
+        session: Session with an open transaction
+        results: Parse results from ``parse_statement``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+
+    Returns:
+        Summary of what was written
+
+    Raises:
+        ValueError: If the result cannot be mapped to a statement
+    """
+    started = time.perf_counter()
+    statement = statement_row(
+        results,
+        file_pdf_url=file_pdf_url,
+        file_csv_url=file_csv_url,
+        processed_at=datetime.now(UTC),
+    )
+    await session.execute(insert(Statement).values(**statement))
+    copied = await _insert_children(session, results, statement["account_id"])
+
+    return PersistedStatement(
+        statement_id=statement["id"],
+        transaction_count=copied,
+        duration=time.perf_counter() - started,
+    )
+
+
+async def _insert_children(
+    session: AsyncSession, results: dict[str, Any], account_id: UUID
+) -> int:
+    """Insert a result's detail rows and transactions; return rows copied."""
+    detail = statement_detail_row(results)
+    if detail is not None:
+        await session.execute(insert(StatementDetail).values(**detail))
+
+    cc_detail = credit_card_detail_row(results)
+    if cc_detail is not None:
+        await session.execute(insert(CreditCardDetail).values(**cc_detail))
+
+    records = transaction_records(results)
+    copied = await copy_transactions(session, records)
+    await refresh_monthly_spending(session, account_id, transaction_dates(records))
+    return copied
+
+
+@timed()
+async def complete_statement(
+    session: AsyncSession,
+    statement_id: UUID,
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+) -> PersistedStatement:
+    """Fill in an uploaded statement from its parse result.
+
+    The ``pending`` row created at upload time gets its billing period,
+    metadata and ``completed`` status, and the details and transactions
+    are written under its ID, all in the caller's transaction.
+
+    Args:
+        session: Session with an open transaction
+        statement_id: ID of the uploaded statement
+        results: Parse results from ``parse_statement``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+
+    Returns:
+        Summary of what was written
+
+    Raises:
+        ValueError: If the result cannot be mapped to a statement, or the
+            account already has a statement for the parsed period
+    """
+    started = time.perf_counter()
+    results = with_statement_id(results, statement_id)
+    row = statement_row(
+        results,
+        file_pdf_url=file_pdf_url,
+        file_csv_url=file_csv_url,
+        processed_at=datetime.now(UTC),
+    )
+    existing = await session.execute(
+        select(Statement.id).where(
+            Statement.account_id == row["account_id"],
+            Statement.period_start == row["period_start"],
+            Statement.period_end == row["period_end"],
+            Statement.id != statement_id,
+        )
+    )
+    duplicate = existing.scalar_one_or_none()
+    if duplicate is not None:
+        error_msg = f"Statement for this account and period already exists: {duplicate}"
+        raise ValueError(error_msg)
+
+    await session.execute(
+        update(Statement)
+        .where(Statement.id == statement_id)
+        .values(
+            period_start=row["period_start"],
+            period_end=row["period_end"],
+            status="completed",
+            processing_metadata=Statement.processing_metadata.op("||")(
+                literal(row["processing_metadata"], JSONB)
+            ),
+            processed_at=row["processed_at"],
+        )
+    )
+    copied = await _insert_children(session, results, row["account_id"])
+
+    return PersistedStatement(
+        statement_id=statement_id,
+        transaction_count=copied,
+        duration=time.perf_counter() - started,
+    )
+
+
+async def set_statement_status(
+    session_maker: async_sessionmaker[AsyncSession],
+    statement_id: UUID,
+    status: str,
+    *,
+    error: str | None = None,
+) -> None:
+    """Move an uploaded statement to another processing status.
+
+    Args:
+        session_maker: Factory for database sessions
+        statement_id: ID of the uploaded statement
+        status: ``processing`` or ``failed``
+        error: Failure description kept in ``processing_metadata``
+    """
+    values: dict[str, Any] = {"status": status}
+    if error is not None:
+        values["processing_metadata"] = Statement.processing_metadata.op("||")(
+            literal({"error": error}, JSONB)
+        )
+        values["processed_at"] = datetime.now(UTC)
+    async with session_maker() as session, session.begin():
+        await session.execute(
+            update(Statement).where(Statement.id == statement_id).values(**values)
+        )
+
+
+async def save_statement(
+    session_maker: async_sessionmaker[AsyncSession],
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+) -> PersistedStatement:
+    """Persist one parse result in its own transaction.
+
+    Args:
+        session_maker: Factory for database sessions
+        results: Parse results from ``parse_statement``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+
+    Returns:
+        Summary of what was written
+    """
+    async with session_maker() as session, session.begin():
+        persisted = await persist_statement(
+            session,
+            results,
+            file_pdf_url=file_pdf_url,
+            file_csv_url=file_csv_url,
+        )
+
+    logger.info(
+        "💾 Saved statement %s with %s transactions in %.3fs",
+        persisted.statement_id,
+        persisted.transaction_count,
+        persisted.duration,
+    )
+    return persisted
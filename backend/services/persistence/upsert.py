@@ -0,0 +1,414 @@
+"""Idempotent statement import keyed on (account, billing period).
+
+The statement row is written with ``INSERT ... ON CONFLICT`` on the
+``statements`` unique constraint. A content hash kept in
+``processing_metadata`` makes the conflict update conditional, so
+re-importing an unchanged statement costs two indexed lookups. When the
+content did change, detail rows are upserted and transactions are copied
+into a temporary staging table and diffed against the stored rows, so
+only inserted, changed or removed transactions are touched.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy import Boolean
+from sqlalchemy import CursorResult
+from sqlalchemy import TextClause
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import literal_column
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.sql.dml import ReturningInsert
+
+from models.orm import CreditCardDetail
+from models.orm import Statement
+from models.orm import StatementDetail
+from services.persistence.partitions import ensure_transaction_partitions
+from services.persistence.rows import TRANSACTION_COLUMNS
+from services.persistence.rows import content_hash
+from services.persistence.rows import credit_card_detail_row
+from services.persistence.rows import statement_detail_row
+from services.persistence.rows import statement_row
+from services.persistence.rows import transaction_dates
+from services.persistence.rows import transaction_records
+from services.persistence.spending_summary import refresh_monthly_spending
+from services.persistence.spending_summary import statement_months
+from services.persistence.statements import copy_transactions
+from services.persistence.statements import driver_connection
+from services.telemetry import span
+from services.telemetry import timed
+
+
+logger = logging.getLogger(__name__)
+
+# Transactions are matched on (date, description, ordinal), where the
+# ordinal numbers repeated date/description pairs within one statement
+_MATCH_TRANSACTIONS = text(
+    """
+    CREATE TEMPORARY TABLE transaction_matches AS
+    SELECT existing.id AS existing_id, staged.id AS staged_id
+    FROM (
+        SELECT id, transaction_date, description,
+               row_number() OVER (
+                   PARTITION BY transaction_date, description
+                   ORDER BY amount, transaction_type
+               ) AS ordinal
+        FROM transactions_staging
+    ) AS staged
+    FULL JOIN (
+        SELECT id, transaction_date, description,
+               row_number() OVER (
+                   PARTITION BY transaction_date, description
+                   ORDER BY amount, transaction_type
+               ) AS ordinal
+        FROM transactions
+        WHERE statement_id = :statement_id
+    ) AS existing
+      ON existing.transaction_date = staged.transaction_date
+     AND existing.description = staged.description
+     AND existing.ordinal = staged.ordinal
+    """
+)
+
+_DELETE_REMOVED = text(
+    """
+    DELETE FROM transactions AS t
+    USING transaction_matches AS m
+    WHERE m.staged_id IS NULL
+      AND t.id = m.existing_id
+      AND t.statement_id = :statement_id
+    """
+)
+
+# Category and custom description may have been edited by the user, so a
+# parsed category only fills an empty one and custom_description is kept
+_UPDATE_CHANGED = text(
+    """
+    UPDATE transactions AS t
+    SET amount = s.amount,
+        transaction_type = s.transaction_type,
+        reference_id = s.reference_id,
+        category = COALESCE(t.category, s.category),
+        updated_at = CURRENT_TIMESTAMP
+    FROM transaction_matches AS m
+    JOIN transactions_staging AS s ON s.id = m.staged_id
+    WHERE t.id = m.existing_id
+      AND t.statement_id = :statement_id
+      AND (t.amount, t.transaction_type, t.reference_id, t.category)
+          IS DISTINCT FROM
+          (s.amount, s.transaction_type, s.reference_id,
+           COALESCE(t.category, s.category))
+    """
+)
+
+_INSERT_ADDED = text(
+    """
+    INSERT INTO transactions (
+        id, statement_id, account_id, transaction_date, amount,
+        description, custom_description, category, transaction_type,
+        reference_id
+    )
+    SELECT s.id, s.statement_id, s.account_id, s.transaction_date, s.amount,
+           s.description, s.custom_description, s.category,
+           s.transaction_type, s.reference_id
+    FROM transactions_staging AS s
+    JOIN transaction_matches AS m ON m.staged_id = s.id
+    WHERE m.existing_id IS NULL
+    """
+)
+
+
+@dataclass(frozen=True)
+class TransactionChanges:
+    """Row counts from diffing a re-imported statement's transactions."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+@dataclass(frozen=True)
+class ImportedStatement:
+    """Summary of an idempotent statement import."""
+
+    statement_id: UUID
+    outcome: str  # "inserted", "updated" or "unchanged"
+    changes: TransactionChanges
+    duration: float
+
+
+def statement_upsert(row: dict[str, Any]) -> ReturningInsert[UUID, bool]:
+    """Build the conditional ``INSERT ... ON CONFLICT`` for a statement row.
+
+    The conflict update only fires when the content hash differs or the
+    stored statement did not complete, and the statement returns
+    ``(id, inserted)`` for rows it wrote and nothing for unchanged ones.
+
+    Args:
+        row: Row from ``statement_row`` with ``content_hash`` in its metadata
+
+    Returns:
+        The insert statement
+    """
+    stmt = insert(Statement).values(**row)
+    excluded = stmt.excluded
+    stored_hash = Statement.processing_metadata["content_hash"].astext
+    new_hash = excluded.processing_metadata["content_hash"].astext
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            Statement.account_id,
+            Statement.period_start,
+            Statement.period_end,
+        ],
+        set_={
+            "file_pdf_url": excluded.file_pdf_url,
+            "file_csv_url": excluded.file_csv_url,
+            "status": excluded.status,
+            "processing_metadata": excluded.processing_metadata,
+            "processed_at": excluded.processed_at,
+            "updated_at": func.current_timestamp(),
+        },
+        where=or_(
+            Statement.status != "completed",
+            stored_hash.is_distinct_from(new_hash),
+        ),
+    ).returning(Statement.id, literal_column("xmax = 0", Boolean).label("inserted"))
+
+
+def detail_upsert(model: type[Any], row: dict[str, Any]) -> Insert:
+    """Build an upsert for a one-per-statement detail row.
+
+    Args:
+        model: ``StatementDetail`` or ``CreditCardDetail``
+        row: Detail row; its ``id`` is only used when inserting
+
+    Returns:
+        The insert statement
+    """
+    stmt = insert(model).values(**row)
+    updates = {
+        name: stmt.excluded[name]
+        for name in row
+        if name not in {"id", "statement_id", "account_id"}
+    }
+    return stmt.on_conflict_do_update(
+        index_elements=[model.statement_id],
+        set_={**updates, "updated_at": func.current_timestamp()},
+    )
+
+
+async def _existing_statement_id(session: AsyncSession, row: dict[str, Any]) -> UUID:
+    """Look up the stored statement for a row's account and period."""
+    result = await session.execute(
+        select(Statement.id).where(
+            Statement.account_id == row["account_id"],
+            Statement.period_start == row["period_start"],
+            Statement.period_end == row["period_end"],
+        )
+    )
+    return result.scalar_one()
+
+
+async def _sync_detail(
+    session: AsyncSession,
+    model: type[Any],
+    statement_id: UUID,
+    row: dict[str, Any] | None,
+) -> None:
+    """Upsert a detail row, or delete the stored one if the parse has none."""
+    if row is None:
+        await session.execute(delete(model).where(model.statement_id == statement_id))
+    else:
+        await session.execute(
+            detail_upsert(model, {**row, "statement_id": statement_id})
+        )
+
+
+async def _execute_count(
+    session: AsyncSession, statement: TextClause, params: dict[str, Any] | None = None
+) -> int:
+    """Execute a DML statement and return the number of rows it affected."""
+    result = cast("CursorResult[Any]", await session.execute(statement, params))
+    return result.rowcount
+
+
+@timed()
+async def diff_transactions(
+    session: AsyncSession, statement_id: UUID, records: list[tuple[Any, ...]]
+) -> TransactionChanges:
+    """Replace a statement's transactions with a set-based diff.
+
+    Records are copied into a temporary staging table, matched against
+    the stored rows, and only the differences are written.
+
+    Args:
+        session: Session with an open transaction
+        statement_id: Stored statement whose transactions are replaced
+        records: Records in ``TRANSACTION_COLUMNS`` order
+
+    Returns:
+        Counts of inserted, updated and deleted rows
+    """
+    params = {"statement_id": statement_id}
+    await session.execute(
+        text(
+            "CREATE TEMPORARY TABLE transactions_staging "
+            "(LIKE transactions INCLUDING DEFAULTS)"
+        )
+    )
+    if records:
+        await ensure_transaction_partitions(session, transaction_dates(records))
+        asyncpg_connection = await driver_connection(session)
+        await asyncpg_connection.copy_records_to_table(
+            "transactions_staging", records=records, columns=TRANSACTION_COLUMNS
+        )
+    await session.execute(_MATCH_TRANSACTIONS, params)
+    deleted = await _execute_count(session, _DELETE_REMOVED, params)
+    updated = await _execute_count(session, _UPDATE_CHANGED, params)
+    inserted = await _execute_count(session, _INSERT_ADDED)
+    # Dropped explicitly so several statements can share one transaction;
+    # a failure rolls back their creation along with everything else
+    await session.execute(text("DROP TABLE transaction_matches, transactions_staging"))
+
+    return TransactionChanges(
+        inserted=inserted,
+        updated=updated,
+        deleted=deleted,
+    )
+
+
+@timed()
+async def upsert_statement(
+    session: AsyncSession,
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+) -> ImportedStatement:
+    """Import a parse result, reusing the stored statement for its period.
+
+    Args:
+        session: Session with an open transaction
+        results: Parse results from ``parse_statement``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+
+    Returns:
+        Summary of what was written
+
+    Raises:
+        ValueError: If the result cannot be mapped to a statement
+    """
+    started = time.perf_counter()
+    row = statement_row(
+        results,
+        file_pdf_url=file_pdf_url,
+        file_csv_url=file_csv_url,
+        processed_at=datetime.now(UTC),
+    )
+    detail = statement_detail_row(results)
+    cc_detail = credit_card_detail_row(results)
+    records = transaction_records(results)
+    row["processing_metadata"]["content_hash"] = content_hash(
+        row, detail, cc_detail, records
+    )
+
+    written = (await session.execute(statement_upsert(row))).one_or_none()
+    if written is None:
+        return ImportedStatement(
+            statement_id=await _existing_statement_id(session, row),
+            outcome="unchanged",
+            changes=TransactionChanges(),
+            duration=time.perf_counter() - started,
+        )
+
+    statement_id, was_inserted = written
+    if was_inserted:
+        if detail is not None:
+            await session.execute(insert(StatementDetail).values(**detail))
+        if cc_detail is not None:
+            await session.execute(insert(CreditCardDetail).values(**cc_detail))
+        copied = await copy_transactions(session, records)
+        await refresh_monthly_spending(
+            session, row["account_id"], transaction_dates(records)
+        )
+        return ImportedStatement(
+            statement_id=statement_id,
+            outcome="inserted",
+            changes=TransactionChanges(inserted=copied),
+            duration=time.perf_counter() - started,
+        )
+
+    # Months losing transactions need a refresh as well as those gaining them
+    touched_months = await statement_months(session, statement_id)
+
+    # The parse generated fresh IDs; children belong to the stored statement
+    with span("sync_details"):
+        await _sync_detail(session, StatementDetail, statement_id, detail)
+        await _sync_detail(session, CreditCardDetail, statement_id, cc_detail)
+    changes = await diff_transactions(
+        session,
+        statement_id,
+        [(record[0], statement_id, *record[2:]) for record in records],
+    )
+    await refresh_monthly_spending(
+        session, row["account_id"], touched_months | transaction_dates(records)
+    )
+    return ImportedStatement(
+        statement_id=statement_id,
+        outcome="updated",
+        changes=changes,
+        duration=time.perf_counter() - started,
+    )
+
+
+async def import_statement(
+    session_maker: async_sessionmaker[AsyncSession],
+    results: dict[str, Any],
+    *,
+    file_pdf_url: str | None = None,
+    file_csv_url: str | None = None,
+) -> ImportedStatement:
+    """Idempotently import one parse result in its own transaction.
+
+    Args:
+        session_maker: Factory for database sessions
+        results: Parse results from ``parse_statement``
+        file_pdf_url: Location of the source PDF
+        file_csv_url: Location of the source CSV
+
+    Returns:
+        Summary of what was written
+    """
+    async with session_maker() as session, session.begin():
+        imported = await upsert_statement(
+            session,
+            results,
+            file_pdf_url=file_pdf_url,
+            file_csv_url=file_csv_url,
+        )
+
+    changes = imported.changes
+    logger.info(
+        "💾 Imported statement %s (%s): +%s ~%s -%s transactions in %.3fs",
+        imported.statement_id,
+        imported.outcome,
+        changes.inserted,
+        changes.updated,
+        changes.deleted,
+        imported.duration,
+    )
+    return imported
@@ -4,22 +4,20 @@ import logging
 import os
 from dataclasses import dataclass
 from dataclasses import field
-from typing import TYPE_CHECKING
 from typing import Any
 
+# database imports this module while vault imports database, so the
+# vault module is bound here and SecureVault is looked up when used
+from . import vault
 from .exceptions import SecretNotFoundError
 from .exceptions import SecureVaultError
 
 
-if TYPE_CHECKING:
-    from .vault import SecureVault
-else:
-    # Import at runtime to avoid circular dependencies
-    from .vault import SecureVault
-
-
 logger = logging.getLogger(__name__)
 
+# Largest statement file accepted, unless MAX_FILE_SIZE_MB says otherwise
+DEFAULT_MAX_FILE_SIZE_MB = 50
+
 
 @dataclass
 class SecretMapping:
@@ -123,9 +121,7 @@ class ConfigManager:
                 self._vault_available = False
                 return
 
-            # Using SecureVault imported at module level
-
-            self._vault_instance = SecureVault(master_key)
+            self._vault_instance = vault.SecureVault(master_key)
             self._vault_available = True
             logger.info("SecureVault available for secret injection")
 
@@ -262,6 +258,11 @@ class ConfigManager:
             "secure": os.getenv("MINIO_SECURE", "false").lower() == "true",
         }
 
+    def get_max_file_bytes(self) -> int:
+        """Get the largest statement file accepted, in bytes."""
+        size_mb = os.getenv("MAX_FILE_SIZE_MB", str(DEFAULT_MAX_FILE_SIZE_MB))
+        return int(size_mb) * 1024 * 1024
+
     async def migrate_environment_secrets(self) -> dict[str, str]:
         """Migrate existing environment variable secrets to SecureVault.
 
@@ -3,9 +3,6 @@
 import os
 from datetime import UTC
 from datetime import datetime
-
-# Use dynamic imports to avoid circular dependencies
-from typing import TYPE_CHECKING
 from typing import Any
 from uuid import UUID
 
@@ -13,16 +10,12 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# database imports this package through the config manager, so only the
+# module is bound here and its session maker is looked up at call time
+import database
+from models.orm import Secret
+from models.orm import SecretAuditLog
 
-if TYPE_CHECKING:
-    from database import async_session_maker
-    from models.orm import Secret
-    from models.orm import SecretAuditLog
-else:
-    # Runtime imports for functions that need them
-    from database import async_session_maker
-    from models.orm import Secret
-    from models.orm import SecretAuditLog
 from .encryption import SecureVaultEncryption
 from .exceptions import MasterKeyError
 from .exceptions import SecretNotFoundError
@@ -101,7 +94,7 @@ class SecureVault:
             key_fingerprint=self._key_fingerprint,
         )
 
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             try:
                 # Check if secret already exists
                 existing = await session.execute(
@@ -161,7 +154,7 @@ class SecureVault:
         """
         # Use imported models and session maker
 
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             # Find secret
             result = await session.execute(
                 select(Secret).where(Secret.name == name.strip())
@@ -239,7 +232,7 @@ class SecureVault:
 
         # Use imported models and session maker
 
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             # Find existing secret
             result = await session.execute(
                 select(Secret).where(Secret.name == name.strip())
@@ -300,7 +293,7 @@ class SecureVault:
         Raises:
             SecretNotFoundError: If secret doesn't exist
         """
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             # Find existing secret
             result = await session.execute(
                 select(Secret).where(Secret.name == name.strip())
@@ -349,7 +342,7 @@ class SecureVault:
         Returns:
             List of secret information (without encrypted values)
         """
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             result = await session.execute(select(Secret))
             secrets = result.scalars().all()
 
@@ -418,7 +411,7 @@ class SecureVault:
             SecretNotFoundError: If secret doesn't exist
             SecretValidationError: If validation fails
         """
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             # Find existing secret
             result = await session.execute(
                 select(Secret).where(Secret.name == name.strip())
@@ -473,7 +466,7 @@ class SecureVault:
         Returns:
             List of audit log entries
         """
-        async with async_session_maker() as session:
+        async with database.async_session_maker() as session:
             query = select(SecretAuditLog).order_by(SecretAuditLog.timestamp.desc())
 
             if secret_name:
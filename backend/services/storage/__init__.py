@@ -0,0 +1,18 @@
+"""Content-addressed storage of uploaded statement files."""
+
+from .base import ObjectStorage
+from .base import content_key
+from .factory import get_storage
+from .factory import storage_from_env
+from .local import LocalStorage
+from .s3 import S3Storage
+
+
+__all__ = [
+    "LocalStorage",
+    "ObjectStorage",
+    "S3Storage",
+    "content_key",
+    "get_storage",
+    "storage_from_env",
+]
@@ -0,0 +1,78 @@
+"""Content-addressed object storage interface."""
+
+from abc import ABC
+from abc import abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+
+
+def content_key(sha256: str, suffix: str) -> str:
+    """Return the object key of a file with the given content digest.
+
+    Keys are the SHA-256 of the content, so the same file uploaded twice
+    is stored once.
+
+    Args:
+        sha256: Hex SHA-256 of the file
+        suffix: File extension, e.g. ``".pdf"``
+    """
+    return f"{sha256}{suffix.lower()}"
+
+
+class ObjectStorage(ABC):
+    """Where uploaded statement files are kept.
+
+    The API stores each upload once it has been received (and hashed)
+    in a local staging directory; parsers open the stored objects by the
+    location recorded on the statement. Implementations are pickled into
+    parser processes, so they must not hold live connections in their
+    pickled state.
+    """
+
+    @abstractmethod
+    def location(self, key: str) -> str:
+        """Return the location recorded for an object (``file_pdf_url``)."""
+
+    @abstractmethod
+    async def ensure_ready(self) -> None:
+        """Create the directory or bucket objects are stored in, if missing."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Return whether an object is stored under ``key``."""
+
+    @abstractmethod
+    async def put_file(self, key: str, path: Path) -> str:
+        """Store a local file under ``key``, consuming it.
+
+        The file is moved or uploaded and then removed; if an object with
+        the key already exists, its content is the same, so the file is
+        only removed.
+
+        Args:
+            key: Content-addressed key from ``content_key``
+            path: Local file, e.g. in the upload staging directory
+
+        Returns:
+            The object's location
+        """
+
+    @abstractmethod
+    def open(self, location: str) -> BinaryIO:
+        """Open a stored object for seekable binary reading.
+
+        Called from parser processes, so it blocks.
+
+        Raises:
+            FileNotFoundError: If there is no such object
+        """
+
+    def read_range(self, location: str, start: int, length: int) -> bytes:
+        """Read ``length`` bytes of an object starting at ``start``.
+
+        Raises:
+            FileNotFoundError: If there is no such object
+        """
+        with self.open(location) as handle:
+            handle.seek(start)
+            return handle.read(length)
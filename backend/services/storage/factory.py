@@ -0,0 +1,52 @@
+"""Storage backend selection from the environment."""
+
+import functools
+import os
+from pathlib import Path
+
+from .base import ObjectStorage
+from .local import LocalStorage
+from .s3 import S3Storage
+
+
+MB = 1024 * 1024
+
+STORAGE_BACKENDS = ("local", "s3")
+
+
+def storage_from_env() -> ObjectStorage:
+    """Build the storage backend named by ``STORAGE_BACKEND``.
+
+    ``local`` (the default) keeps files in ``UPLOAD_DIR``; ``s3`` keeps
+    them in the ``MINIO_BUCKET_STATEMENTS`` bucket of the MinIO (or S3)
+    endpoint from ``ConfigManager.get_minio_config``.
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = os.getenv("STORAGE_BACKEND", "local").lower()
+    if backend == "local":
+        return LocalStorage(Path(os.getenv("UPLOAD_DIR", "data/uploads")))
+    if backend == "s3":
+        # Imported here: the config manager pulls in the vault and database
+        from services.secure_vault.config_manager import get_config_manager  # noqa: PLC0415
+
+        return S3Storage.from_config(
+            get_config_manager().get_minio_config(),
+            bucket=os.getenv("MINIO_BUCKET_STATEMENTS", "ledgerly-statements"),
+            part_size=int(os.getenv("STORAGE_PART_SIZE_MB", "8")) * MB,
+        )
+    error_msg = (
+        f"Unknown STORAGE_BACKEND {backend!r}, expected one of {STORAGE_BACKENDS}"
+    )
+    raise ValueError(error_msg)
+
+
+@functools.cache
+def get_storage() -> ObjectStorage:
+    """Return the process's storage backend, built on first use.
+
+    Built lazily so secrets loaded at startup are in place; usable as a
+    FastAPI dependency.
+    """
+    return storage_from_env()
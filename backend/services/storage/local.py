@@ -0,0 +1,46 @@
+"""Object storage in a local directory."""
+
+import os
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO
+
+import anyio
+
+from .base import ObjectStorage
+
+
+class LocalStorage(ObjectStorage):
+    """Stores objects as files named by their key in one directory.
+
+    Locations are plain file paths, as recorded before storage backends
+    existed. Storing a file from the same filesystem is a rename.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Store objects under ``root``."""
+        self.root = root
+
+    def location(self, key: str) -> str:
+        """Return the object's file path."""
+        return str(self.root / key)
+
+    async def ensure_ready(self) -> None:
+        """Create the storage directory."""
+        await anyio.to_thread.run_sync(
+            partial(self.root.mkdir, parents=True, exist_ok=True)
+        )
+
+    async def exists(self, key: str) -> bool:
+        """Return whether the object's file exists."""
+        return await anyio.to_thread.run_sync((self.root / key).is_file)
+
+    async def put_file(self, key: str, path: Path) -> str:
+        """Move a local file into the storage directory."""
+        # Same content, same name: replacing an existing copy changes nothing
+        await anyio.to_thread.run_sync(os.replace, path, self.root / key)
+        return self.location(key)
+
+    def open(self, location: str) -> BinaryIO:
+        """Open the object's file."""
+        return Path(location).open("rb")
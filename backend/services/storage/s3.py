@@ -0,0 +1,246 @@
+"""Object storage in an S3-compatible bucket (MinIO or AWS S3)."""
+
+import io
+import logging
+import mimetypes
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import BinaryIO
+
+import anyio
+from minio import Minio
+from minio.error import S3Error
+
+from .base import ObjectStorage
+
+
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
+
+logger = logging.getLogger(__name__)
+
+SCHEME = "s3://"
+# S3 parts must be at least 5MiB, except the last
+MIN_PART_BYTES = 5 * 1024 * 1024
+MISSING_CODES = frozenset({"NoSuchKey", "NoSuchBucket"})
+
+
+class _ObjectReader(io.RawIOBase):
+    """Seekable reader that fetches each read as a ranged GET."""
+
+    def __init__(self, client: Minio, bucket: str, key: str, size: int) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+        self.requests = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._size}
+        self._position = max(0, base[whence] + offset)
+        return self._position
+
+    def _fetch(self, length: int) -> bytes:
+        response = self._client.get_object(
+            self._bucket, self._key, offset=self._position, length=length
+        )
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+        self.requests += 1
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        view = memoryview(buffer).cast("B")
+        length = min(len(view), self._size - self._position)
+        if length <= 0:
+            return 0
+        data = self._fetch(length)
+        view[: len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        # One request for the rest, not one per default-sized read
+        length = self._size - self._position
+        return self._fetch(length) if length > 0 else b""
+
+
+class S3Storage(ObjectStorage):
+    """Stores objects in one bucket, keyed by content digest.
+
+    Files are uploaded with streaming multipart puts of ``part_size``
+    parts, so memory use does not grow with the file. Stored objects are
+    read with ranged GETs of ``read_block_bytes`` through a buffered,
+    seekable reader, so a parser reads only the parts of a file it
+    touches.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        bucket: str,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        secure: bool = False,
+        part_size: int = 8 * 1024 * 1024,
+        read_block_bytes: int = 1024 * 1024,
+        client: Minio | None = None,
+    ) -> None:
+        """Configure the bucket; the client connects on first use.
+
+        Args:
+            endpoint: ``host:port`` of the S3 API
+            bucket: Bucket objects are stored in
+            access_key: Access key ID
+            secret_key: Secret access key
+            secure: Use HTTPS
+            part_size: Multipart upload part size (at least 5MiB)
+            read_block_bytes: Bytes fetched by each ranged read
+            client: Client to use instead of one built from the settings
+        """
+        if part_size < MIN_PART_BYTES:
+            error_msg = f"part_size must be at least {MIN_PART_BYTES} bytes"
+            raise ValueError(error_msg)
+        self.endpoint = endpoint
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.secure = secure
+        self.part_size = part_size
+        self.read_block_bytes = read_block_bytes
+        self._client = client
+
+    @classmethod
+    def from_config(
+        cls, config: dict[str, Any], *, bucket: str, part_size: int
+    ) -> "S3Storage":
+        """Build from ``ConfigManager.get_minio_config()`` settings."""
+        return cls(
+            config["endpoint"],
+            bucket=bucket,
+            access_key=config["access_key"],
+            secret_key=config["secret_key"],
+            secure=config["secure"],
+            part_size=part_size,
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the client; parser processes build their own."""
+        state = self.__dict__.copy()
+        state["_client"] = None
+        return state
+
+    @property
+    def client(self) -> Minio:
+        """The S3 client, created on first use in each process."""
+        if self._client is None:
+            self._client = Minio(
+                self.endpoint,
+                access_key=self.access_key,
+                secret_key=self.secret_key,
+                secure=self.secure,
+            )
+        return self._client
+
+    def location(self, key: str) -> str:
+        """Return ``s3://bucket/key``."""
+        return f"{SCHEME}{self.bucket}/{key}"
+
+    def _key(self, location: str) -> str:
+        bucket, _, key = location.removeprefix(SCHEME).partition("/")
+        if bucket != self.bucket or not key:
+            error_msg = f"{location} is not in bucket {self.bucket}"
+            raise FileNotFoundError(error_msg)
+        return key
+
+    async def ensure_ready(self) -> None:
+        """Create the bucket if it does not exist."""
+        if not await anyio.to_thread.run_sync(self.client.bucket_exists, self.bucket):
+            await anyio.to_thread.run_sync(self.client.make_bucket, self.bucket)
+            logger.info("🪣 Created bucket %s", self.bucket)
+
+    def _size(self, key: str) -> int | None:
+        try:
+            stat = self.client.stat_object(self.bucket, key)
+        except S3Error as e:
+            if e.code in MISSING_CODES:
+                return None
+            raise
+        return stat.size
+
+    async def exists(self, key: str) -> bool:
+        """Return whether the object exists."""
+        return await anyio.to_thread.run_sync(self._size, key) is not None
+
+    def _upload(self, key: str, path: Path) -> None:
+        content_type, _ = mimetypes.guess_type(key)
+        with path.open("rb") as handle:
+            self.client.put_object(
+                self.bucket,
+                key,
+                handle,
+                length=path.stat().st_size,
+                content_type=content_type or "application/octet-stream",
+                part_size=self.part_size,
+            )
+
+    async def put_file(self, key: str, path: Path) -> str:
+        """Upload a local file unless the object exists, then remove the file."""
+        if not await self.exists(key):
+            await anyio.to_thread.run_sync(self._upload, key, path)
+            logger.debug("📤 Uploaded %s to %s", key, self.bucket)
+        await anyio.to_thread.run_sync(partial(path.unlink, missing_ok=True))
+        return self.location(key)
+
+    def read_range(self, location: str, start: int, length: int) -> bytes:
+        """Read part of an object with a single ranged GET."""
+        if not location.startswith(SCHEME):
+            return super().read_range(location, start, length)
+        key = self._key(location)
+        try:
+            response = self.client.get_object(
+                self.bucket, key, offset=start, length=length
+            )
+        except S3Error as e:
+            if e.code in MISSING_CODES:
+                error_msg = f"No object {location}"
+                raise FileNotFoundError(error_msg) from e
+            raise
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def open(self, location: str) -> BinaryIO:
+        """Open an object for ranged reading.
+
+        Locations that are not ``s3://`` URLs are files stored before the
+        bucket was configured, and are opened from disk.
+        """
+        if not location.startswith(SCHEME):
+            return Path(location).open("rb")
+        key = self._key(location)
+        size = self._size(key)
+        if size is None:
+            error_msg = f"No object {location}"
+            raise FileNotFoundError(error_msg)
+        reader = _ObjectReader(self.client, self.bucket, key, size)
+        return io.BufferedReader(reader, buffer_size=self.read_block_bytes)
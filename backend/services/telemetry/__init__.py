@@ -0,0 +1,22 @@
+"""Pipeline instrumentation: stage timing spans, profiling and field metrics."""
+
+from .field_metrics import FieldMetrics
+from .field_metrics import collecting_field_metrics
+from .field_metrics import current_field_metrics
+from .profiling import StageProfiler
+from .profiling import StageTiming
+from .profiling import profiling
+from .profiling import span
+from .profiling import timed
+
+
+__all__ = [
+    "FieldMetrics",
+    "StageProfiler",
+    "StageTiming",
+    "collecting_field_metrics",
+    "current_field_metrics",
+    "profiling",
+    "span",
+    "timed",
+]
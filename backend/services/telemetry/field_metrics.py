@@ -0,0 +1,322 @@
+"""Per-field extraction metrics for the PDF summary extraction engine.
+
+Records regex latency per label/value pattern, lines scanned before a
+match, and how often each field hits, misses or comes back as ``None``.
+Collectors are plain data, so batch workers can ship them back as dicts
+and the parent merges them into one report, exportable as JSON or in the
+Prometheus text exposition format.
+"""
+
+import re
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+
+# Extraction outcomes; only "hit" yields a value, and only "miss" means
+# no line matched the field's label
+OUTCOMES = (
+    "hit",
+    "miss",
+    "no_value",
+    "invalid",
+    "transform_failure",
+    "timeout",
+    "error",
+)
+
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 1e-1)
+LINES_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+METRIC_PREFIX = "ledgerly_field"
+
+_active: ContextVar["FieldMetrics | None"] = ContextVar("field_metrics", default=None)
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram compatible with Prometheus."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Allocate one counter per bound plus the +Inf bucket."""
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram with the same bounds into this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total += other.total
+        self.count += other.count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "bounds": list(self.bounds),
+            "counts": self.counts,
+            "sum": self.total,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Histogram":
+        """Rebuild a histogram from ``to_dict`` output."""
+        return cls(
+            bounds=tuple(data["bounds"]),
+            counts=list(data["counts"]),
+            total=data["sum"],
+            count=data["count"],
+        )
+
+
+@dataclass
+class FieldStats:
+    """Outcome counters and lines-scanned distribution for one field."""
+
+    outcomes: dict[str, int] = field(default_factory=lambda: dict.fromkeys(OUTCOMES, 0))
+    lines_scanned: Histogram = field(default_factory=lambda: Histogram(LINES_BUCKETS))
+
+    @property
+    def attempts(self) -> int:
+        """Return how many times the field was extracted."""
+        return sum(self.outcomes.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of attempts that produced a value."""
+        return self.outcomes["hit"] / self.attempts if self.attempts else 0.0
+
+
+class FieldMetrics:
+    """Collects per-field and per-pattern extraction metrics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self.fields: dict[str, FieldStats] = {}
+        self.patterns: dict[tuple[str, str, str], Histogram] = {}
+
+    def _field(self, field_name: str) -> FieldStats:
+        """Return the stats for a field, creating them on first use."""
+        stats = self.fields.get(field_name)
+        if stats is None:
+            stats = self.fields[field_name] = FieldStats()
+        return stats
+
+    def record_outcome(self, field_name: str, outcome: str, lines_scanned: int) -> None:
+        """Record the result of one field extraction.
+
+        Args:
+            field_name: Name of the extracted field
+            outcome: One of ``OUTCOMES``
+            lines_scanned: Lines examined before the extraction finished
+
+        Raises:
+            ValueError: If the outcome is unknown
+        """
+        if outcome not in OUTCOMES:
+            error_msg = f"Unknown extraction outcome: {outcome}"
+            raise ValueError(error_msg)
+        stats = self._field(field_name)
+        stats.outcomes[outcome] += 1
+        stats.lines_scanned.observe(lines_scanned)
+
+    def observe_pattern(
+        self, field_name: str, role: str, pattern: str, seconds: float
+    ) -> None:
+        """Record the latency of one regex search.
+
+        Args:
+            field_name: Name of the field being extracted
+            role: "label" or "value"
+            pattern: The regex pattern searched
+            seconds: Time spent in the search
+        """
+        key = (field_name, role, pattern)
+        histogram = self.patterns.get(key)
+        if histogram is None:
+            histogram = self.patterns[key] = Histogram(LATENCY_BUCKETS)
+        histogram.observe(seconds)
+
+    def searcher(
+        self, field_name: str, role: str
+    ) -> Callable[[str, str], re.Match[str] | None]:
+        """Return a ``re.search`` replacement that times each call.
+
+        Args:
+            field_name: Name of the field being extracted
+            role: "label" or "value"
+
+        Returns:
+            Search function with the same signature as ``re.search``
+        """
+
+        def search(pattern: str, string: str) -> re.Match[str] | None:
+            started = time.perf_counter()
+            try:
+                return re.search(pattern, string)
+            finally:
+                self.observe_pattern(
+                    field_name, role, pattern, time.perf_counter() - started
+                )
+
+        return search
+
+    def merge(self, other: "FieldMetrics") -> None:
+        """Add another collector's metrics into this one."""
+        for field_name, stats in other.fields.items():
+            own = self._field(field_name)
+            for outcome, count in stats.outcomes.items():
+                own.outcomes[outcome] += count
+            own.lines_scanned.merge(stats.lines_scanned)
+
+        for key, histogram in other.patterns.items():
+            if key in self.patterns:
+                self.patterns[key].merge(histogram)
+            else:
+                self.patterns[key] = Histogram.from_dict(histogram.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "fields": {
+                field_name: {
+                    "attempts": stats.attempts,
+                    "hit_rate": round(stats.hit_rate, 4),
+                    "outcomes": dict(stats.outcomes),
+                    "lines_scanned": stats.lines_scanned.to_dict(),
+                }
+                for field_name, stats in sorted(self.fields.items())
+            },
+            "patterns": [
+                {
+                    "field": field_name,
+                    "role": role,
+                    "pattern": pattern,
+                    "latency_seconds": histogram.to_dict(),
+                }
+                for (field_name, role, pattern), histogram in sorted(
+                    self.patterns.items()
+                )
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FieldMetrics":
+        """Rebuild a collector from ``to_dict`` output."""
+        metrics = cls()
+        for field_name, stats in data.get("fields", {}).items():
+            metrics.fields[field_name] = FieldStats(
+                outcomes={**dict.fromkeys(OUTCOMES, 0), **stats["outcomes"]},
+                lines_scanned=Histogram.from_dict(stats["lines_scanned"]),
+            )
+        for entry in data.get("patterns", []):
+            key = (entry["field"], entry["role"], entry["pattern"])
+            metrics.patterns[key] = Histogram.from_dict(entry["latency_seconds"])
+        return metrics
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {METRIC_PREFIX}_extractions_total Field extractions by outcome.",
+            f"# TYPE {METRIC_PREFIX}_extractions_total counter",
+        ]
+        for field_name, stats in sorted(self.fields.items()):
+            for outcome, count in stats.outcomes.items():
+                labels = _labels(field=field_name, outcome=outcome)
+                lines.append(f"{METRIC_PREFIX}_extractions_total{{{labels}}} {count}")
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_lines_scanned Lines scanned per extraction.",
+            f"# TYPE {METRIC_PREFIX}_lines_scanned histogram",
+        ]
+        for field_name, stats in sorted(self.fields.items()):
+            lines += _histogram_lines(
+                f"{METRIC_PREFIX}_lines_scanned",
+                stats.lines_scanned,
+                field=field_name,
+            )
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_pattern_seconds Regex search latency.",
+            f"# TYPE {METRIC_PREFIX}_pattern_seconds histogram",
+        ]
+        for (field_name, role, pattern), histogram in sorted(self.patterns.items()):
+            lines += _histogram_lines(
+                f"{METRIC_PREFIX}_pattern_seconds",
+                histogram,
+                field=field_name,
+                role=role,
+                pattern=pattern,
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels."""
+    return ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in labels.items()
+    )
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels: str) -> list[str]:
+    """Format one histogram as cumulative Prometheus bucket samples."""
+    lines = []
+    cumulative = 0
+    bounds = [*(f"{bound:g}" for bound in histogram.bounds), "+Inf"]
+    for bound, count in zip(bounds, histogram.counts, strict=True):
+        cumulative += count
+        lines.append(f"{name}_bucket{{{_labels(**labels, le=bound)}}} {cumulative}")
+    lines.append(f"{name}_sum{{{_labels(**labels)}}} {histogram.total:g}")
+    lines.append(f"{name}_count{{{_labels(**labels)}}} {histogram.count}")
+    return lines
+
+
+def current_field_metrics() -> FieldMetrics | None:
+    """Return the collector active in this context, if any."""
+    return _active.get()
+
+
+@contextmanager
+def collecting_field_metrics(
+    metrics: FieldMetrics | None = None,
+) -> Iterator[FieldMetrics]:
+    """Collect field extraction metrics for the current context.
+
+    Args:
+        metrics: Collector to record into (defaults to a new one)
+
+    Yields:
+        The active collector
+    """
+    collector = metrics if metrics is not None else FieldMetrics()
+    token = _active.set(collector)
+    try:
+        yield collector
+    finally:
+        _active.reset(token)
@@ -0,0 +1,113 @@
+"""Connection-pool instrumentation for the database engines.
+
+``InstrumentedQueuePool`` and ``InstrumentedAsyncQueuePool`` are drop-in
+``poolclass`` values that time how long callers wait to check out a
+connection and how long opening a new connection takes. ``pool_stats``
+combines those timings with the pool's own occupancy counters into the
+plain dict served by the metrics endpoint.
+"""
+
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Self
+from typing import cast
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.pool import Pool
+from sqlalchemy.pool import PoolProxiedConnection
+from sqlalchemy.pool import QueuePool
+
+
+@dataclass
+class PoolTimings:
+    """Cumulative checkout and connect timings of one pool."""
+
+    checkouts: int = 0
+    checkout_wait_seconds: float = 0.0
+    max_checkout_wait_seconds: float = 0.0
+    checkout_timeouts: int = 0
+    connects: int = 0
+    connect_seconds: float = 0.0
+    max_connect_seconds: float = 0.0
+
+    def record_checkout(self, seconds: float) -> None:
+        """Record one checkout and how long the caller waited for it."""
+        self.checkouts += 1
+        self.checkout_wait_seconds += seconds
+        self.max_checkout_wait_seconds = max(self.max_checkout_wait_seconds, seconds)
+
+    def record_connect(self, seconds: float) -> None:
+        """Record one new DBAPI connection and how long it took to open."""
+        self.connects += 1
+        self.connect_seconds += seconds
+        self.max_connect_seconds = max(self.max_connect_seconds, seconds)
+
+
+class _PoolInstrumentation(Pool):
+    """Timing hooks shared by the instrumented pool classes."""
+
+    timings: PoolTimings
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Create the pool with empty timings."""
+        super().__init__(*args, **kwargs)
+        self.timings = PoolTimings()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait (including pre-ping)."""
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timings.checkout_timeouts += 1
+            raise
+        finally:
+            self.timings.record_checkout(time.perf_counter() - started)
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            self.timings.record_connect(time.perf_counter() - started)
+
+    def recreate(self) -> Self:
+        """Recreate the pool (e.g. after ``dispose``), keeping the timings."""
+        pool = cast("Self", super().recreate())
+        pool.timings = self.timings
+        return pool
+
+
+class InstrumentedQueuePool(_PoolInstrumentation, QueuePool):
+    """``QueuePool`` that records checkout waits and connect latency."""
+
+
+class InstrumentedAsyncQueuePool(_PoolInstrumentation, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records checkout waits and connect latency."""
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    """Return occupancy counters and timings for a pool.
+
+    Args:
+        pool: Pool of an engine (``engine.pool`` or ``async_engine.pool``)
+
+    Returns:
+        JSON-serializable statistics; keys absent for pools that do not
+        track them
+    """
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, _PoolInstrumentation):
+        stats.update(asdict(pool.timings))
+    return stats
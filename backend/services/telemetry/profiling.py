@@ -0,0 +1,178 @@
+"""Lightweight stage timing spans for the parse pipeline.
+
+Spans only record anything while a ``profiling()`` block is active in the
+current context. Otherwise ``span()`` hands back a shared no-op context
+manager and ``timed`` functions call straight through, so instrumented
+code pays a single context-variable lookup.
+"""
+
+import cProfile
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import ParamSpec
+from typing import TypeVar
+from typing import cast
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SEPARATOR = "/"
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+_active: ContextVar["StageProfiler | None"] = ContextVar("stage_profiler", default=None)
+
+
+@dataclass
+class StageTiming:
+    """Accumulated wall-clock time for one stage."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Add one timed call."""
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class StageProfiler:
+    """Collects nested stage timings keyed by their span path."""
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self.stages: dict[str, StageTiming] = {}
+        self._stack: list[str] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a block as a child of the currently open span."""
+        self._stack.append(name)
+        # Registered on entry so stages keep call-tree order
+        timing = self.stages.setdefault(SEPARATOR.join(self._stack), StageTiming())
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing.add(time.perf_counter() - started)
+            self._stack.pop()
+
+    def to_dict(self) -> dict[str, dict[str, float | int]]:
+        """Return timings in milliseconds, suitable for result metadata."""
+        return {
+            path: {
+                "calls": timing.calls,
+                "total_ms": round(timing.total * 1000, 3),
+                "max_ms": round(timing.max * 1000, 3),
+            }
+            for path, timing in self.stages.items()
+        }
+
+    def format_report(self) -> str:
+        """Render an indented per-stage breakdown."""
+        top_level = sum(
+            timing.total
+            for path, timing in self.stages.items()
+            if SEPARATOR not in path
+        )
+        lines = [f"{'stage':<48} {'calls':>6} {'total ms':>10} {'share':>7}"]
+        for path, timing in self.stages.items():
+            depth = path.count(SEPARATOR)
+            label = "  " * depth + path.rsplit(SEPARATOR, 1)[-1]
+            share = timing.total / top_level * 100 if top_level else 0.0
+            lines.append(
+                f"{label:<48} {timing.calls:>6} "
+                f"{timing.total * 1000:>10.1f} {share:>6.1f}%"
+            )
+        return "\n".join(lines)
+
+
+def span(name: str) -> AbstractContextManager[None]:
+    """Return a timing span, or a shared no-op when profiling is off.
+
+    Args:
+        name: Stage name, nested under any span already open
+
+    Returns:
+        Context manager timing the enclosed block
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name)
+
+
+def timed(name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so each call is recorded as a span.
+
+    Coroutine functions are timed until the awaited call completes.
+
+    Args:
+        name: Stage name (defaults to the function name)
+
+    Returns:
+        Decorator wrapping the function
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        stage = name or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # noqa: ANN401
+                profiler = _active.get()
+                if profiler is None:
+                    return await func(*args, **kwargs)
+                with profiler.span(stage):
+                    return await func(*args, **kwargs)
+
+            return cast("Callable[P, R]", async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            profiler = _active.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profiling(pstats_path: Path | None = None) -> Iterator[StageProfiler]:
+    """Enable stage timing for the current context.
+
+    Args:
+        pstats_path: Optional file to receive a cProfile dump of the block
+
+    Yields:
+        Profiler collecting the stage timings
+    """
+    profiler = StageProfiler()
+    token = _active.set(profiler)
+    function_profiler = cProfile.Profile()
+    if pstats_path is not None:
+        function_profiler.enable()
+    try:
+        yield profiler
+    finally:
+        if pstats_path is not None:
+            function_profiler.disable()
+            function_profiler.dump_stats(pstats_path)
+        _active.reset(token)
@@ -0,0 +1,32 @@
+"""Statement uploads: streaming receipt into content-addressed storage."""
+
+from .archive import ArchiveContents
+from .archive import count_statements
+from .archive import extract_statements
+from .chunked import ChunkedUploads
+from .chunked import ChunkError
+from .chunked import IncompleteUploadError
+from .chunked import UploadSession
+from .chunked import UploadSessionNotFoundError
+from .receive import ReceivedUpload
+from .receive import StoredFile
+from .receive import UploadError
+from .receive import UploadTooLargeError
+from .receive import receive_upload
+
+
+__all__ = [
+    "ArchiveContents",
+    "ChunkError",
+    "ChunkedUploads",
+    "IncompleteUploadError",
+    "ReceivedUpload",
+    "StoredFile",
+    "UploadError",
+    "UploadSession",
+    "UploadSessionNotFoundError",
+    "UploadTooLargeError",
+    "count_statements",
+    "extract_statements",
+    "receive_upload",
+]
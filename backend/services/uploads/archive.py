@@ -0,0 +1,242 @@
+"""Statement files unpacked from an uploaded zip archive.
+
+Members are paired the way the batch CLI pairs files in a directory
+(``pair_inputs``), so an archive of a year of statements becomes one
+upload per PDF, each with its transaction CSV when the archive has one.
+Every member is streamed into the staging directory while being hashed,
+with the size limit checked against the bytes actually inflated rather
+than the sizes the archive claims.
+"""
+
+import hashlib
+import logging
+import zipfile
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import IO
+from uuid import uuid4
+
+import anyio
+
+from services.batch.discovery import SUPPORTED_SUFFIXES
+from services.batch.discovery import pair_inputs
+from services.storage import content_key
+
+from .receive import ReceivedUpload
+from .receive import StoredFile
+from .receive import UploadError
+from .receive import UploadTooLargeError
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ARCHIVE_MEMBERS = 1000
+
+_COPY_BLOCK_BYTES = 1024 * 1024
+
+
+@dataclass
+class ArchiveContents:
+    """Statement uploads found in an archive, and the members left out."""
+
+    uploads: list[ReceivedUpload] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+
+def _is_statement_member(info: zipfile.ZipInfo) -> bool:
+    parts = Path(info.filename).parts
+    hidden = any(part.startswith((".", "__MACOSX")) for part in parts)
+    return not info.is_dir() and not hidden
+
+
+def _statement_members(archive: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    members = [info for info in archive.infolist() if _is_statement_member(info)]
+    if len(members) > MAX_ARCHIVE_MEMBERS:
+        error_msg = f"Archive has more than {MAX_ARCHIVE_MEMBERS} files"
+        raise UploadError(error_msg)
+    return members
+
+
+def _count_statements(archive_path: Path) -> int:
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = _statement_members(archive)
+    except zipfile.BadZipFile as e:
+        error_msg = f"Not a valid zip archive: {e}"
+        raise UploadError(error_msg) from e
+    paths = [
+        path
+        for path in (Path(info.filename) for info in members)
+        if path.suffix.lower() in SUPPORTED_SUFFIXES
+    ]
+    return sum(1 for statement in pair_inputs(paths) if statement.pdf_path is not None)
+
+
+def _copy_member(
+    source: IO[bytes], target: IO[bytes], name: str, max_file_bytes: int
+) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    while block := source.read(_COPY_BLOCK_BYTES):
+        size += len(block)
+        if size > max_file_bytes:
+            limit_mb = max_file_bytes // (1024 * 1024)
+            error_msg = f"{name} exceeds the {limit_mb}MB limit"
+            raise UploadTooLargeError(error_msg)
+        digest.update(block)
+        target.write(block)
+    return digest.hexdigest(), size
+
+
+def _extract_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    field_name: str,
+    directory: Path,
+    max_file_bytes: int,
+) -> tuple[StoredFile, Path]:
+    temporary = directory / f".{uuid4().hex}.part"
+    try:
+        with archive.open(info) as source, temporary.open("wb") as target:
+            sha256, size = _copy_member(source, target, info.filename, max_file_bytes)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    path = Path(info.filename)
+    stored = StoredFile(
+        field=field_name,
+        filename=path.name,
+        key=content_key(sha256, path.suffix),
+        size=size,
+        sha256=sha256,
+    )
+    return stored, temporary
+
+
+def _unpack_members(
+    archive: zipfile.ZipFile,
+    directory: Path,
+    fields: dict[str, str],
+    max_file_bytes: int,
+    *,
+    contents: ArchiveContents,
+    extracted: list[Path],
+) -> None:
+    members = _statement_members(archive)
+    by_path: dict[Path, zipfile.ZipInfo] = {}
+    for info in members:
+        path = Path(info.filename)
+        if path.suffix.lower() in SUPPORTED_SUFFIXES:
+            by_path[path] = info
+        else:
+            contents.skipped.append(f"{info.filename}: not a PDF or CSV")
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for statement in pair_inputs(list(by_path)):
+        if statement.pdf_path is None:
+            # The billing period is read from the PDF; a CSV alone has none
+            contents.skipped.append(f"{statement.csv_path}: no matching PDF")
+            continue
+        upload = ReceivedUpload(fields=dict(fields))
+        contents.uploads.append(upload)
+        for field_name, member in (
+            ("pdf_file", statement.pdf_path),
+            ("csv_file", statement.csv_path),
+        ):
+            if member is None:
+                continue
+            stored, temporary = _extract_member(
+                archive, by_path[member], field_name, directory, max_file_bytes
+            )
+            # Recorded at once, so a later failure removes it too
+            extracted.append(temporary)
+            upload.add_file(stored, temporary)
+
+
+def _extract_statements(
+    archive_path: Path,
+    directory: Path,
+    fields: dict[str, str],
+    max_file_bytes: int,
+) -> ArchiveContents:
+    contents = ArchiveContents()
+    extracted: list[Path] = []
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            _unpack_members(
+                archive,
+                directory,
+                fields,
+                max_file_bytes,
+                contents=contents,
+                extracted=extracted,
+            )
+    except BaseException as e:
+        for temporary in extracted:
+            temporary.unlink(missing_ok=True)
+        if isinstance(e, zipfile.BadZipFile):
+            error_msg = f"Not a valid zip archive: {e}"
+            raise UploadError(error_msg) from e
+        if isinstance(e, RuntimeError):
+            # Raised by zipfile for encrypted members
+            error_msg = f"Cannot read archive: {e}"
+            raise UploadError(error_msg) from e
+        raise
+    return contents
+
+
+async def count_statements(archive_path: Path) -> int:
+    """Count the statements an archive holds, from its directory alone.
+
+    Nothing is inflated, so this is cheap enough to run before deciding
+    whether to accept the archive's statements at all.
+
+    Args:
+        archive_path: The uploaded zip file
+
+    Returns:
+        How many uploads ``extract_statements`` would return
+
+    Raises:
+        UploadError: If the file is not a readable zip archive or has too
+            many members
+    """
+    return await anyio.to_thread.run_sync(_count_statements, archive_path)
+
+
+async def extract_statements(
+    archive_path: Path,
+    directory: Path,
+    *,
+    fields: dict[str, str],
+    max_file_bytes: int,
+) -> ArchiveContents:
+    """Unpack the statement files of a zip archive into the staging directory.
+
+    Args:
+        archive_path: The uploaded zip file
+        directory: Staging directory the files are unpacked in
+        fields: Form fields every statement of the archive gets
+        max_file_bytes: Size limit of each unpacked file
+
+    Returns:
+        One upload per statement PDF, with files at temporary paths until
+        ``keep`` is called, and a note for every member left out
+
+    Raises:
+        UploadError: If the file is not a readable zip archive or has too
+            many members
+        UploadTooLargeError: If an unpacked file exceeds ``max_file_bytes``
+    """
+    contents = await anyio.to_thread.run_sync(
+        _extract_statements, archive_path, directory, fields, max_file_bytes
+    )
+    logger.info(
+        "📦 Unpacked %d statement(s) from %s, skipped %d file(s)",
+        len(contents.uploads),
+        archive_path.name,
+        len(contents.skipped),
+    )
+    return contents
@@ -0,0 +1,369 @@
+"""Resumable chunked uploads into a spool directory.
+
+A client creates an upload session for a file of known size, sends the
+file in fixed-size chunks, in any order and in parallel, and completes
+the session once every chunk has arrived. Each chunk is streamed
+straight to its offset in a preallocated spool file while being hashed,
+and is only recorded as received once its SHA-256 matches the digest
+the client sent; a chunk cut off by a dropped connection is simply sent
+again. Completing the session hashes the spool file and hands it over
+with a rename, so the file is never copied or concatenated.
+
+Session state lives next to the data in the spool directory (a manifest
+and one marker file per received chunk), so any API process sharing the
+directory can take any chunk, and an interrupted upload can be resumed
+after a restart.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from pathlib import Path
+from uuid import UUID
+from uuid import uuid4
+
+import anyio
+
+from .receive import UploadError
+from .receive import UploadTooLargeError
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "session.json"
+DATA = "data"
+CHUNKS = "chunks"
+# The spool file is renamed to this while a completion is hashing it
+CLAIMED = "data.completing"
+
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+class UploadSessionNotFoundError(UploadError):
+    """Raised when an upload session does not exist or has expired."""
+
+
+class ChunkError(UploadError):
+    """Raised when a chunk has the wrong offset, length or checksum."""
+
+
+class IncompleteUploadError(UploadError):
+    """Raised when an upload is completed before every chunk has arrived."""
+
+
+@dataclass(frozen=True)
+class UploadSession:
+    """A chunked upload of one file."""
+
+    id: str
+    filename: str
+    size: int
+    chunk_size: int
+    created_at: float
+    fields: dict[str, str] = field(default_factory=dict)
+    # Digest of the whole file, checked at completion when given
+    sha256: str | None = None
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks the file is sent in."""
+        return -(-self.size // self.chunk_size)
+
+    def chunk_length(self, index: int) -> int:
+        """Length of a chunk; only the last one may be short."""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    temporary = path.with_name(f".{path.name}.{uuid4().hex}")
+    temporary.write_text(content)
+    temporary.replace(path)
+
+
+def _write_chunk_data(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while block := handle.read(HASH_BLOCK_BYTES):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ChunkedUploads:
+    """Upload sessions spooled under one directory."""
+
+    def __init__(
+        self,
+        spool_dir: Path,
+        *,
+        chunk_size: int,
+        max_upload_bytes: int,
+        ttl_seconds: float,
+    ) -> None:
+        """Configure the spool; nothing is created until the first session.
+
+        Args:
+            spool_dir: Directory the sessions are spooled in; keep it on the
+                filesystem of the upload directory so completion is a rename
+            chunk_size: Size of every chunk but the last
+            max_upload_bytes: Largest file a session accepts
+            ttl_seconds: Age after which an unfinished session is purged
+        """
+        self.spool_dir = spool_dir
+        self.chunk_size = chunk_size
+        self.max_upload_bytes = max_upload_bytes
+        self.ttl_seconds = ttl_seconds
+
+    def _session_dir(self, upload_id: str) -> Path:
+        # Parsing rejects anything that could leave the spool directory
+        return self.spool_dir / UUID(upload_id).hex
+
+    async def create(
+        self,
+        filename: str,
+        size: int,
+        *,
+        fields: dict[str, str],
+        sha256: str | None = None,
+    ) -> UploadSession:
+        """Open a session and preallocate its spool file.
+
+        Args:
+            filename: Name of the file being uploaded
+            size: Exact size of the file in bytes
+            fields: Form fields stored with the upload (``account_type``)
+            sha256: Hex digest of the whole file, if the client knows it
+
+        Returns:
+            The new session
+
+        Raises:
+            UploadTooLargeError: If ``size`` exceeds the upload limit
+            UploadError: If ``size`` is not positive
+        """
+        if size <= 0:
+            error_msg = "Upload size must be positive"
+            raise UploadError(error_msg)
+        if size > self.max_upload_bytes:
+            limit_mb = self.max_upload_bytes // (1024 * 1024)
+            error_msg = f"Upload exceeds the {limit_mb}MB limit"
+            raise UploadTooLargeError(error_msg)
+
+        await self.purge_expired()
+        session = UploadSession(
+            id=uuid4().hex,
+            filename=Path(filename).name,
+            size=size,
+            chunk_size=self.chunk_size,
+            created_at=time.time(),
+            fields=fields,
+            sha256=sha256.lower() if sha256 else None,
+        )
+        await anyio.to_thread.run_sync(self._create_files, session)
+        logger.info(
+            "📦 Opened upload %s for %s (%d chunks)",
+            session.id,
+            session.filename,
+            session.chunk_count,
+        )
+        return session
+
+    def _create_files(self, session: UploadSession) -> None:
+        directory = self._session_dir(session.id)
+        (directory / CHUNKS).mkdir(parents=True)
+        # Sparse: chunks fill it in place, in whatever order they arrive
+        with (directory / DATA).open("wb") as handle:
+            handle.truncate(session.size)
+        _write_atomic(directory / MANIFEST, json.dumps(asdict(session)))
+
+    async def get(self, upload_id: str) -> UploadSession:
+        """Load a session.
+
+        Raises:
+            UploadSessionNotFoundError: If there is no such session
+        """
+        try:
+            manifest = await anyio.to_thread.run_sync(
+                (self._session_dir(upload_id) / MANIFEST).read_text
+            )
+        except (ValueError, FileNotFoundError) as e:
+            error_msg = f"Upload {upload_id} not found"
+            raise UploadSessionNotFoundError(error_msg) from e
+        session = UploadSession(**json.loads(manifest))
+        if time.time() - session.created_at > self.ttl_seconds:
+            error_msg = f"Upload {upload_id} has expired"
+            raise UploadSessionNotFoundError(error_msg)
+        return session
+
+    async def received(self, session: UploadSession) -> list[int]:
+        """Return the indexes of the chunks that have arrived, in order.
+
+        Raises:
+            UploadSessionNotFoundError: If the session was completed or
+                deleted meanwhile
+        """
+        try:
+            names = await anyio.to_thread.run_sync(
+                os.listdir, self._session_dir(session.id) / CHUNKS
+            )
+        except FileNotFoundError as e:
+            error_msg = f"Upload {session.id} is no longer open"
+            raise UploadSessionNotFoundError(error_msg) from e
+        return sorted(int(name) for name in names if name.isdigit())
+
+    async def write_chunk(
+        self,
+        session: UploadSession,
+        offset: int,
+        stream: AsyncIterator[bytes],
+        sha256: bytes,
+    ) -> None:
+        """Stream one chunk to its place in the spool file.
+
+        Chunks may be written concurrently: each has its own byte range.
+        Sending a chunk that already arrived overwrites it with the same
+        content, so retries are safe.
+
+        Args:
+            session: Session the chunk belongs to
+            offset: Byte offset of the chunk, a multiple of the chunk size
+            stream: Chunk body
+            sha256: Raw SHA-256 digest the chunk must match
+
+        Raises:
+            ChunkError: If the offset, length or checksum is wrong
+            UploadSessionNotFoundError: If the session was completed or
+                deleted meanwhile
+        """
+        if offset % session.chunk_size or not 0 <= offset < session.size:
+            error_msg = (
+                f"Chunk offset {offset} is not a multiple of {session.chunk_size} "
+                f"below {session.size}"
+            )
+            raise ChunkError(error_msg)
+        index = offset // session.chunk_size
+        expected = session.chunk_length(index)
+        directory = self._session_dir(session.id)
+        marker = directory / CHUNKS / str(index)
+        try:
+            fd = await anyio.to_thread.run_sync(os.open, directory / DATA, os.O_WRONLY)
+        except FileNotFoundError as e:
+            error_msg = f"Upload {session.id} is no longer open"
+            raise UploadSessionNotFoundError(error_msg) from e
+
+        try:
+            # The range is rewritten below, so it no longer holds a verified chunk
+            await anyio.to_thread.run_sync(partial(marker.unlink, missing_ok=True))
+            digest = hashlib.sha256()
+            length = 0
+            async for data in stream:
+                if length + len(data) > expected:
+                    error_msg = f"Chunk at {offset} is longer than {expected} bytes"
+                    raise ChunkError(error_msg)
+                digest.update(data)
+                await anyio.to_thread.run_sync(
+                    _write_chunk_data, fd, data, offset + length
+                )
+                length += len(data)
+            if length != expected:
+                error_msg = f"Chunk at {offset} has {length} of {expected} bytes"
+                raise ChunkError(error_msg)
+            if digest.digest() != sha256:
+                error_msg = f"Chunk at {offset} does not match its checksum"
+                raise ChunkError(error_msg)
+            # Durable before it counts as received, so a resume can trust it
+            await anyio.to_thread.run_sync(os.fsync, fd)
+            await anyio.to_thread.run_sync(_write_atomic, marker, digest.hexdigest())
+        finally:
+            await anyio.to_thread.run_sync(os.close, fd)
+        logger.debug("📥 Upload %s: chunk %d (%d bytes)", session.id, index, length)
+
+    async def complete(self, session: UploadSession) -> tuple[Path, str]:
+        """Verify a finished upload and hand over its spool file.
+
+        Args:
+            session: Session whose chunks have all arrived
+
+        Returns:
+            The path of the assembled file, inside the session directory,
+            and its SHA-256 hex digest; the file is deleted with the
+            session, so move it out (``ReceivedUpload.keep``) or consume it
+            before calling ``delete``
+
+        Raises:
+            IncompleteUploadError: If chunks are missing, another request is
+                already completing the session, or the file does not match
+                the session's digest (the session is deleted)
+        """
+        missing = session.chunk_count - len(await self.received(session))
+        if missing:
+            error_msg = f"Upload {session.id} is missing {missing} chunk(s)"
+            raise IncompleteUploadError(error_msg)
+
+        directory = self._session_dir(session.id)
+        claimed = directory / CLAIMED
+        try:
+            # Exactly one completion wins the rename; later chunks find no file
+            await anyio.to_thread.run_sync(os.rename, directory / DATA, claimed)
+        except FileNotFoundError as e:
+            error_msg = f"Upload {session.id} is already being completed"
+            raise IncompleteUploadError(error_msg) from e
+
+        sha256 = await anyio.to_thread.run_sync(_hash_file, claimed)
+        if session.sha256 is not None and sha256 != session.sha256:
+            # Chunks were checked one by one, so the client declared another file
+            await self.delete(session.id)
+            error_msg = f"Upload {session.id} does not match its SHA-256"
+            raise IncompleteUploadError(error_msg)
+        logger.info("✅ Assembled upload %s (%d bytes)", session.id, session.size)
+        return claimed, sha256
+
+    async def release(self, session: UploadSession) -> None:
+        """Hand the spool file back after a completion that was refused.
+
+        The session can then be completed again, with every chunk kept.
+        """
+        directory = self._session_dir(session.id)
+        await anyio.to_thread.run_sync(os.rename, directory / CLAIMED, directory / DATA)
+        logger.info("↩️ Released upload %s for a later completion", session.id)
+
+    async def delete(self, upload_id: str) -> None:
+        """Remove a session and everything spooled for it."""
+        await anyio.to_thread.run_sync(
+            partial(shutil.rmtree, self._session_dir(upload_id), ignore_errors=True)
+        )
+
+    async def purge_expired(self) -> int:
+        """Remove sessions older than the TTL; returns how many were removed."""
+        return await anyio.to_thread.run_sync(self._purge_expired)
+
+    def _purge_expired(self) -> int:
+        if not self.spool_dir.is_dir():
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        purged = 0
+        for directory in self.spool_dir.iterdir():
+            with contextlib.suppress(OSError, ValueError, KeyError):
+                manifest = json.loads((directory / MANIFEST).read_text())
+                if manifest["created_at"] < cutoff:
+                    shutil.rmtree(directory, ignore_errors=True)
+                    purged += 1
+        if purged:
+            logger.info("🧹 Purged %d expired upload(s)", purged)
+        return purged
@@ -0,0 +1,298 @@
+"""Streaming receipt of multipart statement uploads.
+
+Starlette's form parser spools every file part into a temporary file
+before the handler runs, and the file is then read again to store and
+hash it. ``receive_upload`` feeds the request stream to the multipart
+parser instead and writes each file part straight into the upload
+directory while hashing it, so memory use stays at one chunk per request
+and the content hash is known as soon as the body ends.
+
+Files are keyed by their SHA-256 digest, so uploading the same file
+twice keeps a single copy. Received files stay under temporary names in
+the staging directory until the caller has validated the upload and
+calls ``keep``, which hands them to the storage backend; a rejected
+upload is ``discard``-ed without touching stored files that other
+statements may share.
+"""
+
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+
+import anyio
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser
+from python_multipart.multipart import parse_options_header
+
+from services.storage import ObjectStorage
+from services.storage import content_key
+
+
+logger = logging.getLogger(__name__)
+
+MAX_FIELD_BYTES = 1024
+
+
+class UploadError(ValueError):
+    """Raised when a multipart upload is malformed."""
+
+
+class UploadTooLargeError(UploadError):
+    """Raised when an uploaded file exceeds the size limit."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """A received file and the content-addressed key it is stored under."""
+
+    field: str
+    filename: str
+    key: str
+    size: int
+    sha256: str
+
+
+@dataclass
+class ReceivedUpload:
+    """Form fields and stored files of one multipart request."""
+
+    fields: dict[str, str] = field(default_factory=dict)
+    files: dict[str, StoredFile] = field(default_factory=dict)
+    # Temporary path of each received file -> its content-addressed key
+    _staged: dict[Path, str] = field(default_factory=dict, repr=False)
+
+    def add_file(self, stored: StoredFile, temporary: Path) -> None:
+        """Record a received file that is still at a temporary path."""
+        self.files[stored.field] = stored
+        self._staged[temporary] = stored.key
+
+    async def keep(self, storage: ObjectStorage) -> None:
+        """Store the received files under their content-addressed keys."""
+        staged, self._staged = self._staged, {}
+        for temporary, key in staged.items():
+            # Same content, same key: an earlier upload may have stored it
+            await storage.put_file(key, temporary)
+
+    async def discard(self) -> None:
+        """Delete the received files of a rejected upload."""
+        staged, self._staged = self._staged, {}
+        for temporary in staged:
+            await anyio.to_thread.run_sync(partial(temporary.unlink, missing_ok=True))
+
+
+@dataclass
+class _FilePart:
+    """A file part being written to a temporary path."""
+
+    field_name: str
+    filename: str
+    path: Path
+    handle: BinaryIO
+    digest: "hashlib._Hash" = field(default_factory=hashlib.sha256)
+    size: int = 0
+
+
+class _MultipartReceiver:
+    """Collects parser callbacks and applies them between stream chunks.
+
+    The parser's callbacks are synchronous, so file data is queued there
+    and written (off the event loop) by ``flush`` after each chunk.
+    """
+
+    def __init__(self, directory: Path, max_file_bytes: int) -> None:
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        self.upload = ReceivedUpload()
+        self._headers: dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._field_name = ""
+        self._filename: str | None = None
+        self._value = bytearray()
+        self._events: list[tuple[str, bytes]] = []
+        self._part: _FilePart | None = None
+
+    def callbacks(self) -> dict[str, object]:
+        """Return the callback mapping for ``MultipartParser``."""
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        }
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._value = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(
+            self._headers.get(b"content-disposition", b"")
+        )
+        if b"name" not in options:
+            error_msg = "Multipart part has no field name"
+            raise UploadError(error_msg)
+        self._field_name = options[b"name"].decode()
+        filename = options.get(b"filename")
+        self._filename = Path(filename.decode()).name if filename else None
+        if self._filename is not None:
+            self._events.append(("begin", b""))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._filename is not None:
+            self._events.append(("data", data[start:end]))
+            return
+        self._value += data[start:end]
+        if len(self._value) > MAX_FIELD_BYTES:
+            error_msg = f"Form field {self._field_name!r} is too long"
+            raise UploadError(error_msg)
+
+    def _on_part_end(self) -> None:
+        if self._filename is not None:
+            self._events.append(("end", b""))
+        else:
+            self.upload.fields[self._field_name] = self._value.decode()
+
+    async def flush(self) -> None:
+        """Apply the file events queued by the last parsed chunk."""
+        events, self._events = self._events, []
+        for kind, data in events:
+            if kind == "begin":
+                await self._begin_file()
+            elif kind == "data":
+                await self._write(data)
+            else:
+                await self._finish_file()
+
+    async def finish(self) -> None:
+        """Apply the final events and check that no file was cut short.
+
+        Raises:
+            UploadError: If the body ended inside a file part
+        """
+        await self.flush()
+        if self._part is not None:
+            error_msg = "Upload ended in the middle of a file"
+            raise UploadError(error_msg)
+
+    async def _begin_file(self) -> None:
+        if self._field_name in self.upload.files:
+            error_msg = f"File field {self._field_name!r} was sent more than once"
+            raise UploadError(error_msg)
+        path = self.directory / f".{uuid4().hex}.part"
+        self._part = _FilePart(
+            field_name=self._field_name,
+            filename=self._filename or "",
+            path=path,
+            handle=await anyio.to_thread.run_sync(path.open, "wb"),
+        )
+
+    async def _write(self, data: bytes) -> None:
+        part = self._part
+        if part is None:
+            return
+        part.size += len(data)
+        if part.size > self.max_file_bytes:
+            limit_mb = self.max_file_bytes // (1024 * 1024)
+            error_msg = f"{part.field_name} exceeds the {limit_mb}MB limit"
+            raise UploadTooLargeError(error_msg)
+        part.digest.update(data)
+        await anyio.to_thread.run_sync(part.handle.write, data)
+
+    async def _finish_file(self) -> None:
+        part = self._part
+        if part is None:
+            return
+        self._part = None
+        await anyio.to_thread.run_sync(part.handle.close)
+        sha256 = part.digest.hexdigest()
+        key = content_key(sha256, Path(part.filename).suffix)
+        self.upload.add_file(
+            StoredFile(
+                field=part.field_name,
+                filename=part.filename,
+                key=key,
+                size=part.size,
+                sha256=sha256,
+            ),
+            part.path,
+        )
+        logger.debug("📥 Received %s (%s bytes) as %s", part.filename, part.size, key)
+
+    async def discard(self) -> None:
+        """Remove every file an aborted upload has written so far."""
+        part, self._part = self._part, None
+        if part is not None:
+            await anyio.to_thread.run_sync(part.handle.close)
+            await anyio.to_thread.run_sync(partial(part.path.unlink, missing_ok=True))
+        await self.upload.discard()
+
+
+async def receive_upload(
+    content_type: str,
+    stream: AsyncIterator[bytes],
+    directory: Path,
+    *,
+    max_file_bytes: int,
+) -> ReceivedUpload:
+    """Stream a multipart body into the staging directory.
+
+    Args:
+        content_type: ``Content-Type`` header of the request
+        stream: Request body chunks (``request.stream()``)
+        directory: Staging directory the files are received in
+        max_file_bytes: Size limit of each file part
+
+    Returns:
+        The form fields and the received files, keyed by field name; the
+        files are stored under their ``key`` only once ``keep`` is called
+
+    Raises:
+        UploadError: If the body is not valid multipart form data
+        UploadTooLargeError: If a file exceeds ``max_file_bytes``
+    """
+    _, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if not boundary:
+        error_msg = "Missing multipart boundary"
+        raise UploadError(error_msg)
+
+    await anyio.to_thread.run_sync(
+        partial(directory.mkdir, parents=True, exist_ok=True)
+    )
+    receiver = _MultipartReceiver(directory, max_file_bytes)
+    parser = MultipartParser(boundary, receiver.callbacks())  # type: ignore[arg-type]
+    try:
+        async for chunk in stream:
+            parser.write(chunk)
+            await receiver.flush()
+        parser.finalize()
+        await receiver.finish()
+    except MultipartParseError as e:
+        await receiver.discard()
+        error_msg = f"Malformed multipart body: {e}"
+        raise UploadError(error_msg) from e
+    except BaseException:
+        await receiver.discard()
+        raise
+    return receiver.upload
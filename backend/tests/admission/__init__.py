@@ -0,0 +1 @@
+"""Admission control tests."""
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from services.admission import AdmissionRejectedError
+from services.admission import ByteBudget
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # The budget's waiters are asyncio futures
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_requests_within_the_budget_run_at_once() -> None:
+    budget = ByteBudget(100, max_waiters=0, max_wait_seconds=1)
+
+    async with budget.reserve(60), budget.reserve(40):
+        assert budget.in_use == 100
+
+    assert budget.in_use == 0
+    assert budget.stats()["peak_in_flight_bytes"] == 100
+    assert budget.stats()["admitted"] == 2
+
+
+@pytest.mark.anyio
+async def test_waiters_are_admitted_in_arrival_order() -> None:
+    budget = ByteBudget(100, max_waiters=2, max_wait_seconds=5)
+    order: list[int] = []
+    release = asyncio.Event()
+
+    async def upload(nbytes: int) -> None:
+        async with budget.reserve(nbytes):
+            order.append(nbytes)
+            await release.wait()
+
+    async with budget.reserve(100):
+        large = asyncio.create_task(upload(80))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(upload(10))
+        await asyncio.sleep(0)
+        assert budget.stats()["waiting"] == 2
+    # The small upload would fit beside the large one, but came later
+    await asyncio.sleep(0)
+    assert order == [80, 10]
+    release.set()
+    await asyncio.gather(large, small)
+    assert budget.in_use == 0
+
+
+@pytest.mark.anyio
+async def test_requests_beyond_the_wait_queue_are_rejected() -> None:
+    budget = ByteBudget(100, max_waiters=1, max_wait_seconds=5)
+    release = asyncio.Event()
+
+    async def waiter() -> None:
+        async with budget.reserve(1):
+            await release.wait()
+
+    async with budget.reserve(100):
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            async with budget.reserve(1):
+                pass
+    release.set()
+    await waiting
+
+    assert rejected.value.retry_after == 5
+    assert budget.rejected == 1
+    assert budget.in_use == 0
+
+
+@pytest.mark.anyio
+async def test_a_wait_that_times_out_is_rejected() -> None:
+    budget = ByteBudget(100, max_waiters=1, max_wait_seconds=0.01)
+
+    async with budget.reserve(100):
+        with pytest.raises(AdmissionRejectedError, match="Timed out"):
+            async with budget.reserve(1):
+                pass
+
+    assert budget.stats()["waiting"] == 0
+    assert budget.in_use == 0
+
+
+@pytest.mark.anyio
+async def test_a_request_larger_than_the_budget_runs_alone() -> None:
+    budget = ByteBudget(100, max_waiters=0, max_wait_seconds=1)
+
+    async with budget.reserve(500) as reserved:
+        assert reserved == 100
+        with pytest.raises(AdmissionRejectedError):
+            async with budget.reserve(1):
+                pass
@@ -0,0 +1,92 @@
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from services.admission import Admission
+from services.admission import AdmissionLimits
+from services.admission import AdmissionRejectedError
+
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _session(queued: int, queued_for_user: int) -> MagicMock:
+    result = MagicMock()
+    result.one.return_value = (queued, queued_for_user)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.anyio
+async def test_jobs_are_admitted_under_both_limits() -> None:
+    admission = Admission(
+        AdmissionLimits(max_queued_jobs=10, max_queued_jobs_per_user=3)
+    )
+
+    await admission.check_backlog(_session(9, 2), uuid4())
+
+    assert admission.stats()["queued_jobs"] == 9
+
+
+@pytest.mark.anyio
+async def test_a_full_queue_refuses_new_jobs() -> None:
+    admission = Admission(
+        AdmissionLimits(
+            max_queued_jobs=10,
+            max_queued_jobs_per_user=0,
+            backlog_retry_after_seconds=45,
+        )
+    )
+
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        await admission.check_backlog(_session(10, 0), uuid4())
+
+    assert rejected.value.retry_after == 45
+    assert admission.stats()["rejected_queue_full"] == 1
+
+
+@pytest.mark.anyio
+async def test_a_user_with_too_many_queued_jobs_is_refused() -> None:
+    admission = Admission(
+        AdmissionLimits(max_queued_jobs=0, max_queued_jobs_per_user=3)
+    )
+
+    # An archive of two statements would take the user past the limit
+    with pytest.raises(AdmissionRejectedError, match="2 of your statements"):
+        await admission.check_backlog(_session(2, 2), uuid4(), new_jobs=2)
+
+    assert admission.stats()["rejected_user_queue_full"] == 1
+
+
+@pytest.mark.anyio
+async def test_no_queue_limits_skip_the_query() -> None:
+    admission = Admission(
+        AdmissionLimits(max_queued_jobs=0, max_queued_jobs_per_user=0)
+    )
+    session = _session(0, 0)
+
+    await admission.check_backlog(session, uuid4())
+
+    session.execute.assert_not_awaited()
+
+
+def test_limits_are_read_from_the_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAX_UPLOAD_BYTES_IN_FLIGHT_MB", "64")
+    monkeypatch.setenv("MAX_QUEUED_JOBS_PER_USER", "0")
+    monkeypatch.setenv("MAX_CONCURRENT_PARSES", "2")
+
+    limits = AdmissionLimits.from_env()
+
+    assert limits.max_upload_bytes_in_flight == 64 * MB
+    assert limits.max_queued_jobs_per_user == 0
+    assert limits.max_queued_jobs == AdmissionLimits().max_queued_jobs
+    assert limits.max_concurrent_parses == 2
+    assert Admission(limits).stats()["upload_bytes"]["capacity_bytes"] == 64 * MB
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from services.analytics import AnalyticsCache
+from services.analytics import CachedResponse
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_a_hit_reuses_the_computed_response() -> None:
+    cache = AnalyticsCache()
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        return b'{"total": 1}'
+
+    first = await cache.get_or_compute(("report", 1), compute)
+    second = await cache.get_or_compute(("report", 1), compute)
+
+    assert calls == 1
+    assert second is first
+    assert first.etag == CachedResponse.from_body(b'{"total": 1}').etag
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_compute_once() -> None:
+    cache = AnalyticsCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return b"{}"
+
+    requests = [
+        asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert calls == 1
+    assert all(response is responses[0] for response in responses)
+    assert cache.stats()["coalesced"] == 2
+
+
+@pytest.mark.anyio
+async def test_waiters_share_the_computing_request_s_error() -> None:
+    cache = AnalyticsCache()
+    release = asyncio.Event()
+
+    async def compute() -> bytes:
+        await release.wait()
+        error_msg = "database went away"
+        raise RuntimeError(error_msg)
+
+    leader = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    release.set()
+
+    for request in (leader, follower):
+        with pytest.raises(RuntimeError, match="database went away"):
+            await request
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.anyio
+async def test_a_waiter_takes_over_when_the_computing_request_is_cancelled() -> None:
+    cache = AnalyticsCache()
+    started = asyncio.Event()
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.Event().wait()
+        return b"{}"
+
+    leader = asyncio.create_task(cache.get_or_compute("key", compute))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    response = await follower
+
+    assert response.body == b"{}"
+    assert calls == 2
+    assert cache.stats()["computing"] == 0
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_entries_are_evicted() -> None:
+    cache = AnalyticsCache(max_entries=2)
+
+    async def compute() -> bytes:
+        return b"{}"
+
+    await cache.get_or_compute("a", compute)
+    await cache.get_or_compute("b", compute)
+    await cache.get_or_compute("a", compute)
+    await cache.get_or_compute("c", compute)
+    await cache.get_or_compute("a", compute)
+    await cache.get_or_compute("b", compute)
+
+    assert cache.stats()["misses"] == 4
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,146 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from models.orm import MonthlySpendingSummary
+from services.analytics import DataScope
+from services.analytics import category_trends_report
+from services.analytics import data_scope
+from services.analytics import monthly_spending_report
+from services.analytics.reports import period_starts
+from services.analytics.reports import trend
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _session(rows: list[tuple[object, ...]]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def _summary(
+    month: date, category: str, spent: str, credited: str = "0", count: int = 1
+) -> MonthlySpendingSummary:
+    return MonthlySpendingSummary(
+        month=month,
+        category=category,
+        total_amount=Decimal(spent) + Decimal(credited),
+        spending_amount=Decimal(spent),
+        credit_amount=Decimal(credited),
+        transaction_count=count,
+    )
+
+
+@pytest.mark.parametrize(
+    ("amounts", "expected"),
+    [
+        ([-100.0, -150.0, -200.0], "increasing"),
+        ([-200.0, -150.0, -100.0], "decreasing"),
+        ([-100.0, -104.0, -98.0], "stable"),
+        ([-100.0], "stable"),
+        ([0.0, 0.0], "stable"),
+    ],
+)
+def test_trend_follows_the_magnitude_of_the_amounts(
+    amounts: list[float], expected: str
+) -> None:
+    assert trend(amounts) == expected
+
+
+def test_period_starts_cover_the_range() -> None:
+    start, end = date(2025, 1, 15), date(2025, 3, 2)
+
+    assert period_starts(start, end, "monthly") == [
+        date(2025, 1, 1),
+        date(2025, 2, 1),
+        date(2025, 3, 1),
+    ]
+    # Weeks start on Monday, like date_trunc('week', ...)
+    weeks = period_starts(start, end, "weekly")
+    assert weeks[0] == date(2025, 1, 13)
+    assert weeks[-1] == date(2025, 2, 24)
+    assert len(period_starts(start, end, "daily")) == 47
+
+
+@pytest.mark.anyio
+async def test_data_scope_is_none_for_an_unknown_account() -> None:
+    assert await data_scope(_session([]), uuid4()) is None
+
+
+@pytest.mark.anyio
+async def test_monthly_report_sums_the_summary_rows() -> None:
+    account_id = uuid4()
+    scope = DataScope(versions=((account_id, 3),))
+    session = _session([(date(2025, 1, 5), Decimal("-40.00"), 2)])
+    rows = [
+        _summary(date(2025, 1, 1), "dining", "-40.00", count=2),
+        _summary(date(2025, 1, 1), "groceries", "-60.00", count=3),
+        _summary(date(2025, 1, 1), "income", "0", "500.00"),
+    ]
+
+    with patch(
+        "services.analytics.reports.monthly_spending", AsyncMock(return_value=rows)
+    ) as monthly_spending:
+        report = await monthly_spending_report(session, scope, year=2025, month=1)
+
+    monthly_spending.assert_awaited_once_with(
+        session, [account_id], date(2025, 1, 1), date(2025, 1, 31), category=None
+    )
+    assert report["total_spending"] == -100.0
+    assert report["total_credits"] == 500.0
+    assert report["net_amount"] == 400.0
+    assert [c["category"] for c in report["categories"]] == [
+        "groceries",
+        "dining",
+        "income",
+    ]
+    assert report["categories"][0]["percentage"] == 60.0
+    assert report["daily_breakdown"] == [
+        {"date": date(2025, 1, 5), "amount": -40.0, "transaction_count": 2}
+    ]
+
+
+@pytest.mark.anyio
+async def test_trends_fill_periods_without_transactions() -> None:
+    scope = DataScope(versions=((uuid4(), 0),))
+    rows = [
+        _summary(date(2025, 1, 1), "dining", "-100.00"),
+        _summary(date(2025, 3, 1), "dining", "-200.00"),
+        _summary(date(2025, 3, 1), "travel", "-50.00"),
+    ]
+
+    with patch(
+        "services.analytics.reports.monthly_spending", AsyncMock(return_value=rows)
+    ):
+        report = await category_trends_report(
+            MagicMock(),
+            scope,
+            start=date(2025, 1, 1),
+            end=date(2025, 3, 31),
+            categories=["dining"],
+        )
+
+    (dining,) = report["categories"]
+    assert [point["amount"] for point in dining["data_points"]] == [
+        -100.0,
+        0.0,
+        -200.0,
+    ]
+    assert dining["trend"] == "increasing"
+    assert dining["average_monthly"] == -100.0
+    assert [total["total_spending"] for total in report["totals"]] == [
+        -100.0,
+        0.0,
+        -200.0,
+    ]
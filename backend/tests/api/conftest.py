@@ -0,0 +1,78 @@
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from app import app
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+import database
+
+
+@pytest.fixture
+def session() -> Iterator[MagicMock]:
+    """Stand-in read session injected into every endpoint."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    async def override() -> MagicMock:
+        return session
+
+    app.dependency_overrides[database.get_read_session] = override
+    yield session
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget(
+    session: MagicMock,
+) -> Callable[[int], AbstractContextManager[None]]:
+    """Fail the test when a block runs more queries than its budget.
+
+    Usage::
+
+        with query_budget(2):
+            client.get("/api/v1/statements/...")
+    """
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[None]:
+        before = session.execute.await_count
+        yield
+        used = session.execute.await_count - before
+        if used > limit:
+            statements = [
+                str(call.args[0]).split("\n", 1)[0]
+                for call in session.execute.await_args_list[before:]
+            ]
+            pytest.fail(
+                f"{used} queries exceed the budget of {limit}:\n"
+                + "\n".join(statements)
+            )
+
+    return budget
+
+
+@pytest.fixture
+def detached() -> Callable[[Any], Any]:
+    """Turn a new ORM object into a detached, loaded-looking row.
+
+    Relationships that were not assigned then raise on access, just as
+    an unloaded relationship would, so tests catch lazy loads that a
+    plain transient object would silently return as empty.
+    """
+
+    def detach(instance: Any) -> Any:
+        # Columns the test left out would otherwise be expired and refreshed
+        for column in inspect(instance).mapper.column_attrs:
+            if column.key not in vars(instance):
+                setattr(instance, column.key, None)
+        make_transient_to_detached(instance)
+        return instance
+
+    return detach
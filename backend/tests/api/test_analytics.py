@@ -0,0 +1,150 @@
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+from app import app
+from fastapi.testclient import TestClient
+
+from services.analytics import AnalyticsCache
+from services.analytics import get_analytics_cache
+
+
+ACCOUNT_ID = uuid4()
+REPORT: dict[str, Any] = {
+    "period": {
+        "year": 2025,
+        "month": 1,
+        "start_date": date(2025, 1, 1),
+        "end_date": date(2025, 1, 31),
+    },
+    "total_spending": -100.0,
+    "total_credits": 0.0,
+    "net_amount": -100.0,
+    "categories": [
+        {
+            "category": "dining",
+            "amount": -100.0,
+            "percentage": 100.0,
+            "transaction_count": 2,
+        }
+    ],
+    "daily_breakdown": [],
+}
+
+
+@pytest.fixture
+def cache() -> Iterator[AnalyticsCache]:
+    cache = AnalyticsCache()
+    app.dependency_overrides[get_analytics_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_analytics_cache, None)
+
+
+@pytest.fixture
+def report() -> Iterator[AsyncMock]:
+    with patch(
+        "api.v1.endpoints.analytics.monthly_spending_report",
+        AsyncMock(return_value=REPORT),
+    ) as report:
+        yield report
+
+
+def _versions(session: MagicMock, *versions: tuple[UUID, int]) -> None:
+    result = MagicMock()
+    result.all.return_value = [
+        MagicMock(id=account_id, data_version=version)
+        for account_id, version in versions
+    ]
+    session.execute.return_value = result
+
+
+def _get(**headers: str) -> Any:
+    return TestClient(app).get(
+        "/api/v1/analytics/spending/monthly",
+        params={"year": 2025, "month": 1, "account_id": str(ACCOUNT_ID)},
+        headers=headers,
+    )
+
+
+@pytest.mark.usefixtures("cache")
+def test_reports_are_cached_until_the_data_version_changes(
+    session: MagicMock, report: AsyncMock
+) -> None:
+    _versions(session, (ACCOUNT_ID, 1))
+
+    first = _get()
+    second = _get()
+    _versions(session, (ACCOUNT_ID, 2))
+    third = _get()
+
+    assert first.status_code == 200
+    assert first.json()["categories"][0]["category"] == "dining"
+    assert second.content == first.content
+    # An import bumped the version, so the report is computed again
+    assert report.await_count == 2
+    # Same body, same ETag, even across a recomputation
+    assert first.headers["etag"] == second.headers["etag"] == third.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+
+@pytest.mark.usefixtures("cache", "report")
+def test_a_matching_etag_gets_not_modified(session: MagicMock) -> None:
+    _versions(session, (ACCOUNT_ID, 1))
+    etag = _get().headers["etag"]
+
+    revalidated = _get(**{"If-None-Match": f'"stale", W/{etag}'})
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert _get(**{"If-None-Match": '"stale"'}).status_code == 200
+
+
+@pytest.mark.usefixtures("cache")
+def test_an_unknown_account_is_not_found(session: MagicMock, report: AsyncMock) -> None:
+    _versions(session)
+
+    response = _get()
+
+    assert response.status_code == 404
+    report.assert_not_awaited()
+
+
+@pytest.mark.usefixtures("cache")
+def test_trends_key_on_the_resolved_range_and_categories(session: MagicMock) -> None:
+    _versions(session, (ACCOUNT_ID, 1))
+    body = {
+        "period": {
+            "start_date": date(2025, 1, 1),
+            "end_date": date(2025, 3, 31),
+            "granularity": "monthly",
+        },
+        "categories": [],
+        "totals": [],
+    }
+
+    with patch(
+        "api.v1.endpoints.analytics.category_trends_report",
+        AsyncMock(return_value=body),
+    ) as trends:
+        client = TestClient(app)
+        for categories in ("travel,dining", "dining, travel"):
+            response = client.get(
+                "/api/v1/analytics/trends/categories",
+                params={"period": "3months", "categories": categories},
+            )
+            assert response.status_code == 200
+
+    trends.assert_awaited_once()
+    (call,) = trends.await_args_list
+    assert call.kwargs["categories"] == ["dining", "travel"]
+    # The current month and the two before it
+    start, end = call.kwargs["start"], call.kwargs["end"]
+    assert start.day == 1
+    assert (end.year - start.year) * 12 + end.month - start.month == 2
@@ -0,0 +1,297 @@
+import base64
+import hashlib
+import io
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from api.v1.endpoints import uploads
+from app import app
+from fastapi.testclient import TestClient
+
+import database
+from models.orm import ParseJob
+from models.orm import Statement
+from services.admission import Admission
+from services.admission import AdmissionLimits
+from services.admission import get_admission
+from services.storage import LocalStorage
+from services.storage import get_storage
+from services.uploads import ChunkedUploads
+
+
+ACCOUNT_ID = uuid4()
+CHUNK = 32
+
+
+@pytest.fixture
+def write_session(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Iterator[MagicMock]:
+    """Stand-in primary session, with uploads spooled under tmp_path."""
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(
+        uploads,
+        "chunked_uploads",
+        ChunkedUploads(
+            tmp_path / ".chunks",
+            chunk_size=CHUNK,
+            max_upload_bytes=1024 * 1024,
+            ttl_seconds=3600,
+        ),
+    )
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    async def override() -> MagicMock:
+        return session
+
+    app.dependency_overrides[database.get_async_session] = override
+    app.dependency_overrides[get_storage] = lambda: LocalStorage(tmp_path)
+    # No queue limits, so no backlog queries against the stand-in session
+    app.dependency_overrides[get_admission] = lambda: Admission(
+        AdmissionLimits(max_queued_jobs=0, max_queued_jobs_per_user=0)
+    )
+    yield session
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with (
+        patch.object(uploads, "get_account_uuid", return_value=ACCOUNT_ID),
+        patch("api.v1.endpoints.parse.get_account_uuid", return_value=ACCOUNT_ID),
+    ):
+        yield TestClient(app)
+
+
+def _digest(data: bytes) -> str:
+    return f"sha-256=:{base64.b64encode(hashlib.sha256(data).digest()).decode()}:"
+
+
+def _upload(client: TestClient, filename: str, content: bytes) -> str:
+    response = client.post(
+        "/api/v1/uploads/",
+        json={"filename": filename, "size": len(content), "account_type": "citi_cc"},
+    )
+    assert response.status_code == 201
+    body = response.json()
+    for offset in body["missing_offsets"]:
+        chunk = content[offset : offset + body["chunk_size"]]
+        response = client.put(
+            f"/api/v1/uploads/{body['upload_id']}/chunks/{offset}",
+            content=chunk,
+            headers={"Content-Digest": _digest(chunk)},
+        )
+        assert response.status_code == 204
+    return str(body["upload_id"])
+
+
+@pytest.mark.usefixtures("write_session")
+def test_an_interrupted_upload_resumes_from_its_missing_chunks(
+    client: TestClient,
+) -> None:
+    content = b"%PDF-1.7 " * 10
+    created = client.post(
+        "/api/v1/uploads/",
+        json={
+            "filename": "august.pdf",
+            "size": len(content),
+            "account_type": "citi_cc",
+        },
+    ).json()
+    upload_id = created["upload_id"]
+    assert created["missing_offsets"] == [0, 32, 64]
+    client.put(
+        f"/api/v1/uploads/{upload_id}/chunks/32",
+        content=content[32:64],
+        headers={"Content-Digest": _digest(content[32:64])},
+    )
+
+    state = client.get(f"/api/v1/uploads/{upload_id}").json()
+
+    assert state["received_bytes"] == 32
+    assert state["missing_offsets"] == [0, 64]
+
+
+def test_a_completed_pdf_is_queued_under_its_digest(
+    client: TestClient, write_session: MagicMock, tmp_path: Path
+) -> None:
+    content = b"%PDF-1.7 " * 10
+    upload_id = _upload(client, "august.pdf", content)
+
+    response = client.post(f"/api/v1/uploads/{upload_id}/complete")
+
+    assert response.status_code == 202
+    (queued,) = response.json()["statements"]
+    (statement,), (job,) = (c.args for c in write_session.add.call_args_list)
+    assert isinstance(statement, Statement)
+    assert isinstance(job, ParseJob)
+    assert queued["statement_id"] == str(statement.id)
+    assert queued["processing_info"]["progress_url"] == (
+        f"/api/v1/statements/{statement.id}/status"
+    )
+    stored = tmp_path / f"{hashlib.sha256(content).hexdigest()}.pdf"
+    assert queued["files"]["pdf_url"] == str(stored)
+    assert stored.read_bytes() == content
+    write_session.commit.assert_awaited_once()
+    # The session is gone once completed
+    assert list((tmp_path / ".chunks").iterdir()) == []
+    assert client.get(f"/api/v1/uploads/{upload_id}").status_code == 404
+
+
+def test_an_archive_queues_one_statement_per_pdf(
+    client: TestClient, write_session: MagicMock
+) -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("2025-08_statement.pdf", b"%PDF-1.7 august")
+        archive.writestr("2025-08_transactions.csv", b"date,amount\n")
+        archive.writestr("2025-09_statement.pdf", b"%PDF-1.7 september")
+    upload_id = _upload(client, "2025.zip", buffer.getvalue())
+
+    response = client.post(f"/api/v1/uploads/{upload_id}/complete")
+
+    assert response.status_code == 202
+    body = response.json()
+    assert len(body["statements"]) == 2
+    assert body["skipped"] == []
+    assert [s["files"]["csv_url"] is not None for s in body["statements"]] == [
+        True,
+        False,
+    ]
+    assert len(write_session.add.call_args_list) == 4
+
+
+@pytest.mark.usefixtures("write_session")
+def test_chunks_need_a_matching_content_digest(client: TestClient) -> None:
+    content = b"%PDF-1.7"
+    upload_id = client.post(
+        "/api/v1/uploads/",
+        json={
+            "filename": "august.pdf",
+            "size": len(content),
+            "account_type": "citi_cc",
+        },
+    ).json()["upload_id"]
+    url = f"/api/v1/uploads/{upload_id}/chunks/0"
+
+    missing = client.put(url, content=content)
+    wrong = client.put(url, content=content, headers={"Content-Digest": _digest(b"x")})
+
+    assert missing.status_code == 400
+    assert wrong.status_code == 400
+    assert "checksum" in wrong.json()["detail"]
+
+
+def test_completing_before_every_chunk_arrived_is_a_conflict(
+    client: TestClient, write_session: MagicMock
+) -> None:
+    upload_id = client.post(
+        "/api/v1/uploads/",
+        json={"filename": "august.pdf", "size": 100, "account_type": "citi_cc"},
+    ).json()["upload_id"]
+
+    response = client.post(f"/api/v1/uploads/{upload_id}/complete")
+
+    assert response.status_code == 409
+    write_session.commit.assert_not_awaited()
+
+
+@pytest.mark.usefixtures("write_session")
+def test_only_pdfs_and_zip_archives_are_accepted(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/uploads/",
+        json={"filename": "august.csv", "size": 10, "account_type": "citi_cc"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_completion_refused_for_a_full_queue_can_be_retried(
+    client: TestClient, write_session: MagicMock
+) -> None:
+    content = b"%PDF-1.7 " * 10
+    upload_id = _upload(client, "august.pdf", content)
+    admission = Admission(AdmissionLimits(max_queued_jobs=1))
+    app.dependency_overrides[get_admission] = lambda: admission
+    result = MagicMock()
+    result.one.return_value = (1, 1)
+    write_session.execute = AsyncMock(return_value=result)
+
+    refused = client.post(f"/api/v1/uploads/{upload_id}/complete")
+
+    assert refused.status_code == 429
+    assert refused.headers["Retry-After"] == "30"
+    # Every chunk is kept for the retry
+    assert client.get(f"/api/v1/uploads/{upload_id}").json()["missing_offsets"] == []
+
+    result.one.return_value = (0, 0)
+    assert client.post(f"/api/v1/uploads/{upload_id}/complete").status_code == 202
+
+
+def test_an_archive_needs_a_queue_slot_for_every_statement(
+    client: TestClient, write_session: MagicMock
+) -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for month in ("08", "09", "10"):
+            archive.writestr(
+                f"2025-{month}_statement.pdf", b"%PDF-1.7 " + month.encode()
+            )
+    upload_id = _upload(client, "2025.zip", buffer.getvalue())
+    admission = Admission(AdmissionLimits(max_queued_jobs=10))
+    app.dependency_overrides[get_admission] = lambda: admission
+    result = MagicMock()
+    # One slot left: enough for a PDF, not for an archive of three
+    result.one.return_value = (9, 0)
+    write_session.execute = AsyncMock(return_value=result)
+
+    refused = client.post(f"/api/v1/uploads/{upload_id}/complete")
+
+    assert refused.status_code == 429
+    write_session.add.assert_not_called()
+    assert client.get(f"/api/v1/uploads/{upload_id}").json()["missing_offsets"] == []
+
+    result.one.return_value = (7, 0)
+    accepted = client.post(f"/api/v1/uploads/{upload_id}/complete")
+    assert accepted.status_code == 202
+    assert len(accepted.json()["statements"]) == 3
+
+
+@pytest.mark.usefixtures("write_session")
+def test_chunks_are_429_while_the_upload_budget_is_spent(client: TestClient) -> None:
+    content = b"%PDF-1.7"
+    upload_id = client.post(
+        "/api/v1/uploads/",
+        json={
+            "filename": "august.pdf",
+            "size": len(content),
+            "account_type": "citi_cc",
+        },
+    ).json()["upload_id"]
+    admission = Admission(
+        AdmissionLimits(
+            max_upload_bytes_in_flight=4,
+            max_upload_waiters=0,
+            max_upload_wait_seconds=2,
+        )
+    )
+    app.dependency_overrides[get_admission] = lambda: admission
+    # Held by another upload, with no room to wait
+    admission.upload_bytes.in_use = 4
+
+    response = client.put(
+        f"/api/v1/uploads/{upload_id}/chunks/0",
+        content=content,
+        headers={"Content-Digest": _digest(content)},
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    assert admission.stats()["upload_bytes"]["rejected"] == 1
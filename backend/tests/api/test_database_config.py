@@ -0,0 +1,55 @@
+import pytest
+from app import app
+from fastapi.testclient import TestClient
+
+import database
+
+
+def test_engines_are_created_on_first_use() -> None:
+    config = database.DatabaseConfig()
+    assert "async_engine" not in vars(config)
+    assert config.pool_stats() == {}
+
+    engine = config.async_engine
+
+    assert config.async_session_maker.kw["bind"] is engine
+    assert list(config.pool_stats()) == ["primary"]
+
+
+def test_role_selects_pool_sizes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DATABASE_POOL_SIZE", raising=False)
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "7")
+
+    config = database.DatabaseConfig(role="worker")
+
+    assert config.pool_settings == database.PoolSettings(
+        pool_size=database.POOL_ROLES["worker"].pool_size, max_overflow=7
+    )
+    assert config.async_engine.pool.size() == database.POOL_ROLES["worker"].pool_size  # type: ignore[attr-defined]
+
+
+def test_role_cannot_change_after_engines_exist() -> None:
+    config = database.DatabaseConfig(role="cli")
+    config.configure("worker")
+    assert config.sync_engine is not None
+
+    with pytest.raises(RuntimeError):
+        config.configure("api")
+    with pytest.raises(ValueError, match="Unknown database pool role"):
+        database.DatabaseConfig(role="batch")
+
+
+def test_metrics_endpoint_reports_pool_statistics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config = database.DatabaseConfig(role="cli")
+    assert config.async_engine is not None
+    monkeypatch.setattr(database, "pool_stats_snapshot", config.pool_stats)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    primary = response.json()["database_pools"]["primary"]
+    assert primary["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert primary["size"] == database.POOL_ROLES["cli"].pool_size
+    assert primary["checked_out"] == 0
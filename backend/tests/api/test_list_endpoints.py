@@ -0,0 +1,177 @@
+from collections.abc import Callable
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from api.v1.pagination import decode_cursor
+from app import app
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from models.orm import Statement
+from models.orm import Transaction
+
+
+QueryBudget = Callable[[int], AbstractContextManager[None]]
+Detach = Callable[[Any], Any]
+
+
+def _returns(session: MagicMock, rows: Sequence[object]) -> None:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    session.execute.return_value = result
+
+
+def _sql(session: MagicMock) -> str:
+    query = session.execute.await_args.args[0]
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def _transaction(day: int) -> Transaction:
+    return Transaction(
+        id=uuid4(),
+        statement_id=uuid4(),
+        account_id=uuid4(),
+        transaction_date=date(2025, 8, day),
+        amount=Decimal("-12.50"),
+        description="COFFEE",
+        category="dining",
+        transaction_type="debit",
+    )
+
+
+def test_transactions_page_links_to_next_page(
+    session: MagicMock, query_budget: QueryBudget, detached: Detach
+) -> None:
+    rows = [detached(_transaction(day)) for day in (20, 15, 10)]
+    _returns(session, rows)
+
+    with query_budget(1):
+        response = TestClient(app).get("/api/v1/transactions/", params={"limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["date"] for item in body["transactions"]] == [
+        "2025-08-20",
+        "2025-08-15",
+    ]
+    assert body["transactions"][0]["type"] == "debit"
+    assert body["pagination"]["has_next"] is True
+    assert decode_cursor(body["pagination"]["next_cursor"], date.fromisoformat) == (
+        date(2025, 8, 15),
+        rows[1].id,
+    )
+    assert "LIMIT 3" in _sql(session)
+
+
+def test_transactions_filters_and_cursor_reach_the_query(
+    session: MagicMock,
+) -> None:
+    _returns(session, [])
+    first_page = TestClient(app).get("/api/v1/transactions/", params={"limit": 1})
+    assert first_page.json()["pagination"] == {
+        "limit": 1,
+        "next_cursor": None,
+        "has_next": False,
+    }
+
+    last = _transaction(15)
+    _returns(session, [last, _transaction(10)])
+    cursor = (
+        TestClient(app)
+        .get("/api/v1/transactions/", params={"limit": 1})
+        .json()["pagination"]["next_cursor"]
+    )
+
+    account_id = uuid4()
+    response = TestClient(app).get(
+        "/api/v1/transactions/",
+        params={
+            "cursor": cursor,
+            "account_id": str(account_id),
+            "date_from": "2025-08-01",
+            "date_to": "2025-08-31",
+            "category": "dining",
+            "type": "debit",
+            "min_amount": "-100",
+            "max_amount": "0",
+        },
+    )
+
+    assert response.status_code == 200
+    sql = _sql(session)
+    assert f"transactions.account_id = '{account_id}'" in sql
+    assert "transactions.transaction_date >= '2025-08-01'" in sql
+    assert "transactions.transaction_date <= '2025-08-31'" in sql
+    assert "transactions.category = 'dining'" in sql
+    assert "transactions.transaction_type = 'debit'" in sql
+    assert "transactions.amount >= -100" in sql
+    assert "transactions.amount <= 0" in sql
+    assert f"('2025-08-15', '{last.id}')" in sql
+    assert "OFFSET" not in sql
+
+
+def test_transactions_rejects_invalid_cursor_and_type(session: MagicMock) -> None:
+    client = TestClient(app)
+
+    assert (
+        client.get("/api/v1/transactions/", params={"cursor": "x"}).status_code == 400
+    )
+    assert (
+        client.get("/api/v1/transactions/", params={"type": "fee"}).status_code == 422
+    )
+    session.execute.assert_not_awaited()
+
+
+def test_statements_page_is_keyed_on_upload_time(
+    session: MagicMock, query_budget: QueryBudget, detached: Detach
+) -> None:
+    uploaded_at = datetime(2025, 9, 6, 10, 30, tzinfo=UTC)
+    statement = detached(
+        Statement(
+            id=uuid4(),
+            account_id=uuid4(),
+            period_start=date(2025, 8, 1),
+            period_end=date(2025, 8, 31),
+            file_csv_url="statements/abc123.csv",
+            status="completed",
+            uploaded_at=uploaded_at,
+        )
+    )
+    _returns(session, [statement, statement])
+    institution_id = uuid4()
+
+    with query_budget(1):
+        response = TestClient(app).get(
+            "/api/v1/statements/",
+            params={
+                "limit": 1,
+                "status": "completed",
+                "institution_id": str(institution_id),
+            },
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["statements"][0]["files"] == {
+        "pdf_url": None,
+        "csv_url": "statements/abc123.csv",
+    }
+    assert decode_cursor(body["pagination"]["next_cursor"], datetime.fromisoformat) == (
+        uploaded_at,
+        statement.id,
+    )
+    sql = _sql(session)
+    assert "statements.status = 'completed'" in sql
+    assert f"accounts.institution_id = '{institution_id}'" in sql
+    assert "ORDER BY statements.uploaded_at DESC, statements.id DESC" in sql
@@ -0,0 +1,71 @@
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from api.v1.pagination import build_page
+from api.v1.pagination import decode_cursor
+from api.v1.pagination import encode_cursor
+from api.v1.pagination import seek
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from models.orm import Transaction
+
+
+def test_cursor_round_trips_date_and_datetime() -> None:
+    row_id = uuid4()
+    uploaded_at = datetime(2025, 9, 6, 10, 30, tzinfo=UTC)
+
+    assert decode_cursor(
+        encode_cursor(date(2025, 8, 15), row_id), date.fromisoformat
+    ) == (
+        date(2025, 8, 15),
+        row_id,
+    )
+    assert decode_cursor(
+        encode_cursor(uploaded_at, row_id), datetime.fromisoformat
+    ) == (uploaded_at, row_id)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", "W10", encode_cursor(date(2025, 1, 1), uuid4())[:-4]]
+)
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, date.fromisoformat)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_seek_uses_row_comparison_instead_of_offset() -> None:
+    query = seek(
+        select(Transaction),
+        Transaction.transaction_date,
+        Transaction.id,
+        (date(2025, 8, 15), uuid4()),
+        50,
+    )
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "(transactions.transaction_date, transactions.id) <" in sql
+    assert "ORDER BY transactions.transaction_date DESC, transactions.id DESC" in sql
+    assert "LIMIT" in sql
+    assert "OFFSET" not in sql
+
+
+def test_build_page_emits_cursor_only_when_more_rows_exist() -> None:
+    rows = [(date(2025, 8, day), uuid4()) for day in (30, 20, 10)]
+
+    items, page = build_page(rows, 2, lambda row: row)
+    assert items == rows[:2]
+    assert page.has_next
+    assert page.next_cursor is not None
+    assert decode_cursor(page.next_cursor, date.fromisoformat) == rows[1]
+
+    items, page = build_page(rows, 3, lambda row: row)
+    assert items == rows
+    assert not page.has_next
+    assert page.next_cursor is None
@@ -0,0 +1,141 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from api.v1.endpoints.statements import build_summary
+from api.v1.endpoints.statements import statement_summary_query
+from api.v1.endpoints.statements import statement_with_details_query
+from app import app
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+
+from models.orm import Account
+from models.orm import Statement
+from models.orm import StatementDetail
+
+
+QueryBudget = Callable[[int], AbstractContextManager[None]]
+Detach = Callable[[Any], Any]
+
+
+def _statement(detached: Detach) -> Statement:
+    statement_id = uuid4()
+    account = detached(Account(id=uuid4(), institution_id=uuid4()))
+    detail = detached(
+        StatementDetail(
+            id=uuid4(),
+            statement_id=statement_id,
+            new_balance=Decimal("1250.40"),
+            due_date=date(2025, 9, 25),
+        )
+    )
+    statement: Statement = detached(
+        Statement(
+            id=statement_id,
+            account_id=account.id,
+            account=account,
+            statement_detail=detail,
+            credit_card_detail=None,
+            period_start=date(2025, 8, 1),
+            period_end=date(2025, 8, 31),
+            status="completed",
+            uploaded_at=datetime(2025, 9, 2, tzinfo=UTC),
+        )
+    )
+    return statement
+
+
+def _results(session: MagicMock, statement: Statement | None) -> None:
+    loaded = MagicMock()
+    loaded.scalars.return_value.first.return_value = statement
+    totals = MagicMock()
+    totals.tuples.return_value.all.return_value = [
+        ("dining", 3, Decimal("-42.50"), Decimal("0.00"), Decimal("-42.50")),
+        ("income", 1, Decimal("2000.00"), Decimal("2000.00"), Decimal("0.00")),
+    ]
+    session.execute.side_effect = [loaded, totals]
+
+
+def test_statement_detail_loads_in_two_queries(
+    session: MagicMock, query_budget: QueryBudget, detached: Detach
+) -> None:
+    statement = _statement(detached)
+    _results(session, statement)
+
+    with query_budget(2):
+        response = TestClient(app).get(f"/api/v1/statements/{statement.id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["statement"]["institution_id"] == str(statement.account.institution_id)
+    assert body["details"]["new_balance"] == 1250.40
+    assert body["credit_card_details"] is None
+    assert body["summary"] == {
+        "transaction_count": 4,
+        "total_credits": 2000.0,
+        "total_debits": -42.5,
+        "net_amount": 1957.5,
+        "categories": {"dining": -42.5, "income": 2000.0},
+    }
+
+
+def test_missing_statement_is_404(session: MagicMock) -> None:
+    _results(session, None)
+
+    response = TestClient(app).get(f"/api/v1/statements/{uuid4()}")
+
+    assert response.status_code == 404
+    assert session.execute.await_count == 1
+
+
+def test_details_are_joined_into_the_statement_query() -> None:
+    sql = str(
+        statement_with_details_query(uuid4()).compile(dialect=postgresql.dialect())
+    )
+
+    assert sql.count("LEFT OUTER JOIN") == 3
+    assert "transactions" not in sql
+
+
+def test_unloaded_relationship_raises_instead_of_querying(detached: Detach) -> None:
+    statement = detached(Statement(id=uuid4()))
+
+    with pytest.raises(InvalidRequestError):
+        _ = statement.transactions
+
+
+def test_build_summary_of_no_transactions_is_zero() -> None:
+    assert build_summary([]).model_dump() == {
+        "transaction_count": 0,
+        "total_credits": 0.0,
+        "total_debits": 0.0,
+        "net_amount": 0.0,
+        "categories": {},
+    }
+
+
+def test_mixed_sign_category_counts_toward_credits_and_debits() -> None:
+    # A dining refund is a credit even though dining nets out as a debit
+    summary = build_summary(
+        [("dining", 2, Decimal("-30.00"), Decimal("20.00"), Decimal("-50.00"))]
+    )
+
+    assert summary.total_credits == 20.0
+    assert summary.total_debits == -50.0
+    assert summary.net_amount == -30.0
+    assert summary.categories == {"dining": -30.0}
+
+
+def test_credits_and_debits_are_split_per_transaction_in_sql() -> None:
+    sql = str(statement_summary_query(uuid4()).compile(dialect=postgresql.dialect()))
+
+    assert "sum(CASE WHEN (transactions.amount > " in sql
+    assert "sum(CASE WHEN (transactions.amount < " in sql
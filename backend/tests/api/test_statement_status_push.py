@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from datetime import UTC
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import UUID
+from uuid import uuid4
+
+import httpx
+import pytest
+from app import app
+
+import database
+from models.orm import Statement
+from services.jobs import StatusBroker
+from services.jobs import StatusEvent
+
+
+class _Broker(StatusBroker):
+    """Broker that reports when a request has subscribed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.subscribed = asyncio.Event()
+
+    @contextlib.contextmanager
+    def subscribe(self, statement_id: UUID) -> Iterator[asyncio.Queue[StatusEvent]]:
+        with super().subscribe(statement_id) as events:
+            self.subscribed.set()
+            yield events
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # Notifications are published on the loop the requests wait on
+    return "asyncio"
+
+
+@pytest.fixture
+def statement() -> Statement:
+    return Statement(
+        id=uuid4(),
+        status="processing",
+        uploaded_at=datetime(2025, 9, 2, tzinfo=UTC),
+        processed_at=None,
+        period_start=None,
+        period_end=None,
+        processing_metadata={},
+    )
+
+
+@pytest.fixture
+def write_session(statement: Statement) -> Iterator[MagicMock]:
+    session = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = statement
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+
+    async def override() -> MagicMock:
+        return session
+
+    app.dependency_overrides[database.get_async_session] = override
+    yield session
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def broker() -> Iterator[_Broker]:
+    app.state.status_broker = _Broker()
+    yield app.state.status_broker
+    del app.state.status_broker
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _publish_when_waiting(
+    broker: _Broker, statement: Statement, status: str
+) -> None:
+    await asyncio.wait_for(broker.subscribed.wait(), 5)
+    broker.publish(
+        json.dumps(
+            {
+                "statement_id": str(statement.id),
+                "status": status,
+                "uploaded_at": "2025-09-02T00:00:00+00:00",
+                "processed_at": "2025-09-02T00:00:04+00:00",
+                "period_start": "2025-08-01",
+                "period_end": "2025-08-31",
+                "error": None,
+            }
+        )
+    )
+
+
+@pytest.mark.anyio
+async def test_long_poll_answers_from_the_notification(
+    client: httpx.AsyncClient,
+    broker: _Broker,
+    statement: Statement,
+    write_session: MagicMock,
+) -> None:
+    request = asyncio.create_task(
+        client.get(f"/api/v1/statements/{statement.id}/status?wait=5")
+    )
+    await _publish_when_waiting(broker, statement, "completed")
+    response = await asyncio.wait_for(request, 5)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "completed"
+    assert body["period_end"] == "2025-08-31"
+    # One read before waiting, none after
+    assert write_session.execute.await_count == 1
+    write_session.commit.assert_awaited()
+    assert broker.stats()["subscribers"] == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("broker")
+async def test_long_poll_returns_the_unchanged_status_after_the_wait(
+    client: httpx.AsyncClient,
+    statement: Statement,
+    write_session: MagicMock,
+) -> None:
+    response = await client.get(f"/api/v1/statements/{statement.id}/status?wait=0.05")
+
+    assert response.json()["status"] == "processing"
+    assert write_session.execute.await_count == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("broker", "write_session")
+async def test_long_poll_of_a_finished_statement_returns_at_once(
+    client: httpx.AsyncClient, statement: Statement
+) -> None:
+    statement.status = "failed"
+
+    response = await asyncio.wait_for(
+        client.get(f"/api/v1/statements/{statement.id}/status?wait=60"), 5
+    )
+
+    assert response.json()["status"] == "failed"
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("write_session")
+async def test_event_stream_ends_after_a_final_status(
+    client: httpx.AsyncClient, broker: _Broker, statement: Statement
+) -> None:
+    request = asyncio.create_task(
+        client.get(f"/api/v1/statements/{statement.id}/events")
+    )
+    await _publish_when_waiting(broker, statement, "completed")
+    response = await asyncio.wait_for(request, 5)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(block.split("data: ", 1)[1])
+        for block in response.text.split("\n\n")
+        if block.startswith("event: status")
+    ]
+    assert [event["status"] for event in events] == ["processing", "completed"]
+    assert broker.stats()["subscribers"] == 0
@@ -0,0 +1,245 @@
+from collections.abc import Iterator
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from api.v1.endpoints import parse
+from app import app
+from fastapi.testclient import TestClient
+
+import database
+from models.orm import ParseJob
+from models.orm import Statement
+from services.admission import Admission
+from services.admission import AdmissionLimits
+from services.admission import get_admission
+from services.secure_vault.config_manager import DEFAULT_MAX_FILE_SIZE_MB
+from services.secure_vault.config_manager import get_config_manager
+from services.storage import LocalStorage
+from services.storage import get_storage
+
+
+ACCOUNT_ID = uuid4()
+
+
+@pytest.fixture
+def write_session(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Iterator[MagicMock]:
+    """Stand-in primary session, with uploads stored under tmp_path."""
+    monkeypatch.setattr(parse, "UPLOAD_DIR", tmp_path)
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+
+    async def override() -> MagicMock:
+        return session
+
+    app.dependency_overrides[database.get_async_session] = override
+    app.dependency_overrides[get_storage] = lambda: LocalStorage(tmp_path)
+    # No queue limits, so no backlog queries against the stand-in session
+    app.dependency_overrides[get_admission] = lambda: Admission(
+        AdmissionLimits(max_queued_jobs=0, max_queued_jobs_per_user=0)
+    )
+    yield session
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def known_account() -> Iterator[None]:
+    with patch.object(parse, "get_account_uuid", return_value=ACCOUNT_ID):
+        yield
+
+
+@pytest.mark.usefixtures("known_account")
+def test_upload_returns_202_before_parsing(
+    write_session: MagicMock, tmp_path: Path
+) -> None:
+    response = TestClient(app).post(
+        "/api/v1/statements/",
+        data={"account_type": "citi_cc"},
+        files={"pdf_file": ("august.pdf", b"%PDF-1.7", "application/pdf")},
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "pending"
+    (statement,), (job,) = (c.args for c in write_session.add.call_args_list)
+    assert isinstance(statement, Statement)
+    assert statement.account_id == ACCOUNT_ID
+    assert statement.period_start is None
+    assert statement.processing_metadata["uploads"]["pdf_file"]["size"] == 8
+    write_session.commit.assert_awaited_once()
+    assert body["statement_id"] == str(statement.id)
+    assert body["processing_info"]["progress_url"] == (
+        f"/api/v1/statements/{statement.id}/status"
+    )
+    assert Path(body["files"]["pdf_url"]).parent == tmp_path
+    assert body["files"]["csv_url"] is None
+
+    # Queued in the same commit for a parse worker to claim
+    assert isinstance(job, ParseJob)
+    assert job.statement_id == statement.id
+
+
+@pytest.mark.parametrize(
+    ("data", "files", "detail"),
+    [
+        ({}, {"pdf_file": ("a.pdf", b"%PDF")}, "account_type is required"),
+        (
+            {"account_type": "citi_cc"},
+            {"other": ("a.pdf", b"%PDF")},
+            "A pdf_file is required",
+        ),
+        (
+            {"account_type": "citi_cc"},
+            {"csv_file": ("a.csv", b"date,amount")},
+            "A pdf_file is required",
+        ),
+        (
+            {"account_type": "citi_cc"},
+            {"pdf_file": ("a.csv", b"date")},
+            "pdf_file must be a .pdf file",
+        ),
+    ],
+)
+@pytest.mark.usefixtures("known_account")
+def test_invalid_uploads_are_rejected(
+    write_session: MagicMock,
+    tmp_path: Path,
+    data: dict[str, str],
+    files: dict[str, tuple[str, bytes]],
+    detail: str,
+) -> None:
+    response = TestClient(app).post("/api/v1/statements/", data=data, files=files)
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith(detail)
+    write_session.add.assert_not_called()
+    write_session.commit.assert_not_awaited()
+    # Nothing of a rejected upload is left in the upload directory
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.usefixtures("known_account")
+def test_oversized_upload_is_413(
+    write_session: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(parse, "MAX_FILE_BYTES", 16)
+
+    response = TestClient(app).post(
+        "/api/v1/statements/",
+        data={"account_type": "citi_cc"},
+        files={"pdf_file": ("a.pdf", b"x" * 64)},
+    )
+
+    assert response.status_code == 413
+    write_session.add.assert_not_called()
+
+
+def test_file_size_limit_has_one_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MAX_FILE_SIZE_MB", raising=False)
+    assert get_config_manager().get_max_file_bytes() == (
+        DEFAULT_MAX_FILE_SIZE_MB * 1024 * 1024
+    )
+
+    monkeypatch.setenv("MAX_FILE_SIZE_MB", "5")
+    assert get_config_manager().get_max_file_bytes() == 5 * 1024 * 1024
+
+
+@pytest.mark.usefixtures("known_account")
+def test_upload_is_429_while_the_parse_queue_is_full(
+    write_session: MagicMock, tmp_path: Path
+) -> None:
+    result = MagicMock()
+    result.one.return_value = (5, 0)
+    write_session.execute.return_value = result
+    app.dependency_overrides[get_admission] = lambda: Admission(
+        AdmissionLimits(max_queued_jobs=5, backlog_retry_after_seconds=12.5)
+    )
+
+    response = TestClient(app).post(
+        "/api/v1/statements/",
+        data={"account_type": "citi_cc"},
+        files={"pdf_file": ("a.pdf", b"%PDF-1.7")},
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "13"
+    write_session.add.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.usefixtures("write_session", "known_account")
+def test_form_urlencoded_body_is_rejected() -> None:
+    response = TestClient(app).post(
+        "/api/v1/statements/", data={"account_type": "citi_cc"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_status_reports_parse_outcome(write_session: MagicMock) -> None:
+    statement = Statement(
+        id=uuid4(),
+        status="failed",
+        uploaded_at=datetime(2025, 9, 2, tzinfo=UTC),
+        processed_at=datetime(2025, 9, 2, 0, 0, 3, tzinfo=UTC),
+        period_start=None,
+        period_end=None,
+        processing_metadata={"error": "ValueError: no statement_data"},
+    )
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = statement
+    write_session.execute.return_value = result
+
+    response = TestClient(app).get(f"/api/v1/statements/{statement.id}/status")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "statement_id": str(statement.id),
+        "status": "failed",
+        "uploaded_at": "2025-09-02T00:00:00Z",
+        "processed_at": "2025-09-02T00:00:03Z",
+        "period_start": None,
+        "period_end": None,
+        "error": "ValueError: no statement_data",
+    }
+
+
+def test_status_of_completed_statement_has_its_period(
+    write_session: MagicMock,
+) -> None:
+    statement = Statement(
+        id=uuid4(),
+        status="completed",
+        uploaded_at=datetime(2025, 9, 2, tzinfo=UTC),
+        period_start=date(2025, 8, 1),
+        period_end=date(2025, 8, 31),
+        processing_metadata={},
+    )
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = statement
+    write_session.execute.return_value = result
+
+    body = TestClient(app).get(f"/api/v1/statements/{statement.id}/status").json()
+
+    assert body["period_end"] == "2025-08-31"
+    assert body["error"] is None
+
+
+def test_status_of_unknown_statement_is_404(write_session: MagicMock) -> None:
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = None
+    write_session.execute.return_value = result
+
+    response = TestClient(app).get(f"/api/v1/statements/{uuid4()}/status")
+
+    assert response.status_code == 404
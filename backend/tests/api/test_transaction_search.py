@@ -0,0 +1,81 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from api.v1.endpoints.transactions import search_query
+from app import app
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from models.orm import Transaction
+
+
+def _sql(query: object) -> str:
+    return str(
+        query.compile(  # type: ignore[attr-defined]
+            dialect=asyncpg.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_search_matches_with_indexable_operator_on_both_columns() -> None:
+    account_id = uuid4()
+    sql = _sql(
+        search_query(
+            "starbux",
+            account_id=account_id,
+            date_from=date(2025, 1, 1),
+            date_to=date(2025, 3, 31),
+            limit=10,
+        )
+    )
+
+    assert (
+        "(transactions.description % 'starbux') "
+        "OR (transactions.custom_description % 'starbux')"
+    ) in sql
+    assert f"transactions.account_id = '{account_id}'" in sql
+    assert "transactions.transaction_date >= '2025-01-01'" in sql
+    assert "transactions.transaction_date <= '2025-03-31'" in sql
+    assert "ORDER BY score DESC" in sql
+    assert "LIMIT 10" in sql
+
+
+def test_search_sets_threshold_and_returns_scores(session: MagicMock) -> None:
+    transaction = Transaction(
+        id=uuid4(),
+        statement_id=uuid4(),
+        account_id=uuid4(),
+        transaction_date=date(2025, 8, 15),
+        amount=Decimal("-4.75"),
+        description="STARBUCKS STORE #1234",
+        transaction_type="debit",
+    )
+    result = MagicMock()
+    result.all.return_value = [MagicMock(Transaction=transaction, score=0.42)]
+    session.execute.side_effect = [MagicMock(), result]
+
+    response = TestClient(app).get(
+        "/api/v1/transactions/search", params={"q": "starbux", "threshold": 0.4}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "starbux"
+    assert body["transactions"][0]["description"] == "STARBUCKS STORE #1234"
+    assert body["transactions"][0]["score"] == 0.42
+    set_threshold = session.execute.await_args_list[0]
+    assert "pg_trgm.similarity_threshold" in str(set_threshold.args[0])
+    assert set_threshold.args[1] == {"threshold": "0.4"}
+
+
+@pytest.mark.parametrize("params", [{"q": "ab"}, {"q": "coffee", "threshold": 0}])
+def test_search_rejects_unindexable_queries(
+    session: MagicMock, params: dict[str, object]
+) -> None:
+    response = TestClient(app).get("/api/v1/transactions/search", params=params)
+
+    assert response.status_code == 422
+    session.execute.assert_not_awaited()
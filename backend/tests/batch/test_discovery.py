@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from services.batch.discovery import discover_inputs
+from services.batch.discovery import pair_inputs
+from services.batch.discovery import pairing_key
+
+
+def test_pairing_key_strips_statement_and_transactions_suffix() -> None:
+    pdf_key = pairing_key(Path("in/2025-04_statement.pdf"))
+    csv_key = pairing_key(Path("in/2025-04-Transactions.csv"))
+
+    assert pdf_key == csv_key == str(Path("in/2025-04"))
+
+
+def test_pair_inputs_groups_by_directory_and_stem() -> None:
+    paths = [
+        Path("a/april_statement.pdf"),
+        Path("a/april_transactions.csv"),
+        Path("b/april_statement.pdf"),
+        Path("a/may.csv"),
+    ]
+
+    inputs = pair_inputs(paths)
+
+    by_key = {item.key: item for item in inputs}
+    assert by_key[str(Path("a/april"))].pdf_path == Path("a/april_statement.pdf")
+    assert by_key[str(Path("a/april"))].csv_path == Path("a/april_transactions.csv")
+    assert by_key[str(Path("b/april"))].csv_path is None
+    assert by_key[str(Path("a/may"))].pdf_path is None
+    assert len(inputs) == 3
+
+
+def test_discover_inputs_accepts_directories_and_globs(tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "june_statement.pdf").write_bytes(b"%PDF")
+    (tmp_path / "nested" / "june_transactions.csv").write_text("Date\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    from_dir = discover_inputs([str(tmp_path)])
+    from_glob = discover_inputs([str(tmp_path / "**" / "*.pdf")])
+
+    assert len(from_dir) == 1
+    assert from_dir[0].csv_path is not None
+    assert len(from_glob) == 1
+    assert from_glob[0].csv_path is None
+
+
+def test_content_hash_changes_with_file_contents(tmp_path: Path) -> None:
+    pdf = tmp_path / "statement.pdf"
+    pdf.write_bytes(b"first")
+    [item] = pair_inputs([pdf])
+    first_hash = item.content_hash()
+
+    pdf.write_bytes(b"second")
+
+    assert item.content_hash() != first_hash
+    assert len(first_hash) == 64
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from services.batch.journal import BatchJournal
+
+
+def test_journal_records_and_reloads_hashes(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+
+    with BatchJournal(path) as journal:
+        journal.record("abc123", key="a/april")
+        assert "abc123" in journal
+
+    reloaded = BatchJournal(path)
+
+    assert "abc123" in reloaded
+    assert "def456" not in reloaded
+    assert len(reloaded) == 1
+
+
+def test_journal_ignores_truncated_lines(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"hash": "abc123"}\n{"hash": "def4')
+
+    journal = BatchJournal(path)
+
+    assert "abc123" in journal
+    assert len(journal) == 1
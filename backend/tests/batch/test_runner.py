@@ -0,0 +1,108 @@
+import io
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from services.batch.discovery import pair_inputs
+from services.batch.journal import BatchJournal
+from services.batch.runner import BatchProgress
+from services.batch.runner import run_batch
+from services.telemetry import FieldMetrics
+from services.telemetry import current_field_metrics
+
+
+def _fake_parse(
+    _account_slug: str, pdf_path: str | None = None, csv_path: str | None = None
+) -> dict[str, Any]:
+    if pdf_path and "broken" in pdf_path:
+        error_msg = "unreadable statement"
+        raise ValueError(error_msg)
+    return {"statement_data": {"id": f"id-{Path(pdf_path or csv_path or '').stem}"}}
+
+
+def _make_inputs(tmp_path: Path) -> list[Any]:
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "good.pdf").write_bytes(b"good")
+    (inbox / "broken.pdf").write_bytes(b"broken")
+    return pair_inputs(list(inbox.iterdir()))
+
+
+@patch("services.batch.runner.parse_statement", side_effect=_fake_parse)
+def test_run_batch_writes_ready_and_error_files(
+    mock_parse: Any, tmp_path: Path
+) -> None:
+    output_dir = tmp_path / "output"
+
+    summary = run_batch("citi_cc", _make_inputs(tmp_path), output_dir, workers=1)
+
+    assert mock_parse.call_count == 2
+    assert summary.succeeded == 1
+    assert summary.failed == 1
+    ready = json.loads((output_dir / "ready" / "id-good.json").read_text())
+    assert ready["statement_data"]["id"] == "id-good"
+    [error_file] = (output_dir / "errors").iterdir()
+    assert "unreadable statement" in json.loads(error_file.read_text())["error"]
+
+
+@patch("services.batch.runner.parse_statement", side_effect=_fake_parse)
+def test_run_batch_resumes_from_journal(mock_parse: Any, tmp_path: Path) -> None:
+    inputs = _make_inputs(tmp_path)
+    output_dir = tmp_path / "output"
+    journal_path = output_dir / "journal.jsonl"
+
+    with BatchJournal(journal_path) as journal:
+        run_batch("citi_cc", inputs, output_dir, journal=journal, workers=1)
+    mock_parse.reset_mock()
+
+    with BatchJournal(journal_path) as journal:
+        summary = run_batch("citi_cc", inputs, output_dir, journal=journal, workers=1)
+
+    # Only the failed input is retried
+    assert summary.skipped == 1
+    assert summary.failed == 1
+    assert mock_parse.call_count == 1
+
+
+@patch("services.batch.runner.parse_statement", side_effect=_fake_parse)
+def test_run_batch_reports_progress(mock_parse: Any, tmp_path: Path) -> None:
+    stream = io.StringIO()
+
+    run_batch(
+        "citi_cc",
+        _make_inputs(tmp_path),
+        tmp_path / "output",
+        workers=1,
+        progress=BatchProgress(total=0, stream=stream, interval=0),
+    )
+
+    assert mock_parse.call_count == 2
+    assert "[2/2] 100.0%" in stream.getvalue()
+    assert "failed=1" in stream.getvalue()
+
+
+def _parse_recording_metrics(
+    _account_slug: str, pdf_path: str | None = None, csv_path: str | None = None
+) -> dict[str, Any]:
+    metrics = current_field_metrics()
+    assert metrics is not None
+    metrics.record_outcome("new_balance", "hit", 3)
+    return _fake_parse(_account_slug, pdf_path, csv_path)
+
+
+@patch("services.batch.runner.parse_statement", side_effect=_parse_recording_metrics)
+def test_run_batch_merges_field_metrics(mock_parse: Any, tmp_path: Path) -> None:
+    field_metrics = FieldMetrics()
+
+    summary = run_batch(
+        "citi_cc",
+        _make_inputs(tmp_path),
+        tmp_path / "output",
+        workers=1,
+        field_metrics=field_metrics,
+    )
+
+    assert mock_parse.call_count == 2
+    assert field_metrics.fields["new_balance"].outcomes["hit"] == 2
+    assert all(outcome.field_metrics is None for outcome in summary.outcomes)
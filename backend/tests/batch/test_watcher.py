@@ -0,0 +1,199 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from services.batch.watcher import IngestDaemon
+from services.batch.watcher import InotifyWatcher
+from services.batch.watcher import PollingWatcher
+
+
+def _fake_parse(
+    _account_slug: str, pdf_path: str | None = None, csv_path: str | None = None
+) -> dict[str, Any]:
+    if pdf_path and "broken" in pdf_path:
+        error_msg = "unreadable statement"
+        raise ValueError(error_msg)
+    return {"pdf": Path(pdf_path).name if pdf_path else None, "csv": csv_path}
+
+
+def _crashing_parse(
+    account_slug: str, pdf_path: str | None = None, csv_path: str | None = None
+) -> dict[str, Any]:
+    if pdf_path and Path(pdf_path).name.startswith("crash"):
+        os._exit(1)
+    # Still being parsed when the other worker dies
+    time.sleep(0.5)
+    return _fake_parse(account_slug, pdf_path, csv_path)
+
+
+def _daemon(tmp_path: Path, settle_seconds: float = 0.0) -> IngestDaemon:
+    return IngestDaemon(
+        "citi_cc",
+        tmp_path / "inbox",
+        tmp_path / "output",
+        settle_seconds=settle_seconds,
+        watcher=PollingWatcher(interval=0),
+    )
+
+
+@patch("services.batch.watcher.parse_statement", side_effect=_fake_parse)
+def test_daemon_moves_pairs_into_ready_with_result(
+    mock_parse: Any, tmp_path: Path
+) -> None:
+    daemon = _daemon(tmp_path)
+    (daemon.inbox / "april_statement.pdf").write_bytes(b"%PDF")
+    (daemon.inbox / "april_transactions.csv").write_text("Date\n")
+
+    daemon.poll_once()
+
+    assert mock_parse.call_count == 1
+    assert list(daemon.inbox.iterdir()) == []
+    [job_dir] = daemon.ready_dir.iterdir()
+    assert sorted(p.name for p in job_dir.iterdir()) == [
+        "april_statement.pdf",
+        "april_transactions.csv",
+        "result.json",
+    ]
+    result = json.loads((job_dir / "result.json").read_text())
+    assert result["pdf"] == "april_statement.pdf"
+    assert list(daemon.processing_dir.iterdir()) == []
+
+
+@patch("services.batch.watcher.parse_statement", side_effect=_fake_parse)
+def test_daemon_moves_failures_into_errors(mock_parse: Any, tmp_path: Path) -> None:
+    daemon = _daemon(tmp_path)
+    (daemon.inbox / "broken.pdf").write_bytes(b"junk")
+
+    daemon.poll_once()
+
+    [job_dir] = daemon.errors_dir.iterdir()
+    result = json.loads((job_dir / "result.json").read_text())
+    assert "unreadable statement" in result["error"]
+    assert daemon.failed == 1
+    mock_parse.assert_called_once()
+
+
+@patch("services.batch.watcher.parse_statement", side_effect=_fake_parse)
+def test_daemon_waits_for_files_to_settle(mock_parse: Any, tmp_path: Path) -> None:
+    daemon = _daemon(tmp_path, settle_seconds=60)
+    (daemon.inbox / "partial.pdf").write_bytes(b"%PDF")
+    (daemon.inbox / ".partial.pdf.tmp").write_bytes(b"%PDF")
+
+    daemon.poll_once()
+
+    mock_parse.assert_not_called()
+    assert (daemon.inbox / "partial.pdf").exists()
+
+
+@patch("services.batch.watcher.parse_statement", side_effect=_fake_parse)
+def test_daemon_respects_in_flight_limit(mock_parse: Any, tmp_path: Path) -> None:
+    daemon = _daemon(tmp_path)
+    daemon.max_in_flight = 0
+    (daemon.inbox / "queued.pdf").write_bytes(b"%PDF")
+
+    daemon.poll_once()
+
+    mock_parse.assert_not_called()
+    assert (daemon.inbox / "queued.pdf").exists()
+
+
+@patch("services.batch.watcher.parse_statement", side_effect=_fake_parse)
+def test_jobs_left_in_processing_are_parsed_again(
+    mock_parse: Any, tmp_path: Path
+) -> None:
+    daemon = _daemon(tmp_path)
+    job_dir = daemon.processing_dir / "abc123"
+    job_dir.mkdir()
+    (job_dir / "april_statement.pdf").write_bytes(b"%PDF")
+    (daemon.processing_dir / "never_filled").mkdir()
+
+    assert daemon.recover() == 1
+    daemon.poll_once()
+
+    mock_parse.assert_called_once()
+    assert list(daemon.processing_dir.iterdir()) == []
+    assert (daemon.ready_dir / "abc123" / "result.json").exists()
+    assert daemon.succeeded == 1
+
+
+def test_a_job_that_keeps_crashing_is_moved_to_errors(tmp_path: Path) -> None:
+    crashed: Future[Any] = Future()
+    crashed.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+    with patch("services.batch.watcher.ProcessPoolExecutor") as executor:
+        executor.return_value.submit.return_value = crashed
+        daemon = IngestDaemon(
+            "citi_cc",
+            tmp_path / "inbox",
+            tmp_path / "output",
+            workers=2,
+            settle_seconds=0.0,
+            watcher=PollingWatcher(interval=0),
+        )
+        (daemon.inbox / "april_statement.pdf").write_bytes(b"%PDF")
+
+        daemon.poll_once()
+        # Parsed again alone after the first crash, then given up on
+        daemon.poll_once()
+        assert executor.return_value.submit.call_count == 2
+        daemon.poll_once()
+
+    [job_dir] = daemon.errors_dir.iterdir()
+    result = json.loads((job_dir / "result.json").read_text())
+    assert result["error"].startswith("BrokenProcessPool")
+    assert (job_dir / "april_statement.pdf").exists()
+    assert list(daemon.processing_dir.iterdir()) == []
+    assert daemon.failed == 1
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="workers inherit the patch by fork"
+)
+def test_only_the_job_that_crashes_its_worker_goes_to_errors(tmp_path: Path) -> None:
+    with (
+        patch("services.batch.watcher.parse_statement", new=_crashing_parse),
+        IngestDaemon(
+            "citi_cc",
+            tmp_path / "inbox",
+            tmp_path / "output",
+            workers=2,
+            settle_seconds=0.0,
+            watcher=PollingWatcher(interval=0),
+        ) as daemon,
+    ):
+        (daemon.inbox / "april_statement.pdf").write_bytes(b"%PDF")
+        (daemon.inbox / "crash_statement.pdf").write_bytes(b"%PDF")
+
+        deadline = time.monotonic() + 30
+        while daemon.succeeded + daemon.failed < 2 and time.monotonic() < deadline:
+            daemon.poll_once()
+            time.sleep(0.05)
+
+    [ready] = daemon.ready_dir.iterdir()
+    assert (ready / "april_statement.pdf").exists()
+    [failed] = daemon.errors_dir.iterdir()
+    assert (failed / "crash_statement.pdf").exists()
+    result = json.loads((failed / "result.json").read_text())
+    assert result["error"].startswith("BrokenProcessPool")
+    assert list(daemon.processing_dir.iterdir()) == []
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+def test_inotify_watcher_reports_new_files(tmp_path: Path) -> None:
+    watcher = InotifyWatcher(tmp_path)
+    try:
+        (tmp_path / "new.pdf").write_bytes(b"%PDF")
+        changes = watcher.changes(timeout=1.0)
+    finally:
+        watcher.close()
+
+    assert changes == {"new.pdf"}
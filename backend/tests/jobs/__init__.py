@@ -0,0 +1 @@
+"""Parse job tests."""
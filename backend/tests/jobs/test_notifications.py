@@ -0,0 +1,87 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from services.jobs import JOBS_CHANNEL
+from services.jobs import STATUS_CHANNEL
+from services.jobs import NotificationListener
+from services.jobs import StatusBroker
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # Subscribers wait on asyncio queues
+    return "asyncio"
+
+
+def _payload(statement_id: object, status: str) -> str:
+    return json.dumps({"statement_id": str(statement_id), "status": status})
+
+
+def test_listener_dispatches_to_the_channel_handlers() -> None:
+    listener = NotificationListener("postgresql://localhost/ledgerly")
+    wake, publish = MagicMock(), MagicMock()
+    listener.add_handler(JOBS_CHANNEL, wake)
+    listener.add_handler(STATUS_CHANNEL, publish)
+
+    listener.dispatch(JOBS_CHANNEL, "job-1")
+
+    wake.assert_called_once_with("job-1")
+    publish.assert_not_called()
+    assert listener.stats() == {
+        "connected": False,
+        "channels": [JOBS_CHANNEL, STATUS_CHANNEL],
+        "received": 1,
+        "reconnects": 0,
+    }
+
+
+def test_failing_handler_does_not_stop_the_others() -> None:
+    listener = NotificationListener("postgresql://localhost/ledgerly")
+    second = MagicMock()
+    listener.add_handler(JOBS_CHANNEL, MagicMock(side_effect=RuntimeError("boom")))
+    listener.add_handler(JOBS_CHANNEL, second)
+
+    listener.dispatch(JOBS_CHANNEL, "job-1")
+
+    second.assert_called_once_with("job-1")
+
+
+@pytest.mark.anyio
+async def test_status_reaches_only_subscribers_of_that_statement() -> None:
+    broker = StatusBroker()
+    watched, other = uuid4(), uuid4()
+
+    with broker.subscribe(watched) as events:
+        broker.publish(_payload(other, "processing"))
+        broker.publish(_payload(watched, "completed"))
+
+        event = await asyncio.wait_for(events.get(), 1)
+        assert event == {"statement_id": str(watched), "status": "completed"}
+        assert events.empty()
+        assert broker.stats() == {"statements": 1, "subscribers": 1, "delivered": 1}
+
+    assert broker.stats()["subscribers"] == 0
+
+
+@pytest.mark.anyio
+async def test_resync_asks_every_subscriber_to_read_again() -> None:
+    broker = StatusBroker()
+
+    with broker.subscribe(uuid4()) as first, broker.subscribe(uuid4()) as second:
+        broker.resync()
+
+        assert first.get_nowait() is None
+        assert second.get_nowait() is None
+
+
+def test_malformed_status_notification_is_ignored() -> None:
+    broker = StatusBroker()
+
+    broker.publish("not json")
+    broker.publish(json.dumps({"status": "completed"}))
+
+    assert broker.delivered == 0
@@ -0,0 +1,163 @@
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.jobs import ClaimedJob
+from services.jobs import LeaseLostError
+from services.jobs import claim_job
+from services.jobs import complete_job
+from services.jobs import fail_job
+from services.jobs import requeue_expired
+from services.jobs import retry_delay
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _job(attempts: int = 1, max_attempts: int = 5) -> ClaimedJob:
+    return ClaimedJob(
+        id=uuid4(),
+        statement_id=uuid4(),
+        worker_id="host:1:abc",
+        attempts=attempts,
+        max_attempts=max_attempts,
+        account_slug="citi_cc",
+        pdf_path="data/uploads/a.pdf",
+        csv_path=None,
+    )
+
+
+def _result(**values: Any) -> MagicMock:
+    result = MagicMock()
+    for name, value in values.items():
+        getattr(result, name).return_value = value
+    return result
+
+
+@pytest.mark.anyio
+async def test_claim_skips_rows_locked_by_other_workers() -> None:
+    job_id, statement_id = uuid4(), uuid4()
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                one_or_none=MagicMock(
+                    id=job_id, statement_id=statement_id, attempts=2, max_attempts=5
+                )
+            ),
+            _result(one=("citi_cc", "data/uploads/a.pdf", None)),
+        ]
+    )
+
+    job = await claim_job(session, "host:1:abc", lease_seconds=30)
+
+    assert job == ClaimedJob(
+        id=job_id,
+        statement_id=statement_id,
+        worker_id="host:1:abc",
+        attempts=2,
+        max_attempts=5,
+        account_slug="citi_cc",
+        pdf_path="data/uploads/a.pdf",
+        csv_path=None,
+    )
+    claim, mark_processing = (c.args[0] for c in session.execute.await_args_list)
+    sql = _sql(claim)
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "parse_jobs.status = %(status_1)s" in sql
+    assert "ORDER BY parse_jobs.run_after" in sql
+    assert "attempts=(parse_jobs.attempts + " in sql
+    assert "UPDATE statements" in _sql(mark_processing)
+
+
+@pytest.mark.anyio
+async def test_claim_on_empty_queue_returns_none() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result(one_or_none=None))
+
+    assert await claim_job(session, "host:1:abc") is None
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_completion_is_fenced_on_the_lease() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result(scalar_one_or_none=None))
+
+    with pytest.raises(LeaseLostError):
+        await complete_job(session, _job())
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert "parse_jobs.locked_by = %(locked_by_1)s" in sql
+
+
+@pytest.mark.anyio
+async def test_failure_with_attempts_left_is_retried_later() -> None:
+    job = _job(attempts=2)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result(scalar_one_or_none=job.id))
+
+    status = await fail_job(session, job, "OSError: disk full")
+
+    assert status == "queued"
+    fail, statement = (c.args[0] for c in session.execute.await_args_list)
+    assert "run_after=(now() + %(now_1)s)" in _sql(fail)
+    assert statement.compile().params["status"] == "pending"
+
+
+@pytest.mark.parametrize(
+    ("job", "retry"), [(_job(attempts=5), True), (_job(attempts=1), False)]
+)
+@pytest.mark.anyio
+async def test_exhausted_or_permanent_failure_is_dead_lettered(
+    job: ClaimedJob, *, retry: bool
+) -> None:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result(scalar_one_or_none=job.id))
+
+    status = await fail_job(session, job, "ValueError: bad", retry=retry)
+
+    assert status == "dead"
+    fail, statement = (c.args[0] for c in session.execute.await_args_list)
+    assert fail.compile().params["status"] == "dead"
+    assert statement.compile().params["status"] == "failed"
+    assert "processing_metadata || " in _sql(statement)
+
+
+@pytest.mark.anyio
+async def test_expired_leases_are_requeued_or_dead_lettered() -> None:
+    queued, dead = uuid4(), uuid4()
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                all=[
+                    (queued, "queued", "Lease expired on worker a"),
+                    (dead, "dead", "Lease expired on worker b"),
+                ]
+            ),
+            MagicMock(),
+            MagicMock(),
+        ]
+    )
+
+    assert await requeue_expired(session) == 2
+
+    reclaim, requeue, fail = (c.args[0] for c in session.execute.await_args_list)
+    sql = _sql(reclaim)
+    assert "parse_jobs.lease_expires_at < now()" in sql
+    assert "CASE WHEN (parse_jobs.attempts >= parse_jobs.max_attempts)" in sql
+    assert requeue.compile().params["status"] == "pending"
+    assert fail.compile().params["status"] == "failed"
+
+
+@pytest.mark.parametrize(("attempts", "ceiling"), [(1, 5.0), (3, 20.0), (20, 600.0)])
+def test_retry_delay_backs_off_exponentially(attempts: int, ceiling: float) -> None:
+    delays = [retry_delay(attempts) for _ in range(50)]
+
+    assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
@@ -0,0 +1,188 @@
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from services.jobs import ClaimedJob
+from services.jobs import LeaseLostError
+from services.jobs import ParseJobWorker
+from services.parsers.dispatch_parser import parse_statement
+from services.persistence import PersistedStatement
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # The worker schedules jobs and heartbeats as asyncio tasks
+    return "asyncio"
+
+
+@pytest.fixture
+def session_maker() -> MagicMock:
+    session = MagicMock()
+    session.begin.return_value.__aenter__ = AsyncMock()
+    session.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+    maker = MagicMock()
+    maker.return_value.__aenter__ = AsyncMock(return_value=session)
+    maker.return_value.__aexit__ = AsyncMock(return_value=None)
+    return maker
+
+
+@pytest.fixture
+def queue() -> Iterator[MagicMock]:
+    with (
+        patch("services.jobs.worker.claim_job", AsyncMock()) as claim,
+        patch("services.jobs.worker.complete_job", AsyncMock()) as complete,
+        patch("services.jobs.worker.fail_job", AsyncMock()) as fail,
+        patch("services.jobs.worker.requeue_expired", AsyncMock(return_value=0)),
+        patch(
+            "services.jobs.worker.complete_statement",
+            AsyncMock(return_value=PersistedStatement(uuid4(), 3, 0.1)),
+        ) as complete_statement,
+    ):
+        yield MagicMock(
+            claim=claim,
+            complete=complete,
+            fail=fail,
+            complete_statement=complete_statement,
+        )
+
+
+def _job() -> ClaimedJob:
+    return ClaimedJob(
+        id=uuid4(),
+        statement_id=uuid4(),
+        worker_id="host:1:abc",
+        attempts=1,
+        max_attempts=5,
+        account_slug="citi_cc",
+        pdf_path="data/uploads/a.pdf",
+        csv_path=None,
+    )
+
+
+def _worker(session_maker: MagicMock, submit: AsyncMock) -> ParseJobWorker:
+    parser_pool = MagicMock(workers=2)
+    parser_pool.submit = submit
+    return ParseJobWorker(
+        session_maker, parser_pool, worker_id="host:1:abc", poll_interval=0.01
+    )
+
+
+@pytest.mark.anyio
+async def test_parsed_job_completes_with_its_statement(
+    session_maker: MagicMock, queue: MagicMock
+) -> None:
+    job = _job()
+    results: dict[str, Any] = {"statement_data": {}}
+    submit = AsyncMock(return_value=results)
+    worker = _worker(session_maker, submit)
+
+    await worker.process(job)
+
+    submit.assert_awaited_once_with(
+        parse_statement,
+        "citi_cc",
+        pdf_path="data/uploads/a.pdf",
+        csv_path=None,
+        storage=None,
+    )
+    queue.complete.assert_awaited_once()
+    completed = queue.complete_statement.await_args
+    assert completed is not None
+    assert completed.args[1:] == (job.statement_id, results)
+    queue.fail.assert_not_awaited()
+    assert worker.stats()["succeeded"] == 1
+
+
+@pytest.mark.parametrize(
+    ("error", "retry"),
+    [
+        (OSError("worker crashed"), True),
+        (NotImplementedError("No PDF parser implemented"), False),
+    ],
+)
+@pytest.mark.anyio
+async def test_failures_are_retried_unless_permanent(
+    session_maker: MagicMock, queue: MagicMock, error: Exception, *, retry: bool
+) -> None:
+    job = _job()
+    queue.fail.return_value = "queued" if retry else "dead"
+    worker = _worker(session_maker, AsyncMock(side_effect=error))
+
+    await worker.process(job)
+
+    failed = queue.fail.await_args
+    assert failed is not None
+    assert failed.args[1:] == (job, f"{type(error).__name__}: {error}")
+    assert failed.kwargs == {"retry": retry}
+    queue.complete_statement.assert_not_awaited()
+    assert worker.stats()["retried" if retry else "dead"] == 1
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ValueError("Statement for this account and period already exists"),
+        ConnectionResetError("connection was closed"),
+    ],
+)
+@pytest.mark.anyio
+async def test_storage_failures_are_always_retried(
+    session_maker: MagicMock, queue: MagicMock, error: Exception
+) -> None:
+    job = _job()
+    queue.complete_statement.side_effect = error
+    queue.fail.return_value = "queued"
+    worker = _worker(session_maker, AsyncMock(return_value={}))
+
+    await worker.process(job)
+
+    failed = queue.fail.await_args
+    assert failed is not None
+    assert failed.kwargs == {"retry": True}
+    assert worker.stats()["retried"] == 1
+
+
+@pytest.mark.anyio
+async def test_result_is_discarded_after_losing_the_lease(
+    session_maker: MagicMock, queue: MagicMock
+) -> None:
+    queue.complete.side_effect = LeaseLostError("lost")
+    worker = _worker(session_maker, AsyncMock(return_value={}))
+
+    await worker.process(_job())
+
+    queue.complete_statement.assert_not_awaited()
+    queue.fail.assert_not_awaited()
+    assert worker.stats()["lost_leases"] == 1
+
+
+@pytest.mark.anyio
+async def test_run_claims_until_the_queue_is_empty(
+    session_maker: MagicMock, queue: MagicMock
+) -> None:
+    jobs = [_job(), _job(), _job()]
+    pending = iter(jobs)
+    queue.claim.side_effect = lambda *_, **__: next(pending, None)
+    worker = _worker(session_maker, AsyncMock(return_value={}))
+    drained = asyncio.Event()
+
+    def completed(*_: Any) -> None:
+        if queue.complete.await_count == len(jobs):
+            drained.set()
+
+    queue.complete.side_effect = completed
+    runner = asyncio.create_task(worker.run())
+    await asyncio.wait_for(drained.wait(), 5)
+    worker.stop()
+    await runner
+
+    stats = worker.stats()
+    assert stats["claimed"] == 3
+    assert stats["in_flight"] == 0
+    assert queue.complete.await_count == 3
@@ -0,0 +1 @@
+"""Output writer tests."""
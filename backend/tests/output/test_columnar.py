@@ -0,0 +1,110 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+from services.output.columnar import ColumnarExporter  # noqa: E402
+from services.output.columnar import statement_table  # noqa: E402
+from services.output.columnar import transactions_table  # noqa: E402
+
+
+ACCOUNT_ID = uuid4()
+
+
+def _transaction(statement_id: UUID, day: date, amount: float) -> dict[str, object]:
+    return {
+        "id": uuid4(),
+        "statement_id": statement_id,
+        "account_id": ACCOUNT_ID,
+        "date": day,
+        "amount": amount,
+        "description": "COFFEE SHOP",
+        "custom_description": None,
+        "category": "dining",
+        "type": "debit" if amount < 0 else "credit",
+    }
+
+
+@pytest.fixture
+def results() -> dict[str, object]:
+    statement_id = uuid4()
+    return {
+        "statement_data": {
+            "id": statement_id,
+            "account_id": ACCOUNT_ID,
+            "institution_id": uuid4(),
+            "period_start": date(2025, 3, 28),
+            "period_end": date(2025, 4, 27),
+            "uploaded_at": "2025-04-30T12:00:00+00:00",
+        },
+        "statement_details": {"previous_balance": 100.0, "new_balance": 85.1},
+        "debt_details": {"min_payment_due": 25.0, "interest_rate": 0.2399},
+        "credit_card_details": {"credit_limit": 5000.0, "points_earned": 120},
+        "transactions": [
+            _transaction(statement_id, date(2025, 3, 30), -14.9),
+            _transaction(statement_id, date(2025, 4, 2), 0.1),
+        ],
+    }
+
+
+def test_transactions_table_is_typed(results: dict[str, object]) -> None:
+    table = transactions_table(results)
+
+    assert table.schema.field("amount").type == pa.decimal128(12, 2)
+    assert table.schema.field("transaction_date").type == pa.date32()
+    assert table.column("amount").to_pylist() == [Decimal("-14.90"), Decimal("0.10")]
+    assert table.column("month").to_pylist() == ["2025-03", "2025-04"]
+
+
+def test_statement_table_has_one_summary_row(results: dict[str, object]) -> None:
+    row = statement_table(results).to_pylist()[0]
+
+    assert row["new_balance"] == Decimal("85.10")
+    assert row["points_earned"] == 120
+    assert row["transaction_count"] == 2
+    assert row["month"] == "2025-04"
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+def test_export_writes_partitioned_datasets(
+    results: dict[str, object], tmp_path: Path, output_format: str
+) -> None:
+    exporter = ColumnarExporter(tmp_path, output_format)
+
+    written = exporter.export(results)
+
+    assert len(written) == 3
+    assert all(path.exists() for path in written)
+    partitions = {path.parent.relative_to(tmp_path).as_posix() for path in written}
+    assert f"transactions/account_id={ACCOUNT_ID}/month=2025-03" in partitions
+    assert f"statements/account_id={ACCOUNT_ID}/month=2025-04" in partitions
+
+    dataset_format = "ipc" if output_format == "arrow" else "parquet"
+    dataset = ds.dataset(
+        tmp_path / "transactions", format=dataset_format, partitioning="hive"
+    )
+    april = dataset.to_table(filter=ds.field("month") == "2025-04")
+    assert april.column("amount").to_pylist() == [Decimal("0.10")]
+
+
+def test_export_overwrites_same_statement(
+    results: dict[str, object], tmp_path: Path
+) -> None:
+    exporter = ColumnarExporter(tmp_path)
+
+    first = exporter.export(results)
+    second = exporter.export(results)
+
+    assert sorted(first) == sorted(second)
+
+
+def test_rejects_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported columnar format"):
+        ColumnarExporter(tmp_path, "orc")
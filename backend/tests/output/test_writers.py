@@ -0,0 +1,95 @@
+import json
+import logging
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from services.output import JsonWriter
+from services.output import LazyJson
+from services.output import NdjsonWriter
+from services.output import dumps
+from services.output import get_writer
+
+
+@pytest.fixture
+def results() -> dict[str, object]:
+    statement_id = uuid4()
+    return {
+        "statement_data": {"id": statement_id, "period_end": date(2025, 6, 30)},
+        "transactions": [
+            {"id": uuid4(), "amount": Decimal("-12.30"), "date": date(2025, 6, 5)},
+            {"id": uuid4(), "amount": Decimal("45.00"), "date": date(2025, 6, 7)},
+        ],
+    }
+
+
+def test_dumps_uses_typed_encoders() -> None:
+    statement_id = uuid4()
+    payload = {"id": statement_id, "due": date(2025, 6, 30), "fee": Decimal("1.10")}
+
+    decoded = json.loads(dumps(payload))
+
+    assert decoded == {"id": str(statement_id), "due": "2025-06-30", "fee": "1.10"}
+
+
+def test_dumps_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_json_writer_writes_compact_document(
+    tmp_path: Path, results: dict[str, object]
+) -> None:
+    path = JsonWriter().write(results, tmp_path, "statement")
+
+    assert path == tmp_path / "statement.json"
+    assert b"\n" not in path.read_bytes()
+    assert json.loads(path.read_bytes())["transactions"][0]["amount"] == "-12.30"
+    assert [p.name for p in tmp_path.iterdir()] == ["statement.json"]
+
+
+def test_ndjson_writer_streams_one_line_per_transaction(
+    tmp_path: Path, results: dict[str, object]
+) -> None:
+    path = NdjsonWriter().write(results, tmp_path, "statement")
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["record"] for r in records] == ["statement", "transaction", "transaction"]
+    assert "transactions" not in records[0]
+    assert records[2]["date"] == "2025-06-07"
+
+
+def test_zstd_compression(tmp_path: Path, results: dict[str, object]) -> None:
+    zstandard = pytest.importorskip("zstandard")
+
+    path = get_writer("ndjson", "zstd").write(results, tmp_path, "statement")
+
+    assert path.name == "statement.ndjson.zst"
+    with path.open("rb") as f:
+        content = zstandard.ZstdDecompressor().stream_reader(f).read()
+    assert len(content.splitlines()) == 3
+
+
+def test_get_writer_rejects_unknown_format_and_codec() -> None:
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        get_writer("xml")
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        get_writer("json", "lz4")
+
+
+def test_lazy_json_only_serializes_when_emitted(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    class Exploding:
+        pass
+
+    lazy = LazyJson({"value": Exploding()})
+    logger = logging.getLogger("tests.lazy_json")
+
+    with caplog.at_level(logging.INFO, logger="tests.lazy_json"):
+        logger.debug("contents: %s", lazy)
+
+    assert caplog.records == []
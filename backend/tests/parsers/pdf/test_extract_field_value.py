@@ -1,3 +1,7 @@
+import pytest
+
+from services.parsers.parser_config_loader import DEFAULT_MAX_LINE_LENGTH
+from services.parsers.parser_config_loader import ParserConfigError
 from services.parsers.pdf.parse_citi_cc_pdf import extract_field_value
 
 
@@ -165,3 +169,62 @@ def test_extract_field_value_unknown_transform_skips_safely() -> None:
     )
 
     assert result == 123.45  # skips transform and casts raw
+
+
+def test_extract_field_value_truncates_long_lines() -> None:
+    lines = ["Fees " + " " * 600 + "$12.00"]
+
+    result = extract_field_value(
+        lines=lines,
+        label_patterns=[r"Fees"],
+        value_pattern=r"\$[\d,.]+",
+        data_type="float",
+        field_name="fees",
+        max_line_length=500,
+    )
+
+    assert result is None
+
+
+def test_extract_field_value_gives_up_after_time_budget() -> None:
+    lines = ["filler"] * 10 + ["Fees $12.00"]
+
+    result = extract_field_value(
+        lines=lines,
+        label_patterns=[r"Fees"],
+        value_pattern=r"\$[\d,.]+",
+        data_type="float",
+        field_name="fees",
+        time_budget=1e-9,
+    )
+
+    assert result is None
+
+
+def test_extract_field_value_always_caps_line_length() -> None:
+    lines = ["Fees " + " " * DEFAULT_MAX_LINE_LENGTH + "$12.00"]
+
+    result = extract_field_value(
+        lines=lines,
+        label_patterns=[r"Fees"],
+        value_pattern=r"\$[\d,.]+",
+        data_type="float",
+        field_name="fees",
+    )
+
+    assert result is None
+
+
+def test_extract_field_value_refuses_catastrophic_patterns() -> None:
+    # Would run for ages on this line; the time budget cannot stop it
+    lines = ["Fees " + "1" * 40 + "!"]
+
+    with pytest.raises(ParserConfigError, match="nested quantifiers"):
+        extract_field_value(
+            lines=lines,
+            label_patterns=[r"Fees"],
+            value_pattern=r"(\d+)+$",
+            data_type="float",
+            field_name="fees",
+            time_budget=0.05,
+        )
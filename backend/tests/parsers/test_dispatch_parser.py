@@ -1,4 +1,6 @@
+import io
 from typing import Any
+from unittest.mock import MagicMock
 from unittest.mock import mock_open
 from unittest.mock import patch
 from uuid import uuid4
@@ -58,3 +60,15 @@ def test_parse_csv_unknown_slug_raises() -> None:
 def test_parse_csv_missing_file_raises() -> None:
     with pytest.raises(FileNotFoundError):
         parse_csv("citi_cc", "missing.csv", uuid4())
+
+
+@patch("services.parsers.dispatch_parser.parse_citi_cc_csv")
+def test_parse_csv_reads_from_the_storage_backend(mock_csv_parser: Any) -> None:
+    storage = MagicMock()
+    storage.open.return_value = io.BytesIO(b"date,amount\n")
+    mock_csv_parser.side_effect = lambda f, *_: [{"header": f.readline()}]
+
+    result = parse_csv("citi_cc", "s3://statements/a.csv", uuid4(), storage)
+
+    storage.open.assert_called_once_with("s3://statements/a.csv")
+    assert result == [{"header": "date,amount\n"}]
@@ -1,3 +1,4 @@
+import os
 import types
 from pathlib import Path
 
@@ -59,3 +60,75 @@ def test_load_parser_config_invalid_yaml(
 
     with pytest.raises((ValueError, FileNotFoundError, yaml.YAMLError)):
         parser_config_loader.load_parser_config("bad_config")
+
+
+def _write_config(tmp_path: Path, body: str) -> None:
+    config_dir = tmp_path / "pdf" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "unsafe_config.yaml").write_text(body)
+
+
+def test_load_parser_config_rejects_catastrophic_pattern(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_config(
+        tmp_path,
+        """account_summary_fields:
+  - name: fees
+    label_patterns: ['Fees']
+    value_pattern: '(\\d+)+\\.\\d{2}'
+""",
+    )
+    monkeypatch.setattr(parser_config_loader, "__file__", str(tmp_path / "x.py"))
+
+    with pytest.raises(parser_config_loader.ParserConfigError, match="fees"):
+        parser_config_loader.load_parser_config("unsafe")
+
+    # The fuzz harness can still load it for inspection
+    config = parser_config_loader.load_parser_config("unsafe", validate=False)
+    assert parser_config_loader.config_patterns(config) == [
+        ("fees", "Fees"),
+        ("fees", r"(\d+)+\.\d{2}"),
+    ]
+
+
+def test_validate_parser_config_warns_on_polynomial_pattern() -> None:
+    config = {
+        "account_summary_fields": [
+            {"name": "fees", "label_patterns": [r"\w+\s*\w+:"], "value_pattern": "x"}
+        ]
+    }
+
+    warnings = parser_config_loader.validate_parser_config(config, "test")
+
+    assert [issue.pattern for issue in warnings] == [r"\w+\s*\w+:"]
+
+
+def test_validate_parser_config_rejects_invalid_limits() -> None:
+    config = {"matching": {"max_line_length": 0}}
+
+    with pytest.raises(parser_config_loader.ParserConfigError, match="max_line_length"):
+        parser_config_loader.validate_parser_config(config, "test")
+
+
+def test_shipped_configs_are_safe() -> None:
+    for config_name in parser_config_loader.available_parser_configs():
+        parser_config_loader.load_parser_config(config_name)
+
+
+def test_load_parser_config_is_cached_until_the_file_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_config(tmp_path, "matching: {max_line_length: 100}\n")
+    monkeypatch.setattr(parser_config_loader, "__file__", str(tmp_path / "x.py"))
+
+    first = parser_config_loader.load_parser_config("unsafe")
+    assert parser_config_loader.load_parser_config("unsafe") is first
+
+    config_file = tmp_path / "pdf" / "config" / "unsafe_config.yaml"
+    config_file.write_text("matching: {max_line_length: 200}\n")
+    mtime_ns = config_file.stat().st_mtime_ns + 1_000_000
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+    reloaded = parser_config_loader.load_parser_config("unsafe")
+    assert reloaded["matching"]["max_line_length"] == 200
@@ -0,0 +1,61 @@
+import pytest
+
+from services.parsers.regex_safety import ERROR
+from services.parsers.regex_safety import WARNING
+from services.parsers.regex_safety import analyze_pattern
+from services.parsers.regex_safety import fuzz_pattern
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(\d+)+x",
+        r"(?:\s*\w+)+:",
+        r"(.*,)*x",
+        r"(?:\d|\d\d)+x",
+        r"(?:\d\d|\w\w)+!",
+        r"\d*\d*\d*\d*\d*x",
+        r"(.*a){12}",
+        r"(\d{1,3})+x",
+        r"(\d{1,3},?)*x",
+        "(",
+    ],
+)
+def test_unsafe_patterns_are_errors(pattern: str) -> None:
+    assert any(issue.severity == ERROR for issue in analyze_pattern(pattern))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"\$[\d,]+\.\d{2}",
+        r"(?i)^payments?\b",
+        r"(?<=-)\d{2}/\d{2}/\d{2,4}",
+        r"\$[\d,]+(?:\.\d{2})?",
+        r"(?:[a-z]|\w)+!",
+        r"(?>\d+)+x",
+        r".*total.*",
+        r"\$?(\d{1,3},)*\d+\.\d{2}",
+    ],
+)
+def test_safe_patterns_have_no_issues(pattern: str) -> None:
+    assert analyze_pattern(pattern) == ()
+
+
+@pytest.mark.parametrize("pattern", [r"\d+\d*x", r"(.*,){2}x", r"(x)\1"])
+def test_suspicious_patterns_are_warnings(pattern: str) -> None:
+    assert [issue.severity for issue in analyze_pattern(pattern)] == [WARNING]
+
+
+def test_fuzz_finds_slow_input_for_exponential_pattern() -> None:
+    result = fuzz_pattern(r"(\d+)+x", max_length=60, threshold=0.005, seed=1)
+
+    assert result.slow
+    assert result.slowest_input.rstrip("!\n\xa0x").isdigit()
+
+
+def test_fuzz_reports_linear_pattern_as_fast() -> None:
+    result = fuzz_pattern(r"\$[\d,]+\.\d{2}", iterations=300, threshold=0.05, seed=1)
+
+    assert not result.slow
+    assert result.attempts > 300
@@ -0,0 +1,92 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator
+
+import pytest
+
+from services.parsers.worker_pool import ParserPool
+from services.parsers.worker_pool import warm_worker
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # The pool awaits executor futures through asyncio, as the app does
+    return "asyncio"
+
+
+@pytest.fixture
+async def pool() -> AsyncIterator[ParserPool]:
+    pool = ParserPool(1, max_jobs_per_worker=3)
+    await pool.start()
+    yield pool
+    await pool.shutdown()
+
+
+def test_warm_worker_loads_every_parser_config() -> None:
+    warm_worker()
+
+
+@pytest.mark.anyio
+async def test_jobs_run_in_a_worker_process(pool: ParserPool) -> None:
+    assert await pool.submit(os.getpid) != os.getpid()
+    assert await pool.submit(divmod, 17, 5) == (3, 2)
+
+    stats = pool.stats()
+    assert stats["running"] is True
+    assert stats["completed"] == 2
+    assert stats["busy_workers"] == 0
+    assert stats["queue_depth"] == 0
+    assert 0.0 < stats["utilization"] <= 1.0
+
+
+@pytest.mark.anyio
+async def test_worker_errors_reach_the_caller(pool: ParserPool) -> None:
+    with pytest.raises(ValueError, match="invalid literal"):
+        await pool.submit(int, "not a number")
+
+    assert pool.stats()["failed"] == 1
+
+
+@pytest.mark.anyio
+async def test_workers_are_recycled_after_their_job_limit(pool: ParserPool) -> None:
+    pids = [await pool.submit(os.getpid) for _ in range(4)]
+
+    # Three jobs per executor, then a fresh worker takes over
+    assert pids[0] == pids[1] == pids[2] != pids[3]
+    assert pool.stats()["recycles"] == 1
+
+
+@pytest.mark.anyio
+async def test_recycling_with_a_backlog_runs_every_job() -> None:
+    pool = ParserPool(1, max_jobs_per_worker=2)
+    await pool.start()
+    try:
+        pids = await asyncio.wait_for(
+            asyncio.gather(*(pool.submit(os.getpid) for _ in range(7))), 60
+        )
+    finally:
+        await pool.shutdown()
+
+    assert len(pids) == 7
+    assert len(set(pids)) == 4
+    assert pool.stats()["recycles"] == 3
+
+
+@pytest.mark.anyio
+async def test_jobs_beyond_the_worker_count_are_reported_as_queued(
+    pool: ParserPool,
+) -> None:
+    jobs = [asyncio.ensure_future(pool.submit(os.getpid)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    stats = pool.stats()
+    assert stats["busy_workers"] == 1
+    assert stats["queue_depth"] == 2
+    await asyncio.gather(*jobs)
+    assert pool.stats()["queue_depth"] == 0
+
+
+@pytest.mark.anyio
+async def test_submit_requires_a_started_pool() -> None:
+    with pytest.raises(RuntimeError, match="not running"):
+        await ParserPool(1).submit(os.getpid)
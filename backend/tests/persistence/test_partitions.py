@@ -0,0 +1,62 @@
+from datetime import date
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from models.orm import Transaction
+from services.persistence.partitions import add_months
+from services.persistence.partitions import ensure_transaction_partitions
+from services.persistence.partitions import partition_month
+
+
+def test_transactions_table_is_range_partitioned() -> None:
+    ddl = str(CreateTable(Transaction.__table__).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY RANGE (transaction_date)" in ddl
+    assert "PRIMARY KEY (transaction_date, id)" in ddl
+
+
+@pytest.mark.parametrize(
+    ("name", "month"),
+    [
+        ("transactions_2025_03", date(2025, 3, 1)),
+        ("transactions_1999_12", date(1999, 12, 1)),
+        ("transactions_old", None),
+        ("transactions_2025_3", None),
+    ],
+)
+def test_partition_month(name: str, month: date | None) -> None:
+    assert partition_month(name) == month
+
+
+def test_add_months_crosses_years() -> None:
+    assert add_months(date(2025, 11, 15), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 31), -1) == date(2024, 12, 1)
+
+
+@pytest.mark.anyio
+async def test_ensure_partitions_requests_each_month_once() -> None:
+    result = MagicMock()
+    result.scalars.return_value = ["transactions_2025_03"]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    names = await ensure_transaction_partitions(
+        session, [date(2025, 4, 2), date(2025, 3, 30), date(2025, 3, 1)]
+    )
+
+    assert names == ["transactions_2025_03"]
+    params = session.execute.await_args.args[1]
+    assert params == {"months": [date(2025, 3, 1), date(2025, 4, 1)]}
+
+
+@pytest.mark.anyio
+async def test_ensure_partitions_skips_query_without_dates() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    assert await ensure_transaction_partitions(session, []) == []
+    session.execute.assert_not_awaited()
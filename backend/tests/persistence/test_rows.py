@@ -0,0 +1,155 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+
+from services.persistence import TRANSACTION_COLUMNS
+from services.persistence import credit_card_detail_row
+from services.persistence import statement_detail_row
+from services.persistence import statement_row
+from services.persistence import transaction_records
+from services.persistence import with_statement_id
+
+
+ACCOUNT_ID = uuid4()
+STATEMENT_ID = uuid4()
+
+
+def _transaction(amount: float) -> dict[str, object]:
+    return {
+        "id": str(uuid4()),
+        "statement_id": str(STATEMENT_ID),
+        "account_id": str(ACCOUNT_ID),
+        "date": "2025-03-30",
+        "amount": amount,
+        "description": "COFFEE SHOP",
+        "category": "dining",
+        "type": "debit" if amount < 0 else "credit",
+    }
+
+
+@pytest.fixture
+def results() -> dict[str, object]:
+    return {
+        "statement_data": {
+            "id": str(STATEMENT_ID),
+            "account_id": str(ACCOUNT_ID),
+            "period_start": "2025-03-28",
+            "period_end": "2025-04-27",
+            "uploaded_at": "2025-04-30T12:00:00+00:00",
+        },
+        "statement_details": {
+            "id": str(uuid4()),
+            "statement_id": str(STATEMENT_ID),
+            "previous_balance": 100.0,
+            "new_balance": 85.1,
+        },
+        "debt_details": {
+            "min_payment_due": 25.0,
+            "payment_due_date": date(2025, 5, 22),
+            "interest_rate": 0.2399,
+        },
+        "credit_card_details": {
+            "id": str(uuid4()),
+            "account_id": str(ACCOUNT_ID),
+            "statement_id": str(STATEMENT_ID),
+            "credit_limit": 5000.0,
+            "points_earned": 120,
+        },
+        "transactions": [_transaction(-14.9), _transaction(0.0), _transaction(0.1)],
+        "metadata": {"parser": "citi_cc"},
+    }
+
+
+def test_statement_row_converts_types(results: dict[str, object]) -> None:
+    row = statement_row(results, file_pdf_url="s3://bucket/statement.pdf")
+
+    assert row["id"] == STATEMENT_ID
+    assert row["period_start"] == date(2025, 3, 28)
+    assert row["uploaded_at"].year == 2025
+    assert row["status"] == "completed"
+
+
+def test_statement_row_keeps_debt_details_as_metadata(
+    results: dict[str, object],
+) -> None:
+    metadata = statement_row(results, file_csv_url="statement.csv")[
+        "processing_metadata"
+    ]
+
+    assert metadata["parser"] == "citi_cc"
+    assert metadata["debt_details"]["payment_due_date"] == "2025-05-22"
+    assert metadata["debt_details"]["interest_rate"] == 0.2399
+    assert metadata["debt_details"]["payments"] is None
+
+
+def test_statement_row_requires_source_file(results: dict[str, object]) -> None:
+    with pytest.raises(ValueError, match="source PDF or CSV"):
+        statement_row(results)
+
+
+def test_statement_row_requires_statement_data() -> None:
+    with pytest.raises(ValueError, match="no statement_data"):
+        statement_row({"transactions": []}, file_pdf_url="statement.pdf")
+
+
+def test_detail_rows_use_decimal_money(results: dict[str, object]) -> None:
+    detail = statement_detail_row(results)
+    cc_detail = credit_card_detail_row(results)
+
+    assert detail is not None
+    assert detail["new_balance"] == Decimal("85.10")
+    assert detail["minimum_payment"] == Decimal("25.00")
+    assert detail["due_date"] == date(2025, 5, 22)
+    assert cc_detail is not None
+    assert cc_detail["credit_limit"] == Decimal("5000.00")
+    assert cc_detail["fees"] == Decimal(0)
+    assert cc_detail["points_redeemed"] == 0
+
+
+def test_detail_rows_are_optional() -> None:
+    assert statement_detail_row({}) is None
+    assert credit_card_detail_row({}) is None
+
+
+def test_transaction_records_follow_column_order(
+    results: dict[str, object],
+) -> None:
+    records = transaction_records(results)
+
+    assert len(records) == 2
+    record = dict(zip(TRANSACTION_COLUMNS, records[0], strict=True))
+    assert isinstance(record["id"], UUID)
+    assert record["statement_id"] == STATEMENT_ID
+    assert record["transaction_date"] == date(2025, 3, 30)
+    assert record["amount"] == Decimal("-14.90")
+    assert record["transaction_type"] == "debit"
+    assert record["custom_description"] is None
+
+
+def test_transaction_records_skip_zero_amounts(
+    results: dict[str, object], caplog: pytest.LogCaptureFixture
+) -> None:
+    records = transaction_records(results)
+
+    assert [record[4] for record in records] == [Decimal("-14.90"), Decimal("0.10")]
+    assert "Skipped 1 zero-amount transactions" in caplog.text
+
+
+def test_with_statement_id_rebinds_every_child(results: dict[str, object]) -> None:
+    uploaded_id = uuid4()
+
+    rebound = with_statement_id(results, uploaded_id)
+
+    assert statement_row(rebound, file_pdf_url="a.pdf")["id"] == uploaded_id
+    detail = statement_detail_row(rebound)
+    cc_detail = credit_card_detail_row(rebound)
+    assert detail is not None
+    assert cc_detail is not None
+    assert detail["statement_id"] == uploaded_id
+    assert cc_detail["statement_id"] == uploaded_id
+    assert {record[1] for record in transaction_records(rebound)} == {uploaded_id}
+    # The parser's own result is left untouched
+    assert statement_row(results, file_pdf_url="a.pdf")["id"] == STATEMENT_ID
@@ -0,0 +1,66 @@
+from datetime import date
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.persistence.spending_summary import monthly_spending
+from services.persistence.spending_summary import refresh_monthly_spending
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+    return session
+
+
+@pytest.mark.anyio
+async def test_refresh_recomputes_only_touched_months() -> None:
+    session = _session()
+    account_id = uuid4()
+
+    rows = await refresh_monthly_spending(
+        session, account_id, [date(2025, 4, 2), date(2025, 3, 30), date(2025, 3, 1)]
+    )
+
+    assert rows == 3
+    lock, bump, delete, insert = session.execute.await_args_list
+    assert "pg_advisory_xact_lock" in str(lock.args[0])
+    # Cached analytics of the account are invalidated with the import
+    assert "data_version = data_version + 1" in str(bump.args[0])
+    assert bump.args[1]["account_id"] == account_id
+    assert "DELETE FROM monthly_spending_summary" in str(delete.args[0])
+    assert insert.args[1] == {
+        "account_id": account_id,
+        "months": [date(2025, 3, 1), date(2025, 4, 1)],
+        "first_month": date(2025, 3, 1),
+        "after_last_month": date(2025, 5, 1),
+    }
+
+
+@pytest.mark.anyio
+async def test_refresh_without_dates_does_nothing() -> None:
+    session = _session()
+
+    assert await refresh_monthly_spending(session, uuid4(), []) == 0
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_monthly_spending_reads_summary_rows_only() -> None:
+    session = _session()
+
+    await monthly_spending(
+        session, [uuid4()], date(2025, 1, 15), date(2025, 3, 31), category="dining"
+    )
+
+    query = session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    params = query.compile(dialect=postgresql.dialect()).params
+    assert "FROM monthly_spending_summary" in sql
+    assert "transactions" not in sql.replace("transaction_", "")
+    assert date(2025, 1, 1) in params.values()
+    assert date(2025, 3, 1) in params.values()
+    assert "dining" in params.values()
@@ -0,0 +1,34 @@
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from models.orm import Transaction
+
+
+def _index_ddl() -> dict[str, str]:
+    return {
+        str(index.name): str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        for index in Transaction.__table__.indexes
+    }
+
+
+def test_reads_are_served_by_account_composites() -> None:
+    ddl = _index_ddl()
+
+    assert "(account_id, transaction_date, id)" in ddl["idx_transactions_account_date"]
+    assert ddl["idx_transactions_account_category_date"].endswith(
+        "(account_id, category, transaction_date) WHERE category IS NOT NULL"
+    )
+    assert (
+        "WHERE custom_description IS NOT NULL"
+        in (ddl["idx_transactions_custom_description_search"])
+    )
+
+
+def test_single_column_indexes_are_not_maintained_on_insert() -> None:
+    assert set(_index_ddl()) == {
+        "idx_transactions_statement_id",
+        "idx_transactions_account_date",
+        "idx_transactions_account_category_date",
+        "idx_transactions_description_search",
+        "idx_transactions_custom_description_search",
+    }
@@ -0,0 +1,108 @@
+import copy
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models.orm import StatementDetail
+from services.persistence import content_hash
+from services.persistence import credit_card_detail_row
+from services.persistence import statement_detail_row
+from services.persistence import statement_row
+from services.persistence import transaction_records
+from services.persistence.upsert import detail_upsert
+from services.persistence.upsert import statement_upsert
+
+
+def _results() -> dict[str, object]:
+    statement_id = str(uuid4())
+    account_id = "2c3f0a2e-7a8b-4d55-9a61-3f6b2b0e9c11"
+    return {
+        "statement_data": {
+            "id": statement_id,
+            "account_id": account_id,
+            "period_start": "2025-03-28",
+            "period_end": "2025-04-27",
+        },
+        "statement_details": {
+            "id": str(uuid4()),
+            "statement_id": statement_id,
+            "new_balance": 85.1,
+        },
+        "transactions": [
+            {
+                "id": str(uuid4()),
+                "statement_id": statement_id,
+                "account_id": account_id,
+                "date": "2025-03-30",
+                "amount": -14.9,
+                "description": "COFFEE SHOP",
+                "type": "debit",
+            }
+        ],
+        "metadata": {"timings": {"parse_pdf": {"total_ms": 12.5}}},
+    }
+
+
+def _hash(results: dict[str, object]) -> str:
+    statement = statement_row(results, file_pdf_url="statement.pdf")
+    return content_hash(
+        statement,
+        statement_detail_row(results),
+        credit_card_detail_row(results),
+        transaction_records(results),
+    )
+
+
+def test_content_hash_ignores_generated_ids_and_timings() -> None:
+    first = _results()
+    second = _results()
+    second["metadata"] = {"timings": {"parse_pdf": {"total_ms": 99.0}}}
+
+    assert _hash(first) == _hash(second)
+
+
+@pytest.mark.parametrize(
+    ("section", "name", "value"),
+    [
+        ("transactions", "amount", -15.9),
+        ("transactions", "description", "TEA SHOP"),
+        ("statement_details", "new_balance", 86.1),
+        ("statement_data", "period_end", "2025-04-28"),
+    ],
+)
+def test_content_hash_changes_with_content(
+    section: str, name: str, value: object
+) -> None:
+    original = _results()
+    changed = copy.deepcopy(original)
+    target = changed[section]
+    (target[0] if isinstance(target, list) else target)[name] = value
+
+    assert _hash(original) != _hash(changed)
+
+
+def test_statement_upsert_only_updates_changed_content() -> None:
+    row = statement_row(_results(), file_pdf_url="statement.pdf")
+    row["processing_metadata"]["content_hash"] = "abc"
+
+    sql = str(statement_upsert(row).compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (account_id, period_start, period_end) DO UPDATE" in sql
+    assert "IS DISTINCT FROM" in sql
+    assert "RETURNING statements.id, xmax = 0 AS inserted" in sql
+    assert "uploaded_at = " not in sql.split("DO UPDATE", 1)[1]
+
+
+def test_detail_upsert_keeps_stored_id() -> None:
+    detail = statement_detail_row(_results())
+    assert detail is not None
+
+    sql = str(
+        detail_upsert(StatementDetail, detail).compile(dialect=postgresql.dialect())
+    )
+    updates = sql.split("DO UPDATE SET", 1)[1]
+
+    assert "ON CONFLICT (statement_id)" in sql
+    assert "new_balance = excluded.new_balance" in updates
+    assert " id = " not in updates
@@ -0,0 +1 @@
+"""Object storage tests."""
@@ -0,0 +1,55 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from services.storage import LocalStorage
+from services.storage import content_key
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # File moves go through anyio worker threads
+    return "asyncio"
+
+
+def _staged(directory: Path, content: bytes) -> tuple[str, Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f".{hashlib.sha256(content).hexdigest()[:8]}.part"
+    path.write_bytes(content)
+    return content_key(hashlib.sha256(content).hexdigest(), ".PDF"), path
+
+
+@pytest.mark.anyio
+async def test_files_are_moved_under_their_content_key(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path / "store")
+    await storage.ensure_ready()
+    content = b"%PDF-1.7 statement"
+    key, staged = _staged(tmp_path / "staging", content)
+
+    location = await storage.put_file(key, staged)
+
+    assert key.endswith(".pdf")
+    assert location == str(tmp_path / "store" / key)
+    assert not staged.exists()
+    assert await storage.exists(key)
+    with storage.open(location) as handle:
+        assert handle.read() == content
+    assert storage.read_range(location, 5, 3) == b"1.7"
+
+
+@pytest.mark.anyio
+async def test_storing_the_same_content_twice_keeps_one_file(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path / "store")
+    await storage.ensure_ready()
+
+    for _ in range(2):
+        key, staged = _staged(tmp_path / "staging", b"date,amount\n")
+        await storage.put_file(key, staged)
+
+    assert [path.name for path in (tmp_path / "store").iterdir()] == [key]
+
+
+def test_missing_objects_raise_file_not_found(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        LocalStorage(tmp_path).open(str(tmp_path / "missing.pdf"))
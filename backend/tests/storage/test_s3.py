@@ -0,0 +1,189 @@
+import hashlib
+import io
+import pickle
+from pathlib import Path
+from typing import Any
+from typing import BinaryIO
+
+import pytest
+from minio.error import S3Error
+
+from services.storage import S3Storage
+from services.storage import content_key
+
+
+PART = 5 * 1024 * 1024
+
+
+class _Response:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class _Stat:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+
+class _FakeMinio:
+    """In-memory stand-in for the parts of the MinIO client storage uses."""
+
+    def __init__(self) -> None:
+        self.buckets: set[str] = set()
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.puts: list[dict[str, Any]] = []
+        self.ranges: list[tuple[int, int]] = []
+
+    def bucket_exists(self, bucket: str) -> bool:
+        return bucket in self.buckets
+
+    def make_bucket(self, bucket: str) -> None:
+        self.buckets.add(bucket)
+
+    def stat_object(self, bucket: str, key: str) -> _Stat:
+        if (bucket, key) not in self.objects:
+            raise S3Error(None, "NoSuchKey", "missing", key, "", "")  # type: ignore[arg-type]
+        return _Stat(len(self.objects[bucket, key]))
+
+    def put_object(
+        self,
+        bucket: str,
+        key: str,
+        data: BinaryIO,
+        *,
+        length: int,
+        content_type: str,
+        part_size: int,
+    ) -> None:
+        # Read part by part, as a multipart upload streams the file
+        parts = []
+        while part := data.read(part_size):
+            parts.append(part)
+        assert sum(len(part) for part in parts) == length
+        self.objects[bucket, key] = b"".join(parts)
+        self.puts.append(
+            {"key": key, "parts": len(parts), "content_type": content_type}
+        )
+
+    def get_object(
+        self, bucket: str, key: str, offset: int = 0, length: int = 0
+    ) -> _Response:
+        if (bucket, key) not in self.objects:
+            raise S3Error(None, "NoSuchKey", "missing", key, "", "")  # type: ignore[arg-type]
+        self.ranges.append((offset, length))
+        return _Response(self.objects[bucket, key][offset : offset + length])
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # Client calls go through anyio worker threads
+    return "asyncio"
+
+
+@pytest.fixture
+def client() -> _FakeMinio:
+    return _FakeMinio()
+
+
+@pytest.fixture
+def storage(client: _FakeMinio) -> S3Storage:
+    return S3Storage(
+        "minio:9000",
+        bucket="statements",
+        part_size=PART,
+        read_block_bytes=1024,
+        client=client,  # type: ignore[arg-type]
+    )
+
+
+def _staged(tmp_path: Path, content: bytes, suffix: str = ".pdf") -> tuple[str, Path]:
+    path = tmp_path / f"{hashlib.sha256(content).hexdigest()[:8]}.part"
+    path.write_bytes(content)
+    return content_key(hashlib.sha256(content).hexdigest(), suffix), path
+
+
+@pytest.mark.anyio
+async def test_files_are_uploaded_in_parts_and_removed_locally(
+    storage: S3Storage, client: _FakeMinio, tmp_path: Path
+) -> None:
+    await storage.ensure_ready()
+    content = b"%PDF" + bytes(2 * PART)
+    key, staged = _staged(tmp_path, content)
+
+    location = await storage.put_file(key, staged)
+
+    assert client.buckets == {"statements"}
+    assert location == f"s3://statements/{key}"
+    assert client.puts == [{"key": key, "parts": 3, "content_type": "application/pdf"}]
+    assert client.objects["statements", key] == content
+    assert not staged.exists()
+
+
+@pytest.mark.anyio
+async def test_content_already_stored_is_not_uploaded_again(
+    storage: S3Storage, client: _FakeMinio, tmp_path: Path
+) -> None:
+    for _ in range(2):
+        key, staged = _staged(tmp_path, b"date,amount\n", ".csv")
+        await storage.put_file(key, staged)
+
+    assert len(client.puts) == 1
+    assert not staged.exists()
+
+
+@pytest.mark.anyio
+async def test_objects_are_read_with_ranged_gets(
+    storage: S3Storage, client: _FakeMinio, tmp_path: Path
+) -> None:
+    content = bytes(range(256)) * 40
+    key, staged = _staged(tmp_path, content)
+    location = await storage.put_file(key, staged)
+
+    with storage.open(location) as handle:
+        handle.seek(-16, io.SEEK_END)
+        tail = handle.read(16)
+        handle.seek(0)
+        head = handle.read(8)
+    assert tail == content[-16:]
+    assert head == content[:8]
+    # A read block each, never the whole object
+    assert client.ranges == [(len(content) - 16, 16), (0, 1024)]
+
+    assert storage.read_range(location, 100, 4) == content[100:104]
+    with storage.open(location) as handle:
+        assert handle.read() == content
+
+
+def test_missing_objects_raise_file_not_found(storage: S3Storage) -> None:
+    with pytest.raises(FileNotFoundError):
+        storage.open("s3://statements/missing.pdf")
+    with pytest.raises(FileNotFoundError):
+        storage.read_range("s3://statements/missing.pdf", 0, 10)
+    with pytest.raises(FileNotFoundError):
+        storage.open("s3://other-bucket/a.pdf")
+
+
+def test_local_paths_from_before_the_bucket_are_still_readable(
+    storage: S3Storage, tmp_path: Path
+) -> None:
+    path = tmp_path / "a.pdf"
+    path.write_bytes(b"%PDF")
+
+    with storage.open(str(path)) as handle:
+        assert handle.read() == b"%PDF"
+
+
+def test_pickled_storage_builds_its_own_client(storage: S3Storage) -> None:
+    copy = pickle.loads(pickle.dumps(storage))  # noqa: S301
+
+    assert copy.bucket == "statements"
+    assert copy._client is None  # noqa: SLF001
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from services.parsers.pdf.parse_citi_cc_pdf import extract_field_value
+from services.telemetry import FieldMetrics
+from services.telemetry import collecting_field_metrics
+from services.telemetry import current_field_metrics
+
+
+LINES = ["Account Summary", "New balance $1,234.56", "Payment due date: 13/45/2025"]
+
+
+def _extract(
+    field_name: str, label: str, value: str, data_type: str = "float"
+) -> object:
+    return extract_field_value(
+        lines=LINES,
+        label_patterns=[label],
+        value_pattern=value,
+        data_type=data_type,
+        field_name=field_name,
+    )
+
+
+def test_no_collector_by_default() -> None:
+    assert current_field_metrics() is None
+    assert _extract("new_balance", r"New balance", r"\$[\d,]+\.\d{2}") == 1234.56
+
+
+def test_extraction_outcomes_are_recorded() -> None:
+    with collecting_field_metrics() as metrics:
+        _extract("new_balance", r"New balance", r"\$[\d,]+\.\d{2}")
+        _extract("fees", r"Fees charged", r"\$[\d,]+\.\d{2}")
+        _extract("credits", r"Account Summary", r"\$[\d,]+\.\d{2}")
+        _extract("due_date", r"Payment due", r"\d+/\d+/\d{4}", data_type="date")
+        _extract("bad_float", r"Payment due", r"\d+/\d+/\d{4}")
+
+    outcomes = {name: stats.outcomes for name, stats in metrics.fields.items()}
+    assert outcomes["new_balance"]["hit"] == 1
+    assert outcomes["fees"]["miss"] == 1
+    assert outcomes["credits"]["no_value"] == 1
+    assert outcomes["due_date"]["invalid"] == 1
+    assert outcomes["bad_float"]["transform_failure"] == 1
+    assert metrics.fields["new_balance"].lines_scanned.total == 2
+    assert metrics.fields["fees"].lines_scanned.total == len(LINES)
+
+
+def test_pattern_latency_is_recorded_per_role() -> None:
+    with collecting_field_metrics() as metrics:
+        _extract("new_balance", r"New balance", r"\$[\d,]+\.\d{2}")
+
+    label = metrics.patterns[("new_balance", "label", "New balance")]
+    value = metrics.patterns[("new_balance", "value", r"\$[\d,]+\.\d{2}")]
+    assert label.count == 2
+    assert value.count == 1
+    assert sum(label.counts) == label.count
+
+
+def test_merge_and_round_trip() -> None:
+    first = FieldMetrics()
+    first.record_outcome("fees", "hit", 4)
+    first.observe_pattern("fees", "label", "Fees", 2e-6)
+    second = FieldMetrics.from_dict(json.loads(json.dumps(first.to_dict())))
+    second.record_outcome("fees", "miss", 40)
+
+    first.merge(second)
+
+    stats = first.fields["fees"]
+    assert stats.attempts == 3
+    assert stats.outcomes == {**stats.outcomes, "hit": 2, "miss": 1}
+    assert stats.hit_rate == pytest.approx(2 / 3)
+    assert first.patterns[("fees", "label", "Fees")].count == 2
+
+
+def test_prometheus_export() -> None:
+    metrics = FieldMetrics()
+    metrics.record_outcome("fees", "hit", 4)
+    metrics.observe_pattern("fees", "value", r'\$\d+ "x"', 2e-6)
+
+    text = metrics.to_prometheus()
+
+    assert 'ledgerly_field_extractions_total{field="fees",outcome="hit"} 1' in text
+    assert 'ledgerly_field_lines_scanned_bucket{field="fees",le="5"} 1' in text
+    assert 'ledgerly_field_lines_scanned_bucket{field="fees",le="+Inf"} 1' in text
+    assert r'pattern="\\$\\d+ \"x\"",le="5e-06"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_unknown_outcome_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown extraction outcome"):
+        FieldMetrics().record_outcome("fees", "maybe", 1)
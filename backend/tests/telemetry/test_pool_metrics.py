@@ -0,0 +1,59 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool
+
+from services.telemetry.pool_metrics import InstrumentedQueuePool
+from services.telemetry.pool_metrics import pool_stats
+
+
+def _pool() -> InstrumentedQueuePool:
+    return InstrumentedQueuePool(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.01
+    )
+
+
+def test_checkouts_and_connects_are_timed() -> None:
+    pool = _pool()
+
+    first = pool.connect()
+    first.close()
+    second = pool.connect()
+
+    stats = pool_stats(pool)
+    assert stats["checked_out"] == 1
+    assert stats["size"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["connects"] == 1
+    assert stats["connect_seconds"] >= 0
+    assert stats["max_checkout_wait_seconds"] >= 0
+    second.close()
+
+
+def test_exhausted_pool_counts_timeouts() -> None:
+    pool = _pool()
+    held = pool.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    assert pool.timings.checkout_timeouts == 1
+    assert pool.timings.max_checkout_wait_seconds >= 0.01
+    held.close()
+
+
+def test_recreated_pool_keeps_timings() -> None:
+    pool = _pool()
+    pool.connect().close()
+
+    recreated = pool.recreate()
+
+    assert isinstance(recreated, InstrumentedQueuePool)
+    assert recreated.timings is pool.timings
+
+
+def test_uninstrumented_pools_report_their_class_only() -> None:
+    assert pool_stats(NullPool(lambda: sqlite3.connect(":memory:"))) == {
+        "pool_class": "NullPool"
+    }
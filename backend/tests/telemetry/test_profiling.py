@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from services.telemetry import profiling
+from services.telemetry import span
+from services.telemetry import timed
+
+
+@timed()
+def _leaf() -> str:
+    with span("inner"):
+        return "done"
+
+
+@timed("outer")
+def _outer() -> str:
+    return _leaf() + _leaf()
+
+
+def test_spans_are_noops_without_profiling() -> None:
+    with span("ignored") as result:
+        assert result is None
+
+    assert _outer() == "donedone"
+
+
+def test_nested_spans_are_recorded_by_path() -> None:
+    with profiling() as profiler:
+        _outer()
+
+    assert list(profiler.stages) == ["outer", "outer/_leaf", "outer/_leaf/inner"]
+    assert profiler.stages["outer/_leaf"].calls == 2
+    assert profiler.stages["outer"].total >= profiler.stages["outer/_leaf"].total
+
+
+def test_timings_are_scoped_to_the_profiling_block() -> None:
+    with profiling() as profiler:
+        _leaf()
+    _leaf()
+
+    assert profiler.stages["_leaf"].calls == 1
+
+
+def test_to_dict_and_report() -> None:
+    with profiling() as profiler:
+        _outer()
+
+    timings = profiler.to_dict()
+    report = profiler.format_report()
+
+    assert timings["outer"]["calls"] == 1
+    assert set(timings["outer"]) == {"calls", "total_ms", "max_ms"}
+    assert "    inner" in report
+    assert "100.0%" in report
+
+
+def test_profiling_dumps_pstats(tmp_path: Path) -> None:
+    pstats_path = tmp_path / "parse.pstats"
+
+    with profiling(pstats_path):
+        _outer()
+
+    assert pstats_path.stat().st_size > 0
+
+
+def test_exception_still_records_span() -> None:
+    with profiling() as profiler:
+        with pytest.raises(RuntimeError), span("failing"):
+            raise RuntimeError
+        with span("after"):
+            pass
+
+    assert set(profiler.stages) == {"failing", "after"}
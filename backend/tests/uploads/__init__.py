@@ -0,0 +1 @@
+"""Statement upload tests."""
@@ -0,0 +1,100 @@
+import hashlib
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from services.storage import LocalStorage
+from services.uploads import UploadError
+from services.uploads import UploadTooLargeError
+from services.uploads import count_statements
+from services.uploads import extract_statements
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # Members are unpacked on an anyio worker thread
+    return "asyncio"
+
+
+def _archive(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return path
+
+
+@pytest.mark.anyio
+async def test_statements_are_paired_and_unpaired_files_skipped(
+    tmp_path: Path,
+) -> None:
+    pdf = b"%PDF-1.7 august"
+    archive = _archive(
+        tmp_path / "2025.zip",
+        {
+            "2025/2025-08_statement.pdf": pdf,
+            "2025/2025-08_transactions.csv": b"date,amount\n",
+            "2025/2025-09_transactions.csv": b"date,amount\n",
+            "2025/notes.txt": b"hi",
+            "__MACOSX/2025/._2025-08_statement.pdf": b"junk",
+        },
+    )
+    directory = tmp_path / "uploads"
+
+    contents = await extract_statements(
+        archive, directory, fields={"account_type": "citi_cc"}, max_file_bytes=1024
+    )
+
+    (upload,) = contents.uploads
+    assert upload.fields == {"account_type": "citi_cc"}
+    assert set(upload.files) == {"pdf_file", "csv_file"}
+    stored = upload.files["pdf_file"]
+    assert stored.filename == "2025-08_statement.pdf"
+    assert stored.sha256 == hashlib.sha256(pdf).hexdigest()
+    assert contents.skipped == [
+        "2025/notes.txt: not a PDF or CSV",
+        "2025/2025-09_transactions.csv: no matching PDF",
+    ]
+
+    await upload.keep(LocalStorage(directory))
+    assert (directory / stored.key).read_bytes() == pdf
+
+
+@pytest.mark.anyio
+async def test_statements_are_counted_like_they_are_paired(tmp_path: Path) -> None:
+    archive = _archive(
+        tmp_path / "2025.zip",
+        {
+            "2025-08_statement.pdf": b"%PDF-1.7 august",
+            "2025-08_transactions.csv": b"date,amount\n",
+            "2025-09_statement.pdf": b"%PDF-1.7 september",
+            "2025-10_transactions.csv": b"date,amount\n",
+            "notes.txt": b"hi",
+        },
+    )
+
+    assert await count_statements(archive) == 2
+
+
+@pytest.mark.anyio
+async def test_a_member_inflating_past_the_limit_leaves_nothing_behind(
+    tmp_path: Path,
+) -> None:
+    archive = _archive(
+        tmp_path / "bomb.zip",
+        {"a_statement.pdf": b"%PDF", "b_statement.pdf": b"\0" * 10_000},
+    )
+    directory = tmp_path / "uploads"
+
+    with pytest.raises(UploadTooLargeError, match=r"b_statement\.pdf"):
+        await extract_statements(archive, directory, fields={}, max_file_bytes=1024)
+    assert list(directory.iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_a_file_that_is_not_a_zip_is_rejected(tmp_path: Path) -> None:
+    archive = tmp_path / "year.zip"
+    archive.write_bytes(b"%PDF-1.7")
+
+    with pytest.raises(UploadError, match="Not a valid zip"):
+        await extract_statements(archive, tmp_path, fields={}, max_file_bytes=1024)
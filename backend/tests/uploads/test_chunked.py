@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from services.uploads import ChunkedUploads
+from services.uploads import ChunkError
+from services.uploads import IncompleteUploadError
+from services.uploads import UploadSessionNotFoundError
+from services.uploads import UploadTooLargeError
+
+
+CHUNK = 16
+CONTENT = b"%PDF-1.7 " + bytes(range(256)) * 2
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # Chunks are written on anyio worker threads; the app runs on asyncio
+    return "asyncio"
+
+
+@pytest.fixture
+def uploads(tmp_path: Path) -> ChunkedUploads:
+    return ChunkedUploads(
+        tmp_path / "spool",
+        chunk_size=CHUNK,
+        max_upload_bytes=4096,
+        ttl_seconds=3600,
+    )
+
+
+async def _body(data: bytes, size: int = 5) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _chunk(offset: int) -> bytes:
+    return CONTENT[offset : offset + CHUNK]
+
+
+@pytest.mark.anyio
+async def test_parallel_out_of_order_chunks_assemble_in_place(
+    uploads: ChunkedUploads,
+) -> None:
+    session = await uploads.create("august.pdf", len(CONTENT), fields={})
+    offsets = list(range(0, len(CONTENT), CHUNK))[::-1]
+
+    await asyncio.gather(
+        *(
+            uploads.write_chunk(
+                session,
+                offset,
+                _body(_chunk(offset)),
+                hashlib.sha256(_chunk(offset)).digest(),
+            )
+            for offset in offsets
+        )
+    )
+    assert await uploads.received(session) == list(range(session.chunk_count))
+    spooled = (uploads.spool_dir / session.id / "data").stat().st_ino
+
+    path, sha256 = await uploads.complete(session)
+
+    assert path.read_bytes() == CONTENT
+    assert sha256 == hashlib.sha256(CONTENT).hexdigest()
+    # Renamed, not copied
+    assert path.stat().st_ino == spooled
+
+
+@pytest.mark.anyio
+async def test_a_chunk_that_fails_its_checksum_is_not_received(
+    uploads: ChunkedUploads,
+) -> None:
+    session = await uploads.create("august.pdf", len(CONTENT), fields={})
+    good = _chunk(CHUNK)
+
+    with pytest.raises(ChunkError, match="checksum"):
+        await uploads.write_chunk(
+            session, CHUNK, _body(b"x" * CHUNK), hashlib.sha256(good).digest()
+        )
+    assert await uploads.received(session) == []
+
+    await uploads.write_chunk(
+        session, CHUNK, _body(good), hashlib.sha256(good).digest()
+    )
+    assert await uploads.received(session) == [1]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("offset", "data", "error"),
+    [
+        (3, b"x" * CHUNK, "not a multiple"),
+        (len(CONTENT) + CHUNK, b"x", "not a multiple"),
+        (0, b"x" * (CHUNK + 1), "longer than"),
+        (0, b"x", "1 of 16 bytes"),
+    ],
+)
+async def test_chunks_must_fill_exactly_their_slot(
+    uploads: ChunkedUploads, offset: int, data: bytes, error: str
+) -> None:
+    session = await uploads.create("august.pdf", len(CONTENT), fields={})
+
+    with pytest.raises(ChunkError, match=error):
+        await uploads.write_chunk(
+            session, offset, _body(data), hashlib.sha256(data).digest()
+        )
+
+
+@pytest.mark.anyio
+async def test_completion_needs_every_chunk_and_the_declared_digest(
+    uploads: ChunkedUploads,
+) -> None:
+    content = b"%PDF" * 8
+    session = await uploads.create(
+        "august.pdf", len(content), fields={}, sha256="0" * 64
+    )
+    first = content[:CHUNK]
+    await uploads.write_chunk(session, 0, _body(first), hashlib.sha256(first).digest())
+
+    with pytest.raises(IncompleteUploadError, match="missing 1 chunk"):
+        await uploads.complete(session)
+
+    last = content[CHUNK:]
+    await uploads.write_chunk(
+        session, CHUNK, _body(last), hashlib.sha256(last).digest()
+    )
+    with pytest.raises(IncompleteUploadError, match="SHA-256"):
+        await uploads.complete(session)
+    with pytest.raises(UploadSessionNotFoundError):
+        await uploads.get(session.id)
+
+
+@pytest.mark.anyio
+async def test_oversized_uploads_are_refused_up_front(uploads: ChunkedUploads) -> None:
+    with pytest.raises(UploadTooLargeError):
+        await uploads.create("year.zip", 4097, fields={})
+
+
+@pytest.mark.anyio
+async def test_expired_sessions_are_purged(uploads: ChunkedUploads) -> None:
+    session = await uploads.create("august.pdf", len(CONTENT), fields={})
+    uploads.ttl_seconds = -1
+
+    with pytest.raises(UploadSessionNotFoundError, match="expired"):
+        await uploads.get(session.id)
+    assert await uploads.purge_expired() == 1
+    assert list(uploads.spool_dir.iterdir()) == []
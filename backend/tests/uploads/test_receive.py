@@ -0,0 +1,138 @@
+import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from services.storage import LocalStorage
+from services.uploads import UploadError
+from services.uploads import UploadTooLargeError
+from services.uploads import receive_upload
+
+
+BOUNDARY = "ledgerly-test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def _body(*parts: tuple[str, str | None, bytes]) -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += (
+            f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+            + content
+            + b"\r\n"
+        )
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def _stored(directory: Path) -> list[str]:
+    return [path.name for path in directory.iterdir()]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # File I/O goes through anyio worker threads; the app runs on asyncio
+    return "asyncio"
+
+
+async def _chunks(body: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    # Small chunks split headers and boundaries across parser writes
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.anyio
+async def test_fields_and_files_are_streamed_to_content_addressed_paths(
+    tmp_path: Path,
+) -> None:
+    pdf = b"%PDF-1.7 statement" * 50
+    body = _body(
+        ("account_type", None, b"citi_cc"),
+        ("pdf_file", "../../August.PDF", pdf),
+    )
+
+    upload = await receive_upload(
+        CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024 * 1024
+    )
+
+    assert upload.fields == {"account_type": "citi_cc"}
+    stored = upload.files["pdf_file"]
+    digest = hashlib.sha256(pdf).hexdigest()
+    assert stored.sha256 == digest
+    assert stored.size == len(pdf)
+    assert stored.filename == "August.PDF"
+    assert stored.key == f"{digest}.pdf"
+    assert not (tmp_path / stored.key).exists()
+
+    await upload.keep(LocalStorage(tmp_path))
+
+    stored_bytes = (tmp_path / stored.key).read_bytes()
+    assert hashlib.sha256(stored_bytes).hexdigest() == digest
+    assert _stored(tmp_path) == [f"{digest}.pdf"]
+
+
+@pytest.mark.anyio
+async def test_the_same_file_uploaded_twice_is_stored_once(tmp_path: Path) -> None:
+    body = _body(("csv_file", "august.csv", b"date,amount\n2025-08-01,-4.50\n"))
+
+    first = await receive_upload(
+        CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024
+    )
+    await first.keep(LocalStorage(tmp_path))
+    second = await receive_upload(
+        CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024
+    )
+    await second.keep(LocalStorage(tmp_path))
+
+    assert first.files["csv_file"].key == second.files["csv_file"].key
+    assert len(_stored(tmp_path)) == 1
+
+
+@pytest.mark.anyio
+async def test_discarded_upload_leaves_stored_files_alone(tmp_path: Path) -> None:
+    body = _body(("csv_file", "august.csv", b"date,amount\n"))
+    kept = await receive_upload(
+        CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024
+    )
+    await kept.keep(LocalStorage(tmp_path))
+
+    rejected = await receive_upload(
+        CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024
+    )
+    await rejected.discard()
+
+    assert _stored(tmp_path) == [kept.files["csv_file"].key]
+
+
+@pytest.mark.anyio
+async def test_oversized_file_is_rejected_and_removed(tmp_path: Path) -> None:
+    body = _body(
+        ("csv_file", "small.csv", b"date,amount\n"),
+        ("pdf_file", "big.pdf", b"x" * 2048),
+    )
+
+    with pytest.raises(UploadTooLargeError):
+        await receive_upload(CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024)
+
+    assert _stored(tmp_path) == []
+
+
+@pytest.mark.anyio
+async def test_truncated_body_is_rejected_and_removed(tmp_path: Path) -> None:
+    body = _body(("pdf_file", "cut.pdf", b"x" * 100))[:-40]
+
+    with pytest.raises(UploadError):
+        await receive_upload(CONTENT_TYPE, _chunks(body), tmp_path, max_file_bytes=1024)
+
+    assert _stored(tmp_path) == []
+
+
+@pytest.mark.anyio
+async def test_missing_boundary_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(UploadError, match="boundary"):
+        await receive_upload(
+            "multipart/form-data", _chunks(b""), tmp_path, max_file_bytes=1024
+        )